@@ -0,0 +1,150 @@
+"""
+Project Scanner Benchmark
+
+Generates a synthetic project tree and scans it with ProjectScanner in
+each scenario (no index, cold index, warm index, warm index after some
+configs changed), printing wall time, directories visited / listed, file
+system calls and parse time per parser.
+
+Usage:
+    python benchmark_project_scanner.py
+    python benchmark_project_scanner.py --fan-out 10 --depth 4 --json report.json
+    python benchmark_project_scanner.py --baseline report.json   # exit 1 on regression
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.benchmark import SCENARIOS, TreeSpec, compare, generate_tree, run_benchmark
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = TreeSpec()
+    parser = argparse.ArgumentParser(description="Benchmark ProjectScanner on a synthetic tree")
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out, help="Subdirectories per directory")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="Tree depth (and scanner max_depth)")
+    parser.add_argument("--project-ratio", type=float, default=defaults.project_ratio)
+    parser.add_argument(
+        "--type-mix",
+        default=",".join(f"{name}={weight:g}" for name, weight in defaults.type_mix.items()),
+        help="Project type weights, e.g. nodejs=4,python=4,rust=1",
+    )
+    parser.add_argument("--ignored-ratio", type=float, default=defaults.ignored_ratio)
+    parser.add_argument("--gitignored-ratio", type=float, default=defaults.gitignored_ratio)
+    parser.add_argument("--junk-dirs", type=int, default=defaults.junk_dirs, help="Directories per ignored subtree")
+    parser.add_argument("--config-kb", type=float, default=defaults.config_kb, help="Size of each config file")
+    parser.add_argument("--no-lockfiles", action="store_true", help="Don't write lockfiles")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--workers", type=int, default=8, help="Scanner threads")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--json", type=Path, help="Write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed wall time growth vs baseline")
+    parser.add_argument("--keep", type=Path, help="Generate the tree here and keep it")
+    return parser.parse_args()
+
+
+def build_spec(args: argparse.Namespace) -> TreeSpec:
+    type_mix = {}
+    for item in args.type_mix.split(","):
+        name, _, weight = item.partition("=")
+        type_mix[name.strip()] = float(weight or 1)
+    return TreeSpec(
+        fan_out=args.fan_out,
+        depth=args.depth,
+        project_ratio=args.project_ratio,
+        type_mix=type_mix,
+        ignored_ratio=args.ignored_ratio,
+        gitignored_ratio=args.gitignored_ratio,
+        junk_dirs=args.junk_dirs,
+        config_kb=args.config_kb,
+        lockfiles=not args.no_lockfiles,
+        seed=args.seed,
+    )
+
+
+def print_report(report: dict) -> None:
+    tree = report["tree"]
+    print(
+        f"\nTree: {tree['directories']} directories, {tree['files']} files, "
+        f"{tree['total_bytes'] / 1024 / 1024:.1f} MB, {tree['projects']} projects {tree['projects_by_type']}"
+    )
+    print(f"Workers: {report['workers']}, Python {report['python']}, {report['cpu_count']} CPUs\n")
+
+    print(f"{'scenario':<10} {'wall':>9} {'projects':>9} {'visited':>8} {'listed':>7} "
+          f"{'pruned':>7} {'hits':>6} {'misses':>7} {'fs calls':>9}")
+    print("-" * 80)
+    for name, scenario in report["scenarios"].items():
+        print(
+            f"{name:<10} {scenario['wall_seconds']:>8.3f}s {scenario['projects']:>9} "
+            f"{scenario['directories_visited']:>8} {scenario['directories_listed']:>7} "
+            f"{scenario['directories_pruned']:>7} {scenario['cache_hits']:>6} {scenario['cache_misses']:>7} "
+            f"{scenario['fs_calls_total']:>9}"
+        )
+
+    for name, scenario in report["scenarios"].items():
+        calls = ", ".join(f"{call}={count}" for call, count in scenario["fs_calls"].items())
+        parse = ", ".join(
+            f"{parser}={seconds * 1000:.1f}ms/{scenario['parse_calls'][parser]}"
+            for parser, seconds in scenario["parse_seconds"].items()
+        )
+        print(f"\n{name}:")
+        print(f"  fs calls: {calls or '-'}")
+        print(f"  parsers:  {parse or '-'}")
+        if scenario["errors"]:
+            print(f"  errors:   {len(scenario['errors'])} (first: {scenario['errors'][0]})")
+
+
+def main():
+    """Generate, scan, report"""
+    args = parse_args()
+    spec = build_spec(args)
+    logging.disable(logging.INFO)  # Scan progress logs would dominate the timings
+
+    print("\n" + "=" * 80)
+    print("PROJECT SCANNER BENCHMARK")
+    print("=" * 80)
+
+    root = args.keep or Path(tempfile.mkdtemp(prefix="sendell-bench-"))
+    try:
+        tree = generate_tree(root, spec)
+        report = run_benchmark(
+            tree,
+            spec,
+            scenarios=tuple(name.strip() for name in args.scenarios.split(",") if name.strip()),
+            workers=args.workers,
+            repeat=args.repeat,
+        ).to_dict()
+    finally:
+        if args.keep is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.json}")
+
+    exit_code = 0
+    if args.baseline:
+        problems = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        print(f"\nBaseline {args.baseline}: {'no regressions' if not problems else f'{len(problems)} regressions'}")
+        for problem in problems:
+            print(f"  [REGRESSION] {problem}")
+        exit_code = 1 if problems else 0
+
+    print("\n" + "=" * 80)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
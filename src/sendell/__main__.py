@@ -18,7 +18,8 @@ from rich.table import Table
 
 from sendell.agent.core import get_agent
 from sendell.config import get_settings, validate_settings
-from sendell.device.monitor import SystemMonitor
+from sendell.device.monitor import get_system_monitor
+from sendell.projects.config_cache import close_config_cache
 from sendell.utils.logger import get_logger
 
 # Initialize CLI
@@ -127,6 +128,9 @@ async def run_proactive_loop(interval: int, max_cycles: Optional[int] = None):
 
     except KeyboardInterrupt:
         raise
+    finally:
+        agent.memory.close()
+        close_config_cache()
 
 
 @app.command()
@@ -191,12 +195,14 @@ async def run_chat_loop():
                 console.print("[yellow]Stopping services...[/yellow]")
                 await agent.proactive_loop.stop()
                 await agent.stop_vscode_server()
+                agent.memory.close()
+                close_config_cache()
                 console.print("[yellow]Goodbye![/yellow]")
                 break
 
             if user_input.lower() == "/health":
                 # Quick health check
-                monitor = SystemMonitor()
+                monitor = get_system_monitor()
                 health = monitor.get_system_health()
                 display_health(health)
                 continue
@@ -244,7 +250,7 @@ def health():
     try:
         console.print("\n[bold]Checking system health...[/bold]\n")
 
-        monitor = SystemMonitor()
+        monitor = get_system_monitor()
         health = monitor.get_system_health()
 
         display_health(health)
@@ -280,6 +286,22 @@ def display_health(health):
         disk_status,
     )
 
+    # Other partitions (first entry is the system drive shown above)
+    for disk in health.disks[1:]:
+        status = "[?] Stale" if disk["stale"] else ("[!] High" if disk["percent"] > 90 else "[OK]")
+        table.add_row(
+            f"  {disk['mountpoint']}",
+            f"{disk['percent']}% ({disk['used_gb']:.1f}GB / {disk['total_gb']:.1f}GB)",
+            status,
+        )
+
+    if health.disk_io:
+        table.add_row(
+            "Disk I/O",
+            f"R {health.disk_io['read_mb_per_sec']} MB/s, W {health.disk_io['write_mb_per_sec']} MB/s",
+            "",
+        )
+
     console.print(table)
 
 
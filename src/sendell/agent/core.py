@@ -16,8 +16,13 @@ from langgraph.prebuilt import create_react_agent
 from sendell.agent.memory import get_memory
 from sendell.agent.prompts import get_chat_mode_prompt, get_proactive_loop_prompt, get_system_prompt
 from sendell.config import get_settings
+from sendell.device.alerts import get_alert_engine
+from sendell.device.events import ProcessEvent, get_process_event_source
+from sendell.device.focus import get_focus_tracker
+from sendell.device.monitor import get_system_monitor
 from sendell.mcp.tools.conversation import respond_to_user as respond_to_user_func
 from sendell.mcp.tools.monitoring import get_active_window as get_active_window_func
+from sendell.mcp.tools.monitoring import get_focus_history as get_focus_history_func
 from sendell.mcp.tools.monitoring import get_system_health as get_system_health_func
 from sendell.mcp.tools.process import list_top_processes as list_top_processes_func
 from sendell.mcp.tools.process import open_application as open_application_func
@@ -25,6 +30,13 @@ from sendell.proactive.identity import AgentIdentity
 from sendell.proactive.proactive_loop import ProactiveLoop
 from sendell.proactive.reminders import Reminder, ReminderManager, ReminderType
 from sendell.proactive.temporal_clock import TemporalClock
+from sendell.projects.attribution import ProjectAttributor
+from sendell.projects.dependency_index import get_dependency_index
+from sendell.projects.git_meta import get_git_reader
+from sendell.projects.repository import get_project_repository
+from sendell.projects.sizer import get_project_sizer
+from sendell.projects.types import Project
+from sendell.projects.watcher import ProjectChanges, get_project_watcher
 from sendell.utils.logger import get_logger
 from sendell.vscode_integration.tools import (
     list_active_projects,
@@ -81,6 +93,39 @@ class SendellAgent:
             self.reminder_manager = ReminderManager.from_dict({"reminders": reminders_data})
             logger.info(f"Loaded {len(reminders_data)} reminders from memory")
 
+        # Shared system monitor (created now so the CPU sampler is warm by the first health check)
+        self.system_monitor = get_system_monitor()
+
+        # Process start/exit events (started together with the proactive loop)
+        self.process_events = get_process_event_source()
+        self.vscode_monitor = None  # Created on first list_vscode_instances call
+
+        # Threshold alerts (evaluated in the background, no LLM call per sample)
+        self.alert_engine = get_alert_engine()
+
+        # Foreground window history (no-op where focus tracking is unsupported)
+        self.focus_tracker = get_focus_tracker()
+        if self.focus_tracker.available:
+            self.focus_tracker.start()
+
+        # Process -> project attribution (fed by discover_projects and the project watcher,
+        # refreshed by the proactive loop)
+        self.project_attributor = ProjectAttributor()
+
+        # Package -> projects index (fed the same way)
+        self.dependency_index = get_dependency_index()
+
+        # File counts / sizes, measured in the background after discovery
+        self.project_sizer = get_project_sizer() if self.settings.projects.project_size_workers else None
+        if self.project_sizer:
+            self.project_sizer.subscribe(self._on_project_sizes)
+
+        # Background project discovery over SENDELL_PROJECT_WATCH_ROOTS (off when unset)
+        self.project_watcher = get_project_watcher()
+        self.project_watcher.subscribe(self._on_project_changes)
+        if self.project_watcher.roots:
+            self.project_watcher.start()
+
         # Initialize proactive loop (don't auto-start)
         self.proactive_loop = ProactiveLoop(
             identity=self.identity,
@@ -88,6 +133,10 @@ class SendellAgent:
             temporal_clock=self.temporal_clock,
             check_interval_seconds=60,  # Check every 60 seconds
             on_reminder_callback=self._on_reminder_triggered,
+            process_events=self.process_events,
+            on_process_exit_callback=self._on_process_exit,
+            alert_engine=self.alert_engine,
+            project_attributor=self.project_attributor,
         )
 
         # Create tools list for LangGraph
@@ -130,6 +179,18 @@ class SendellAgent:
             Respects privacy settings (blocked apps)."""
             return get_active_window_func()
 
+        @tool
+        def get_focus_history(minutes: int = 60) -> dict:
+            """Summarize which apps Daniel has been using over the last N minutes.
+            Returns time per app, percent of tracked time and number of focus switches.
+            Answered from in-memory history, so it is cheap to call.
+            Useful for "what have I been doing for the last hour?".
+
+            Args:
+                minutes: How far back to look (1-1440), defaults to 60
+            """
+            return get_focus_history_func(minutes=minutes)
+
         @tool
         def list_top_processes(n: int = 10, sort_by: str = "memory") -> dict:
             """List top N processes by resource usage (CPU or memory).
@@ -259,7 +320,11 @@ class SendellAgent:
                 }
 
         @tool
-        def discover_projects(path: str) -> dict:
+        def discover_projects(
+            path: str,
+            max_results: Optional[int] = None,
+            time_budget_seconds: Optional[float] = 10.0,
+        ) -> dict:
             """Discover development projects in a directory by scanning for project markers.
 
             Scans recursively (max 3 levels deep) to find projects. Detects:
@@ -270,8 +335,14 @@ class SendellAgent:
             - Java (pom.xml, build.gradle)
             - And more...
 
+            Results stream in as they are found, so large folders answer early:
+            the scan stops after max_results projects or time_budget_seconds and
+            returns what it has (complete=False).
+
             Args:
                 path: Directory path to scan (e.g., "C:/Users/Daniel/projects")
+                max_results: Stop after this many projects (default: no limit)
+                time_budget_seconds: Return partial results after this long (default 10s)
 
             Returns:
                 dict with:
@@ -280,6 +351,13 @@ class SendellAgent:
                 - projects: list of project summaries
                 - by_type: count by project type
                 - scan_duration: seconds
+                - complete: False if stopped by a limit or timeout (ask again with larger limits)
+                - progress: directories visited / still queued when the scan stopped
+                - cache: index hits/misses (rescans of unchanged folders are fast)
+                - saved: projects inserted/updated/unchanged in the project database
+                - ignored: directories skipped per .gitignore / .ignore rule (top 10)
+                - per project git: branch, upstream, ahead/behind, dirty (tracked files)
+                - per project file_count / size_mb once measured in the background
 
             Examples:
                 - "Discover projects in C:/Users/Daniel"
@@ -288,20 +366,57 @@ class SendellAgent:
             """
             try:
                 from pathlib import Path
-                from sendell.projects import ProjectScanner
-
-                scanner = ProjectScanner(max_depth=3, timeout_seconds=30)
-                result = scanner.scan_directory(Path(path))
+                from sendell.projects import ProjectScanner, get_project_index
+
+                progress = None
+                watcher = self.project_watcher
+                if watcher.running and watcher.ready.is_set() and watcher.covers(Path(path)):
+                    # Watched folder: already up to date in memory
+                    result = watcher.scan_result(Path(path))
+                    complete = True
+                else:
+                    scanner = ProjectScanner(max_depth=3, timeout_seconds=30, index=get_project_index())
+                    stream = scanner.iter_scan(
+                        Path(path), max_results=max_results, time_budget_seconds=time_budget_seconds
+                    )
+                    for _ in stream:
+                        pass
+                    result = stream.result()
+                    complete = stream.complete
+                    progress = stream.progress.to_dict()
+                self.project_attributor.add_projects(result.projects_found)
+                self.dependency_index.add_projects(result.projects_found)
+                get_git_reader().read_projects(result.projects_found)
+                if self.project_sizer:
+                    self.project_sizer.fill_known(result.projects_found)
+                saved = get_project_repository().save_scan(result)
+                if self.project_sizer:
+                    self.project_sizer.submit(result.projects_found)
 
                 # Format projects for response
                 projects_list = []
-                for project in result.projects_found:
+                for project in result.projects_found[:max_results]:
                     project_summary = {
                         "name": project.name,
                         "path": str(project.path),
                         "type": project.project_type.value,
                         "config_file": str(project.config_file) if project.config_file else None,
                     }
+                    if project.workspace_root is not None:
+                        project_summary["workspace_root"] = str(project.workspace_root)
+                    if project.git is not None:
+                        project_summary["git"] = {
+                            "branch": project.git.branch or (project.git.head or "")[:12] or None,
+                            "upstream": project.git.upstream,
+                            "ahead": project.git.ahead,
+                            "behind": project.git.behind,
+                            "dirty": project.git.dirty,
+                        }
+
+                    # Sizes are measured in the background (none yet on a folder's first scan)
+                    if project.file_count is not None:
+                        project_summary["file_count"] = project.file_count
+                        project_summary["size_mb"] = round(project.total_size_bytes / (1024 * 1024), 1)
 
                     # Add config details if available
                     if project.config:
@@ -318,6 +433,15 @@ class SendellAgent:
                     "projects": projects_list,
                     "by_type": result.projects_by_type,
                     "scan_duration": round(result.scan_duration_seconds, 2),
+                    "complete": complete,
+                    "progress": progress,
+                    "cache": {
+                        "hits": result.cache_hits,
+                        "misses": result.cache_misses,
+                        "config_hit_rate": round(get_project_index().configs.hit_rate, 3),
+                    },
+                    "saved": saved.to_dict(),
+                    "ignored": dict(list(result.pruned_by_rule.items())[:10]),
                     "errors": result.errors if result.errors else [],
                 }
 
@@ -329,6 +453,135 @@ class SendellAgent:
                     "message": f"Failed to scan directory: {str(e)}"
                 }
 
+        @tool
+        def get_project_resource_usage() -> dict:
+            """Show how much CPU, memory and disk I/O each discovered project is using.
+
+            Matches running processes to projects found by discover_projects
+            (by working directory or by project paths in the command line)
+            and sums their usage per project. Each call also stores a
+            snapshot in the project metrics history.
+
+            Returns:
+                dict with:
+                - success: bool
+                - projects_tracked: int (projects known from discover_projects)
+                - active_projects: int (projects with running processes)
+                - usage: list sorted by memory, each with:
+                    - project, path, process_count, pids
+                    - cpu_percent, memory_mb
+                    - io_read_mb, io_write_mb (since the previous measurement)
+                    - uptime_seconds (oldest process)
+
+            Examples:
+                - "Which project is eating my RAM?"
+                - "How heavy is my dev server?"
+                - "What projects are running right now?"
+            """
+            try:
+                tracked = len(self.project_attributor.projects)
+                if tracked == 0:
+                    return {
+                        "success": True,
+                        "projects_tracked": 0,
+                        "active_projects": 0,
+                        "usage": [],
+                        "message": "No projects known yet. Run discover_projects first.",
+                    }
+
+                usage = self.project_attributor.refresh(record=True)
+                usage_list = sorted(
+                    (project_usage.to_dict() for project_usage in usage.values()),
+                    key=lambda entry: entry["memory_mb"],
+                    reverse=True,
+                )
+
+                return {
+                    "success": True,
+                    "projects_tracked": tracked,
+                    "active_projects": len(usage_list),
+                    "usage": usage_list,
+                    "message": f"{len(usage_list)} of {tracked} project(s) have running processes",
+                }
+
+            except Exception as e:
+                logger.error(f"Failed to get project resource usage: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "message": f"Failed to attribute processes: {str(e)}"
+                }
+
+        @tool
+        def find_dependents(
+            package: str,
+            version_constraint: Optional[str] = None,
+            ecosystem: Optional[str] = None,
+            include_dev: bool = True,
+            include_transitive: bool = True,
+        ) -> dict:
+            """Find which discovered projects depend on a package, optionally filtered by version.
+
+            Answers from an index of the dependencies declared in every project
+            found by discover_projects (package.json, pyproject.toml, Cargo.toml,
+            go.mod, ...), without rescanning. Versions pinned by lockfiles
+            (package-lock.json, yarn.lock, poetry.lock, Cargo.lock, go.sum) are
+            used when present, including packages only pulled in transitively.
+
+            Args:
+                package: Package name (e.g., "lodash", "pydantic", "serde")
+                version_constraint: Only projects whose locked version (else the
+                    start of the declared range) is inside this constraint
+                    (e.g., "<4.17.21", "<2", ">=1,<2")
+                ecosystem: npm, pypi, cargo, go, maven, rubygems, composer or nuget
+                    (default: all)
+                include_dev: Include dev dependencies (default True)
+                include_transitive: Include packages only found in lockfiles (default True)
+
+            Returns:
+                dict with:
+                - success: bool
+                - package: str
+                - dependents: int
+                - projects: list of {project, path, ecosystem, package, spec, resolved, dev, direct}
+                - projects_indexed: how many projects the index knows
+
+            Examples:
+                - "Which of my projects depend on lodash < 4.17.21?"
+                - "Who still uses pydantic v1?" (package="pydantic", version_constraint="<2")
+                - "Where do I use tokio?"
+            """
+            try:
+                uses = self.dependency_index.find(
+                    package,
+                    ecosystem=ecosystem,
+                    version_constraint=version_constraint,
+                    include_dev=include_dev,
+                    include_transitive=include_transitive,
+                )
+                indexed = self.dependency_index.project_count
+
+                result = {
+                    "success": True,
+                    "package": package,
+                    "dependents": len(uses),
+                    "projects": [use.to_dict() for use in uses],
+                    "projects_indexed": indexed,
+                }
+                if indexed == 0:
+                    result["message"] = "No projects known yet. Run discover_projects first."
+                return result
+
+            except ValueError as e:
+                return {"success": False, "error": str(e), "message": str(e)}
+            except Exception as e:
+                logger.error(f"Failed to find dependents: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "message": f"Failed to query dependencies: {str(e)}"
+                }
+
         @tool
         def list_vscode_instances() -> dict:
             """List all running VS Code instances with their open projects and terminals.
@@ -372,7 +625,12 @@ class SendellAgent:
             try:
                 from sendell.vscode import VSCodeMonitor
 
-                monitor = VSCodeMonitor()
+                # Long-lived monitor so terminals stay tracked between calls
+                if self.vscode_monitor is None:
+                    self.vscode_monitor = VSCodeMonitor()
+                    self.vscode_monitor.attach_event_source(self.process_events)
+
+                monitor = self.vscode_monitor
                 instances = monitor.find_vscode_instances()
 
                 # Format instances for response
@@ -418,6 +676,9 @@ class SendellAgent:
                     "instances_found": len(instances),
                     "total_terminals": total_terminals,
                     "instances": instances_list,
+                    "recently_exited_terminals": [
+                        event.to_dict() for event in list(monitor.terminal_exits)[-5:]
+                    ],
                     "message": f"Found {len(instances)} VS Code instance(s) with {total_terminals} terminal(s)",
                 }
 
@@ -432,12 +693,15 @@ class SendellAgent:
         return [
             get_system_health,
             get_active_window,
+            get_focus_history,
             list_top_processes,
             open_application,
             respond_to_user,
             show_brain,
             add_reminder,
             discover_projects,
+            get_project_resource_usage,
+            find_dependents,
             list_vscode_instances,
             # VS Code Integration tools (via WebSocket)
             list_active_projects,
@@ -689,6 +953,40 @@ class SendellAgent:
 
         return round(importance, 2)
 
+    def _on_project_changes(self, changes: ProjectChanges) -> None:
+        """
+        Callback from the project watcher thread.
+
+        Args:
+            changes: Projects added, updated or removed under the watched roots
+        """
+        self.project_attributor.add_projects(changes.added + changes.updated)
+        self.project_attributor.remove_projects(changes.removed)
+        self.dependency_index.add_projects(changes.added + changes.updated)
+        self.dependency_index.remove_projects(changes.removed)
+        get_git_reader().read_projects(changes.added + changes.updated)
+
+        repository = get_project_repository()
+        repository.save_projects(changes.added + changes.updated)
+        repository.remove_projects(changes.removed)
+        logger.debug(f"Project changes: {changes.to_dict()}")
+
+        if self.project_sizer:
+            self.project_sizer.submit(changes.added + changes.updated)
+
+    def _on_project_sizes(self, projects: List[Project]) -> None:
+        """
+        Callback from the project sizer thread.
+
+        Args:
+            projects: Projects whose file_count / total_size_bytes were just measured
+        """
+        get_project_repository().save_projects(projects)
+        logger.debug(
+            f"Measured {len(projects)} projects: "
+            f"{[(project.name, project.file_count, project.total_size_bytes) for project in projects]}"
+        )
+
     async def _on_reminder_triggered(self, reminder: Reminder, results: List[Dict]) -> None:
         """
         Callback when a reminder is triggered by the proactive loop.
@@ -707,6 +1005,19 @@ class SendellAgent:
             if not result["success"]:
                 logger.warning(f"Reminder action failed: {result['action']} - {result.get('error')}")
 
+    async def _on_process_exit(self, event: ProcessEvent) -> None:
+        """
+        Callback when a watched process (e.g. a VS Code terminal) exits.
+
+        The exit is logged against the project it was running in.
+
+        Args:
+            event: The EXITED process event
+        """
+        project = await asyncio.to_thread(self.project_attributor.record_process_exit, event)
+        if project:
+            logger.info(f"{event.name} (PID {event.pid}) exited in project {project.name}")
+
     def get_proactive_status(self) -> dict:
         """
         Get status of proactive system.
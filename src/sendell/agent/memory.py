@@ -6,18 +6,106 @@ Manages:
 - Learned facts about Daniel
 - User preferences
 - Session memories
+
+get_memory() returns the backend set in settings.memory.memory_backend:
+SQLite tables (memory_sqlite.SQLiteMemory, the default) or the JSON
+memory files handled by SendellMemory below.
+
+JSON layout (memory_file = data/sendell_memory.json):
+- memory_file is a small header: timestamps, section counts and the
+  conversation archive bounds (enough for get_memory_summary)
+- Each section (facts, preferences, sessions, reminders, agent_identity,
+  personal_memory) is its own file in data/sendell_memory/, read on first
+  access
+- Conversations are archived in pages of CONVERSATION_PAGE_SIZE under
+  data/sendell_memory/conversations/, read only for the range requested
+- A single-document memory file from older versions is split on load
+
+Changes are written in batches: save() marks the memory dirty and a
+background timer writes the changed sections once after
+SENDELL_MEMORY_FLUSH_DELAY_SECONDS, as compact JSON through a temp file
+and rename. flush() writes pending changes right away; get_memory()
+registers close() of the global instance to run at interpreter exit.
 """
 
+import atexit
 import json
+import os
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
-from sendell.config import get_settings
+from sendell.config import MemoryBackend, get_settings
 from sendell.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from sendell.agent.memory_sqlite import SQLiteMemory
+
 logger = get_logger(__name__)
 
+# JSON memory file (also imported by the SQLite backend on first start)
+DEFAULT_MEMORY_FILE = Path("data/sendell_memory.json")
+
+# Conversations kept (oldest are dropped)
+MAX_CONVERSATIONS = 50
+
+# Conversations per archive page file
+CONVERSATION_PAGE_SIZE = 10
+
+# Sections stored in their own files (loaded on first access)
+SECTIONS = ("agent_identity", "reminders", "personal_memory", "facts", "preferences", "sessions")
+
+# Header "format" of the sectioned layout (older files have no header)
+MEMORY_FORMAT = 2
+
+
+def empty_memory() -> Dict[str, Any]:
+    """Create empty memory structure"""
+    return {
+        # Agent Identity (NEW in v0.2)
+        "agent_identity": None,  # Will be initialized on first run
+
+        # Reminders (NEW in v0.2)
+        "reminders": [],  # Personal reminders
+
+        # Personal Memory (NEW in v0.2 - placeholder for future)
+        "personal_memory": {
+            "habits": [],
+            "routines": [],
+            "personal_projects": [],
+            "goals": [],
+            "patterns": [],
+        },
+
+        # Existing v0.1 structure
+        "facts": [],  # Things learned about Daniel
+        "preferences": {
+            "favorite_apps": [],
+            "work_hours": None,
+            "notification_style": "normal",
+        },
+        "conversations": [],  # Historical conversations
+        "sessions": [],  # Session metadata
+        "created_at": datetime.now().isoformat(),
+        "last_updated": datetime.now().isoformat(),
+    }
+
+
+def read_memory_file(path: Path) -> Dict[str, Any]:
+    """
+    Full memory (every section and conversation) from a JSON memory file.
+
+    Accepts the sectioned layout (header file) and single-document files
+    (older versions, export_memory()).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format") == MEMORY_FORMAT:
+        return SendellMemory(path, flush_delay=0).to_dict()
+    return data
+
 
 class SendellMemory:
     """
@@ -30,79 +118,259 @@ class SendellMemory:
     - Sessions: Historical sessions
     """
 
-    def __init__(self, memory_file: Optional[Path] = None):
-        """Initialize memory system"""
+    def __init__(self, memory_file: Optional[Path] = None, flush_delay: Optional[float] = None):
+        """
+        Initialize memory system
+
+        Only the header is read here; sections and conversation pages are
+        read when first used.
+
+        Args:
+            memory_file: Header file (defaults to data/sendell_memory.json);
+                sections go in a directory next to it named after its stem
+            flush_delay: Seconds to collect changes before writing
+                (defaults to MemoryConfig.memory_flush_delay_seconds, 0 = write on every save)
+        """
         settings = get_settings()
 
         if memory_file is None:
             # Default memory location
-            self.memory_file = Path("data/sendell_memory.json")
+            self.memory_file = DEFAULT_MEMORY_FILE
         else:
             self.memory_file = memory_file
+        self.sections_dir = self.memory_file.parent / self.memory_file.stem
+        self.pages_dir = self.sections_dir / "conversations"
 
         # Ensure directory exists
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load or initialize memory
-        self.memory = self._load_memory()
+        # Write coalescing
+        self.flush_delay = (
+            settings.memory.memory_flush_delay_seconds if flush_delay is None else flush_delay
+        )
+        self.writes = 0  # Flushes that wrote to disk (for diagnostics)
+        self._dirty: Set[str] = set()  # Section names
+        self._dirty_pages: Set[int] = set()
+        self._deleted_pages: Set[int] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()  # Guards memory contents and pending changes
+        self._write_lock = threading.Lock()  # One writer at a time, in order
+
+        # Loaded lazily
+        self._sections: Dict[str, Any] = {}
+        self._pages: Dict[int, List[Dict]] = {}
+
+        # Load or initialize the header
+        self._header = self._load_header()
 
         logger.info(f"Memory system initialized: {self.memory_file}")
 
-    def _load_memory(self) -> Dict[str, Any]:
-        """Load memory from disk"""
-        if self.memory_file.exists():
-            try:
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info("Memory loaded from disk")
-                    return data
-            except Exception as e:
-                logger.error(f"Failed to load memory: {e}")
-                return self._create_empty_memory()
-        else:
+    # ==================== STORAGE ====================
+
+    def _load_header(self) -> Dict[str, Any]:
+        """Load the header from disk (splitting a single-document file)"""
+        if not self.memory_file.exists():
             logger.info("No existing memory, creating new")
-            return self._create_empty_memory()
+            return self._new_header(empty_memory())
 
-    def _create_empty_memory(self) -> Dict[str, Any]:
-        """Create empty memory structure"""
+        try:
+            with open(self.memory_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load memory: {e}")
+            return self._new_header(empty_memory())
+
+        if data.get("format") == MEMORY_FORMAT:
+            logger.info("Memory loaded from disk")
+            return data
+
+        # Older single-document file: split it once, then only the header is read at startup
+        self._header = self._new_header(data)
+        self._replace(data)
+        self._header["last_updated"] = data.get("last_updated") or self._header["last_updated"]
+        self.flush()
+        logger.info("Memory migrated to sectioned files")
+        return self._header
+
+    @staticmethod
+    def _new_header(data: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now().isoformat()
         return {
-            # Agent Identity (NEW in v0.2)
-            "agent_identity": None,  # Will be initialized on first run
-
-            # Reminders (NEW in v0.2)
-            "reminders": [],  # Personal reminders
-
-            # Personal Memory (NEW in v0.2 - placeholder for future)
-            "personal_memory": {
-                "habits": [],
-                "routines": [],
-                "personal_projects": [],
-                "goals": [],
-                "patterns": [],
-            },
-
-            # Existing v0.1 structure
-            "facts": [],  # Things learned about Daniel
-            "preferences": {
-                "favorite_apps": [],
-                "work_hours": None,
-                "notification_style": "normal",
-            },
-            "conversations": [],  # Historical conversations
-            "sessions": [],  # Session metadata
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "format": MEMORY_FORMAT,
+            "created_at": data.get("created_at") or now,
+            "last_updated": data.get("last_updated") or now,
+            "counts": {name: len(data.get(name) or []) for name in ("facts", "preferences", "sessions")},
+            "conversations": {"first": 0, "next": 0, "page_size": CONVERSATION_PAGE_SIZE},
         }
 
-    def save(self) -> None:
-        """Save memory to disk"""
+    def _read_json(self, path: Path, default: Any) -> Any:
         try:
-            self.memory["last_updated"] = datetime.now().isoformat()
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=2, ensure_ascii=False)
-            logger.debug("Memory saved to disk")
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
         except Exception as e:
-            logger.error(f"Failed to save memory: {e}")
+            logger.error(f"Failed to load memory file {path}: {e}")
+            return default
+
+    def _section(self, name: str) -> Any:
+        """A section's contents, read from disk on first access (caller holds _lock)"""
+        if name not in self._sections:
+            self._sections[name] = self._read_json(self.sections_dir / f"{name}.json", empty_memory()[name])
+        return self._sections[name]
+
+    def _page_path(self, page: int) -> Path:
+        return self.pages_dir / f"{page:06d}.json"
+
+    def _page(self, page: int) -> List[Dict]:
+        """Conversations of one archive page, read on first access (caller holds _lock)"""
+        if page not in self._pages:
+            self._pages[page] = self._read_json(self._page_path(page), [])
+        return self._pages[page]
+
+    def _replace(self, data: Dict[str, Any]) -> None:
+        """Replace all memory with a single-document dict (marks everything dirty)"""
+        with self._lock:
+            defaults = empty_memory()
+            self._sections = {name: data.get(name, defaults[name]) for name in SECTIONS}
+
+            # New pages are numbered after the old ones, which are deleted on flush
+            bounds = self._header["conversations"]
+            page_size = bounds["page_size"]
+            self._deleted_pages.update(range(bounds["first"] // page_size, -(-bounds["next"] // page_size)))
+            first = -(-bounds["next"] // page_size) * page_size
+            conversations = (data.get("conversations") or [])[-MAX_CONVERSATIONS:]
+
+            self._pages = {}
+            for i in range(0, len(conversations), page_size):
+                self._pages[(first + i) // page_size] = conversations[i : i + page_size]
+            self._dirty_pages.update(self._pages)
+            self._header["conversations"] = {"first": first, "next": first + len(conversations), "page_size": page_size}
+            self._header["created_at"] = data.get("created_at") or self._header["created_at"]
+            self._mark(*SECTIONS)
+
+    def _mark(self, *sections: str) -> None:
+        """Record changed sections and refresh the header (caller holds _lock)"""
+        self._dirty.update(sections)
+        self._header["last_updated"] = datetime.now().isoformat()
+        for name in ("facts", "preferences", "sessions"):
+            if name in self._sections:
+                self._header["counts"][name] = len(self._sections[name])
+
+    def save(self) -> None:
+        """
+        Mark memory as changed; it's written by the next flush (within flush_delay).
+
+        Every loaded section is marked, so changes made to returned lists and
+        dicts are saved too.
+        """
+        with self._lock:
+            self._mark(*self._sections)
+        self._save()
+
+    def _save(self) -> None:
+        """Write marked changes now (flush_delay 0) or schedule a flush"""
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+
+        with self._lock:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer unless one is pending (caller holds _lock)"""
+        if self._timer is not None or self.flush_delay <= 0:
+            return  # A scheduled flush will include this change
+        self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to disk now.
+
+        Only changed sections and conversation pages are written, then the
+        header.
+
+        Returns:
+            True if files were written, False if nothing was pending or the write failed
+        """
+        with self._write_lock:
+            with self._lock:
+                if not (self._dirty or self._dirty_pages or self._deleted_pages):
+                    return False
+                sections, self._dirty = self._dirty, set()
+                pages, self._dirty_pages = self._dirty_pages, set()
+                deleted, self._deleted_pages = self._deleted_pages, set()
+
+                files = [(self.sections_dir / f"{name}.json", self._sections[name]) for name in sections]
+                written_pages = {page for page in pages if page in self._pages}
+                deleted -= written_pages
+                files += [(self._page_path(page), self._pages[page]) for page in written_pages]
+                files.append((self.memory_file, self._header))
+                files = [
+                    (path, json.dumps(content, ensure_ascii=False, separators=(",", ":")))
+                    for path, content in files
+                ]
+
+            try:
+                for path, data in files:
+                    self._write_atomic(path, data)
+                for page in deleted:
+                    try:
+                        os.unlink(self._page_path(page))
+                    except FileNotFoundError:
+                        pass
+            except Exception as e:
+                # Keep the changes pending
+                with self._lock:
+                    self._dirty |= sections
+                    self._dirty_pages |= pages
+                    self._deleted_pages |= deleted
+                    self._schedule_flush()
+                logger.error(f"Failed to save memory: {e}")
+                return False
+
+            with self._lock:
+                # Written pages other than the newest are only read again on request
+                newest = (self._header["conversations"]["next"] - 1) // self._header["conversations"]["page_size"]
+                for page in list(self._pages):
+                    if page != newest and page not in self._dirty_pages:
+                        del self._pages[page]
+
+        self.writes += 1
+        logger.debug("Memory saved to disk")
+        return True
+
+    def _write_atomic(self, path: Path, data: str) -> None:
+        """Write to a temp file next to path, then rename it over the old one"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def close(self) -> None:
+        """Cancel the pending timer and write pending changes (call on shutdown)"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
 
     # ==================== FACTS ====================
 
@@ -120,13 +388,16 @@ class SendellMemory:
             "learned_at": datetime.now().isoformat(),
         }
 
-        self.memory["facts"].append(fact_entry)
-        self.save()
+        with self._lock:
+            self._section("facts").append(fact_entry)
+            self._mark("facts")
+        self._save()
         logger.info(f"Added fact: {fact}")
 
     def get_facts(self, category: Optional[str] = None) -> List[Dict]:
         """Get all facts, optionally filtered by category"""
-        facts = self.memory["facts"]
+        with self._lock:
+            facts = self._section("facts")
 
         if category:
             facts = [f for f in facts if f.get("category") == category]
@@ -136,8 +407,10 @@ class SendellMemory:
     def remove_fact(self, index: int) -> bool:
         """Remove a fact by index"""
         try:
-            removed = self.memory["facts"].pop(index)
-            self.save()
+            with self._lock:
+                removed = self._section("facts").pop(index)
+                self._mark("facts")
+            self._save()
             logger.info(f"Removed fact: {removed['fact']}")
             return True
         except IndexError:
@@ -146,26 +419,32 @@ class SendellMemory:
 
     def clear_facts(self) -> None:
         """Clear all facts"""
-        count = len(self.memory["facts"])
-        self.memory["facts"] = []
-        self.save()
+        with self._lock:
+            count = len(self._section("facts"))
+            self._sections["facts"] = []
+            self._mark("facts")
+        self._save()
         logger.info(f"Cleared {count} facts")
 
     # ==================== PREFERENCES ====================
 
     def set_preference(self, key: str, value: Any) -> None:
         """Set a user preference"""
-        self.memory["preferences"][key] = value
-        self.save()
+        with self._lock:
+            self._section("preferences")[key] = value
+            self._mark("preferences")
+        self._save()
         logger.info(f"Set preference: {key} = {value}")
 
     def get_preference(self, key: str, default: Any = None) -> Any:
         """Get a user preference"""
-        return self.memory["preferences"].get(key, default)
+        with self._lock:
+            return self._section("preferences").get(key, default)
 
     def get_all_preferences(self) -> Dict[str, Any]:
         """Get all preferences"""
-        return self.memory["preferences"]
+        with self._lock:
+            return self._section("preferences")
 
     # ==================== CONVERSATIONS ====================
 
@@ -173,6 +452,8 @@ class SendellMemory:
         """
         Save a conversation.
 
+        Appends to the newest archive page; older pages aren't read.
+
         Args:
             messages: List of conversation messages
             summary: Optional summary of the conversation
@@ -184,23 +465,62 @@ class SendellMemory:
             "message_count": len(messages),
         }
 
-        self.memory["conversations"].append(conv_entry)
-
-        # Keep only last 50 conversations
-        if len(self.memory["conversations"]) > 50:
-            self.memory["conversations"] = self.memory["conversations"][-50:]
+        with self._lock:
+            bounds = self._header["conversations"]
+            page_size = bounds["page_size"]
+            page = bounds["next"] // page_size
+            self._page(page).append(conv_entry)
+            self._dirty_pages.add(page)
+            bounds["next"] += 1
+
+            # Keep only the last MAX_CONVERSATIONS conversations (whole pages are dropped
+            # once empty; get_conversations skips the rest)
+            if bounds["next"] - bounds["first"] > MAX_CONVERSATIONS:
+                first = bounds["next"] - MAX_CONVERSATIONS
+                for dropped in range(bounds["first"] // page_size, first // page_size):
+                    self._pages.pop(dropped, None)
+                    self._deleted_pages.add(dropped)
+                bounds["first"] = first
+            self._mark()
+
+        self._save()
+
+    def get_conversations(self, limit: int = 10, offset: int = 0) -> List[Dict]:
+        """
+        Get recent conversations, oldest first.
 
-        self.save()
+        Only the archive pages holding the requested range are read.
 
-    def get_conversations(self, limit: int = 10) -> List[Dict]:
-        """Get recent conversations"""
-        return self.memory["conversations"][-limit:]
+        Args:
+            limit: Conversations to return
+            offset: Newest conversations to skip (for paging back through history)
+        """
+        with self._lock:
+            bounds = self._header["conversations"]
+            page_size = bounds["page_size"]
+            end = max(bounds["first"], bounds["next"] - offset)
+            start = max(bounds["first"], end - limit)
+
+            conversations = []
+            for position in range(start, end):
+                page = self._page(position // page_size)
+                index = position % page_size
+                if index < len(page):
+                    conversations.append(page[index])
+            return conversations
 
     def clear_conversations(self) -> None:
         """Clear all conversation history"""
-        count = len(self.memory["conversations"])
-        self.memory["conversations"] = []
-        self.save()
+        with self._lock:
+            bounds = self._header["conversations"]
+            count = bounds["next"] - bounds["first"]
+            # Continue numbering on a fresh page
+            next_page = -(-bounds["next"] // bounds["page_size"])
+            self._deleted_pages.update(range(bounds["first"] // bounds["page_size"], next_page))
+            self._pages = {}
+            bounds["first"] = bounds["next"] = next_page * bounds["page_size"]
+            self._mark()
+        self._save()
         logger.info(f"Cleared {count} conversations")
 
     # ==================== SESSIONS ====================
@@ -216,55 +536,72 @@ class SendellMemory:
             "interactions": 0,
         }
 
-        self.memory["sessions"].append(session_entry)
-        self.save()
+        with self._lock:
+            self._section("sessions").append(session_entry)
+            self._mark("sessions")
+        self._save()
 
         logger.info(f"Started session: {session_id}")
         return session_id
 
     def end_session(self, session_id: str, interactions: int) -> None:
         """End a session"""
-        for session in reversed(self.memory["sessions"]):
-            if session["session_id"] == session_id:
-                session["ended_at"] = datetime.now().isoformat()
-                session["interactions"] = interactions
-                self.save()
-                logger.info(f"Ended session: {session_id}")
-                break
+        with self._lock:
+            for session in reversed(self._section("sessions")):
+                if session["session_id"] == session_id:
+                    session["ended_at"] = datetime.now().isoformat()
+                    session["interactions"] = interactions
+                    self._mark("sessions")
+                    break
+            else:
+                return
+        self._save()
+        logger.info(f"Ended session: {session_id}")
 
     def get_sessions(self, limit: int = 10) -> List[Dict]:
         """Get recent sessions"""
-        return self.memory["sessions"][-limit:]
+        with self._lock:
+            return self._section("sessions")[-limit:]
 
     # ==================== UTILITY ====================
 
     def get_memory_summary(self) -> Dict[str, Any]:
-        """Get summary of memory contents"""
-        return {
-            "total_facts": len(self.memory["facts"]),
-            "total_conversations": len(self.memory["conversations"]),
-            "total_sessions": len(self.memory["sessions"]),
-            "preferences_count": len(self.memory["preferences"]),
-            "created_at": self.memory["created_at"],
-            "last_updated": self.memory["last_updated"],
-            "memory_file": str(self.memory_file),
-        }
+        """Get summary of memory contents (from the header; no section is read)"""
+        with self._lock:
+            header = self._header
+            return {
+                "total_facts": header["counts"]["facts"],
+                "total_conversations": header["conversations"]["next"] - header["conversations"]["first"],
+                "total_sessions": header["counts"]["sessions"],
+                "preferences_count": header["counts"]["preferences"],
+                "created_at": header["created_at"],
+                "last_updated": header["last_updated"],
+                "memory_file": str(self.memory_file),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """All memory as one document (reads every section and conversation page)"""
+        with self._lock:
+            data = {name: self._section(name) for name in SECTIONS}
+            data["conversations"] = self.get_conversations(limit=MAX_CONVERSATIONS)
+            data["created_at"] = self._header["created_at"]
+            data["last_updated"] = self._header["last_updated"]
+            return data
 
     def export_memory(self, export_path: Path) -> None:
-        """Export memory to a file"""
+        """Export memory to a file (single document)"""
         try:
             with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=2, ensure_ascii=False)
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
             logger.info(f"Memory exported to: {export_path}")
         except Exception as e:
             logger.error(f"Failed to export memory: {e}")
 
     def import_memory(self, import_path: Path) -> bool:
-        """Import memory from a file"""
+        """Import memory from a file (an export or another memory file)"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                self.memory = json.load(f)
-            self.save()
+            self._replace(read_memory_file(import_path))
+            self._save()
             logger.info(f"Memory imported from: {import_path}")
             return True
         except Exception as e:
@@ -275,46 +612,56 @@ class SendellMemory:
 
     def get_agent_identity(self) -> Optional[Dict]:
         """Get agent identity data"""
-        return self.memory.get("agent_identity")
+        with self._lock:
+            return self._section("agent_identity")
 
     def set_agent_identity(self, identity_data: Dict) -> None:
         """Save agent identity data"""
-        self.memory["agent_identity"] = identity_data
-        self.save()
+        with self._lock:
+            self._sections["agent_identity"] = identity_data
+            self._mark("agent_identity")
+        self._save()
         logger.info("Agent identity saved")
 
     def has_agent_identity(self) -> bool:
         """Check if agent has been initialized (has birth_date)"""
-        return self.memory.get("agent_identity") is not None
+        return self.get_agent_identity() is not None
 
     # ==================== REMINDERS (NEW v0.2) ====================
 
     def get_reminders(self) -> List[Dict]:
         """Get all reminders"""
-        return self.memory.get("reminders", [])
+        with self._lock:
+            return self._section("reminders")
 
     def set_reminders(self, reminders_data: List[Dict]) -> None:
         """Save all reminders"""
-        self.memory["reminders"] = reminders_data
-        self.save()
+        with self._lock:
+            self._sections["reminders"] = reminders_data
+            self._mark("reminders")
+        self._save()
         logger.debug(f"Saved {len(reminders_data)} reminders")
 
     def add_reminder(self, reminder_data: Dict) -> None:
         """Add a single reminder"""
-        if "reminders" not in self.memory:
-            self.memory["reminders"] = []
-        self.memory["reminders"].append(reminder_data)
-        self.save()
+        with self._lock:
+            self._section("reminders").append(reminder_data)
+            self._mark("reminders")
+        self._save()
         logger.info(f"Added reminder: {reminder_data.get('content')}")
 
     def delete_reminder(self, reminder_id: str) -> bool:
         """Delete a reminder by ID"""
-        reminders = self.memory.get("reminders", [])
-        original_count = len(reminders)
-        self.memory["reminders"] = [r for r in reminders if r.get("reminder_id") != reminder_id]
-
-        if len(self.memory["reminders"]) < original_count:
-            self.save()
+        with self._lock:
+            reminders = self._section("reminders")
+            original_count = len(reminders)
+            self._sections["reminders"] = [r for r in reminders if r.get("reminder_id") != reminder_id]
+            deleted = len(self._sections["reminders"]) < original_count
+            if deleted:
+                self._mark("reminders")
+
+        if deleted:
+            self._save()
             logger.info(f"Deleted reminder: {reminder_id}")
             return True
 
@@ -322,12 +669,27 @@ class SendellMemory:
 
 
 # Global memory instance
-_memory: Optional[SendellMemory] = None
+_memory: Optional["SendellMemory | SQLiteMemory"] = None
 
 
-def get_memory() -> SendellMemory:
-    """Get or create global memory instance"""
+def get_memory() -> "SendellMemory | SQLiteMemory":
+    """
+    Get or create global memory instance.
+
+    The backend follows settings.memory.memory_backend: SQLite tables in
+    db_path (default), or the JSON memory files. Its close() runs at
+    interpreter exit; other instances must be closed by their owner.
+    """
     global _memory
     if _memory is None:
-        _memory = SendellMemory()
+        backend = get_settings().memory.memory_backend
+        if backend == MemoryBackend.JSON:
+            _memory = SendellMemory()
+        else:
+            if backend != MemoryBackend.SQLITE:
+                logger.warning(f"Memory backend {backend.value} is not implemented yet, using SQLite")
+            from sendell.agent.memory_sqlite import SQLiteMemory
+
+            _memory = SQLiteMemory()
+        atexit.register(_memory.close)
     return _memory
@@ -0,0 +1,107 @@
+"""
+SQLAlchemy Models for Agent Memory
+
+6 tables backing SQLiteMemory (one row per item, so changes are single
+inserts / updates):
+1. memory_facts - Things learned about Daniel
+2. memory_preferences - User preferences (key -> JSON value)
+3. memory_conversations - Saved conversations (messages as JSON)
+4. memory_sessions - Session start/end metadata
+5. memory_reminders - Reminders (ReminderManager dicts as JSON)
+6. memory_meta - Everything else: agent identity, personal memory, timestamps
+
+Timestamps are kept as the ISO strings the JSON memory file used, so
+imported and exported memory round-trips unchanged.
+"""
+
+from sqlalchemy import Column, Index, Integer, String, Text
+from sqlalchemy.ext.declarative import declarative_base
+
+MemoryBase = declarative_base()
+
+
+class FactModel(MemoryBase):
+    """One learned fact"""
+
+    __tablename__ = "memory_facts"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Insertion order
+    fact = Column(Text, nullable=False)
+    category = Column(String(50), nullable=False, default="general")
+    learned_at = Column(String(32), nullable=False)
+
+    __table_args__ = (Index("idx_memory_facts_category", "category"),)
+
+    def __repr__(self):
+        return f"<Fact(id={self.id}, category={self.category})>"
+
+
+class PreferenceModel(MemoryBase):
+    """One user preference"""
+
+    __tablename__ = "memory_preferences"
+
+    key = Column(String(255), primary_key=True)
+    value_json = Column(Text, nullable=False)
+
+    def __repr__(self):
+        return f"<Preference(key='{self.key}')>"
+
+
+class ConversationModel(MemoryBase):
+    """One saved conversation"""
+
+    __tablename__ = "memory_conversations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Insertion order
+    timestamp = Column(String(32), nullable=False)
+    summary = Column(Text, nullable=False, default="")
+    message_count = Column(Integer, nullable=False, default=0)
+    messages_json = Column(Text, nullable=False)  # Only read when a conversation is requested
+
+    def __repr__(self):
+        return f"<Conversation(id={self.id}, messages={self.message_count})>"
+
+
+class SessionModel(MemoryBase):
+    """One agent session"""
+
+    __tablename__ = "memory_sessions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Insertion order
+    session_id = Column(String(32), nullable=False)  # YYYYmmdd_HHMMSS (not unique: same-second starts)
+    started_at = Column(String(32), nullable=False)
+    ended_at = Column(String(32), nullable=True)
+    interactions = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (Index("idx_memory_sessions_session_id", "session_id"),)
+
+    def __repr__(self):
+        return f"<Session(session_id='{self.session_id}')>"
+
+
+class ReminderModel(MemoryBase):
+    """One reminder"""
+
+    __tablename__ = "memory_reminders"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Insertion order
+    reminder_id = Column(String(64), nullable=True)
+    data_json = Column(Text, nullable=False)  # Reminder.to_dict()
+
+    __table_args__ = (Index("idx_memory_reminders_reminder_id", "reminder_id"),)
+
+    def __repr__(self):
+        return f"<Reminder(reminder_id='{self.reminder_id}')>"
+
+
+class MemoryMetaModel(MemoryBase):
+    """Single-value memory entries (agent_identity, personal_memory, created_at, ...)"""
+
+    __tablename__ = "memory_meta"
+
+    key = Column(String(64), primary_key=True)
+    value_json = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<MemoryMeta(key='{self.key}')>"
@@ -0,0 +1,462 @@
+"""
+SQLite memory backend for Sendell.
+
+Same API as SendellMemory, stored in the tables of memory_models inside
+MemoryConfig.db_path:
+- Every change is a row-level insert / update / delete, so adding a fact
+  costs the same however much history there is
+- Reads select only what they return (conversation messages are loaded
+  only for the conversations asked for)
+- WAL journal (shared engine setup with the project database)
+- An existing JSON memory file is imported on first start
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.engine import Engine
+
+from sendell.agent.memory import DEFAULT_MEMORY_FILE, MAX_CONVERSATIONS, empty_memory, read_memory_file
+from sendell.agent.memory_models import (
+    ConversationModel,
+    FactModel,
+    MemoryBase,
+    MemoryMetaModel,
+    PreferenceModel,
+    ReminderModel,
+    SessionModel,
+)
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# memory_meta keys holding whole sections of the JSON layout
+META_SECTIONS = ("agent_identity", "personal_memory", "created_at", "last_updated")
+
+
+class SQLiteMemory:
+    """
+    Sendell's memory system on SQLite.
+
+    Drop-in replacement for SendellMemory (see get_memory()).
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, import_file: Optional[Path] = DEFAULT_MEMORY_FILE):
+        """
+        Initialize memory tables
+
+        Args:
+            engine: SQLite engine (defaults to the shared engine for MemoryConfig.db_path)
+            import_file: JSON memory file imported when the tables are new (None = don't import)
+        """
+        if engine is None:
+            from sendell.projects.database import get_engine
+
+            engine = get_engine()
+
+        self.engine = engine
+        MemoryBase.metadata.create_all(engine)
+
+        if self._get_meta("created_at") is None:
+            if import_file is not None and Path(import_file).exists():
+                self.import_memory(Path(import_file))
+            else:
+                self._reset(empty_memory())
+                logger.info("No existing memory, creating new")
+
+        logger.info(f"Memory system initialized: {self.engine.url.database}")
+
+    # ==================== STORAGE ====================
+
+    def _get_meta(self, key: str, default: Any = None) -> Any:
+        with self.engine.connect() as conn:
+            value = conn.execute(
+                select(MemoryMetaModel.value_json).where(MemoryMetaModel.key == key)
+            ).scalar_one_or_none()
+        return default if value is None else json.loads(value)
+
+    def _set_meta(self, conn, key: str, value: Any) -> None:
+        conn.execute(delete(MemoryMetaModel).where(MemoryMetaModel.key == key))
+        conn.execute(insert(MemoryMetaModel).values(key=key, value_json=json.dumps(value, ensure_ascii=False)))
+
+    def _touch(self, conn) -> None:
+        """Update last_updated in the same transaction as a change"""
+        conn.execute(
+            update(MemoryMetaModel)
+            .where(MemoryMetaModel.key == "last_updated")
+            .values(value_json=json.dumps(datetime.now().isoformat()))
+        )
+
+    def _reset(self, data: Dict[str, Any]) -> None:
+        """Replace all memory with a JSON-layout dict (one transaction)"""
+        with self.engine.begin() as conn:
+            for model in (FactModel, PreferenceModel, ConversationModel, SessionModel, ReminderModel, MemoryMetaModel):
+                conn.execute(delete(model))
+
+            facts = [
+                {
+                    "fact": fact.get("fact", ""),
+                    "category": fact.get("category", "general"),
+                    "learned_at": fact.get("learned_at") or datetime.now().isoformat(),
+                }
+                for fact in data.get("facts", [])
+            ]
+            if facts:
+                conn.execute(insert(FactModel), facts)
+
+            preferences = [
+                {"key": key, "value_json": json.dumps(value, ensure_ascii=False)}
+                for key, value in (data.get("preferences") or {}).items()
+            ]
+            if preferences:
+                conn.execute(insert(PreferenceModel), preferences)
+
+            conversations = [
+                self._conversation_row(conv.get("messages", []), conv.get("summary", ""), conv.get("timestamp"))
+                for conv in data.get("conversations", [])[-MAX_CONVERSATIONS:]
+            ]
+            if conversations:
+                conn.execute(insert(ConversationModel), conversations)
+
+            sessions = [
+                {
+                    "session_id": session.get("session_id", ""),
+                    "started_at": session.get("started_at") or "",
+                    "ended_at": session.get("ended_at"),
+                    "interactions": session.get("interactions", 0),
+                }
+                for session in data.get("sessions", [])
+            ]
+            if sessions:
+                conn.execute(insert(SessionModel), sessions)
+
+            reminders = [self._reminder_row(reminder) for reminder in data.get("reminders") or []]
+            if reminders:
+                conn.execute(insert(ReminderModel), reminders)
+
+            now = datetime.now().isoformat()
+            for key in META_SECTIONS:
+                value = data.get(key)
+                if key in ("created_at", "last_updated"):
+                    value = value or now
+                self._set_meta(conn, key, value)
+
+    @staticmethod
+    def _conversation_row(messages: List[Dict], summary: str, timestamp: Optional[str] = None) -> dict:
+        return {
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "summary": summary,
+            "message_count": len(messages),
+            "messages_json": json.dumps(messages, ensure_ascii=False),
+        }
+
+    @staticmethod
+    def _reminder_row(reminder_data: Dict) -> dict:
+        return {
+            "reminder_id": reminder_data.get("reminder_id"),
+            "data_json": json.dumps(reminder_data, ensure_ascii=False),
+        }
+
+    def save(self) -> None:
+        """No-op: every change is written when it is made (kept for SendellMemory compatibility)"""
+
+    def flush(self) -> bool:
+        """No-op: nothing is ever pending"""
+        return False
+
+    def close(self) -> None:
+        """No-op: the engine is shared with the project database"""
+
+    # ==================== FACTS ====================
+
+    def add_fact(self, fact: str, category: str = "general") -> None:
+        """
+        Add a learned fact about Daniel.
+
+        Args:
+            fact: The fact to remember
+            category: Category (general, preference, work, personal)
+        """
+        with self.engine.begin() as conn:
+            conn.execute(
+                insert(FactModel).values(fact=fact, category=category, learned_at=datetime.now().isoformat())
+            )
+            self._touch(conn)
+        logger.info(f"Added fact: {fact}")
+
+    def get_facts(self, category: Optional[str] = None) -> List[Dict]:
+        """Get all facts, optionally filtered by category"""
+        query = select(FactModel.fact, FactModel.category, FactModel.learned_at).order_by(FactModel.id)
+        if category:
+            query = query.where(FactModel.category == category)
+
+        with self.engine.connect() as conn:
+            return [
+                {"fact": row.fact, "category": row.category, "learned_at": row.learned_at}
+                for row in conn.execute(query)
+            ]
+
+    def remove_fact(self, index: int) -> bool:
+        """Remove a fact by index (negative counts from the newest, like list.pop)"""
+        if index >= 0:
+            query = select(FactModel.id, FactModel.fact).order_by(FactModel.id).offset(index).limit(1)
+        else:
+            query = select(FactModel.id, FactModel.fact).order_by(FactModel.id.desc()).offset(-index - 1).limit(1)
+
+        with self.engine.begin() as conn:
+            row = conn.execute(query).first()
+            if row is None:
+                logger.error(f"Invalid fact index: {index}")
+                return False
+            conn.execute(delete(FactModel).where(FactModel.id == row.id))
+            self._touch(conn)
+
+        logger.info(f"Removed fact: {row.fact}")
+        return True
+
+    def clear_facts(self) -> None:
+        """Clear all facts"""
+        with self.engine.begin() as conn:
+            count = conn.execute(delete(FactModel)).rowcount
+            self._touch(conn)
+        logger.info(f"Cleared {count} facts")
+
+    # ==================== PREFERENCES ====================
+
+    def set_preference(self, key: str, value: Any) -> None:
+        """Set a user preference"""
+        with self.engine.begin() as conn:
+            conn.execute(delete(PreferenceModel).where(PreferenceModel.key == key))
+            conn.execute(insert(PreferenceModel).values(key=key, value_json=json.dumps(value, ensure_ascii=False)))
+            self._touch(conn)
+        logger.info(f"Set preference: {key} = {value}")
+
+    def get_preference(self, key: str, default: Any = None) -> Any:
+        """Get a user preference"""
+        with self.engine.connect() as conn:
+            value = conn.execute(
+                select(PreferenceModel.value_json).where(PreferenceModel.key == key)
+            ).scalar_one_or_none()
+        return default if value is None else json.loads(value)
+
+    def get_all_preferences(self) -> Dict[str, Any]:
+        """Get all preferences"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(PreferenceModel.key, PreferenceModel.value_json))
+            return {row.key: json.loads(row.value_json) for row in rows}
+
+    # ==================== CONVERSATIONS ====================
+
+    def add_conversation(self, messages: List[Dict], summary: str = "") -> None:
+        """
+        Save a conversation.
+
+        Args:
+            messages: List of conversation messages
+            summary: Optional summary of the conversation
+        """
+        with self.engine.begin() as conn:
+            conn.execute(insert(ConversationModel).values(**self._conversation_row(messages, summary)))
+
+            # Keep only the last MAX_CONVERSATIONS conversations
+            cutoff = conn.execute(
+                select(ConversationModel.id)
+                .order_by(ConversationModel.id.desc())
+                .offset(MAX_CONVERSATIONS)
+                .limit(1)
+            ).scalar_one_or_none()
+            if cutoff is not None:
+                conn.execute(delete(ConversationModel).where(ConversationModel.id <= cutoff))
+            self._touch(conn)
+
+    def get_conversations(self, limit: int = 10, offset: int = 0) -> List[Dict]:
+        """
+        Get recent conversations, oldest first.
+
+        Args:
+            limit: Conversations to return
+            offset: Newest conversations to skip (for paging back through history)
+        """
+        query = select(ConversationModel).order_by(ConversationModel.id.desc()).offset(offset).limit(limit)
+        with self.engine.connect() as conn:
+            rows = list(conn.execute(query))
+
+        return [
+            {
+                "messages": json.loads(row.messages_json),
+                "summary": row.summary,
+                "timestamp": row.timestamp,
+                "message_count": row.message_count,
+            }
+            for row in reversed(rows)
+        ]
+
+    def clear_conversations(self) -> None:
+        """Clear all conversation history"""
+        with self.engine.begin() as conn:
+            count = conn.execute(delete(ConversationModel)).rowcount
+            self._touch(conn)
+        logger.info(f"Cleared {count} conversations")
+
+    # ==================== SESSIONS ====================
+
+    def start_session(self) -> str:
+        """Start a new session and return session ID"""
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        with self.engine.begin() as conn:
+            conn.execute(
+                insert(SessionModel).values(
+                    session_id=session_id, started_at=datetime.now().isoformat(), ended_at=None, interactions=0
+                )
+            )
+            self._touch(conn)
+
+        logger.info(f"Started session: {session_id}")
+        return session_id
+
+    def end_session(self, session_id: str, interactions: int) -> None:
+        """End a session"""
+        with self.engine.begin() as conn:
+            row_id = conn.execute(
+                select(SessionModel.id)
+                .where(SessionModel.session_id == session_id)
+                .order_by(SessionModel.id.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+            if row_id is None:
+                return
+            conn.execute(
+                update(SessionModel)
+                .where(SessionModel.id == row_id)
+                .values(ended_at=datetime.now().isoformat(), interactions=interactions)
+            )
+            self._touch(conn)
+        logger.info(f"Ended session: {session_id}")
+
+    def get_sessions(self, limit: int = 10) -> List[Dict]:
+        """Get recent sessions"""
+        query = select(SessionModel).order_by(SessionModel.id.desc()).limit(limit)
+        with self.engine.connect() as conn:
+            rows = list(conn.execute(query))
+
+        return [
+            {
+                "session_id": row.session_id,
+                "started_at": row.started_at,
+                "ended_at": row.ended_at,
+                "interactions": row.interactions,
+            }
+            for row in reversed(rows)
+        ]
+
+    # ==================== UTILITY ====================
+
+    def get_memory_summary(self) -> Dict[str, Any]:
+        """Get summary of memory contents"""
+        with self.engine.connect() as conn:
+            counts = {
+                name: conn.execute(select(func.count()).select_from(model)).scalar_one()
+                for name, model in (
+                    ("total_facts", FactModel),
+                    ("total_conversations", ConversationModel),
+                    ("total_sessions", SessionModel),
+                    ("preferences_count", PreferenceModel),
+                )
+            }
+
+        return {
+            **counts,
+            "created_at": self._get_meta("created_at"),
+            "last_updated": self._get_meta("last_updated"),
+            "memory_file": str(self.engine.url.database),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """All memory in the JSON memory file layout"""
+        data = {key: self._get_meta(key) for key in META_SECTIONS}
+        data.update(
+            {
+                "reminders": self.get_reminders(),
+                "facts": self.get_facts(),
+                "preferences": self.get_all_preferences(),
+                "conversations": self.get_conversations(limit=MAX_CONVERSATIONS),
+                "sessions": self.get_sessions(limit=self.get_memory_summary()["total_sessions"]),
+            }
+        )
+        return data
+
+    def export_memory(self, export_path: Path) -> None:
+        """Export memory to a file (same format as the JSON backend)"""
+        try:
+            with open(export_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            logger.info(f"Memory exported to: {export_path}")
+        except Exception as e:
+            logger.error(f"Failed to export memory: {e}")
+
+    def import_memory(self, import_path: Path) -> bool:
+        """Import memory from a JSON memory file or export (replaces everything stored)"""
+        try:
+            self._reset(read_memory_file(import_path))
+            logger.info(f"Memory imported from: {import_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to import memory: {e}")
+            return False
+
+    # ==================== AGENT IDENTITY ====================
+
+    def get_agent_identity(self) -> Optional[Dict]:
+        """Get agent identity data"""
+        return self._get_meta("agent_identity")
+
+    def set_agent_identity(self, identity_data: Dict) -> None:
+        """Save agent identity data"""
+        with self.engine.begin() as conn:
+            self._set_meta(conn, "agent_identity", identity_data)
+            self._touch(conn)
+        logger.info("Agent identity saved")
+
+    def has_agent_identity(self) -> bool:
+        """Check if agent has been initialized (has birth_date)"""
+        return self.get_agent_identity() is not None
+
+    # ==================== REMINDERS ====================
+
+    def get_reminders(self) -> List[Dict]:
+        """Get all reminders"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(ReminderModel.data_json).order_by(ReminderModel.id))
+            return [json.loads(row.data_json) for row in rows]
+
+    def set_reminders(self, reminders_data: List[Dict]) -> None:
+        """Save all reminders"""
+        with self.engine.begin() as conn:
+            conn.execute(delete(ReminderModel))
+            if reminders_data:
+                conn.execute(insert(ReminderModel), [self._reminder_row(reminder) for reminder in reminders_data])
+            self._touch(conn)
+        logger.debug(f"Saved {len(reminders_data)} reminders")
+
+    def add_reminder(self, reminder_data: Dict) -> None:
+        """Add a single reminder"""
+        with self.engine.begin() as conn:
+            conn.execute(insert(ReminderModel).values(**self._reminder_row(reminder_data)))
+            self._touch(conn)
+        logger.info(f"Added reminder: {reminder_data.get('content')}")
+
+    def delete_reminder(self, reminder_id: str) -> bool:
+        """Delete a reminder by ID"""
+        with self.engine.begin() as conn:
+            deleted = conn.execute(delete(ReminderModel).where(ReminderModel.reminder_id == reminder_id)).rowcount
+            if deleted:
+                self._touch(conn)
+
+        if deleted:
+            logger.info(f"Deleted reminder: {reminder_id}")
+            return True
+        return False
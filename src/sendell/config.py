@@ -50,9 +50,18 @@ class MemoryBackend(str, Enum):
     """Memory/database backend options"""
 
     SQLITE = "sqlite"
+    JSON = "json"  # Single data/sendell_memory.json file
     POSTGRES = "postgres"
 
 
+class ProcessBackend(str, Enum):
+    """Process enumeration backends"""
+
+    AUTO = "auto"  # /proc on Linux, psutil elsewhere
+    PSUTIL = "psutil"
+    PROC = "proc"
+
+
 class VectorStore(str, Enum):
     """Vector store options for RAG"""
 
@@ -167,6 +176,12 @@ class MemoryConfig(BaseSettings):
         default=MemoryBackend.SQLITE, description="Memory backend"
     )
     db_path: Path = Field(default=Path("data/sendell.db"), description="SQLite database path")
+    memory_flush_delay_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        le=60,
+        description="Delay before changes to the memory file are written (0 = write immediately)",
+    )
     vector_store: VectorStore = Field(default=VectorStore.CHROMA, description="Vector store")
     chroma_path: Path = Field(
         default=Path("data/chroma"), description="Chroma persist directory"
@@ -210,6 +225,73 @@ class MonitoringConfig(BaseSettings):
     process_ram_threshold: int = Field(
         default=2000, ge=500, le=16000, description="Per-process RAM alert (MB)"
     )
+    process_backend: ProcessBackend = Field(
+        default=ProcessBackend.AUTO,
+        description="Process enumeration backend (auto uses /proc on Linux)",
+    )
+    alert_interval_seconds: int = Field(
+        default=10, ge=1, le=300, description="Seconds between alert metric samples"
+    )
+    alert_window: int = Field(
+        default=6, ge=1, le=60, description="Samples averaged before an alert fires"
+    )
+    alert_hysteresis: int = Field(
+        default=5, ge=0, le=30, description="Points below threshold before an alert clears"
+    )
+    alert_cooldown_seconds: int = Field(
+        default=600, ge=0, le=86400, description="Minimum seconds between repeats of one alert"
+    )
+    focus_interval_seconds: float = Field(
+        default=1.0, ge=0.2, le=60.0, description="Foreground window sampling interval (seconds)"
+    )
+
+
+class ProjectsConfig(BaseSettings):
+    """Project discovery settings"""
+
+    model_config = SettingsConfigDict(env_prefix="SENDELL_", env_file=".env", extra="ignore")
+
+    project_watch_roots: str = Field(
+        default="",
+        description="Directories to watch for projects, comma-separated (empty = watcher off)",
+    )
+    project_watch_debounce_seconds: float = Field(
+        default=0.25, ge=0.05, le=10.0, description="Quiet period before file events are applied"
+    )
+    project_watch_poll_seconds: float = Field(
+        default=2.0, ge=0.5, le=300.0, description="Rescan interval when inotify is unavailable"
+    )
+    project_config_cache_size: int = Field(
+        default=4096, ge=64, le=1_000_000, description="Parsed config files kept in the LRU cache"
+    )
+    project_config_hash: bool = Field(
+        default=False,
+        description="Hash config files so rewrites with identical content stay cached",
+    )
+    project_parse_processes: int = Field(
+        default=0, ge=0, le=32, description="Processes for parsing large config files (0 = in-thread)"
+    )
+    project_scan_respect_gitignore: bool = Field(
+        default=True, description="Skip directories matched by .gitignore / .ignore when scanning"
+    )
+    project_git_dirty_ttl_seconds: float = Field(
+        default=30.0, ge=0.0, le=86400.0, description="Seconds a project's git dirty flag is reused"
+    )
+    project_size_workers: int = Field(
+        default=4, ge=0, le=32, description="Threads measuring project sizes after discovery (0 = off)"
+    )
+    project_size_full_rescan_seconds: float = Field(
+        default=900.0, ge=0.0, le=86400.0, description="Seconds between full relists of a project's size walk"
+    )
+
+    @property
+    def watch_roots(self) -> List[Path]:
+        """project_watch_roots as absolute paths"""
+        return [
+            Path(root.strip()).expanduser().resolve()
+            for root in self.project_watch_roots.split(",")
+            if root.strip()
+        ]
 
 
 class AdvancedConfig(BaseSettings):
@@ -248,6 +330,7 @@ class Settings(BaseSettings):
     langsmith: LangSmithConfig = Field(default_factory=LangSmithConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    projects: ProjectsConfig = Field(default_factory=ProjectsConfig)
     advanced: AdvancedConfig = Field(default_factory=AdvancedConfig)
 
     def __repr__(self) -> str:
@@ -340,5 +423,6 @@ __all__ = [
     "AutonomyLevel",
     "LogLevel",
     "MemoryBackend",
+    "ProcessBackend",
     "VectorStore",
 ]
@@ -0,0 +1,416 @@
+"""
+Streaming threshold alerts.
+
+Evaluates system metrics continuously in the background instead of
+checking a single snapshot on demand:
+- Windowed averages: an alert fires only when the average over the last
+  N samples crosses the threshold (one spiky sample is not enough)
+- Hysteresis: an active alert clears only once the average drops a few
+  points below the threshold, so values hovering at the line don't flap
+- Cooldowns: the same alert is not raised again within the cooldown
+- Per-process RAM rule from MonitoringConfig.process_ram_threshold
+
+Alerts are structured (Alert dataclass) and delivered to subscribers such
+as the proactive loop; no LLM call is involved.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+import psutil
+
+from sendell.config import get_settings
+from sendell.device.disks import get_disk_monitor
+from sendell.device.process_tree import ProcessNode, ProcessSnapshotService, get_snapshot_service
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AlertLevel(str, Enum):
+    """Alert transition"""
+
+    RAISED = "raised"
+    CLEARED = "cleared"
+
+
+@dataclass
+class Alert:
+    """A threshold was crossed (or recovered)"""
+
+    rule: str  # cpu, ram, disk, process_ram
+    level: AlertLevel
+    value: float  # Windowed average that triggered the transition
+    threshold: float
+    unit: str
+    message: str
+    pid: Optional[int] = None
+    process_name: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "rule": self.rule,
+            "level": self.level.value,
+            "value": round(self.value, 1),
+            "threshold": self.threshold,
+            "unit": self.unit,
+            "message": self.message,
+            "pid": self.pid,
+            "process_name": self.process_name,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+@dataclass
+class ThresholdRule:
+    """Raise above `threshold`, clear below `clear_below`"""
+
+    name: str
+    label: str
+    threshold: float
+    clear_below: float
+    unit: str = "%"
+
+
+@dataclass
+class _RuleState:
+    """Sliding window and alert state for one rule (or one process)"""
+
+    samples: Deque[float]
+    active: bool = False
+    last_raised: Optional[float] = None
+    process_name: Optional[str] = None
+
+    @property
+    def average(self) -> float:
+        return sum(self.samples) / len(self.samples)
+
+
+class AlertEngine:
+    """
+    Background threshold evaluator.
+
+    Usage:
+        engine = get_alert_engine()
+        engine.subscribe(lambda alert: print(alert.message))
+        await engine.start()
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[float] = None,
+        window: Optional[int] = None,
+        hysteresis: Optional[float] = None,
+        cooldown_seconds: Optional[float] = None,
+        snapshot_service: Optional[ProcessSnapshotService] = None,
+    ):
+        """
+        Initialize alert engine (defaults come from MonitoringConfig).
+
+        Args:
+            interval_seconds: Seconds between samples
+            window: Samples averaged per rule
+            hysteresis: Points below the threshold required to clear
+            cooldown_seconds: Minimum seconds between raises of the same alert
+            snapshot_service: Process snapshot source for per-process rules
+        """
+        monitoring = get_settings().monitoring
+
+        self.interval = interval_seconds if interval_seconds is not None else monitoring.alert_interval_seconds
+        self.window = window if window is not None else monitoring.alert_window
+        hysteresis = hysteresis if hysteresis is not None else monitoring.alert_hysteresis
+        self.cooldown = cooldown_seconds if cooldown_seconds is not None else monitoring.alert_cooldown_seconds
+        self.snapshot_service = snapshot_service or get_snapshot_service()
+
+        self.rules: Dict[str, ThresholdRule] = {
+            "cpu": ThresholdRule("cpu", "CPU usage", monitoring.cpu_threshold, monitoring.cpu_threshold - hysteresis),
+            "ram": ThresholdRule("ram", "RAM usage", monitoring.ram_threshold, monitoring.ram_threshold - hysteresis),
+            "disk": ThresholdRule("disk", "Disk usage", monitoring.disk_threshold, monitoring.disk_threshold - hysteresis),
+        }
+        # Hysteresis for MB values scales with the threshold (5 points -> 5%)
+        process_threshold = monitoring.process_ram_threshold
+        self.process_rule = ThresholdRule(
+            "process_ram",
+            "Process RAM",
+            process_threshold,
+            process_threshold * (1 - hysteresis / 100),
+            unit="MB",
+        )
+
+        self._states: Dict[Tuple[str, int], _RuleState] = {}
+        self._subscribers: Dict[int, Callable[[Alert], None]] = {}
+        self._next_token = 0
+
+        self.recent_alerts: Deque[Alert] = deque(maxlen=50)
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.stats = {"samples": 0, "raised": 0, "cleared": 0, "suppressed": 0}
+
+    # ==================== SUBSCRIPTIONS ====================
+
+    def subscribe(self, callback: Callable[[Alert], None]) -> int:
+        """
+        Register a subscriber (called on the event loop for every alert).
+
+        Returns:
+            Subscription token for unsubscribe()
+        """
+        token = self._next_token
+        self._next_token += 1
+        self._subscribers[token] = callback
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscriber"""
+        self._subscribers.pop(token, None)
+
+    # ==================== EVALUATION ====================
+
+    def evaluate(
+        self,
+        metrics: Dict[str, float],
+        processes: Iterable[ProcessNode] = (),
+        now: Optional[float] = None,
+    ) -> List[Alert]:
+        """
+        Feed one sample into the windows and return state transitions.
+
+        Args:
+            metrics: Rule name -> current value (e.g. {"cpu": 42.0, "ram": 71.3})
+            processes: Process snapshot for the per-process RAM rule
+            now: Monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            Alerts raised or cleared by this sample
+        """
+        now = time.monotonic() if now is None else now
+        alerts: List[Alert] = []
+
+        for name, value in metrics.items():
+            rule = self.rules.get(name)
+            if rule is None:
+                continue
+            alert = self._update((name, 0), rule, value, now)
+            if alert:
+                alerts.append(alert)
+
+        alerts.extend(self._evaluate_processes(processes, now))
+
+        self.stats["samples"] += 1
+        return alerts
+
+    def _evaluate_processes(self, processes: Iterable[ProcessNode], now: float) -> List[Alert]:
+        """Per-process RAM rule; only processes near the threshold are tracked"""
+        rule = self.process_rule
+        alerts: List[Alert] = []
+        seen = set()
+
+        for node in processes:
+            key = (rule.name, node.pid)
+            memory_mb = node.memory_mb
+            if memory_mb < rule.clear_below and key not in self._states:
+                continue
+
+            seen.add(key)
+            alert = self._update(key, rule, memory_mb, now, pid=node.pid, process_name=node.name)
+            if alert:
+                alerts.append(alert)
+
+            state = self._states[key]
+            cooling_down = state.last_raised is not None and now - state.last_raised < self.cooldown
+            if not state.active and state.average < rule.clear_below and not cooling_down:
+                del self._states[key]  # Back to normal and out of cooldown, stop tracking
+
+        # Processes that exited: clear their alerts and drop their windows
+        for key in [k for k in self._states if k[0] == rule.name and k not in seen]:
+            state = self._states.pop(key)
+            if state.active:
+                alerts.append(
+                    self._make_alert(
+                        rule, AlertLevel.CLEARED, state.average, key[1], state.process_name, suffix="process exited"
+                    )
+                )
+                self.stats["cleared"] += 1
+
+        return alerts
+
+    def _update(
+        self,
+        key: Tuple[str, int],
+        rule: ThresholdRule,
+        value: float,
+        now: float,
+        pid: Optional[int] = None,
+        process_name: Optional[str] = None,
+    ) -> Optional[Alert]:
+        """Push a value into a rule window and apply hysteresis and cooldown"""
+        state = self._states.get(key)
+        if state is None:
+            state = _RuleState(samples=deque(maxlen=self.window))
+            self._states[key] = state
+
+        state.samples.append(value)
+        if process_name:
+            state.process_name = process_name
+        if len(state.samples) < self.window:
+            return None  # Not sustained yet
+
+        average = state.average
+
+        if not state.active and average > rule.threshold:
+            if state.last_raised is not None and now - state.last_raised < self.cooldown:
+                self.stats["suppressed"] += 1
+                return None
+
+            state.active = True
+            state.last_raised = now
+            self.stats["raised"] += 1
+            return self._make_alert(rule, AlertLevel.RAISED, average, pid, process_name)
+
+        if state.active and average < rule.clear_below:
+            state.active = False
+            self.stats["cleared"] += 1
+            return self._make_alert(rule, AlertLevel.CLEARED, average, pid, process_name)
+
+        return None
+
+    @staticmethod
+    def _make_alert(
+        rule: ThresholdRule,
+        level: AlertLevel,
+        value: float,
+        pid: Optional[int] = None,
+        process_name: Optional[str] = None,
+        suffix: Optional[str] = None,
+    ) -> Alert:
+        subject = rule.label
+        if pid is not None:
+            subject = f"{rule.label} of {process_name or 'process'} (PID {pid})"
+
+        if level == AlertLevel.RAISED:
+            message = f"{subject} high: {value:.1f}{rule.unit} (threshold: {rule.threshold:g}{rule.unit})"
+        else:
+            message = f"{subject} back to normal: {value:.1f}{rule.unit}"
+        if suffix:
+            message += f" ({suffix})"
+
+        return Alert(
+            rule=rule.name,
+            level=level,
+            value=value,
+            threshold=rule.threshold,
+            unit=rule.unit,
+            message=message,
+            pid=pid,
+            process_name=process_name,
+        )
+
+    def active_alerts(self) -> List[dict]:
+        """Currently active alerts (rule, pid, windowed value)"""
+        return [
+            {"rule": rule, "pid": pid or None, "value": round(state.average, 1)}
+            for (rule, pid), state in self._states.items()
+            if state.active
+        ]
+
+    # ==================== SAMPLING ====================
+
+    def sample(self) -> Tuple[Dict[str, float], List[ProcessNode]]:
+        """
+        Read current metrics (non-blocking).
+
+        CPU uses psutil's non-blocking cpu_percent(), i.e. the average since
+        the previous sample.
+
+        Returns:
+            (metrics dict, process snapshot)
+        """
+        metrics = {
+            "cpu": psutil.cpu_percent(interval=None),
+            "ram": psutil.virtual_memory().percent,
+        }
+
+        # Cached and timeout-protected; a stale value is skipped, not averaged
+        disk = get_disk_monitor().system_disk()
+        if disk.updated_at and not disk.stale:
+            metrics["disk"] = disk.percent
+
+        processes = list(self.snapshot_service.get_tree(max_age=self.interval / 2))
+        return metrics, processes
+
+    # ==================== LIFECYCLE ====================
+
+    async def start(self) -> None:
+        """Start sampling in a background task on the running event loop"""
+        if self._running:
+            return
+
+        psutil.cpu_percent(interval=None)  # Prime the non-blocking CPU counter
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Alert engine started (every {self.interval}s, window {self.window}, cooldown {self.cooldown}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background task"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Alert engine stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def _run(self) -> None:
+        """Sample, evaluate, publish, sleep"""
+        while self._running:
+            try:
+                # Process walk does file I/O: keep it off the event loop
+                metrics, processes = await asyncio.to_thread(self.sample)
+                for alert in self.evaluate(metrics, processes):
+                    self._publish(alert)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Alert evaluation failed: {e}", exc_info=True)
+
+            await asyncio.sleep(self.interval)
+
+    def _publish(self, alert: Alert) -> None:
+        """Record and deliver an alert"""
+        self.recent_alerts.append(alert)
+        for callback in list(self._subscribers.values()):
+            try:
+                callback(alert)
+            except Exception as e:
+                logger.error(f"Alert subscriber failed: {e}", exc_info=True)
+
+
+# Global alert engine
+_alert_engine: Optional[AlertEngine] = None
+
+
+def get_alert_engine() -> AlertEngine:
+    """Get or create the global alert engine"""
+    global _alert_engine
+    if _alert_engine is None:
+        _alert_engine = AlertEngine()
+    return _alert_engine
@@ -0,0 +1,346 @@
+"""
+Disk usage and throughput for all mounted partitions.
+
+psutil.disk_usage() is a blocking statvfs/GetDiskFreeSpaceEx call, and on
+a stale network mount or mapped drive it can hang for a long time. This
+module keeps health checks instant:
+- Partitions are enumerated once (rescan_partitions() to refresh)
+- Usage is cached; once older than refresh_seconds, get_usage() returns
+  the cached values right away and refreshes in a background thread
+- Each mount is queried in a daemon worker thread with a timeout; a hung
+  mount keeps its last known values (marked stale), never gets a second
+  worker while the first one is still stuck, and can't block shutdown
+- Disk I/O counters are tracked as deltas for read/write throughput, with
+  one baseline per consumer
+"""
+
+import os
+import platform
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Pseudo and container filesystems that are never interesting to report
+IGNORED_FSTYPES = {"squashfs", "overlay", "tmpfs", "devtmpfs", "proc", "sysfs", "autofs", "nsfs"}
+
+
+@dataclass
+class DiskInfo:
+    """Usage of one mounted partition"""
+
+    mountpoint: str
+    device: str
+    fstype: str
+    total_bytes: int = 0
+    used_bytes: int = 0
+    free_bytes: int = 0
+    percent: float = 0.0
+    updated_at: Optional[datetime] = None
+    stale: bool = False  # Last refresh timed out or failed
+    error: Optional[str] = None
+
+    @property
+    def total_gb(self) -> float:
+        return self.total_bytes / (1024**3)
+
+    @property
+    def used_gb(self) -> float:
+        return self.used_bytes / (1024**3)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "mountpoint": self.mountpoint,
+            "device": self.device,
+            "fstype": self.fstype,
+            "percent": round(self.percent, 1),
+            "used_gb": round(self.used_gb, 2),
+            "total_gb": round(self.total_gb, 2),
+            "free_gb": round(self.free_bytes / (1024**3), 2),
+            "stale": self.stale,
+            "error": self.error,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+@dataclass
+class DiskThroughput:
+    """Disk read/write rates between two counter samples"""
+
+    read_bytes_per_sec: float
+    write_bytes_per_sec: float
+    read_count_per_sec: float
+    write_count_per_sec: float
+    interval_seconds: float
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "read_mb_per_sec": round(self.read_bytes_per_sec / (1024 * 1024), 2),
+            "write_mb_per_sec": round(self.write_bytes_per_sec / (1024 * 1024), 2),
+            "read_iops": round(self.read_count_per_sec, 1),
+            "write_iops": round(self.write_count_per_sec, 1),
+            "interval_seconds": round(self.interval_seconds, 1),
+        }
+
+
+def system_root() -> str:
+    """Mountpoint of the system drive ("/" or e.g. "C:\\")"""
+    if platform.system() == "Windows":
+        return os.environ.get("SystemDrive", "C:") + "\\"
+    return "/"
+
+
+class DiskMonitor:
+    """
+    Cached, timeout-protected disk usage for every partition.
+
+    Usage:
+        disks = get_disk_monitor()
+        for disk in disks.get_usage():
+            print(disk.mountpoint, disk.percent, disk.stale)
+        print(disks.get_throughput().to_dict())
+    """
+
+    def __init__(self, refresh_seconds: float = 30.0, timeout_seconds: float = 2.0):
+        """
+        Initialize disk monitor.
+
+        Args:
+            refresh_seconds: Minimum age before usage is queried again
+            timeout_seconds: Max time a refresh waits for slow mounts
+        """
+        self.refresh_seconds = refresh_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._disks: Dict[str, DiskInfo] = {}
+        self._pending: Dict[str, Future] = {}
+        self._refreshed_at = 0.0
+
+        # Previous (counters, monotonic time) per throughput consumer
+        self._io_baselines: Dict[str, Tuple[Any, float]] = {}
+
+        self.rescan_partitions()
+        self._start_refresh()  # Warm the cache before the first health check
+
+    # ==================== PARTITIONS ====================
+
+    def rescan_partitions(self) -> None:
+        """Enumerate mounted partitions (drives added or removed)"""
+        try:
+            partitions = psutil.disk_partitions(all=False)
+        except Exception as e:
+            logger.error(f"Failed to enumerate partitions: {e}")
+            partitions = []
+
+        disks: Dict[str, DiskInfo] = {}
+        for part in partitions:
+            if part.fstype in IGNORED_FSTYPES:
+                continue
+            if platform.system() == "Windows" and "cdrom" in part.opts:
+                continue  # Empty optical drives raise on every query
+            disks[part.mountpoint] = self._disks.get(part.mountpoint) or DiskInfo(
+                mountpoint=part.mountpoint, device=part.device, fstype=part.fstype
+            )
+
+        # The system drive is always reported, even if filtered above
+        root = system_root()
+        if root not in disks:
+            disks[root] = self._disks.get(root) or DiskInfo(mountpoint=root, device="", fstype="")
+
+        with self._lock:
+            self._disks = disks
+            self._refreshed_at = 0.0
+
+        logger.debug(f"Tracking {len(disks)} partition(s)")
+
+    # ==================== USAGE ====================
+
+    def get_usage(self, max_age: Optional[float] = None, wait: bool = False) -> List[DiskInfo]:
+        """
+        Usage for every partition, from the cache.
+
+        If the cache is older than max_age a refresh starts in the background
+        and the last known values are returned right away; mounts that don't
+        answer within timeout_seconds keep them with stale=True.
+
+        Args:
+            max_age: Override refresh_seconds (0 always starts a refresh)
+            wait: Run the refresh in this thread instead (at most timeout_seconds)
+
+        Returns:
+            List of DiskInfo (system drive first)
+        """
+        max_age = self.refresh_seconds if max_age is None else max_age
+
+        if time.monotonic() - self._refreshed_at > max_age:
+            if wait:
+                # Only one refresh at a time; wait for a running one instead of starting another
+                with self._refresh_lock:
+                    if time.monotonic() - self._refreshed_at > max_age:
+                        self._refresh()
+            else:
+                self._start_refresh()
+
+        root = system_root()
+        with self._lock:
+            disks = list(self._disks.values())
+        disks.sort(key=lambda d: (d.mountpoint != root, d.mountpoint))
+        return disks
+
+    def system_disk(self, max_age: Optional[float] = None) -> DiskInfo:
+        """Usage of the system drive"""
+        self.get_usage(max_age)
+        with self._lock:
+            return self._disks[system_root()]
+
+    def _start_refresh(self) -> bool:
+        """Refresh in a daemon thread unless a refresh is already running"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self._refresh()
+            except Exception as e:
+                logger.error(f"Disk usage refresh failed: {e}")
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=run, name="disk-usage-refresh", daemon=True).start()
+        return True
+
+    def _refresh(self) -> None:
+        """Query every partition concurrently, bounded by timeout_seconds"""
+        with self._lock:
+            mountpoints = list(self._disks)
+            self._refreshed_at = time.monotonic()
+
+        submitted = []
+        for mountpoint in mountpoints:
+            previous = self._pending.get(mountpoint)
+            if previous is not None and not previous.done():
+                # Still hung from an earlier refresh: don't pile up workers
+                self._mark_stale(mountpoint, "usage query still pending")
+                continue
+
+            future = self._query(mountpoint)
+            self._pending[mountpoint] = future
+            submitted.append((mountpoint, future))
+
+        if not submitted:
+            return
+
+        wait([future for _, future in submitted], timeout=self.timeout_seconds)
+
+        for mountpoint, future in submitted:
+            if not future.done():
+                logger.warning(f"Disk usage for {mountpoint} timed out after {self.timeout_seconds}s")
+                self._mark_stale(mountpoint, "timed out")
+                continue
+
+            self._pending.pop(mountpoint, None)
+            try:
+                usage = future.result()
+            except Exception as e:
+                self._mark_stale(mountpoint, str(e))
+                continue
+
+            with self._lock:
+                disk = self._disks.get(mountpoint)
+                if disk is None:
+                    continue
+                disk.total_bytes = usage.total
+                disk.used_bytes = usage.used
+                disk.free_bytes = usage.free
+                disk.percent = usage.percent
+                disk.updated_at = datetime.now()
+                disk.stale = False
+                disk.error = None
+
+    @staticmethod
+    def _query(mountpoint: str) -> Future:
+        """Run disk_usage in a daemon thread (ThreadPoolExecutor workers are joined at exit)"""
+        future: Future = Future()
+
+        def run():
+            try:
+                future.set_result(psutil.disk_usage(mountpoint))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"disk-usage:{mountpoint}", daemon=True).start()
+        return future
+
+    def _mark_stale(self, mountpoint: str, reason: str) -> None:
+        with self._lock:
+            disk = self._disks.get(mountpoint)
+            if disk is not None:
+                disk.stale = True
+                disk.error = reason
+
+    # ==================== THROUGHPUT ====================
+
+    def get_throughput(self, consumer: str = "default") -> Optional[DiskThroughput]:
+        """
+        Read/write rates since this consumer's previous call.
+
+        Each consumer keeps its own baseline, so callers polling at
+        different rates don't shorten each other's intervals. A consumer's
+        first call only records its baseline and returns None.
+
+        Args:
+            consumer: Name of the caller (e.g. "health")
+
+        Returns:
+            DiskThroughput or None (baseline call, or counters unavailable)
+        """
+        try:
+            counters = psutil.disk_io_counters(perdisk=False)
+        except Exception as e:
+            logger.debug(f"Disk I/O counters unavailable: {e}")
+            return None
+        if counters is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            baseline = self._io_baselines.get(consumer)
+            self._io_baselines[consumer] = (counters, now)
+
+        if baseline is None or now - baseline[1] <= 0:
+            return None
+
+        prev, prev_time = baseline
+        elapsed = now - prev_time
+        return DiskThroughput(
+            # Counters may wrap or reset (e.g. disk removed): clamp at 0
+            read_bytes_per_sec=max(counters.read_bytes - prev.read_bytes, 0) / elapsed,
+            write_bytes_per_sec=max(counters.write_bytes - prev.write_bytes, 0) / elapsed,
+            read_count_per_sec=max(counters.read_count - prev.read_count, 0) / elapsed,
+            write_count_per_sec=max(counters.write_count - prev.write_count, 0) / elapsed,
+            interval_seconds=elapsed,
+        )
+
+
+# Global disk monitor
+_disk_monitor: Optional[DiskMonitor] = None
+
+
+def get_disk_monitor() -> DiskMonitor:
+    """Get or create the global disk monitor"""
+    global _disk_monitor
+    if _disk_monitor is None:
+        _disk_monitor = DiskMonitor()
+    return _disk_monitor
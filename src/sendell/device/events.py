@@ -0,0 +1,526 @@
+"""
+Process lifecycle events.
+
+Publishes process start/exit notifications to subscribers (proactive loop,
+VS Code terminal tracker, ...) instead of making each of them rescan the
+process table:
+- Linux: diff the /proc PID listing (one directory read per poll) and read
+  details only for PIDs that just appeared
+- Other platforms: diff psutil PIDs and their create times, so a reused
+  PID is reported as an exit followed by a start
+- Adaptive polling: fast while processes churn, backs off when idle
+- Watched PIDs (e.g. dev servers) get a pidfd on Linux, so their exit
+  wakes the event thread immediately instead of waiting for the next poll
+- The selector, wake socket pair and pidfds only exist while the event
+  thread runs; they are closed when it stops
+"""
+
+import os
+import selectors
+import socket
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import psutil
+
+from sendell.device.process_tree import ProcessNode, ProcessSnapshotService, get_snapshot_service
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PIDFD_AVAILABLE = hasattr(os, "pidfd_open")
+
+# Create times of one process read at different times may differ by a clock tick
+CREATE_TIME_TOLERANCE = 0.05
+
+
+class ProcessEventType(str, Enum):
+    """Kind of lifecycle event"""
+
+    STARTED = "started"
+    EXITED = "exited"
+
+
+@dataclass
+class ProcessEvent:
+    """A process started or exited"""
+
+    event_type: ProcessEventType
+    pid: int
+    name: str
+    ppid: int
+    cmdline: List[str]
+    cwd: str
+    watched: bool = False  # PID was registered with watch()
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "event_type": self.event_type.value,
+            "pid": self.pid,
+            "name": self.name,
+            "ppid": self.ppid,
+            "cmdline": self.cmdline,
+            "cwd": self.cwd,
+            "watched": self.watched,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+@dataclass
+class _Subscription:
+    """Registered subscriber and its filters"""
+
+    callback: Callable[[ProcessEvent], None]
+    event_types: Optional[Set[ProcessEventType]]
+    names: Optional[Set[str]]
+    watched_only: bool
+
+    def matches(self, event: ProcessEvent) -> bool:
+        if self.event_types and event.event_type not in self.event_types:
+            return False
+        if self.names and event.name.lower() not in self.names:
+            return False
+        if self.watched_only and not event.watched:
+            return False
+        return True
+
+
+class ProcessEventSource:
+    """
+    Background source of process start/exit events.
+
+    Callbacks run on the event thread; they must be quick and thread-safe
+    (e.g. append to a deque or call loop.call_soon_threadsafe).
+
+    Usage:
+        source = get_process_event_source()
+        source.subscribe(on_exit, event_types=[ProcessEventType.EXITED])
+        source.watch(dev_server_pid)
+        source.start()
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.05,
+        max_interval: float = 1.0,
+        snapshot_service: Optional[ProcessSnapshotService] = None,
+    ):
+        """
+        Initialize event source.
+
+        Args:
+            min_interval: Poll interval while processes are churning (seconds)
+            max_interval: Poll interval once things are idle (seconds)
+            snapshot_service: Used to seed the initial process table
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = max_interval
+        self.snapshot_service = snapshot_service or get_snapshot_service()
+
+        self._known: Dict[int, ProcessNode] = {}
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._next_token = 0
+        self._watched: Set[int] = set()
+        self._lock = threading.RLock()
+
+        # Native /proc reader for new PIDs (psutil elsewhere)
+        self._proc_reader = None
+        try:
+            from sendell.device.platform.linux import LinuxProcReader
+
+            self._proc_reader = LinuxProcReader()
+        except ImportError:
+            pass
+        self._use_proc = self._proc_reader is not None
+
+        # Selector wakes the thread on watched-process exit or stop()
+        # (opened by start(), closed when the event thread exits)
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+        self._pidfds: Dict[int, int] = {}
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.stats = {"polls": 0, "started": 0, "exited": 0, "watched_exits": 0}
+
+    # ==================== SUBSCRIPTIONS ====================
+
+    def subscribe(
+        self,
+        callback: Callable[[ProcessEvent], None],
+        event_types: Optional[Iterable[ProcessEventType]] = None,
+        names: Optional[Iterable[str]] = None,
+        watched_only: bool = False,
+    ) -> int:
+        """
+        Register a subscriber.
+
+        Args:
+            callback: Called with each matching ProcessEvent
+            event_types: Only deliver these event types (default: all)
+            names: Only deliver events for these process names (case-insensitive)
+            watched_only: Only deliver events for watched PIDs
+
+        Returns:
+            Subscription token for unsubscribe()
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscriptions[token] = _Subscription(
+                callback=callback,
+                event_types=set(event_types) if event_types else None,
+                names={n.lower() for n in names} if names else None,
+                watched_only=watched_only,
+            )
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscriber"""
+        with self._lock:
+            self._subscriptions.pop(token, None)
+
+    def watch(self, pid: int) -> bool:
+        """
+        Mark a PID as watched (its exit is delivered as soon as possible).
+
+        Args:
+            pid: Process ID to watch
+
+        Returns:
+            True if the process exists and is now watched
+        """
+        with self._lock:
+            if pid in self._watched:
+                return True
+
+            # Make sure the exit event can carry the process details
+            if pid not in self._known:
+                node = self._read_node(pid)
+                if node is None:
+                    return False
+                self._known[pid] = node
+
+            if self._selector is not None and not self._open_pidfd(pid):
+                return False
+
+            self._watched.add(pid)
+
+        self._wake()
+        return True
+
+    def unwatch(self, pid: int) -> None:
+        """Stop watching a PID"""
+        with self._lock:
+            self._watched.discard(pid)
+            self._close_pidfd(pid)
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> None:
+        """Start the event thread"""
+        if self._running:
+            return
+
+        self._seed()
+        self._open_selector()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="process-events", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Process event source started ({'proc' if self._use_proc else 'psutil'} diffing)"
+        )
+
+    def stop(self) -> None:
+        """Stop the event thread (it closes the selector and pidfds on exit)"""
+        if not self._running:
+            return
+
+        self._running = False
+        self._wake()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        logger.info("Process event source stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _seed(self) -> None:
+        """Load the initial process table so exits carry names, cmdlines and cwds"""
+        nodes = dict(self.snapshot_service.get_tree().nodes)
+
+        if self._proc_reader:
+            from sendell.device.platform.linux import LazyProcessNode
+
+            # /proc snapshots read these on first access, which fails once the process is gone
+            for node in nodes.values():
+                if isinstance(node, LazyProcessNode):
+                    node.load()
+
+        with self._lock:
+            self._known = nodes
+
+    def _run(self) -> None:
+        """Event thread main loop"""
+        try:
+            while self._running:
+                try:
+                    ready = self._selector.select(timeout=self.interval)
+                except OSError as e:
+                    logger.error(f"Process event selector failed: {e}")
+                    ready = []
+
+                watched_exits = []
+                for key, _ in ready:
+                    if key.data is None:
+                        self._drain_wake()
+                    else:
+                        watched_exits.append(key.data)
+
+                if not self._running:
+                    break
+
+                try:
+                    events = self.poll_once(exited_hint=watched_exits)
+                except Exception as e:
+                    logger.error(f"Process event poll failed: {e}", exc_info=True)
+                    events = []
+
+                # Adapt: poll fast while things change, back off when idle
+                if events:
+                    self.interval = max(self.min_interval, self.interval / 4)
+                else:
+                    self.interval = min(self.max_interval, self.interval * 2)
+        finally:
+            self._close_selector()
+
+    # ==================== POLLING ====================
+
+    def poll_once(self, exited_hint: Iterable[int] = ()) -> List[ProcessEvent]:
+        """
+        Diff the current processes against the known table and publish events.
+
+        A known PID whose create time changed belongs to a new process: the
+        old one is reported as exited and the new one as started.
+
+        Can be called directly (without start()) for synchronous use.
+
+        Args:
+            exited_hint: PIDs already known to have exited (from pidfds)
+
+        Returns:
+            Events published during this poll
+        """
+        if not self._known and not self._running:
+            self._seed()
+
+        current = self._list_pids()
+        events: List[ProcessEvent] = []
+
+        with self._lock:
+            known = self._known
+            exited = set(known) - set(current)
+            for pid in exited_hint:
+                if pid in known:
+                    exited.add(pid)  # Exited but not reaped yet (zombie)
+                else:
+                    self._close_pidfd(pid)
+            started = set(current) - set(known)
+
+            # Same PID, different process
+            for pid, node in known.items():
+                create_time = current.get(pid)
+                if create_time is None or not node.create_time:
+                    continue  # Not read (Linux) or unknown
+                if abs(create_time - node.create_time) > CREATE_TIME_TOLERANCE:
+                    exited.add(pid)
+                    started.add(pid)
+
+            for pid in exited:
+                node = known.pop(pid)
+                watched = pid in self._watched
+                if watched:
+                    self._watched.discard(pid)
+                    self._close_pidfd(pid)
+                    self.stats["watched_exits"] += 1
+                events.append(self._make_event(ProcessEventType.EXITED, node, watched))
+
+            for pid in started:
+                node = self._read_node(pid)
+                if node is None or node.status == "zombie":
+                    continue  # Already gone again
+                known[pid] = node
+                events.append(self._make_event(ProcessEventType.STARTED, node, False))
+
+            subscriptions = list(self._subscriptions.values())
+
+        self.stats["polls"] += 1
+        self.stats["started"] += sum(1 for e in events if e.event_type == ProcessEventType.STARTED)
+        self.stats["exited"] += sum(1 for e in events if e.event_type == ProcessEventType.EXITED)
+
+        for event in events:
+            self._publish(event, subscriptions)
+
+        return events
+
+    def _list_pids(self) -> Dict[int, Optional[float]]:
+        """
+        Current PID -> create time.
+
+        On Linux this is one directory read and create times are not read
+        (None); a watched PID's exit is still seen through its pidfd before
+        the PID can be reused.
+        """
+        if self._use_proc:
+            return dict.fromkeys(int(entry) for entry in os.listdir("/proc") if entry.isdigit())
+
+        current: Dict[int, Optional[float]] = {}
+        for pid in psutil.pids():
+            try:
+                current[pid] = psutil.Process(pid).create_time()
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+            except psutil.AccessDenied:
+                current[pid] = None
+        return current
+
+    def _read_node(self, pid: int) -> Optional[ProcessNode]:
+        """Read details for a newly started process"""
+        if self._proc_reader:
+            return self._proc_reader.read_node(pid)
+
+        try:
+            proc = psutil.Process(pid)
+            info = proc.as_dict(["ppid", "name", "cmdline", "cwd", "create_time", "status"], ad_value=None)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+
+        return ProcessNode(
+            pid=pid,
+            ppid=info["ppid"] or 0,
+            name=info["name"] or "",
+            exe="",
+            cmdline=info["cmdline"] or [],
+            cwd=info["cwd"] or "",
+            create_time=info["create_time"] or 0.0,
+            status=info["status"] or "unknown",
+            cpu_percent=0.0,
+            memory_rss=0,
+            memory_percent=0.0,
+            num_threads=0,
+        )
+
+    @staticmethod
+    def _make_event(event_type: ProcessEventType, node: ProcessNode, watched: bool) -> ProcessEvent:
+        return ProcessEvent(
+            event_type=event_type,
+            pid=node.pid,
+            name=node.name,
+            ppid=node.ppid,
+            cmdline=node.cmdline,
+            cwd=node.cwd,
+            watched=watched,
+        )
+
+    @staticmethod
+    def _publish(event: ProcessEvent, subscriptions: List[_Subscription]) -> None:
+        """Deliver an event to matching subscribers"""
+        for subscription in subscriptions:
+            if not subscription.matches(event):
+                continue
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                logger.error(f"Process event subscriber failed: {e}", exc_info=True)
+
+    # ==================== HELPERS ====================
+
+    def _open_selector(self) -> None:
+        """Create the selector and wake socket pair; open pidfds for watched PIDs"""
+        with self._lock:
+            if self._selector is not None:
+                return  # Previous event thread hasn't exited yet
+
+            self._selector = selectors.DefaultSelector()
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+            for pid in list(self._watched):
+                self._open_pidfd(pid)  # Already gone: the next poll reports the exit
+
+    def _close_selector(self) -> None:
+        """Close every pidfd, the wake socket pair and the selector"""
+        with self._lock:
+            for pid in list(self._pidfds):
+                self._close_pidfd(pid)
+
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            for sock in (self._wake_r, self._wake_w):
+                if sock is not None:
+                    sock.close()
+            self._wake_r = self._wake_w = None
+
+    def _open_pidfd(self, pid: int) -> bool:
+        """Register a pidfd for a watched PID (False if the process is gone)"""
+        if not PIDFD_AVAILABLE:
+            return True
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            return False
+        self._pidfds[pid] = pidfd
+        self._selector.register(pidfd, selectors.EVENT_READ, pid)
+        return True
+
+    def _wake(self) -> None:
+        """Interrupt a pending select()"""
+        wake_w = self._wake_w
+        if wake_w is None:
+            return
+        try:
+            wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_pidfd(self, pid: int) -> None:
+        pidfd = self._pidfds.pop(pid, None)
+        if pidfd is None:
+            return
+        if self._selector is not None:
+            try:
+                self._selector.unregister(pidfd)
+            except (KeyError, ValueError):
+                pass
+        os.close(pidfd)
+
+
+# Global event source (shared by all subscribers)
+_event_source: Optional[ProcessEventSource] = None
+
+
+def get_process_event_source() -> ProcessEventSource:
+    """Get or create the global process event source"""
+    global _event_source
+    if _event_source is None:
+        _event_source = ProcessEventSource()
+    return _event_source
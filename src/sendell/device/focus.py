@@ -0,0 +1,348 @@
+"""
+Focus tracking - which app had the foreground window, and for how long.
+
+A background thread samples the foreground window at a configurable rate:
+- Unchanged samples (same window, pid and title) are deduplicated
+- PID -> process name lookups are cached (LRU)
+- Focus changes close a FocusSpan (app, title hash, start, duration) into
+  a fixed-size ring buffer, so "what have I been doing for the last hour"
+  is answered from memory without touching the window system
+- Titles are kept only for the current window; history stores a hash
+
+Backends: Windows (pywin32) and a stub backend for tests / other platforms.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sendell.config import get_settings
+from sendell.device.monitor import ActiveWindow
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shown instead of app names / titles matched by the privacy settings
+PRIVATE_APP = "<private>"
+
+
+@dataclass(slots=True)
+class FocusSpan:
+    """One uninterrupted period of focus on a window"""
+
+    app: str
+    title_hash: str  # Empty for private windows
+    start: float  # Epoch seconds
+    duration: float  # Seconds
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "app": self.app,
+            "title_hash": self.title_hash,
+            "start": datetime.fromtimestamp(self.start).isoformat(),
+            "duration_seconds": round(self.duration, 1),
+        }
+
+
+class StubFocusBackend:
+    """
+    Scriptable backend for tests and platforms without a window system.
+
+    Usage:
+        backend = StubFocusBackend(names={100: "code.exe"})
+        backend.set_foreground(1, 100, "main.py - Visual Studio Code")
+    """
+
+    def __init__(self, names: Optional[Dict[int, str]] = None):
+        self.names = dict(names or {})
+        self.foreground: Optional[Tuple[int, int, str]] = None
+        self.name_lookups = 0
+
+    def set_foreground(self, window_id: int, pid: int, title: str) -> None:
+        """Pretend a window gained focus"""
+        self.foreground = (window_id, pid, title)
+
+    def clear_foreground(self) -> None:
+        """Pretend nothing has focus (e.g. screen locked)"""
+        self.foreground = None
+
+    def read_foreground(self) -> Optional[Tuple[int, int, str]]:
+        return self.foreground
+
+    def process_name(self, pid: int) -> str:
+        self.name_lookups += 1
+        return self.names.get(pid, "<Unknown>")
+
+
+class FocusTracker:
+    """
+    Background foreground-window sampler with focus history.
+
+    Usage:
+        tracker = get_focus_tracker()
+        tracker.start()
+        ...
+        summary = tracker.summarize(since_seconds=3600)
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        interval_seconds: Optional[float] = None,
+        max_spans: int = 5000,
+        name_cache_size: int = 256,
+    ):
+        """
+        Initialize focus tracker.
+
+        Args:
+            backend: Object with read_foreground() and process_name(pid);
+                None means focus tracking is unavailable
+            interval_seconds: Sampling interval (defaults to MonitoringConfig)
+            max_spans: Ring buffer size (oldest spans are dropped)
+            name_cache_size: PID -> process name cache entries
+        """
+        settings = get_settings()
+        self.backend = backend
+        self.interval = (
+            interval_seconds if interval_seconds is not None else settings.monitoring.focus_interval_seconds
+        )
+        self.blocked_apps = [app.lower() for app in settings.agent.blocked_apps]
+        self.blocked_windows = [title.lower() for title in settings.agent.blocked_windows]
+
+        self.spans: Deque[FocusSpan] = deque(maxlen=max_spans)
+        self._names: "OrderedDict[int, str]" = OrderedDict()
+        self._name_cache_size = name_cache_size
+
+        self._current_key: Optional[Tuple[int, int, str]] = None
+        self._current_span: Optional[FocusSpan] = None
+        self._current_window: Optional[ActiveWindow] = None
+        self._last_sample_at = 0.0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {"samples": 0, "changes": 0, "name_lookups": 0, "name_cache_hits": 0}
+
+    @property
+    def available(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> None:
+        """Start the sampling thread"""
+        if not self.available:
+            logger.warning("Focus tracking not available on this platform")
+            return
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="focus-tracker", daemon=True)
+        self._thread.start()
+        logger.info(f"Focus tracker started (every {self.interval}s)")
+
+    def stop(self) -> None:
+        """Stop sampling and close the open span"""
+        if not self.running:
+            return
+
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+        with self._lock:
+            self._close_span(time.time())
+        logger.info("Focus tracker stopped")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Focus sample failed: {e}")
+            self._stop.wait(self.interval)
+
+    # ==================== SAMPLING ====================
+
+    def sample(self, now: Optional[float] = None) -> bool:
+        """
+        Take one foreground sample.
+
+        Args:
+            now: Epoch timestamp (defaults to time.time())
+
+        Returns:
+            True if focus changed
+        """
+        now = time.time() if now is None else now
+        foreground = self.backend.read_foreground()
+
+        with self._lock:
+            self.stats["samples"] += 1
+            self._last_sample_at = now
+
+            if foreground == self._current_key:
+                return False  # Unchanged: nothing to record
+
+            self.stats["changes"] += 1
+            self._close_span(now)
+            self._current_key = foreground
+
+            if foreground is None:
+                self._current_window = None
+                return True
+
+            _, pid, title = foreground
+            app = self._process_name(pid)
+            private = self._is_private(app, title)
+
+            self._current_span = FocusSpan(
+                app=PRIVATE_APP if private else app,
+                title_hash="" if private else self._hash_title(title),
+                start=now,
+                duration=0.0,
+            )
+            self._current_window = ActiveWindow(
+                title=PRIVATE_APP if private else title,
+                process_name=PRIVATE_APP if private else app,
+                pid=pid,
+                timestamp=datetime.fromtimestamp(now),
+            )
+            return True
+
+    def _close_span(self, now: float) -> None:
+        """Move the open span into the ring buffer (lock held)"""
+        if self._current_span is not None:
+            self._current_span.duration = max(now - self._current_span.start, 0.0)
+            self.spans.append(self._current_span)
+            self._current_span = None
+
+    def _process_name(self, pid: int) -> str:
+        """PID -> process name, LRU cached"""
+        name = self._names.get(pid)
+        if name is not None:
+            self._names.move_to_end(pid)
+            self.stats["name_cache_hits"] += 1
+            return name
+
+        self.stats["name_lookups"] += 1
+        name = self.backend.process_name(pid)
+        self._names[pid] = name
+        if len(self._names) > self._name_cache_size:
+            self._names.popitem(last=False)
+        return name
+
+    def _is_private(self, app: str, title: str) -> bool:
+        app_lower = app.lower()
+        title_lower = title.lower()
+        return any(blocked in app_lower for blocked in self.blocked_apps) or any(
+            blocked in title_lower for blocked in self.blocked_windows
+        )
+
+    @staticmethod
+    def _hash_title(title: str) -> str:
+        return hashlib.blake2b(title.encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+    # ==================== QUERIES ====================
+
+    @property
+    def current(self) -> Optional[ActiveWindow]:
+        """Foreground window as of the last sample"""
+        with self._lock:
+            return self._current_window
+
+    def is_fresh(self, max_age: Optional[float] = None) -> bool:
+        """Whether the last sample is recent enough to answer get_active_window"""
+        max_age = self.interval * 2 if max_age is None else max_age
+        return self.running and time.time() - self._last_sample_at <= max_age
+
+    def get_history(self, since_seconds: float = 3600, now: Optional[float] = None) -> List[FocusSpan]:
+        """
+        Focus spans overlapping the last `since_seconds`, oldest first.
+
+        The open span is included with its duration so far.
+        """
+        now = time.time() if now is None else now
+        cutoff = now - since_seconds
+
+        with self._lock:
+            spans = [span for span in self.spans if span.start + span.duration >= cutoff]
+            if self._current_span is not None:
+                current = self._current_span
+                spans.append(FocusSpan(current.app, current.title_hash, current.start, now - current.start))
+
+        return spans
+
+    def summarize(self, since_seconds: float = 3600, now: Optional[float] = None) -> dict:
+        """
+        Time per app over the last `since_seconds`.
+
+        Returns:
+            dict with tracked_seconds, switches and apps (sorted by time)
+        """
+        now = time.time() if now is None else now
+        cutoff = now - since_seconds
+        spans = self.get_history(since_seconds, now)
+
+        per_app: Dict[str, float] = {}
+        windows: Dict[str, set] = {}
+        for span in spans:
+            # Clip spans that started before the window
+            seconds = span.start + span.duration - max(span.start, cutoff)
+            per_app[span.app] = per_app.get(span.app, 0.0) + seconds
+            windows.setdefault(span.app, set()).add(span.title_hash)
+
+        tracked = sum(per_app.values())
+        apps = [
+            {
+                "app": app,
+                "seconds": round(seconds, 0),
+                "percent": round(seconds * 100 / tracked, 1) if tracked else 0.0,
+                "distinct_windows": len(windows[app]),
+            }
+            for app, seconds in sorted(per_app.items(), key=lambda item: item[1], reverse=True)
+        ]
+
+        return {
+            "since_minutes": round(since_seconds / 60, 1),
+            "tracked_seconds": round(tracked, 0),
+            "switches": max(len(spans) - 1, 0),
+            "apps": apps,
+        }
+
+
+def _default_backend():
+    """Pick the focus backend for this platform (None if unsupported)"""
+    try:
+        import platform
+
+        if platform.system() == "Windows":
+            from sendell.device.platform.windows import WindowsFocusBackend
+
+            return WindowsFocusBackend()
+    except ImportError as e:
+        logger.warning(f"Focus tracking not available: {e}")
+    return None
+
+
+# Global focus tracker
+_focus_tracker: Optional[FocusTracker] = None
+
+
+def get_focus_tracker() -> FocusTracker:
+    """Get or create the global focus tracker (not started)"""
+    global _focus_tracker
+    if _focus_tracker is None:
+        _focus_tracker = FocusTracker(backend=_default_backend())
+    return _focus_tracker
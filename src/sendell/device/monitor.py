@@ -9,19 +9,30 @@ Provides cross-platform system monitoring:
 All methods are safe and respect privacy settings.
 """
 
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Deque, List, Optional, Tuple
 
 import psutil
 
 from sendell.config import get_settings
+from sendell.device.disks import DiskMonitor, get_disk_monitor
+from sendell.device.process_tree import (
+    ProcessNode,
+    ProcessSnapshotService,
+    get_snapshot_service,
+)
 from sendell.utils.errors import MonitoringError
 from sendell.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds between background CPU samples; a reading covers the newest pair
+CPU_SAMPLE_INTERVAL = 1.0
+
 
 @dataclass
 class SystemHealth:
@@ -36,6 +47,8 @@ class SystemHealth:
     disk_total_gb: float
     timestamp: datetime
     cpu_count: int
+    disks: List[dict] = field(default_factory=list)  # All partitions (DiskInfo.to_dict)
+    disk_io: Optional[dict] = None  # Read/write throughput since the previous check
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -48,6 +61,8 @@ class SystemHealth:
             "disk_used_gb": round(self.disk_used_gb, 2),
             "disk_total_gb": round(self.disk_total_gb, 2),
             "cpu_count": self.cpu_count,
+            "disks": self.disks,
+            "disk_io": self.disk_io,
             "timestamp": self.timestamp.isoformat(),
         }
 
@@ -100,12 +115,27 @@ class SystemMonitor:
     """
     Cross-platform system monitor using psutil.
 
-    Respects privacy settings and blocked apps.
+    Respects privacy settings and blocked apps. Meant to be long-lived
+    (see get_system_monitor()): it keeps static facts between calls, and a
+    background thread samples CPU times so health checks never wait for a
+    CPU interval. Shared by the MCP tools, the CLI and the agent threads.
     """
 
-    def __init__(self):
-        """Initialize system monitor"""
+    def __init__(
+        self,
+        snapshot_service: Optional[ProcessSnapshotService] = None,
+        disk_monitor: Optional[DiskMonitor] = None,
+    ):
+        """
+        Initialize system monitor.
+
+        Args:
+            snapshot_service: Process snapshot service (defaults to the shared one)
+            disk_monitor: Disk usage cache (defaults to the shared one)
+        """
         self.settings = get_settings()
+        self.snapshot_service = snapshot_service or get_snapshot_service()
+        self.disk_monitor = disk_monitor or get_disk_monitor()
         self._platform_monitor = None
 
         # Try to load platform-specific monitor
@@ -118,6 +148,64 @@ class SystemMonitor:
         except ImportError as e:
             logger.warning(f"Platform-specific monitoring not available: {e}")
 
+        # Static facts
+        self.cpu_count = psutil.cpu_count()
+
+        # CPU sampler: a daemon thread appends psutil.cpu_times() every
+        # CPU_SAMPLE_INTERVAL; readings use the newest two samples
+        self._cpu_lock = threading.Lock()
+        self._cpu_samples: Deque[Tuple[float, Any]] = deque(
+            [(time.monotonic(), psutil.cpu_times())], maxlen=2
+        )
+        self._cpu_stop = threading.Event()
+        self._cpu_thread = threading.Thread(target=self._run_cpu_sampler, name="cpu-sampler", daemon=True)
+        self._cpu_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background CPU sampler"""
+        self._cpu_stop.set()
+
+    def _run_cpu_sampler(self) -> None:
+        while not self._cpu_stop.wait(CPU_SAMPLE_INTERVAL):
+            try:
+                sample = (time.monotonic(), psutil.cpu_times())
+            except Exception as e:
+                logger.debug(f"CPU sample failed: {e}")
+                continue
+            with self._cpu_lock:
+                self._cpu_samples.append(sample)
+
+    @staticmethod
+    def _cpu_busy_total(times) -> tuple:
+        """(busy, total) seconds from psutil.cpu_times(), like psutil.cpu_percent()"""
+        total = sum(times)
+        # guest time is already included in user time on Linux
+        total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+        idle = times.idle + getattr(times, "iowait", 0.0)
+        return total - idle, total
+
+    def _sample_cpu(self) -> float:
+        """
+        System CPU percent over the newest pair of background samples.
+
+        Never sleeps: the reading is at most CPU_SAMPLE_INTERVAL old. Before
+        the sampler has a second sample (the monitor's first second), the
+        window runs from its start to now.
+        """
+        with self._cpu_lock:
+            samples = list(self._cpu_samples)
+        if len(samples) < 2:
+            samples.append((time.monotonic(), psutil.cpu_times()))
+
+        busy_before, total_before = self._cpu_busy_total(samples[-2][1])
+        busy_now, total_now = self._cpu_busy_total(samples[-1][1])
+
+        total_delta = total_now - total_before
+        percent = 0.0
+        if total_delta > 0:
+            percent = min(max((busy_now - busy_before) / total_delta * 100, 0.0), 100.0)
+        return round(percent, 1)
+
     def get_system_health(self) -> SystemHealth:
         """
         Get current system health snapshot.
@@ -129,9 +217,9 @@ class SystemMonitor:
             MonitoringError: If monitoring fails
         """
         try:
-            # CPU (interval=1 for more accurate reading)
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
+            # CPU (newest background sample pair, no waiting)
+            cpu_percent = self._sample_cpu()
+            cpu_count = self.cpu_count
 
             # Memory
             memory = psutil.virtual_memory()
@@ -139,11 +227,13 @@ class SystemMonitor:
             ram_used_gb = memory.used / (1024**3)
             ram_total_gb = memory.total / (1024**3)
 
-            # Disk (main partition)
-            disk = psutil.disk_usage("/")
+            # Disk (system drive; cached and refreshed in the background, hung mounts can't block)
+            disks = self.disk_monitor.get_usage()
+            disk = self.disk_monitor.system_disk()
             disk_percent = disk.percent
-            disk_used_gb = disk.used / (1024**3)
-            disk_total_gb = disk.total / (1024**3)
+            disk_used_gb = disk.used_gb
+            disk_total_gb = disk.total_gb
+            throughput = self.disk_monitor.get_throughput(consumer="health")
 
             health = SystemHealth(
                 cpu_percent=cpu_percent,
@@ -155,6 +245,8 @@ class SystemMonitor:
                 disk_total_gb=disk_total_gb,
                 timestamp=datetime.now(),
                 cpu_count=cpu_count,
+                disks=[d.to_dict() for d in disks],
+                disk_io=throughput.to_dict() if throughput else None,
             )
 
             logger.debug(f"System health: CPU={cpu_percent}%, RAM={ram_percent}%")
@@ -184,34 +276,15 @@ class SystemMonitor:
             processes = []
             blocked_apps = [app.lower() for app in self.settings.agent.blocked_apps]
 
-            for proc in psutil.process_iter(
-                ["pid", "name", "cpu_percent", "memory_info", "memory_percent", "status", "num_threads"]
-            ):
-                try:
-                    pinfo = proc.info
-                    proc_name = pinfo["name"].lower()
-
-                    # Skip blocked apps (privacy)
-                    if any(blocked in proc_name for blocked in blocked_apps):
-                        continue
-
-                    # Get memory in MB
-                    memory_mb = pinfo["memory_info"].rss / (1024 * 1024)
-
-                    process_info = ProcessInfo(
-                        pid=pinfo["pid"],
-                        name=pinfo["name"],
-                        cpu_percent=pinfo["cpu_percent"] or 0.0,
-                        memory_mb=memory_mb,
-                        memory_percent=pinfo["memory_percent"] or 0.0,
-                        status=pinfo["status"],
-                        num_threads=pinfo["num_threads"] or 0,
-                    )
-                    processes.append(process_info)
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+            for node in self.snapshot_service.get_tree():
+                proc_name = node.name.lower()
+
+                # Skip blocked apps (privacy)
+                if any(blocked in proc_name for blocked in blocked_apps):
                     continue
 
+                processes.append(self._to_process_info(node))
+
             # Sort processes
             if sort_by == "cpu":
                 processes.sort(key=lambda p: p.cpu_percent, reverse=True)
@@ -230,7 +303,8 @@ class SystemMonitor:
         """
         Get currently active window.
 
-        Uses platform-specific implementation if available.
+        Served from the focus tracker's last sample when it is running;
+        otherwise uses the platform-specific implementation if available.
 
         Returns:
             ActiveWindow info or None if not available
@@ -239,6 +313,12 @@ class SystemMonitor:
             MonitoringError: If getting active window fails
         """
         try:
+            from sendell.device.focus import get_focus_tracker
+
+            tracker = get_focus_tracker()
+            if tracker.is_fresh():
+                return tracker.current
+
             if self._platform_monitor:
                 return self._platform_monitor.get_active_window()
 
@@ -279,6 +359,14 @@ class SystemMonitor:
                 f"(threshold: {self.settings.monitoring.disk_threshold}%)"
             )
 
+        # Other partitions (system drive is reported above)
+        for disk in health.disks[1:]:
+            if disk["percent"] > self.settings.monitoring.disk_threshold:
+                warnings.append(
+                    f"Disk {disk['mountpoint']} usage high: {disk['percent']}% "
+                    f"(threshold: {self.settings.monitoring.disk_threshold}%)"
+                )
+
         return warnings
 
     def find_process_by_name(self, name: str) -> Optional[ProcessInfo]:
@@ -294,26 +382,37 @@ class SystemMonitor:
         name_lower = name.lower()
 
         try:
-            for proc in psutil.process_iter(
-                ["pid", "name", "cpu_percent", "memory_info", "memory_percent", "status", "num_threads"]
-            ):
-                try:
-                    if name_lower in proc.info["name"].lower():
-                        memory_mb = proc.info["memory_info"].rss / (1024 * 1024)
-                        return ProcessInfo(
-                            pid=proc.info["pid"],
-                            name=proc.info["name"],
-                            cpu_percent=proc.info["cpu_percent"] or 0.0,
-                            memory_mb=memory_mb,
-                            memory_percent=proc.info["memory_percent"] or 0.0,
-                            status=proc.info["status"],
-                            num_threads=proc.info["num_threads"] or 0,
-                        )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            for node in self.snapshot_service.get_tree():
+                if name_lower in node.name.lower():
+                    return self._to_process_info(node)
 
             return None
 
         except Exception as e:
             logger.error(f"Failed to find process '{name}': {e}")
             return None
+
+    @staticmethod
+    def _to_process_info(node: ProcessNode) -> ProcessInfo:
+        """Convert a snapshot node to ProcessInfo"""
+        return ProcessInfo(
+            pid=node.pid,
+            name=node.name,
+            cpu_percent=node.cpu_percent,
+            memory_mb=node.memory_mb,
+            memory_percent=node.memory_percent,
+            status=node.status,
+            num_threads=node.num_threads,
+        )
+
+
+# Global system monitor (shared by MCP tools, CLI and agent)
+_system_monitor: Optional[SystemMonitor] = None
+
+
+def get_system_monitor() -> SystemMonitor:
+    """Get or create the global system monitor"""
+    global _system_monitor
+    if _system_monitor is None:
+        _system_monitor = SystemMonitor()
+    return _system_monitor
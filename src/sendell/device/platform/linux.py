@@ -0,0 +1,477 @@
+"""
+Linux-specific process enumeration reading /proc directly.
+
+psutil issues separate open/read/close calls per attribute. This backend
+reads each process's stat once with raw os.open/os.read and fills a
+columnar table, which the process snapshot service turns into ProcessNode
+objects. cmdline, cwd and exe are read on first access (most consumers
+only need names, CPU and memory). psutil remains the fallback on other
+platforms.
+
+Also provides a minimal inotify binding (ctypes, no extra dependency)
+used by the project watcher.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sendell.device.process_tree import ProcessNode
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROC_AVAILABLE = sys.platform.startswith("linux") and os.path.isdir("/proc")
+
+# /proc/[pid]/stat state letters -> psutil status strings
+PROC_STATUS = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "Z": "zombie",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "X": "dead",
+    "x": "dead",
+    "I": "idle",
+    "K": "wake-kill",
+    "W": "waking",
+    "P": "parked",
+}
+
+# Field offsets in /proc/[pid]/stat after the ")" that closes comm
+# (man 5 proc numbers fields from 1; field 3 "state" is offset 0)
+_STATE = 0
+_PPID = 1
+_UTIME = 11
+_STIME = 12
+_NUM_THREADS = 17
+_STARTTIME = 19
+_RSS = 21
+
+# Kernel truncates comm to 15 characters
+_COMM_MAX = 15
+
+
+@dataclass
+class ProcTable:
+    """
+    Columnar process table read from /proc.
+
+    Row i of every column describes the same process.
+    """
+
+    pids: array = field(default_factory=lambda: array("i"))
+    ppids: array = field(default_factory=lambda: array("i"))
+    cpu_ticks: array = field(default_factory=lambda: array("Q"))  # utime + stime
+    start_ticks: array = field(default_factory=lambda: array("Q"))
+    num_threads: array = field(default_factory=lambda: array("i"))
+    rss_pages: array = field(default_factory=lambda: array("q"))
+    states: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    cmdlines: List[Optional[List[str]]] = field(default_factory=list)  # None = not read
+    timestamp: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+
+def _read_file(path: str, chunk_size: int = 4096) -> bytes:
+    """Read a /proc file with raw syscalls (no buffered file object)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, chunk_size)
+        if len(data) < chunk_size:
+            return data
+
+        # Long cmdlines need more than one read
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_cmdline(pid: int) -> List[str]:
+    """argv of a process ([] if it is gone or a kernel thread)"""
+    try:
+        cmdline = _read_file(f"/proc/{pid}/cmdline")
+    except OSError:
+        return []
+
+    args = cmdline.decode("utf-8", "replace").split("\0") if cmdline else []
+    if args and not args[-1]:
+        args.pop()  # Trailing NUL terminator
+    return args
+
+
+def _read_link(pid: int, name: str) -> str:
+    """Target of /proc/[pid]/cwd or /proc/[pid]/exe ("" for other users' processes and kernel threads)"""
+    try:
+        target = os.readlink(f"/proc/{pid}/{name}")
+    except OSError:
+        return ""
+    if target.endswith(" (deleted)") and not os.path.exists(target):
+        target = target[: -len(" (deleted)")]  # Binary replaced on disk (e.g. after an upgrade)
+    return target
+
+
+# Marks a LazyProcessNode field that hasn't been read yet
+_UNREAD = object()
+
+
+def _lazy_field(name: str, read: Callable[["LazyProcessNode"], object]) -> property:
+    """Property that reads a field from /proc on first access and keeps the value"""
+    slot = "_" + name
+
+    def get(node: "LazyProcessNode"):
+        value = node.__dict__[slot]
+        if value is _UNREAD:
+            value = node.__dict__[slot] = read(node)
+        return value
+
+    def set(node: "LazyProcessNode", value) -> None:
+        node.__dict__[slot] = value
+
+    return property(get, set)
+
+
+class LazyProcessNode(ProcessNode):
+    """
+    ProcessNode whose cmdline, cwd and exe come from /proc on first access.
+
+    A process that exits (or whose PID is reused) before the first access
+    reads as [] / "".
+    """
+
+    exe = _lazy_field("exe", lambda node: _read_link(node.pid, "exe"))
+    cmdline = _lazy_field("cmdline", lambda node: _read_cmdline(node.pid))
+    cwd = _lazy_field("cwd", lambda node: _read_link(node.pid, "cwd"))
+
+    def load(self) -> None:
+        """Read every lazy field now (e.g. while the process still exists)"""
+        self.exe, self.cmdline, self.cwd
+
+
+class LinuxProcReader:
+    """
+    Bulk /proc reader producing ProcTable snapshots.
+
+    Per process a snapshot costs one stat read (plus a cmdline read when
+    the kernel truncated the name). cmdline, cwd and exe are read when a
+    node's field is first used. CPU percent is computed from tick deltas
+    between consecutive reads, matching psutil's non-blocking cpu_percent().
+    """
+
+    def __init__(self, read_cwd: bool = True):
+        """
+        Initialize reader.
+
+        Args:
+            read_cwd: Resolve /proc/[pid]/cwd (one readlink per process whose cwd is used)
+
+        Raises:
+            ImportError: If /proc is not available on this platform
+        """
+        if not PROC_AVAILABLE:
+            raise ImportError("/proc is required for the Linux process backend")
+
+        self.read_cwd = read_cwd
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.boot_time = self._read_boot_time()
+        self.total_memory = self._read_total_memory()
+
+        self._prev_ticks: Dict[int, int] = {}
+        self._prev_time: Optional[float] = None
+
+    @staticmethod
+    def _read_boot_time() -> float:
+        """Read system boot time (btime) from /proc/stat"""
+        for line in _read_file("/proc/stat", 65536).splitlines():
+            if line.startswith(b"btime"):
+                return float(line.split()[1])
+        return 0.0
+
+    @staticmethod
+    def _read_total_memory() -> int:
+        """Read MemTotal from /proc/meminfo (bytes)"""
+        for line in _read_file("/proc/meminfo").splitlines():
+            if line.startswith(b"MemTotal:"):
+                return int(line.split()[1]) * 1024
+        return 1
+
+    def read_table(self) -> ProcTable:
+        """
+        Read every process in /proc into a columnar table.
+
+        Processes that exit mid-read are skipped silently. cmdlines are
+        only read for names the kernel truncated.
+
+        Returns:
+            ProcTable snapshot
+        """
+        table = ProcTable(timestamp=time.time())
+
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+
+            row = self._read_stat(entry)
+            if row is None:
+                continue  # Exited or inaccessible
+
+            comm, fields = row
+            args = _read_cmdline(int(entry)) if len(comm) >= _COMM_MAX else None
+
+            table.pids.append(int(entry))
+            table.ppids.append(int(fields[_PPID]))
+            table.cpu_ticks.append(int(fields[_UTIME]) + int(fields[_STIME]))
+            table.start_ticks.append(int(fields[_STARTTIME]))
+            table.num_threads.append(int(fields[_NUM_THREADS]))
+            table.rss_pages.append(int(fields[_RSS]))
+            table.states.append(fields[_STATE].decode("ascii", "replace"))
+            table.names.append(self._full_name(comm, args or []))
+            table.cmdlines.append(args)
+
+        return table
+
+    def read_node(self, pid: int) -> Optional[ProcessNode]:
+        """
+        Read a single process (CPU percent is not sampled).
+
+        cmdline and cwd are read right away, so they survive the process
+        (e.g. for its exit event); exe is read on first access.
+
+        Args:
+            pid: Process ID
+
+        Returns:
+            ProcessNode or None if the process is gone
+        """
+        row = self._read_stat(str(pid))
+        if row is None:
+            return None
+
+        comm, fields = row
+        args = _read_cmdline(pid)
+        rss = int(fields[_RSS]) * self.page_size
+
+        return LazyProcessNode(
+            pid=pid,
+            ppid=int(fields[_PPID]),
+            name=self._full_name(comm, args),
+            exe=_UNREAD,
+            cmdline=args,
+            cwd=_read_link(pid, "cwd") if self.read_cwd else "",
+            create_time=self.boot_time + int(fields[_STARTTIME]) / self.clock_ticks,
+            status=PROC_STATUS.get(fields[_STATE].decode("ascii", "replace"), "unknown"),
+            cpu_percent=0.0,
+            memory_rss=rss,
+            memory_percent=rss * 100.0 / self.total_memory,
+            num_threads=int(fields[_NUM_THREADS]),
+        )
+
+    @staticmethod
+    def _read_stat(entry: str) -> Optional[Tuple[str, List[bytes]]]:
+        """
+        Read stat for one PID directory.
+
+        Returns:
+            (comm, stat fields after comm) or None if unreadable
+        """
+        try:
+            stat = _read_file("/proc/" + entry + "/stat")
+        except OSError:
+            return None
+
+        # comm may contain spaces and parens: split on the LAST ")"
+        open_paren = stat.find(b"(")
+        close_paren = stat.rfind(b")")
+        if open_paren < 0 or close_paren < 0:
+            return None
+
+        comm = stat[open_paren + 1 : close_paren].decode("utf-8", "replace")
+        fields = stat[close_paren + 2 :].split()
+
+        return comm, fields
+
+    @staticmethod
+    def _full_name(comm: str, args: List[str]) -> str:
+        """Expand a truncated comm using argv[0], like psutil.Process.name()"""
+        if len(comm) >= _COMM_MAX and args:
+            exe_name = os.path.basename(args[0])
+            if exe_name.startswith(comm):
+                return exe_name
+        return comm
+
+    def read_nodes(self) -> Dict[int, ProcessNode]:
+        """
+        Read the process table and convert it to ProcessNode objects.
+
+        The nodes' cmdline, cwd and exe are read on first access.
+
+        Returns:
+            Mapping of PID -> ProcessNode
+        """
+        table = self.read_table()
+
+        now = time.monotonic()
+        elapsed = (now - self._prev_time) if self._prev_time is not None else 0.0
+        prev_ticks = self._prev_ticks
+
+        nodes: Dict[int, ProcessNode] = {}
+        new_ticks: Dict[int, int] = {}
+
+        for i in range(len(table)):
+            pid = table.pids[i]
+            ticks = table.cpu_ticks[i]
+            new_ticks[pid] = ticks
+
+            # First sighting reports 0.0, like psutil's first cpu_percent()
+            cpu_percent = 0.0
+            if elapsed > 0 and pid in prev_ticks:
+                delta = ticks - prev_ticks[pid]
+                cpu_percent = max(delta, 0) / self.clock_ticks / elapsed * 100
+
+            args = table.cmdlines[i]
+            rss = table.rss_pages[i] * self.page_size
+
+            nodes[pid] = LazyProcessNode(
+                pid=pid,
+                ppid=table.ppids[i],
+                name=table.names[i],
+                exe=_UNREAD,
+                cmdline=args if args is not None else _UNREAD,
+                cwd=_UNREAD if self.read_cwd else "",
+                create_time=self.boot_time + table.start_ticks[i] / self.clock_ticks,
+                status=PROC_STATUS.get(table.states[i], "unknown"),
+                cpu_percent=cpu_percent,
+                memory_rss=rss,
+                memory_percent=rss * 100.0 / self.total_memory,
+                num_threads=table.num_threads[i],
+            )
+
+        self._prev_ticks = new_ticks
+        self._prev_time = now
+
+        return nodes
+
+
+# ==================== INOTIFY ====================
+
+INOTIFY_AVAILABLE = sys.platform.startswith("linux")
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """
+    Thin ctypes wrapper over inotify(7).
+
+    The file descriptor is non-blocking; wait on fileno() with select/selectors
+    and call read_events() when it is readable.
+    """
+
+    def __init__(self):
+        """
+        Create an inotify instance.
+
+        Raises:
+            ImportError: If inotify is not available on this platform
+            OSError: If the kernel refuses a new instance
+        """
+        if not INOTIFY_AVAILABLE:
+            raise ImportError("inotify is only available on Linux")
+
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """
+        Watch a path.
+
+        Returns:
+            Watch descriptor (the same one if the path is already watched)
+
+        Raises:
+            OSError: ENOSPC when fs.inotify.max_user_watches is exhausted,
+                ENOENT/ENOTDIR if the path went away
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Stop watching (the kernel queues IN_IGNORED for the descriptor)"""
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self, buffer_size: int = 64 * 1024) -> List[Tuple[int, int, int, str]]:
+        """
+        Read all queued events without blocking.
+
+        Returns:
+            List of (wd, mask, cookie, name); name is "" for events on the watched path itself
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, buffer_size)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return events
+                raise
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, cookie, name))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -6,7 +6,7 @@ Requires: pywin32
 
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from sendell.device.monitor import ActiveWindow
 from sendell.utils.errors import MonitoringError
@@ -80,3 +80,43 @@ class WindowsMonitor:
         except Exception as e:
             logger.error(f"Failed to get active window: {e}")
             raise MonitoringError(f"Failed to get active window: {e}")
+
+
+class WindowsFocusBackend:
+    """
+    Foreground window reader for the focus tracker.
+
+    Per sample this costs GetForegroundWindow + GetWindowText; the owning
+    PID is only looked up when the foreground window handle changes.
+    """
+
+    def __init__(self):
+        """Initialize focus backend"""
+        if not WIN32_AVAILABLE:
+            raise ImportError("pywin32 is required for Windows focus tracking")
+        self._last_hwnd = 0
+        self._last_pid = 0
+
+    def read_foreground(self) -> Optional[Tuple[int, int, str]]:
+        """
+        Read the foreground window.
+
+        Returns:
+            (window handle, pid, title) or None if nothing has focus
+        """
+        hwnd = win32gui.GetForegroundWindow()
+        if not hwnd:
+            return None
+
+        if hwnd != self._last_hwnd:
+            _, self._last_pid = win32process.GetWindowThreadProcessId(hwnd)
+            self._last_hwnd = hwnd
+
+        return hwnd, self._last_pid, win32gui.GetWindowText(hwnd) or "<No Title>"
+
+    def process_name(self, pid: int) -> str:
+        """Resolve a PID to its executable name"""
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return "<Unknown>"
@@ -0,0 +1,290 @@
+"""
+Process tree snapshots.
+
+Builds the whole process table once per refresh and shares it between
+consumers (SystemMonitor, VSCodeMonitor, TerminalFinder):
+- One process-table walk per refresh, attributes batched with oneshot()
+- Parent -> children adjacency lists for cheap subtree queries
+- Short-lived cache so back-to-back consumers reuse the same walk
+- Optional /proc fast path on Linux (psutil everywhere else)
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import psutil
+
+from sendell.config import get_settings
+from sendell.utils.errors import MonitoringError
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ProcessNode:
+    """Single process in a snapshot"""
+
+    pid: int
+    ppid: int
+    name: str
+    exe: str
+    cmdline: List[str]
+    cwd: str
+    create_time: float
+    status: str
+    cpu_percent: float
+    memory_rss: int
+    memory_percent: float
+    num_threads: int
+
+    @property
+    def memory_mb(self) -> float:
+        """Resident memory in MB"""
+        return self.memory_rss / (1024 * 1024)
+
+
+class ProcessTree:
+    """
+    Immutable snapshot of the process table.
+
+    Nodes are indexed by PID and linked through parent -> children
+    adjacency lists, so subtree queries never touch the OS again.
+    """
+
+    def __init__(self, nodes: Dict[int, ProcessNode], timestamp: Optional[float] = None):
+        """
+        Build tree from process nodes.
+
+        Args:
+            nodes: Mapping of PID -> ProcessNode
+            timestamp: Time the snapshot was taken (time.time())
+        """
+        self.nodes = nodes
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+        self._children: Dict[int, List[int]] = defaultdict(list)
+        for node in nodes.values():
+            if node.ppid != node.pid:
+                self._children[node.ppid].append(node.pid)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[ProcessNode]:
+        return iter(self.nodes.values())
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.nodes
+
+    def get(self, pid: int) -> Optional[ProcessNode]:
+        """Get node by PID (None if not in snapshot)"""
+        return self.nodes.get(pid)
+
+    def children(self, pid: int) -> List[ProcessNode]:
+        """Get direct children of a process"""
+        return [self.nodes[child] for child in self._children.get(pid, ())]
+
+    def descendants(self, pid: int) -> List[ProcessNode]:
+        """
+        Get all descendants of a process (breadth-first).
+
+        Equivalent to psutil's children(recursive=True) but served
+        from the snapshot's adjacency lists.
+        """
+        result = []
+        queue = deque(self._children.get(pid, ()))
+        seen = set(queue)
+
+        while queue:
+            child_pid = queue.popleft()
+            result.append(self.nodes[child_pid])
+
+            for grandchild in self._children.get(child_pid, ()):
+                if grandchild not in seen:
+                    seen.add(grandchild)
+                    queue.append(grandchild)
+
+        return result
+
+    def find_by_name(self, names: Iterable[str]) -> List[ProcessNode]:
+        """
+        Find processes whose name matches one of the given names exactly.
+
+        Args:
+            names: Process names to match
+
+        Returns:
+            Matching nodes
+        """
+        wanted = set(names)
+        return [node for node in self.nodes.values() if node.name in wanted]
+
+
+class ProcessSnapshotService:
+    """
+    Builds and caches process tree snapshots.
+
+    All process-level consumers should go through this service so a
+    single refresh serves every query made within max_age_seconds.
+
+    Usage:
+        service = get_snapshot_service()
+        tree = service.get_tree()
+        for node in tree.descendants(vscode_pid):
+            print(node.name, node.cwd)
+    """
+
+    # Attributes fetched per process. process_iter() reads them inside
+    # Process.oneshot(), so each process costs one batch of syscalls.
+    ATTRS = [
+        "pid",
+        "ppid",
+        "name",
+        "exe",
+        "cmdline",
+        "cwd",
+        "create_time",
+        "status",
+        "cpu_percent",
+        "memory_info",
+        "num_threads",
+    ]
+
+    BACKENDS = ("auto", "psutil", "proc")
+
+    def __init__(self, max_age_seconds: float = 2.0, backend: str = "auto"):
+        """
+        Initialize snapshot service.
+
+        Args:
+            max_age_seconds: How long a snapshot is reused before refreshing
+            backend: 'auto' (use /proc when available), 'proc' or 'psutil'
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}")
+
+        self.max_age_seconds = max_age_seconds
+        self._tree: Optional[ProcessTree] = None
+        self._lock = threading.Lock()
+
+        # Try to load the native Linux reader
+        self._proc_reader = None
+        if backend != "psutil":
+            try:
+                from sendell.device.platform.linux import LinuxProcReader
+
+                self._proc_reader = LinuxProcReader()
+                logger.info("Using /proc process backend")
+            except ImportError as e:
+                if backend == "proc":
+                    raise
+                logger.debug(f"/proc backend not available, using psutil: {e}")
+
+        self.backend = "proc" if self._proc_reader else "psutil"
+
+        self.stats = {"refreshes": 0, "cache_hits": 0, "last_refresh_ms": 0.0}
+
+    def get_tree(self, max_age: Optional[float] = None) -> ProcessTree:
+        """
+        Get a process tree, refreshing only if the cached one is too old.
+
+        Args:
+            max_age: Override max snapshot age in seconds (0 forces refresh)
+
+        Returns:
+            ProcessTree snapshot
+
+        Raises:
+            MonitoringError: If the process table cannot be read
+        """
+        max_age = self.max_age_seconds if max_age is None else max_age
+
+        with self._lock:
+            tree = self._tree
+            if tree is not None and time.time() - tree.timestamp <= max_age:
+                self.stats["cache_hits"] += 1
+                return tree
+
+            return self._refresh_locked()
+
+    def refresh(self) -> ProcessTree:
+        """Force a new snapshot"""
+        with self._lock:
+            return self._refresh_locked()
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next query walks the table again"""
+        with self._lock:
+            self._tree = None
+
+    def _refresh_locked(self) -> ProcessTree:
+        """Walk the process table (caller holds the lock)"""
+        start = time.perf_counter()
+
+        try:
+            if self._proc_reader:
+                nodes = self._proc_reader.read_nodes()
+            else:
+                nodes = self._read_nodes()
+        except Exception as e:
+            logger.error(f"Failed to snapshot process table: {e}")
+            raise MonitoringError(f"Failed to snapshot process table: {e}")
+
+        self._tree = ProcessTree(nodes)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats["refreshes"] += 1
+        self.stats["last_refresh_ms"] = round(elapsed_ms, 2)
+        logger.debug(f"Process snapshot: {len(nodes)} processes in {elapsed_ms:.1f}ms")
+
+        return self._tree
+
+    def _read_nodes(self) -> Dict[int, ProcessNode]:
+        """Read every process with psutil"""
+        total_memory = psutil.virtual_memory().total or 1
+        nodes: Dict[int, ProcessNode] = {}
+
+        for proc in psutil.process_iter(self.ATTRS, ad_value=None):
+            try:
+                info = proc.info
+                memory_info = info["memory_info"]
+                rss = memory_info.rss if memory_info else 0
+
+                nodes[info["pid"]] = ProcessNode(
+                    pid=info["pid"],
+                    ppid=info["ppid"] or 0,
+                    name=info["name"] or "",
+                    exe=info["exe"] or "",
+                    cmdline=info["cmdline"] or [],
+                    cwd=info["cwd"] or "",
+                    create_time=info["create_time"] or 0.0,
+                    status=info["status"] or "unknown",
+                    cpu_percent=info["cpu_percent"] or 0.0,
+                    memory_rss=rss,
+                    memory_percent=rss * 100.0 / total_memory,
+                    num_threads=info["num_threads"] or 0,
+                )
+
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+
+        return nodes
+
+
+# Global snapshot service (shared by all monitors)
+_snapshot_service: Optional[ProcessSnapshotService] = None
+
+
+def get_snapshot_service() -> ProcessSnapshotService:
+    """Get or create the global process snapshot service"""
+    global _snapshot_service
+    if _snapshot_service is None:
+        settings = get_settings()
+        _snapshot_service = ProcessSnapshotService(
+            backend=settings.monitoring.process_backend.value
+        )
+    return _snapshot_service
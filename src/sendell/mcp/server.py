@@ -15,7 +15,7 @@ from mcp.types import Tool, TextContent
 
 from sendell.config import get_settings
 from sendell.mcp.tools.conversation import respond_to_user
-from sendell.mcp.tools.monitoring import get_active_window, get_system_health
+from sendell.mcp.tools.monitoring import get_active_window, get_focus_history, get_system_health
 from sendell.mcp.tools.process import list_top_processes, open_application
 from sendell.utils.logger import get_logger
 
@@ -79,6 +79,26 @@ class SendellMCPServer:
                         "required": [],
                     },
                 ),
+                Tool(
+                    name="get_focus_history",
+                    description=(
+                        "Summarize which apps had focus over the last N minutes "
+                        "(time per app, number of switches). "
+                        "Answered from in-memory history, cheap to call. "
+                        "Window titles are not returned."
+                    ),
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "minutes": {
+                                "type": "integer",
+                                "description": "How far back to look (1-1440)",
+                                "default": 60,
+                            },
+                        },
+                        "required": [],
+                    },
+                ),
                 Tool(
                     name="list_top_processes",
                     description=(
@@ -178,6 +198,8 @@ class SendellMCPServer:
                     result = get_system_health()
                 elif name == "get_active_window":
                     result = get_active_window()
+                elif name == "get_focus_history":
+                    result = get_focus_history(minutes=arguments.get("minutes", 60))
                 elif name == "list_top_processes":
                     n = arguments.get("n", 10)
                     sort_by = arguments.get("sort_by", "memory")
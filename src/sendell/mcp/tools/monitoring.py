@@ -4,11 +4,13 @@ MCP tools for system monitoring.
 Implements:
 - get_system_health: Get CPU, RAM, disk usage
 - get_active_window: Get current active window info
+- get_focus_history: Time spent per app, from the focus tracker
 """
 
 from typing import Any
 
-from sendell.device.monitor import SystemMonitor
+from sendell.device.focus import get_focus_tracker
+from sendell.device.monitor import get_system_monitor
 from sendell.security.permissions import get_permission_manager
 from sendell.utils.errors import MonitoringError
 from sendell.utils.logger import get_logger
@@ -40,7 +42,7 @@ def get_system_health() -> dict[str, Any]:
     logger.info("Getting system health")
 
     try:
-        monitor = SystemMonitor()
+        monitor = get_system_monitor()
         health = monitor.get_system_health()
 
         # Convert to dict for MCP
@@ -85,7 +87,7 @@ def get_active_window() -> dict[str, Any]:
     logger.info("Getting active window")
 
     try:
-        monitor = SystemMonitor()
+        monitor = get_system_monitor()
         active_window = monitor.get_active_window()
 
         if active_window is None:
@@ -108,3 +110,50 @@ def get_active_window() -> dict[str, Any]:
     except Exception as e:
         logger.error(f"Failed to get active window: {e}")
         raise MonitoringError(f"Failed to get active window: {e}")
+
+
+def get_focus_history(minutes: int = 60) -> dict[str, Any]:
+    """
+    Summarize which apps had focus over the last N minutes.
+
+    Answered from the focus tracker's in-memory history (no window
+    system calls). Starts the tracker if it isn't running yet.
+    This is a read-only operation (L1+ permission).
+
+    Args:
+        minutes: How far back to look (1-1440)
+
+    Returns:
+        Dict with tracked_seconds, switches, apps (time per app) and
+        recent spans
+
+    Raises:
+        MonitoringError: If focus tracking fails
+
+    Example:
+        >>> history = get_focus_history(60)
+        >>> print(history["apps"][0]["app"])
+    """
+    # Check permissions (L1+)
+    pm = get_permission_manager()
+    pm.require_permission("get_focus_history")
+
+    minutes = max(1, min(minutes, 1440))
+    logger.info(f"Getting focus history ({minutes} min)")
+
+    try:
+        tracker = get_focus_tracker()
+        if not tracker.available:
+            return {"available": False, "message": "Focus tracking is not available on this platform"}
+
+        if not tracker.running:
+            tracker.start()
+
+        result = tracker.summarize(since_seconds=minutes * 60)
+        result["available"] = True
+        result["recent_spans"] = [span.to_dict() for span in tracker.get_history(minutes * 60)[-20:]]
+        return result
+
+    except Exception as e:
+        logger.error(f"Failed to get focus history: {e}")
+        raise MonitoringError(f"Failed to get focus history: {e}")
@@ -9,7 +9,7 @@ Implements:
 from typing import Any, Optional
 
 from sendell.device.automation import AppController
-from sendell.device.monitor import SystemMonitor
+from sendell.device.monitor import get_system_monitor
 from sendell.security.permissions import get_permission_manager
 from sendell.utils.errors import AutomationError, MonitoringError
 from sendell.utils.logger import get_logger
@@ -50,7 +50,7 @@ def list_top_processes(n: int = 10, sort_by: str = "memory") -> dict[str, Any]:
         if sort_by not in ["memory", "cpu"]:
             raise ValueError("sort_by must be 'memory' or 'cpu'")
 
-        monitor = SystemMonitor()
+        monitor = get_system_monitor()
         processes = monitor.get_top_processes(n=n, sort_by=sort_by)
 
         # Convert to dicts
@@ -5,17 +5,25 @@ Runs continuously to:
 - Check for due reminders
 - Execute reminder actions
 - Monitor system state
+- React to watched processes exiting (e.g. crashed dev servers)
+- Surface threshold alerts from the alert engine
+- Attribute running processes to projects and record their usage
 - Make proactive suggestions (future)
 """
 
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Callable, List, Optional
+from typing import Callable, Deque, List, Optional
 
+from sendell.device.alerts import Alert, AlertEngine, AlertLevel
+from sendell.device.events import ProcessEvent, ProcessEventSource
 from sendell.proactive.identity import AgentIdentity
 from sendell.proactive.reminder_actions import execute_reminder_actions
 from sendell.proactive.reminders import Reminder, ReminderManager
 from sendell.proactive.temporal_clock import TemporalClock
+from sendell.projects.attribution import ProjectAttributor
 from sendell.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +43,11 @@ class ProactiveLoop:
         temporal_clock: TemporalClock,
         check_interval_seconds: int = 60,
         on_reminder_callback: Optional[Callable] = None,
+        process_events: Optional[ProcessEventSource] = None,
+        on_process_exit_callback: Optional[Callable] = None,
+        alert_engine: Optional[AlertEngine] = None,
+        on_alert_callback: Optional[Callable] = None,
+        project_attributor: Optional[ProjectAttributor] = None,
     ):
         """
         Initialize proactive loop.
@@ -45,6 +58,11 @@ class ProactiveLoop:
             temporal_clock: Temporal awareness system
             check_interval_seconds: How often to check (default 60s, use 60 for testing)
             on_reminder_callback: Callback function when reminder triggers
+            process_events: Process lifecycle event source (watched exits wake the loop)
+            on_process_exit_callback: Async callback when a watched process exits
+            alert_engine: Threshold alert engine (started and stopped with the loop)
+            on_alert_callback: Async callback for each raised/cleared alert
+            project_attributor: Refreshed (and recorded) once per check interval
         """
         self.identity = identity
         self.reminder_manager = reminder_manager
@@ -52,10 +70,33 @@ class ProactiveLoop:
         self.check_interval = check_interval_seconds
         self.on_reminder_callback = on_reminder_callback
 
+        self.process_events = process_events
+        self.on_process_exit_callback = on_process_exit_callback
+        self._pending_process_events: Deque[ProcessEvent] = deque(maxlen=100)
+        self.recent_process_exits: Deque[ProcessEvent] = deque(maxlen=20)
+        self._process_events_token: Optional[int] = None
+
+        self.alert_engine = alert_engine
+        self.on_alert_callback = on_alert_callback
+        self._pending_alerts: Deque[Alert] = deque(maxlen=100)
+        self._alert_token: Optional[int] = None
+
+        self.project_attributor = project_attributor
+        self._usage_refreshed_at: Optional[float] = None
+
         self.running = False
         self.loop_task: Optional[asyncio.Task] = None
-
-        self.stats = {"cycles_run": 0, "reminders_triggered": 0, "last_check_at": None}
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.stats = {
+            "cycles_run": 0,
+            "reminders_triggered": 0,
+            "process_exits": 0,
+            "alerts": 0,
+            "usage_refreshes": 0,
+            "last_check_at": None,
+        }
 
         logger.info(f"ProactiveLoop initialized (check every {check_interval_seconds}s)")
 
@@ -66,6 +107,21 @@ class ProactiveLoop:
             return
 
         self.running = True
+        self._event_loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+        # Watched process exits are pushed from the event thread
+        if self.process_events:
+            self._process_events_token = self.process_events.subscribe(
+                self._on_process_event, watched_only=True
+            )
+            self.process_events.start()
+
+        # Alerts are evaluated in their own task and wake the loop
+        if self.alert_engine:
+            self._alert_token = self.alert_engine.subscribe(self._on_alert)
+            await self.alert_engine.start()
+
         self.loop_task = asyncio.create_task(self._run_loop())
         logger.debug("ProactiveLoop started")
 
@@ -76,6 +132,16 @@ class ProactiveLoop:
 
         self.running = False
 
+        if self.process_events and self._process_events_token is not None:
+            self.process_events.unsubscribe(self._process_events_token)
+            self._process_events_token = None
+            self.process_events.stop()
+
+        if self.alert_engine and self._alert_token is not None:
+            self.alert_engine.unsubscribe(self._alert_token)
+            self._alert_token = None
+            await self.alert_engine.stop()
+
         if self.loop_task:
             self.loop_task.cancel()
             try:
@@ -92,7 +158,13 @@ class ProactiveLoop:
         try:
             while self.running:
                 await self._run_cycle()
-                await asyncio.sleep(self.check_interval)
+
+                # Sleep until the next check, or until a process event arrives
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.check_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
 
         except asyncio.CancelledError:
             logger.debug("Proactive loop cancelled")
@@ -124,7 +196,16 @@ class ProactiveLoop:
             else:
                 logger.debug(f"No reminders due yet")
 
-            # 2. Future: Check for patterns, habits, etc.
+            # 2. Handle watched processes that exited since last cycle
+            await self._process_exit_events()
+
+            # 3. Surface threshold alerts
+            await self._process_alerts()
+
+            # 4. Per-project resource usage
+            await self._refresh_project_usage()
+
+            # 5. Future: Check for patterns, habits, etc.
             # await self._check_habits()
             # await self._check_patterns()
 
@@ -207,6 +288,69 @@ class ProactiveLoop:
         except Exception as e:
             logger.error(f"Error processing reminder {reminder.reminder_id}: {e}", exc_info=True)
 
+    def _on_process_event(self, event: ProcessEvent) -> None:
+        """
+        Receive a process event (called on the event source's thread).
+
+        Queues the event and wakes the loop so it is handled immediately.
+        """
+        self._pending_process_events.append(event)
+        if self._event_loop and self._wakeup:
+            self._event_loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _process_exit_events(self):
+        """Handle queued watched-process exits"""
+        while self._pending_process_events:
+            event = self._pending_process_events.popleft()
+
+            self.stats["process_exits"] += 1
+            self.recent_process_exits.append(event)
+            logger.warning(f"Watched process exited: {event.name} (PID {event.pid})")
+
+            if self.on_process_exit_callback:
+                try:
+                    await self.on_process_exit_callback(event)
+                except Exception as e:
+                    logger.error(f"Process exit callback error: {e}")
+
+    def _on_alert(self, alert: Alert) -> None:
+        """Receive an alert from the alert engine and wake the loop"""
+        self._pending_alerts.append(alert)
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def _process_alerts(self):
+        """Handle queued threshold alerts"""
+        while self._pending_alerts:
+            alert = self._pending_alerts.popleft()
+
+            self.stats["alerts"] += 1
+            if alert.level == AlertLevel.RAISED:
+                logger.warning(f"⚠️ {alert.message}")
+            else:
+                logger.info(alert.message)
+
+            if self.on_alert_callback:
+                try:
+                    await self.on_alert_callback(alert)
+                except Exception as e:
+                    logger.error(f"Alert callback error: {e}")
+
+    async def _refresh_project_usage(self):
+        """Attribute processes to projects and record the usage (at most once per check interval)"""
+        if not self.project_attributor or not self.project_attributor.projects:
+            return
+
+        now = time.monotonic()
+        if self._usage_refreshed_at is not None and now - self._usage_refreshed_at < self.check_interval:
+            return
+        self._usage_refreshed_at = now
+
+        # Reads the process table and writes project_metrics: keep it off the event loop
+        usage = await asyncio.to_thread(self.project_attributor.refresh, True)
+        self.stats["usage_refreshes"] += 1
+        logger.debug(f"Project usage refreshed: {len(usage)} active project(s)")
+
     def get_status(self) -> dict:
         """Get current status of the proactive loop"""
         return {
@@ -214,6 +358,10 @@ class ProactiveLoop:
             "check_interval_seconds": self.check_interval,
             "cycles_run": self.stats["cycles_run"],
             "reminders_triggered": self.stats["reminders_triggered"],
+            "process_exits": self.stats["process_exits"],
+            "alerts": self.stats["alerts"],
+            "usage_refreshes": self.stats["usage_refreshes"],
+            "active_alerts": self.alert_engine.active_alerts() if self.alert_engine else [],
             "last_check_at": self.stats["last_check_at"].isoformat()
             if self.stats["last_check_at"]
             else None,
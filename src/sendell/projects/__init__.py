@@ -4,11 +4,32 @@ Project Management System
 Discover, monitor, and manage development projects on this machine.
 """
 
+from sendell.projects.attribution import ProjectAttributor
+from sendell.projects.config_cache import ConfigCache, close_config_cache, get_config_cache
+from sendell.projects.dependency_index import DependencyIndex, get_dependency_index
+from sendell.projects.index import ProjectIndex, get_project_index
+from sendell.projects.repository import ProjectRepository, get_project_repository
 from sendell.projects.scanner import ProjectScanner
+from sendell.projects.sizer import ProjectSizer, get_project_sizer
 from sendell.projects.types import ProjectType, Project, ProjectConfig
+from sendell.projects.watcher import ProjectWatcher, get_project_watcher
 
 __all__ = [
     "ProjectScanner",
+    "ProjectAttributor",
+    "ConfigCache",
+    "get_config_cache",
+    "close_config_cache",
+    "DependencyIndex",
+    "get_dependency_index",
+    "ProjectIndex",
+    "get_project_index",
+    "ProjectRepository",
+    "get_project_repository",
+    "ProjectSizer",
+    "get_project_sizer",
+    "ProjectWatcher",
+    "get_project_watcher",
     "ProjectType",
     "Project",
     "ProjectConfig",
@@ -0,0 +1,409 @@
+"""
+Project Resource Attribution
+
+Maps running processes to discovered projects and aggregates their
+resource usage (CPU, RSS, I/O) per project:
+- Project roots are stored in a path-prefix trie
+- Each process is matched by its cwd (then absolute cmdline paths),
+  walking the trie once per candidate path: O(processes x path depth)
+- I/O is reported as the bytes read/written since the previous
+  attribute() call, from per-process counters kept by (pid, create_time)
+- Results can be written into the project_metrics table, and exits of
+  watched processes into project_logs
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import psutil
+
+from sendell.device.events import ProcessEvent
+from sendell.device.process_tree import ProcessNode, ProcessTree, get_snapshot_service
+from sendell.projects.models import ProjectLogModel, ProjectMetricModel, ProjectModel, get_project_by_path
+from sendell.projects.types import Project
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _path_parts(path: str) -> List[str]:
+    """Split a path into normalized components (case-insensitive on Windows)"""
+    normalized = os.path.normcase(os.path.normpath(path))
+    return [part for part in normalized.split(os.sep) if part]
+
+
+class _TrieNode:
+    __slots__ = ("children", "project")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.project: Optional[Project] = None
+
+
+class PathTrie:
+    """
+    Path-prefix trie of project roots.
+
+    lookup() returns the deepest project whose root contains the path,
+    so nested projects win over their parents.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, path: Path, project: Project) -> None:
+        """Add a project root"""
+        node = self._root
+        for part in _path_parts(str(path)):
+            node = node.children.setdefault(part, _TrieNode())
+
+        if node.project is None:
+            self._size += 1
+        node.project = project
+
+    def remove(self, path: Path) -> None:
+        """Drop a project root (empty branches are left in place)"""
+        node = self._root
+        for part in _path_parts(str(path)):
+            node = node.children.get(part)
+            if node is None:
+                return
+
+        if node.project is not None:
+            self._size -= 1
+        node.project = None
+
+    def lookup(self, path: str) -> Optional[Project]:
+        """
+        Find the innermost project containing a path.
+
+        Args:
+            path: Absolute path (file or directory)
+
+        Returns:
+            Project or None
+        """
+        node = self._root
+        match = None
+
+        for part in _path_parts(path):
+            node = node.children.get(part)
+            if node is None:
+                break
+            if node.project is not None:
+                match = node.project
+
+        return match
+
+
+@dataclass
+class ProjectUsage:
+    """Aggregated resource usage of one project's processes"""
+
+    project: Project
+    cpu_percent: float = 0.0
+    rss_bytes: int = 0
+    io_read_bytes: int = 0  # Since the previous attribute() call
+    io_write_bytes: int = 0
+    pids: List[int] = field(default_factory=list)
+    oldest_start: Optional[float] = None  # create_time of the oldest process
+    measured_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def memory_mb(self) -> float:
+        return self.rss_bytes / (1024 * 1024)
+
+    @property
+    def uptime_seconds(self) -> Optional[float]:
+        if self.oldest_start is None:
+            return None
+        return max(time.time() - self.oldest_start, 0.0)
+
+    def add(self, node: ProcessNode) -> None:
+        """Add a process to the totals"""
+        self.pids.append(node.pid)
+        self.cpu_percent += node.cpu_percent
+        self.rss_bytes += node.memory_rss
+        if node.create_time and (self.oldest_start is None or node.create_time < self.oldest_start):
+            self.oldest_start = node.create_time
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "project": self.project.name,
+            "path": str(self.project.path),
+            "process_count": len(self.pids),
+            "pids": self.pids,
+            "cpu_percent": round(self.cpu_percent, 1),
+            "memory_mb": round(self.memory_mb, 1),
+            "io_read_mb": round(self.io_read_bytes / (1024 * 1024), 1),
+            "io_write_mb": round(self.io_write_bytes / (1024 * 1024), 1),
+            "uptime_seconds": round(self.uptime_seconds, 0) if self.uptime_seconds else None,
+            "measured_at": self.measured_at.isoformat(),
+        }
+
+
+class ProjectAttributor:
+    """
+    Attributes processes to discovered projects.
+
+    Usage:
+        attributor = ProjectAttributor(scan_result.projects_found)
+        usage = attributor.attribute()
+        for project_usage in usage.values():
+            print(project_usage.project.name, project_usage.memory_mb)
+    """
+
+    def __init__(self, projects: Optional[Iterable[Project]] = None):
+        """
+        Initialize attributor.
+
+        Args:
+            projects: Projects to attribute processes to
+        """
+        self._trie = PathTrie()
+        self.projects: Dict[str, Project] = {}
+        self.last_usage: Dict[str, ProjectUsage] = {}  # Result of the latest refresh()
+
+        # I/O counters per (pid, create_time) from the previous attribute() call
+        self._io_lock = threading.Lock()
+        self._io_previous: Dict[Tuple[int, float], Tuple[int, int]] = {}
+        self._io_since: Optional[float] = None  # time.time() of that call
+
+        if projects:
+            self.add_projects(projects)
+
+    def add_projects(self, projects: Iterable[Project]) -> None:
+        """Register (or replace) projects by path"""
+        for project in projects:
+            self.projects[str(project.path)] = project
+            self._trie.insert(project.path, project)
+
+    def remove_projects(self, paths: Iterable[Path]) -> None:
+        """Forget projects (e.g. deleted from disk)"""
+        for path in paths:
+            if self.projects.pop(str(path), None) is not None:
+                self._trie.remove(path)
+
+    def match_process(self, node: ProcessNode) -> Optional[Project]:
+        """
+        Find the project a process belongs to.
+
+        The cwd is checked first; absolute paths in the command line
+        (e.g. `python C:/dev/app/main.py`) are the fallback.
+        """
+        return self.match_paths(node.cwd, node.cmdline)
+
+    def match_paths(self, cwd: str, cmdline: List[str]) -> Optional[Project]:
+        """Find the project for a working directory and command line (see match_process)"""
+        if cwd:
+            project = self._trie.lookup(cwd)
+            if project:
+                return project
+
+        for arg in cmdline[1:]:
+            if os.path.isabs(arg):
+                project = self._trie.lookup(arg)
+                if project:
+                    return project
+
+        return None
+
+    def attribute(self, tree: Optional[ProcessTree] = None, include_io: bool = True) -> Dict[str, ProjectUsage]:
+        """
+        Aggregate resource usage per project.
+
+        Args:
+            tree: Process snapshot (defaults to the shared snapshot)
+            include_io: Read I/O counters for attributed processes
+
+        Returns:
+            Mapping of project path -> ProjectUsage (only projects with processes)
+        """
+        if not len(self._trie):
+            return {}
+
+        if tree is None:
+            tree = get_snapshot_service().get_tree()
+
+        usage: Dict[str, ProjectUsage] = {}
+        members: Dict[str, List[ProcessNode]] = {}
+
+        for node in tree:
+            project = self.match_process(node)
+            if project is None:
+                continue
+
+            key = str(project.path)
+            if key not in usage:
+                usage[key] = ProjectUsage(project=project)
+                members[key] = []
+            usage[key].add(node)
+            members[key].append(node)
+
+        # I/O counters are only read for attributed processes
+        if include_io:
+            self._add_io_deltas(usage, members)
+
+        logger.debug(f"Attributed processes to {len(usage)} project(s)")
+        return usage
+
+    def _add_io_deltas(self, usage: Dict[str, ProjectUsage], members: Dict[str, List[ProcessNode]]) -> None:
+        """
+        Add each process's I/O since the previous call to its project.
+
+        psutil counters are lifetime totals, so the previous counters are
+        kept per (pid, create_time) (a reused PID starts over). A process
+        first seen now counts in full if it started after the previous
+        call, otherwise its counters only become the baseline.
+        """
+        now = time.time()
+        with self._io_lock:
+            previous, since = self._io_previous, self._io_since
+            current: Dict[Tuple[int, float], Tuple[int, int]] = {}
+
+            for key, nodes in members.items():
+                project_usage = usage[key]
+                for node in nodes:
+                    counters = self._read_io(node.pid)
+                    if counters is None:
+                        continue
+                    ident = (node.pid, node.create_time)
+                    current[ident] = counters
+
+                    before = previous.get(ident)
+                    if before is None:
+                        started_since = since is not None and node.create_time >= since
+                        before = (0, 0) if started_since else counters
+                    project_usage.io_read_bytes += max(counters[0] - before[0], 0)
+                    project_usage.io_write_bytes += max(counters[1] - before[1], 0)
+
+            self._io_previous, self._io_since = current, now
+
+    @staticmethod
+    def _read_io(pid: int) -> Optional[Tuple[int, int]]:
+        """Lifetime (read_bytes, write_bytes) of a process (None if unavailable)"""
+        try:
+            counters = psutil.Process(pid).io_counters()
+            return counters.read_bytes, counters.write_bytes
+        except (psutil.Error, AttributeError, NotImplementedError):
+            return None
+
+    def record_metrics(self, session, usage: Dict[str, ProjectUsage]) -> int:
+        """
+        Write one project_metrics row per project with running processes.
+
+        Projects missing from the projects table are inserted first.
+
+        Args:
+            session: SQLAlchemy session
+            usage: Result of attribute()
+
+        Returns:
+            Number of metric rows written
+        """
+        written = 0
+
+        for project_usage in usage.values():
+            model = self._project_model(session, project_usage.project)
+            session.add(
+                ProjectMetricModel(
+                    project_id=model.id,
+                    cpu_percent=project_usage.cpu_percent,
+                    memory_mb=project_usage.memory_mb,
+                    io_read_bytes=project_usage.io_read_bytes,
+                    io_write_bytes=project_usage.io_write_bytes,
+                    process_count=len(project_usage.pids),
+                    process_id=min(project_usage.pids),
+                    is_running=True,
+                    uptime_seconds=project_usage.uptime_seconds,
+                    measured_at=project_usage.measured_at,
+                )
+            )
+            written += 1
+
+        return written
+
+    def record_process_exit(self, event: ProcessEvent) -> Optional[Project]:
+        """
+        Log a process exit (e.g. a watched terminal or dev server) in project_logs.
+
+        Exits of processes outside every known project are ignored.
+
+        Args:
+            event: EXITED process event
+
+        Returns:
+            Project the process belonged to, or None
+        """
+        project = self.match_paths(event.cwd, event.cmdline)
+        if project is None:
+            return None
+
+        from sendell.projects.database import session_scope
+
+        try:
+            with session_scope() as session:
+                model = self._project_model(session, project)
+                session.add(
+                    ProjectLogModel(
+                        project_id=model.id,
+                        log_text=f"Process exited: {event.name} (PID {event.pid}) {' '.join(event.cmdline)}".rstrip(),
+                        log_level="WARNING",
+                        source="process",
+                        logged_at=event.timestamp,
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Failed to record process exit: {e}")
+
+        return project
+
+    @staticmethod
+    def _project_model(session, project: Project) -> ProjectModel:
+        """Row for a project, inserted if it is not in the projects table yet"""
+        model = get_project_by_path(session, project.path)
+        if model is None:
+            model = ProjectModel(
+                name=project.name,
+                path=str(project.path),
+                project_type=project.project_type,
+                status=project.status,
+            )
+            session.add(model)
+            session.flush()
+        return model
+
+    def refresh(self, record: bool = True) -> Dict[str, ProjectUsage]:
+        """
+        Attribute the current process table and optionally persist it.
+
+        Args:
+            record: Write the results into project_metrics
+
+        Returns:
+            Mapping of project path -> ProjectUsage
+        """
+        usage = self.attribute()
+        self.last_usage = usage
+
+        if record and usage:
+            from sendell.projects.database import session_scope
+
+            try:
+                with session_scope() as session:
+                    written = self.record_metrics(session, usage)
+                logger.debug(f"Recorded {written} project metric row(s)")
+            except Exception as e:
+                logger.error(f"Failed to record project metrics: {e}")
+
+        return usage
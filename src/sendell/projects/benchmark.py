@@ -0,0 +1,576 @@
+"""
+Project Scanner Benchmark
+
+Reproducible synthetic trees and a runner for ProjectScanner:
+- generate_tree(): builds a tree from a TreeSpec (fan-out, depth, project
+  type mix, ignored directories, .gitignore'd data, config file sizes);
+  the same spec and seed always give the same tree
+- run_benchmark(): scans it in several scenarios (no index, cold index,
+  warm index, warm index after some configs changed) and records wall
+  time, directories visited / listed, file system calls and parse time
+  per parser
+- compare(): lists metrics that regressed against a saved report
+
+File system calls are counted by wrapping os.scandir / os.stat / os.lstat /
+os.listdir / open during a separate counting pass (no strace needed), so
+the wrappers never slow down the timed runs.
+"""
+
+import builtins
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sendell.projects import lockfiles, parsers
+from sendell.projects.index import ProjectIndex
+from sendell.projects.scanner import ProjectScanner
+from sendell.projects.types import ScanResult
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Scenarios run by default, in order
+SCENARIOS = ("no_index", "cold", "warm", "touched")
+
+# Names used for dependency / build directories the scanner prunes by name
+IGNORED_NAMES = ("node_modules", ".venv", "target", "build", "__pycache__")
+
+# Approximate bytes each generated dependency adds to a config file
+_BYTES_PER_DEPENDENCY = 32
+
+
+@dataclass
+class TreeSpec:
+    """Shape of a synthetic project tree"""
+
+    fan_out: int = 8  # Subdirectories per non-project directory
+    depth: int = 4  # Levels below the root (also the scanner's max_depth)
+    project_ratio: float = 0.35  # Chance a directory is a project
+    type_mix: Dict[str, float] = field(
+        default_factory=lambda: {"nodejs": 4, "python": 4, "rust": 1, "go": 1, "java": 1}
+    )
+    ignored_ratio: float = 0.3  # Chance a plain directory holds a node_modules-style subtree
+    gitignored_ratio: float = 0.2  # Chance a plain directory .gitignores a data/ subtree
+    junk_dirs: int = 20  # Directories in each ignored / gitignored subtree
+    config_kb: float = 2.0  # Target size of each config file
+    lockfiles: bool = True  # Write lockfiles next to Node.js and Rust configs
+    files_per_dir: int = 3  # Plain files per directory
+    seed: int = 1
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return asdict(self)
+
+
+@dataclass
+class TreeStats:
+    """What generate_tree() wrote"""
+
+    root: Path
+    directories: int = 0
+    files: int = 0
+    total_bytes: int = 0
+    projects_by_type: Dict[str, int] = field(default_factory=dict)  # Projects the scanner should find
+    hidden_projects: int = 0  # Projects inside ignored subtrees (should not be found)
+    config_files: List[Path] = field(default_factory=list)
+
+    @property
+    def projects(self) -> int:
+        return sum(self.projects_by_type.values())
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "root": str(self.root),
+            "directories": self.directories,
+            "files": self.files,
+            "total_bytes": self.total_bytes,
+            "projects": self.projects,
+            "projects_by_type": dict(self.projects_by_type),
+            "hidden_projects": self.hidden_projects,
+        }
+
+
+# ==================== TREE GENERATOR ====================
+
+
+def _config_files(project_type: str, name: str, dependencies: int, lockfile: bool) -> Dict[str, str]:
+    """Config (and lockfile) contents of one generated project"""
+    deps = [f"dep-{i}" for i in range(dependencies)]
+
+    if project_type == "nodejs":
+        files = {
+            "package.json": json.dumps(
+                {
+                    "name": name,
+                    "version": "1.0.0",
+                    "scripts": {"start": "node index.js", "test": "jest"},
+                    "dependencies": {dep: f"^{i % 9 + 1}.{i % 7}.0" for i, dep in enumerate(deps)},
+                },
+                indent=2,
+            )
+        }
+        if lockfile:
+            packages = {"": {"name": name, "version": "1.0.0"}}
+            packages.update(
+                {f"node_modules/{dep}": {"version": f"{i % 9 + 1}.{i % 7}.3"} for i, dep in enumerate(deps)}
+            )
+            files["package-lock.json"] = json.dumps(
+                {"name": name, "lockfileVersion": 3, "packages": packages}, indent=2
+            )
+        return files
+
+    if project_type == "python":
+        requirements = ",\n".join(f'    "{dep}>={i % 5 + 1}.0"' for i, dep in enumerate(deps))
+        return {
+            "pyproject.toml": f'[project]\nname = "{name}"\nversion = "0.1.0"\n'
+            f'requires-python = ">=3.10"\ndependencies = [\n{requirements}\n]\n'
+        }
+
+    if project_type == "rust":
+        files = {
+            "Cargo.toml": f'[package]\nname = "{name}"\nversion = "0.1.0"\nedition = "2021"\n\n[dependencies]\n'
+            + "".join(f'{dep} = "{i % 4 + 1}.0"\n' for i, dep in enumerate(deps))
+        }
+        if lockfile:
+            files["Cargo.lock"] = "version = 3\n\n" + "".join(
+                f'[[package]]\nname = "{dep}"\nversion = "{i % 4 + 1}.0.2"\n\n' for i, dep in enumerate(deps)
+            )
+        return files
+
+    if project_type == "go":
+        requires = "".join(f"\texample.com/{dep} v1.{i % 6}.0\n" for i, dep in enumerate(deps))
+        return {"go.mod": f"module example.com/{name}\n\ngo 1.22\n\nrequire (\n{requires})\n"}
+
+    if project_type == "java":
+        dependencies_xml = "".join(
+            f"    <dependency><groupId>org.example</groupId><artifactId>{dep}</artifactId>"
+            f"<version>1.{i % 5}</version></dependency>\n"
+            for i, dep in enumerate(deps)
+        )
+        return {
+            "pom.xml": '<?xml version="1.0"?>\n<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+            f"  <groupId>org.example</groupId>\n  <artifactId>{name}</artifactId>\n  <version>1.0</version>\n"
+            f"  <dependencies>\n{dependencies_xml}  </dependencies>\n</project>\n"
+        }
+
+    raise ValueError(f"Unsupported project type in type_mix: {project_type}")
+
+
+class _Generator:
+    """Writes one tree; all randomness comes from one seeded Random"""
+
+    def __init__(self, root: Path, spec: TreeSpec):
+        self.root = root
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.stats = TreeStats(root=root)
+        self.types = sorted(spec.type_mix)
+        self.weights = [spec.type_mix[name] for name in self.types]
+        self.dependencies = max(1, int(spec.config_kb * 1024 / _BYTES_PER_DEPENDENCY))
+
+    def write(self, path: Path, content: str) -> None:
+        path.write_text(content, encoding="utf-8")
+        self.stats.files += 1
+        self.stats.total_bytes += len(content)
+
+    def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        self.stats.directories += 1
+
+    def plain_files(self, directory: Path) -> None:
+        for i in range(self.spec.files_per_dir):
+            self.write(directory / f"notes_{i}.md", f"# {directory.name} {i}\n" + "lorem ipsum " * self.rng.randint(1, 40))
+
+    def project(self, directory: Path, hidden: bool = False) -> None:
+        project_type = self.rng.choices(self.types, weights=self.weights)[0]
+        self.mkdir(directory)
+        for name, content in _config_files(
+            project_type, directory.name, self.dependencies, self.spec.lockfiles
+        ).items():
+            self.write(directory / name, content)
+            if not hidden and name not in lockfiles.LOCKFILE_PARSERS:
+                self.stats.config_files.append(directory / name)
+        src = directory / "src"
+        self.mkdir(src)
+        self.plain_files(src)
+
+        if hidden:
+            self.stats.hidden_projects += 1
+        else:
+            self.stats.projects_by_type[project_type] = self.stats.projects_by_type.get(project_type, 0) + 1
+
+    def junk(self, directory: Path) -> None:
+        """Subtree the scanner should never enter (some of it looks like projects)"""
+        self.mkdir(directory)
+        frontier = [directory]
+        for i in range(self.spec.junk_dirs):
+            parent = frontier[i // 4] if i // 4 < len(frontier) else frontier[-1]
+            child = parent / f"pkg_{i}"
+            if i % 5 == 4:
+                self.project(child, hidden=True)
+            else:
+                self.mkdir(child)
+                self.plain_files(child)
+                frontier.append(child)
+
+    def fill(self, directory: Path, level: int) -> None:
+        for i in range(self.spec.fan_out):
+            child = directory / f"dir_{level}_{i}"
+            if self.rng.random() < self.spec.project_ratio:
+                self.project(child)
+                continue
+
+            self.mkdir(child)
+            self.plain_files(child)
+            if self.rng.random() < self.spec.ignored_ratio:
+                self.junk(child / self.rng.choice(IGNORED_NAMES))
+            if self.rng.random() < self.spec.gitignored_ratio:
+                self.write(child / ".gitignore", "# generated\n*.log\ndata/\n")
+                self.junk(child / "data")
+            if level < self.spec.depth:
+                self.fill(child, level + 1)
+
+
+def _backdate(root: Path, seconds: float = 3600) -> None:
+    """Move every mtime into the past, so index and config caches accept the entries"""
+    stamp = time.time() - seconds
+    for directory, _, files in os.walk(root, topdown=False):
+        for name in files:
+            os.utime(os.path.join(directory, name), (stamp, stamp))
+        os.utime(directory, (stamp, stamp))
+
+
+def generate_tree(root: Path, spec: Optional[TreeSpec] = None) -> TreeStats:
+    """
+    Build a synthetic tree below root (which must be empty or missing).
+
+    Args:
+        root: Directory to create the tree in
+        spec: Tree shape (defaults to TreeSpec())
+
+    Returns:
+        TreeStats with the expected scan results
+    """
+    spec = spec or TreeSpec()
+    root.mkdir(parents=True, exist_ok=True)
+    if any(root.iterdir()):
+        raise ValueError(f"Benchmark root is not empty: {root}")
+
+    generator = _Generator(root, spec)
+    generator.fill(root, 1)
+    _backdate(root)
+    return generator.stats
+
+
+# ==================== INSTRUMENTATION ====================
+
+
+class FsCallCounter:
+    """
+    Counts file system calls made by this process while active.
+
+    Wraps os.scandir, os.stat, os.lstat, os.listdir and open (builtin and
+    io.open) on entry and restores them on exit. Calls served from
+    DirEntry's cached data make no syscall and aren't counted.
+
+    Usage:
+        with FsCallCounter() as counter:
+            scanner.scan_directory(root)
+        print(counter.counts)  # {"scandir": 812, "stat": 1630, ...}
+    """
+
+    _OS_FUNCTIONS = ("scandir", "stat", "lstat", "listdir")
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._originals: List[Tuple[object, str, Callable]] = []
+
+    def _wrap(self, owner, attribute: str, label: str) -> None:
+        original = getattr(owner, attribute)
+        counts, lock = self.counts, self._lock
+
+        def counted(*args, **kwargs):
+            with lock:
+                counts[label] = counts.get(label, 0) + 1
+            return original(*args, **kwargs)
+
+        self._originals.append((owner, attribute, original))
+        setattr(owner, attribute, counted)
+
+    def __enter__(self) -> "FsCallCounter":
+        for name in self._OS_FUNCTIONS:
+            self._wrap(os, name, name)
+        self._wrap(builtins, "open", "open")
+        self._wrap(io, "open", "open")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for owner, attribute, original in reversed(self._originals):
+            setattr(owner, attribute, original)
+        self._originals.clear()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class ParserTimer:
+    """
+    Times config and lockfile parsers while active (calls and seconds per file name).
+
+    Replaces the entries of parsers.CONFIG_PARSERS and
+    lockfiles.LOCKFILE_PARSERS, which parse_project_config looks up per call.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._originals: List[Tuple[Dict, str, Callable]] = []
+
+    def __enter__(self) -> "ParserTimer":
+        for table in (parsers.CONFIG_PARSERS, lockfiles.LOCKFILE_PARSERS):
+            for name, parser in list(table.items()):
+                table[name] = self._timed(name, parser)
+                self._originals.append((table, name, parser))
+        return self
+
+    def _timed(self, name: str, parser: Callable) -> Callable:
+        def timed(path):
+            start = time.perf_counter()
+            try:
+                return parser(path)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+                    self.calls[name] = self.calls.get(name, 0) + 1
+
+        return timed
+
+    def __exit__(self, *exc) -> None:
+        for table, name, parser in self._originals:
+            table[name] = parser
+        self._originals.clear()
+
+
+# ==================== RUNNER ====================
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one scenario"""
+
+    name: str
+    wall_seconds: float  # Median of the timed runs
+    runs: List[float]
+    projects: int
+    directories_visited: int
+    directories_listed: int
+    directories_pruned: int
+    cache_hits: int
+    cache_misses: int
+    fs_calls: Dict[str, int]
+    parse_seconds: Dict[str, float]
+    parse_calls: Dict[str, int]
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "name": self.name,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "runs": [round(run, 4) for run in self.runs],
+            "projects": self.projects,
+            "directories_visited": self.directories_visited,
+            "directories_listed": self.directories_listed,
+            "directories_pruned": self.directories_pruned,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "fs_calls": dict(sorted(self.fs_calls.items())),
+            "fs_calls_total": sum(self.fs_calls.values()),
+            "parse_seconds": {name: round(seconds, 4) for name, seconds in sorted(self.parse_seconds.items())},
+            "parse_calls": dict(sorted(self.parse_calls.items())),
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of run_benchmark()"""
+
+    spec: TreeSpec
+    tree: TreeStats
+    workers: int
+    scenarios: List[ScenarioResult]
+    created_at: datetime = field(default_factory=datetime.now)
+
+    def scenario(self, name: str) -> Optional[ScenarioResult]:
+        return next((scenario for scenario in self.scenarios if scenario.name == name), None)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary (the format compare() reads)"""
+        return {
+            "created_at": self.created_at.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "workers": self.workers,
+            "spec": self.spec.to_dict(),
+            "tree": self.tree.to_dict(),
+            "scenarios": {scenario.name: scenario.to_dict() for scenario in self.scenarios},
+        }
+
+
+class _Scenario:
+    """Sets up the scanner state a scenario measures (the same way for every run)"""
+
+    def __init__(self, name: str, tree: TreeStats, spec: TreeSpec, workers: int, touch_ratio: float):
+        self.name = name
+        self.tree = tree
+        self.spec = spec
+        self.workers = workers
+        self.touch_ratio = touch_ratio
+        self._index: Optional[ProjectIndex] = None
+        self._touches = 0
+
+    def _scanner(self, index: Optional[ProjectIndex]) -> ProjectScanner:
+        return ProjectScanner(
+            max_depth=self.spec.depth,
+            timeout_seconds=600,
+            max_workers=self.workers,
+            index=index,
+            respect_ignore_files=True,
+        )
+
+    def _warm_index(self) -> ProjectIndex:
+        if self._index is None:
+            self._index = ProjectIndex(persist=False)
+            self._scanner(self._index).scan_directory(self.tree.root)
+        return self._index
+
+    def _touch_configs(self) -> None:
+        """Rewrite a fixed sample of configs with a new (old enough) mtime"""
+        self._touches += 1
+        rng = random.Random(self.spec.seed + self._touches)
+        count = max(1, int(len(self.tree.config_files) * self.touch_ratio))
+        stamp = time.time() - 1800 + self._touches
+        for path in rng.sample(self.tree.config_files, min(count, len(self.tree.config_files))):
+            path.write_text(path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+            os.utime(path, (stamp, stamp))
+
+    def prepare(self) -> ProjectScanner:
+        if self.name == "no_index":
+            return self._scanner(None)
+        if self.name == "cold":
+            return self._scanner(ProjectIndex(persist=False))
+        if self.name == "warm":
+            return self._scanner(self._warm_index())
+        if self.name == "touched":
+            index = self._warm_index()
+            self._touch_configs()
+            return self._scanner(index)
+        raise ValueError(f"Unknown scenario: {self.name}")
+
+
+def run_benchmark(
+    tree: TreeStats,
+    spec: TreeSpec,
+    scenarios: Tuple[str, ...] = SCENARIOS,
+    workers: int = 8,
+    repeat: int = 3,
+    touch_ratio: float = 0.1,
+) -> BenchmarkReport:
+    """
+    Scan a generated tree in each scenario.
+
+    Each scenario runs `repeat` timed scans, then one more with file system
+    call counting and parser timing turned on.
+
+    Args:
+        tree: Result of generate_tree()
+        spec: The spec the tree was generated from
+        scenarios: Names from SCENARIOS
+        workers: Scanner threads
+        repeat: Timed runs per scenario (the median is reported)
+        touch_ratio: Share of configs rewritten before each "touched" run
+
+    Returns:
+        BenchmarkReport
+    """
+    results: List[ScenarioResult] = []
+    for name in scenarios:
+        scenario = _Scenario(name, tree, spec, workers, touch_ratio)
+
+        runs = []
+        for _ in range(max(1, repeat)):
+            scanner = scenario.prepare()
+            start = time.perf_counter()
+            scanner.scan_directory(tree.root)
+            runs.append(time.perf_counter() - start)
+
+        scanner = scenario.prepare()
+        with FsCallCounter() as counter, ParserTimer() as timer:
+            result: ScanResult = scanner.scan_directory(tree.root)
+
+        results.append(ScenarioResult(
+            name=name,
+            wall_seconds=statistics.median(runs),
+            runs=runs,
+            projects=result.total_projects,
+            directories_visited=result.directories_visited,
+            directories_listed=result.directories_listed,
+            directories_pruned=sum(result.pruned_by_rule.values()),
+            cache_hits=result.cache_hits,
+            cache_misses=result.cache_misses,
+            fs_calls=dict(counter.counts),
+            parse_seconds=dict(timer.seconds),
+            parse_calls=dict(timer.calls),
+            errors=list(result.errors),
+        ))
+        logger.debug(f"Benchmark scenario {name}: {results[-1].to_dict()}")
+
+    return BenchmarkReport(spec=spec, tree=tree, workers=workers, scenarios=results)
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.25) -> List[str]:
+    """
+    Regressions of a report against a baseline (both BenchmarkReport.to_dict()).
+
+    Wall time may grow by `tolerance` (noise); directory and file system
+    call counts are deterministic for a given spec and may not grow at all.
+
+    Returns:
+        One message per regressed metric (empty = no regression)
+    """
+    problems: List[str] = []
+    if report.get("spec") != baseline.get("spec"):
+        problems.append("Tree spec differs from the baseline; counts are not comparable")
+        return problems
+
+    for name, base in baseline.get("scenarios", {}).items():
+        current = report.get("scenarios", {}).get(name)
+        if current is None:
+            continue
+        if current["projects"] != base["projects"]:
+            problems.append(f"{name}: found {current['projects']} projects, baseline {base['projects']}")
+        if base["wall_seconds"] > 0 and current["wall_seconds"] > base["wall_seconds"] * (1 + tolerance):
+            problems.append(
+                f"{name}: wall time {current['wall_seconds']:.3f}s vs {base['wall_seconds']:.3f}s "
+                f"(+{current['wall_seconds'] / base['wall_seconds'] - 1:.0%})"
+            )
+        for metric in ("directories_listed", "fs_calls_total"):
+            if current[metric] > base[metric]:
+                problems.append(f"{name}: {metric} {current[metric]} vs {base[metric]}")
+    return problems
@@ -0,0 +1,346 @@
+"""
+Parsed Config Cache
+
+Caches ProjectConfig results of parse_project_config by file identity:
+- Key: path, validated by (size, mtime_ns) and optionally a blake2b content
+  hash, so a file rewritten with identical content (git checkout, touch)
+  is still a hit
+- In memory with LRU eviction; persisted to SQLite (scan_config_files)
+  between runs, configs are only revalidated from JSON on first use
+- Large files can be parsed in a process pool on cold scans, so pom.xml /
+  big package.json parsing doesn't serialize scanner threads on the GIL
+- Hit rate is tracked for tuning
+"""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from sendell.config import get_settings
+from sendell.projects.models import ScanConfigFileModel
+from sendell.projects.parsers import parse_project_config
+from sendell.projects.types import ProjectConfig
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Files modified this recently are not cached: a second change within the
+# file system's mtime granularity would go unnoticed ("racily clean")
+RACY_WINDOW_NS = 2_000_000_000
+
+# Smaller files parse faster in-thread than the round trip to a worker process
+POOL_MIN_BYTES = 32 * 1024
+
+
+@dataclass
+class _Entry:
+    """One cached parse result"""
+
+    size: int
+    mtime_ns: int
+    content_hash: Optional[str]
+    config_json: Optional[str]  # As persisted; validated into config on first use
+    config: Optional[ProjectConfig] = None
+    loaded: bool = False  # config is valid (may legitimately be None)
+
+    def get_config(self) -> Optional[ProjectConfig]:
+        if not self.loaded:
+            self.config = ProjectConfig.model_validate_json(self.config_json) if self.config_json else None
+            self.loaded = True
+        return self.config
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConfigCache:
+    """
+    LRU cache of parsed project config files.
+
+    Thread-safe: scanner workers load concurrently.
+
+    Usage:
+        cache = get_config_cache()
+        config, hit = cache.load(Path("app/package.json"))
+        print(cache.hit_rate)
+        cache.flush()
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        verify_hash: Optional[bool] = None,
+        parse_processes: Optional[int] = None,
+        persist: bool = True,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: LRU size (defaults to ProjectsConfig.project_config_cache_size)
+            verify_hash: Also match by content hash (defaults to ProjectsConfig.project_config_hash)
+            parse_processes: Worker processes for large files, 0 = parse in-thread
+                (defaults to ProjectsConfig.project_parse_processes)
+            persist: Load from and flush to the project database
+        """
+        settings = get_settings().projects
+        self.max_entries = max_entries if max_entries is not None else settings.project_config_cache_size
+        self.verify_hash = verify_hash if verify_hash is not None else settings.project_config_hash
+        self.parse_processes = parse_processes if parse_processes is not None else settings.project_parse_processes
+        self.persist = persist
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self.stats = {"hits": 0, "hash_hits": 0, "misses": 0, "evictions": 0, "pool_parses": 0}
+
+        if persist:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of loads answered without parsing (0.0 before any load)"""
+        hits = self.stats["hits"] + self.stats["hash_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        """Counters, size and hit rate"""
+        return {**self.stats, "entries": len(self._entries), "hit_rate": round(self.hit_rate, 3)}
+
+    # ==================== LOOKUP ====================
+
+    def load(self, path: Path) -> Tuple[Optional[ProjectConfig], bool]:
+        """
+        Parsed config for a file, from the cache when the file is unchanged.
+
+        Args:
+            path: Config file (package.json, pyproject.toml, ...)
+
+        Returns:
+            (config or None, hit)
+        """
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return parse_project_config(path), False
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.size == st.st_size and entry.mtime_ns == st.st_mtime_ns:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry.get_config(), True
+
+        content_hash = None
+        if self.verify_hash:
+            try:
+                content_hash = _hash_file(path)
+            except OSError:
+                pass
+
+            if content_hash and entry is not None and entry.content_hash == content_hash:
+                # Same bytes, new stat (touched or rewritten): revalidate without parsing
+                with self._lock:
+                    self.stats["hash_hits"] += 1
+                    if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+                        entry.size, entry.mtime_ns = st.st_size, st.st_mtime_ns
+                        self._store(key, entry)
+                return entry.get_config(), True
+
+        config = self._parse(path, st.st_size)
+
+        with self._lock:
+            self.stats["misses"] += 1
+            if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+                self._store(key, _Entry(
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    content_hash=content_hash,
+                    config_json=None,
+                    config=config,
+                    loaded=True,
+                ))
+
+        return config, False
+
+    def _parse(self, path: Path, size: int) -> Optional[ProjectConfig]:
+        """Parse in-thread, or in the process pool for large files"""
+        if self.parse_processes <= 0 or size < POOL_MIN_BYTES:
+            return parse_project_config(path)
+
+        try:
+            config = self._get_pool().submit(parse_project_config, path).result()
+            with self._lock:
+                self.stats["pool_parses"] += 1
+            return config
+        except Exception as e:
+            logger.warning(f"Config parse in worker process failed, parsing in-thread: {e}")
+            return parse_project_config(path)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking a process with scanner threads running can deadlock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.parse_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        """Insert and evict least recently used entries (lock held)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._dirty.add(key)
+        self._deleted.discard(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._dirty.discard(evicted)
+            self._deleted.add(evicted)
+            self.stats["evictions"] += 1
+
+    def forget_tree(self, path: str) -> int:
+        """
+        Drop cached configs at or below a directory (e.g. after it was deleted).
+
+        Returns:
+            Number of entries dropped
+        """
+        prefix = path.rstrip(os.sep) + os.sep
+        with self._lock:
+            gone = [key for key in self._entries if key.startswith(prefix)]
+            for key in gone:
+                del self._entries[key]
+                self._dirty.discard(key)
+                self._deleted.add(key)
+        return len(gone)
+
+    # ==================== PERSISTENCE ====================
+
+    def _load(self) -> None:
+        """Load the most recently parsed entries from the database"""
+        from sendell.projects.database import session_scope
+
+        start = time.perf_counter()
+        try:
+            with session_scope() as session:
+                rows = session.execute(
+                    select(
+                        ScanConfigFileModel.path,
+                        ScanConfigFileModel.size,
+                        ScanConfigFileModel.mtime_ns,
+                        ScanConfigFileModel.content_hash,
+                        ScanConfigFileModel.config_json,
+                    )
+                    .order_by(ScanConfigFileModel.parsed_at.desc())
+                    .limit(self.max_entries)
+                ).all()
+        except Exception as e:
+            logger.error(f"Failed to load config cache: {e}")
+            return
+
+        # Oldest first, so the most recent rows end up most recently used
+        for path, size, mtime_ns, content_hash, config_json in reversed(rows):
+            self._entries[path] = _Entry(
+                size=size, mtime_ns=mtime_ns, content_hash=content_hash, config_json=config_json
+            )
+
+        logger.debug(
+            f"Loaded config cache: {len(self._entries)} entries in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+
+    def flush(self) -> int:
+        """
+        Write new and evicted entries to the database in one transaction.
+
+        If the write fails, the entries stay pending for the next flush.
+
+        Returns:
+            Number of rows written or deleted
+        """
+        with self._lock:
+            dirty = [(key, self._entries[key]) for key in self._dirty if key in self._entries]
+            deleted = list(self._deleted)
+            self._dirty.clear()
+            self._deleted.clear()
+
+        if not self.persist or not (dirty or deleted):
+            return 0
+
+        from sendell.projects.database import bulk_delete, bulk_upsert, session_scope
+
+        now = datetime.now()
+        rows: List[Dict] = []
+        for key, entry in dirty:
+            config = entry.get_config()
+            rows.append({
+                "path": key,
+                "size": entry.size,
+                "mtime_ns": entry.mtime_ns,
+                "content_hash": entry.content_hash,
+                "config_json": config.model_dump_json() if config else None,
+                "parsed_at": now,
+            })
+
+        try:
+            with session_scope() as session:
+                bulk_upsert(session, ScanConfigFileModel, rows)
+                bulk_delete(session, ScanConfigFileModel.path, deleted)
+        except Exception as e:
+            logger.error(f"Failed to flush config cache: {e}")
+            with self._lock:
+                # Skip keys evicted or stored again since the swap
+                self._dirty.update(key for key, _ in dirty if key in self._entries and key not in self._deleted)
+                self._deleted.update(key for key in deleted if key not in self._dirty and key not in self._entries)
+            return 0
+
+        return len(rows) + len(deleted)
+
+    def close(self) -> None:
+        """Shut down the parse pool"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global config cache
+_config_cache: Optional[ConfigCache] = None
+
+
+def get_config_cache() -> ConfigCache:
+    """Get or create the global config cache (loaded from the database)"""
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = ConfigCache()
+    return _config_cache
+
+
+def close_config_cache() -> None:
+    """Shut down the global config cache's parse pool (no-op if it was never created)"""
+    if _config_cache is not None:
+        _config_cache.close()
@@ -0,0 +1,175 @@
+"""
+Project Database Access
+
+Engine and session helpers for the project management tables.
+Uses the SQLite database configured in MemoryConfig.db_path:
+- WAL journal, so the agent, watcher and scanner threads can read while
+  one of them writes
+- Connections are pooled and reused across sessions
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, delete, event, inspect
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from sendell.config import get_settings
+from sendell.projects.models import (
+    ScanConfigFileModel,
+    ScanDirectoryModel,
+    ScanGitModel,
+    ScanSizeModel,
+    init_database,
+)
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Scanner caches: safe to drop and rebuild when their schema changes
+CACHE_MODELS = (ScanDirectoryModel, ScanConfigFileModel, ScanSizeModel, ScanGitModel)
+
+# Values per DELETE ... IN (...) (keeps bound parameters under SQLite's limit)
+DELETE_BATCH_SIZE = 500
+
+# Connection pool (one connection per concurrently writing/reading thread)
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 5
+
+# Seconds a connection waits for another writer's lock before failing
+BUSY_TIMEOUT_SECONDS = 15
+
+# Global engine and session factory
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+
+
+def get_engine(db_path: Optional[Path] = None) -> Engine:
+    """
+    Get or create the project database engine.
+
+    Args:
+        db_path: SQLite file (defaults to settings.memory.db_path).
+            Only used when the engine is first created.
+
+    Returns:
+        SQLAlchemy engine with the schema created
+    """
+    global _engine, _session_factory
+    if _engine is None:
+        if db_path is None:
+            db_path = get_settings().memory.db_path
+
+        _engine = create_sqlite_engine(db_path)
+        _reset_stale_cache_tables(_engine)
+        init_database(_engine)
+        _session_factory = sessionmaker(bind=_engine, expire_on_commit=False)
+
+        logger.info(f"Project database ready: {db_path}")
+    return _engine
+
+
+def create_sqlite_engine(db_path: Path) -> Engine:
+    """
+    New engine for a SQLite file, with the pool and pragmas used by Sendell.
+
+    The schema isn't created; get_engine() does that for the shared engine.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        connect_args={"timeout": BUSY_TIMEOUT_SECONDS, "check_same_thread": False},
+    )
+    event.listen(engine, "connect", _configure_connection)
+    return engine
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Transactional session scope.
+
+    Commits on success, rolls back on error, always closes.
+
+    Example:
+        >>> with session_scope() as session:
+        ...     session.add(ProjectModel(...))
+    """
+    get_engine()
+    session = _session_factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _configure_connection(dbapi_connection, connection_record) -> None:
+    """Per-connection pragmas: WAL journal, fewer fsyncs (safe with WAL)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _reset_stale_cache_tables(engine: Engine) -> None:
+    """Drop cache tables whose columns no longer match the models (create_all rebuilds them)"""
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    for model in CACHE_MODELS:
+        table = model.__table__
+        if table.name not in existing:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if columns != set(table.columns.keys()):
+            logger.info(f"Rebuilding cache table {table.name} (schema changed)")
+            table.drop(engine)
+
+
+def bulk_upsert(
+    session: Session,
+    model,
+    rows: List[dict],
+    key: str = "path",
+    exclude_from_update: Tuple[str, ...] = (),
+) -> None:
+    """
+    INSERT ... ON CONFLICT(key) DO UPDATE for many rows.
+
+    The statement is compiled once and executed as executemany; all rows
+    must have the same columns.
+
+    Args:
+        session: SQLAlchemy session
+        model: Mapped class
+        rows: Column values per row
+        key: Unique column the conflict is detected on
+        exclude_from_update: Columns only set on insert (kept on existing rows)
+    """
+    if not rows:
+        return
+    stmt = insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={
+            column: stmt.excluded[column]
+            for column in rows[0]
+            if column != key and column not in exclude_from_update
+        },
+    )
+    session.connection().execute(stmt, rows)
+
+
+def bulk_delete(session: Session, column, values: List) -> None:
+    """DELETE ... WHERE column IN (...), in batches"""
+    for i in range(0, len(values), DELETE_BATCH_SIZE):
+        batch = values[i : i + DELETE_BATCH_SIZE]
+        session.execute(delete(column.class_).where(column.in_(batch)))
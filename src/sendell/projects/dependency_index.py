@@ -0,0 +1,337 @@
+"""
+Cross-Project Dependency Index
+
+Inverted index from (ecosystem, package) to the projects that declare it:
+- Built from ProjectConfig.dependencies / dev_dependencies, updated per
+  project as scans and the watcher report changes
+- Package names are normalized per ecosystem (PEP 503 for PyPI, lowercase
+  for npm), PEP 508 strings ("pydantic>=2,<3") are split into name + spec
+- Lookups are a dict access plus a pass over the matches, independent of
+  how many projects are indexed
+- Lockfile versions (ProjectConfig.resolved_versions) are attached to the
+  declared dependencies, and packages only present in the lockfile are
+  indexed as transitive
+- Optional version constraint ("<4.17.21", ">=1,<2") is checked against the
+  resolved version, else the lowest version the declared spec allows
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sendell.projects.types import Project, ProjectType
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Package ecosystem per project type
+ECOSYSTEMS = {
+    ProjectType.NODEJS: "npm",
+    ProjectType.PYTHON: "pypi",
+    ProjectType.RUST: "cargo",
+    ProjectType.GO: "go",
+    ProjectType.JAVA: "maven",
+    ProjectType.RUBY: "rubygems",
+    ProjectType.PHP: "composer",
+    ProjectType.DOTNET: "nuget",
+}
+
+# Entries that aren't packages (language / runtime pins)
+IGNORED_PACKAGES = {
+    "pypi": {"python"},
+    "composer": {"php"},
+}
+
+_PEP508_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(.*)$")
+_VERSION = re.compile(r"\d+(?:\.\d+)*")
+_CONSTRAINT = re.compile(r"(<=|>=|==|!=|~=|<|>|=)?\s*v?(\d+(?:\.\d+)*)")
+
+
+def normalize_package(ecosystem: str, name: str) -> str:
+    """Canonical package name for lookups"""
+    name = name.strip()
+    if ecosystem == "pypi":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    if ecosystem in ("npm", "composer", "nuget", "cargo"):
+        return name.lower()
+    return name  # go module paths and maven coordinates are case-sensitive
+
+
+def parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """First dotted number in a string as a tuple ("^4.17.15" -> (4, 17, 15))"""
+    match = _VERSION.search(version)
+    if match is None:
+        return None
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+def _compare(left: Tuple[int, ...], right: Tuple[int, ...]) -> int:
+    """Compare version tuples, padding the shorter one with zeros"""
+    size = max(len(left), len(right))
+    left = left + (0,) * (size - len(left))
+    right = right + (0,) * (size - len(right))
+    return (left > right) - (left < right)
+
+
+def minimum_version(spec: str) -> Optional[Tuple[int, ...]]:
+    """
+    Lowest version a declared spec allows.
+
+    "^4.17.15", "~=1.10", ">=1.10,<2", "1.x" -> first bound that isn't an
+    upper bound; "<2" alone -> (0,). None if the spec has no version
+    ("*", "latest", git URLs).
+    """
+    bounds = _CONSTRAINT.findall(spec)
+    if not bounds:
+        return None
+    for op, version in bounds:
+        if op not in ("<", "<=", "!="):
+            return tuple(int(part) for part in version.split("."))
+    return (0,)
+
+
+def parse_constraint(constraint: str) -> List[Tuple[str, Tuple[int, ...]]]:
+    """
+    Parse a query constraint into (operator, version) clauses.
+
+    Clauses are separated by commas or spaces; a bare version means "==".
+
+    Raises:
+        ValueError: If the constraint contains no version
+    """
+    clauses = [
+        (op or "==", tuple(int(part) for part in version.split(".")))
+        for op, version in _CONSTRAINT.findall(constraint)
+    ]
+    if not clauses:
+        raise ValueError(f"Invalid version constraint: {constraint!r}")
+    return clauses
+
+
+def satisfies(version: Tuple[int, ...], clauses: List[Tuple[str, Tuple[int, ...]]]) -> bool:
+    """Check a version against parse_constraint() clauses"""
+    for op, bound in clauses:
+        cmp = _compare(version, bound)
+        if op == "<" and not cmp < 0:
+            return False
+        if op == "<=" and not cmp <= 0:
+            return False
+        if op == ">" and not cmp > 0:
+            return False
+        if op == ">=" and not cmp >= 0:
+            return False
+        if op in ("==", "=") and version[: len(bound)] != bound:
+            return False  # "==1" matches 1.x
+        if op == "!=" and version[: len(bound)] == bound:
+            return False
+        if op == "~=" and not (cmp >= 0 and version[: len(bound) - 1] == bound[:-1]):
+            return False
+    return True
+
+
+@dataclass(slots=True)
+class DependencyUse:
+    """One project's use of a package"""
+
+    project: Project
+    ecosystem: str
+    package: str  # As declared (or as named in the lockfile)
+    spec: str  # Declared version spec ("^4.17.15", ">=2,<3", "*"); "" if transitive
+    dev: bool = False
+    resolved: Optional[str] = None  # Version pinned by the lockfile
+    direct: bool = True  # Declared by the project (False: only in the lockfile)
+
+    @property
+    def version(self) -> Optional[Tuple[int, ...]]:
+        """Version used for constraint checks: resolved, else the spec's lower bound"""
+        if self.resolved:
+            resolved = parse_version(self.resolved)
+            if resolved is not None:
+                return resolved
+        return minimum_version(self.spec)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "project": self.project.name,
+            "path": str(self.project.path),
+            "ecosystem": self.ecosystem,
+            "package": self.package,
+            "spec": self.spec,
+            "resolved": self.resolved,
+            "dev": self.dev,
+            "direct": self.direct,
+        }
+
+
+def _declared(project: Project) -> Iterable[Tuple[str, str, bool]]:
+    """(package, spec, dev) for every dependency in the project's config"""
+    config = project.config
+    if config is None:
+        return
+    for dependencies, dev in ((config.dependencies, False), (config.dev_dependencies, True)):
+        for name, spec in (dependencies or {}).items():
+            if isinstance(spec, dict):  # Poetry table: {version = "^1.0", extras = [...]}
+                spec = spec.get("version", "*")
+            spec = str(spec)
+
+            # PEP 621 lists keep the whole requirement in the key: "pydantic>=2,<3"
+            if project.project_type == ProjectType.PYTHON and spec == "*":
+                match = _PEP508_NAME.match(name.split(";")[0])
+                if match:
+                    name, spec = match.group(1), match.group(2).strip() or "*"
+
+            yield name, spec, dev
+
+
+class DependencyIndex:
+    """
+    Inverted index of package -> declaring projects.
+
+    Thread-safe: fed from the project watcher thread and the agent.
+
+    Usage:
+        index = get_dependency_index()
+        index.add_projects(result.projects_found)
+        for use in index.find("lodash", version_constraint="<4.17.21"):
+            print(use.project.name, use.spec)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (ecosystem, normalized package) -> project path -> use
+        self._uses: Dict[Tuple[str, str], Dict[str, DependencyUse]] = {}
+        # project path -> keys it contributed (for incremental updates)
+        self._keys_by_project: Dict[str, Set[Tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct (ecosystem, package) keys"""
+        return len(self._uses)
+
+    @property
+    def project_count(self) -> int:
+        return len(self._keys_by_project)
+
+    # ==================== UPDATES ====================
+
+    def add_projects(self, projects: Iterable[Project]) -> None:
+        """Index projects, replacing what was indexed for the same paths"""
+        for project in projects:
+            self.update_project(project)
+
+    def update_project(self, project: Project) -> None:
+        """Re-index one project (only keys it gained or lost are touched)"""
+        ecosystem = ECOSYSTEMS.get(project.project_type)
+        path = str(project.path)
+
+        uses: Dict[Tuple[str, str], DependencyUse] = {}
+        if ecosystem is not None:
+            ignored = IGNORED_PACKAGES.get(ecosystem, set())
+            resolved = {
+                normalize_package(ecosystem, name): version
+                for name, version in (project.config.resolved_versions if project.config else {}).items()
+            }
+
+            for name, spec, dev in _declared(project):
+                key = (ecosystem, normalize_package(ecosystem, name))
+                if key[1] in ignored or (key in uses and not uses[key].dev):
+                    continue  # Runtime declaration wins over a dev duplicate
+                uses[key] = DependencyUse(project, ecosystem, name, spec, dev, resolved.get(key[1]))
+
+            for package, version in resolved.items():
+                key = (ecosystem, package)
+                if key not in uses and package not in ignored:
+                    uses[key] = DependencyUse(project, ecosystem, package, "", resolved=version, direct=False)
+
+        with self._lock:
+            for key in self._keys_by_project.get(path, set()) - uses.keys():
+                self._discard(key, path)
+            for key, use in uses.items():
+                self._uses.setdefault(key, {})[path] = use
+            if uses:
+                self._keys_by_project[path] = set(uses)
+            else:
+                self._keys_by_project.pop(path, None)
+
+    def remove_projects(self, paths: Iterable[Path]) -> None:
+        """Drop projects from the index"""
+        with self._lock:
+            for path in paths:
+                path = str(path)
+                for key in self._keys_by_project.pop(path, set()):
+                    self._discard(key, path)
+
+    def _discard(self, key: Tuple[str, str], path: str) -> None:
+        """Remove one project from one key (lock held)"""
+        projects = self._uses.get(key)
+        if projects is None:
+            return
+        projects.pop(path, None)
+        if not projects:
+            del self._uses[key]
+
+    # ==================== QUERIES ====================
+
+    def find(
+        self,
+        package: str,
+        ecosystem: Optional[str] = None,
+        version_constraint: Optional[str] = None,
+        include_dev: bool = True,
+        include_transitive: bool = True,
+    ) -> List[DependencyUse]:
+        """
+        Projects that depend on a package.
+
+        Args:
+            package: Package name ("lodash", "pydantic", "github.com/gin-gonic/gin")
+            ecosystem: Restrict to one ecosystem (npm, pypi, cargo, go, ...)
+            version_constraint: Keep only uses whose resolved version (else the
+                spec's lowest allowed version) satisfies this ("<4.17.21", ">=1,<2", "1")
+            include_dev: Include dev dependencies
+            include_transitive: Include packages only pinned by a lockfile
+
+        Returns:
+            Matching uses, sorted by project name
+
+        Raises:
+            ValueError: If version_constraint has no version in it
+        """
+        clauses = parse_constraint(version_constraint) if version_constraint else None
+        ecosystems = [ecosystem] if ecosystem else sorted(set(ECOSYSTEMS.values()))
+
+        matches: List[DependencyUse] = []
+        with self._lock:
+            for name in ecosystems:
+                matches.extend(self._uses.get((name, normalize_package(name, package)), {}).values())
+
+        if not include_dev:
+            matches = [use for use in matches if not use.dev]
+        if not include_transitive:
+            matches = [use for use in matches if use.direct]
+        if clauses is not None:
+            matches = [
+                use for use in matches
+                if use.version is not None and satisfies(use.version, clauses)
+            ]
+
+        return sorted(matches, key=lambda use: (use.project.name, str(use.project.path)))
+
+    def dependencies_of(self, path: Path) -> List[Tuple[str, str]]:
+        """(ecosystem, package) keys a project contributed"""
+        with self._lock:
+            return sorted(self._keys_by_project.get(str(path), set()))
+
+
+# Global dependency index
+_dependency_index: Optional[DependencyIndex] = None
+
+
+def get_dependency_index() -> DependencyIndex:
+    """Get or create the global dependency index"""
+    global _dependency_index
+    if _dependency_index is None:
+        _dependency_index = DependencyIndex()
+    return _dependency_index
@@ -0,0 +1,784 @@
+"""
+Git Metadata Reader
+
+Branch, HEAD commit, ahead/behind and a dirty flag for project repositories,
+read straight from the .git directory (no git process):
+- HEAD, loose refs and packed-refs; upstream from .git/config
+  (branch.<name>.remote / merge); worktrees and submodules ("gitdir:" files)
+- Ahead/behind by walking commits newest-first from both tips (loose
+  objects and packfiles, deltas included), bounded by MAX_WALK_COMMITS
+- Dirty: each tracked file's size and mtime compared with the index entry
+  (what `git status` does before reading content); untracked files are
+  not looked at, and a file touched without changes counts as dirty
+  until git next refreshes the index
+
+Results are keyed by a signature of the HEAD, ref, packed-refs, config and
+index stats and kept in the ProjectIndex, so an unchanged repository costs
+a handful of stats. The dirty check is repeated after
+ProjectsConfig.project_git_dirty_ttl_seconds.
+"""
+
+import hashlib
+import heapq
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sendell.config import get_settings
+from sendell.projects.index import GitRecord, ProjectIndex, get_project_index
+from sendell.projects.types import GitInfo, Project
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Commits visited per ahead/behind computation before giving up (None is reported)
+MAX_WALK_COMMITS = 2000
+
+# Parsed commits (timestamp, parents) kept in memory across repositories
+MAX_CACHED_COMMITS = 50_000
+
+# Parsed files (.git/config, packed-refs, index entries) kept in memory
+MAX_CACHED_FILES = 1024
+
+# Delta chain length followed when reading packed objects
+MAX_DELTA_DEPTH = 64
+
+# Threads used by read_projects()
+READ_WORKERS = 4
+
+_OBJ_COMMIT = 1
+_OBJ_OFS_DELTA = 6
+_OBJ_REF_DELTA = 7
+
+# Index entry flags
+_FLAG_ASSUME_VALID = 0x8000
+_FLAG_EXTENDED = 0x4000
+_FLAG_SKIP_WORKTREE = 0x4000  # In the extended flags
+_MODE_GITLINK = 0o160000
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, None if missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class _FileCache:
+    """LRU of parsed files keyed by (path, mtime_ns, size)"""
+
+    def __init__(self, size: int = MAX_CACHED_FILES):
+        self.size = size
+        self._items: "OrderedDict[Tuple[str, Tuple[int, int]], object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, parse):
+        stat = _stat_key(path)
+        if stat is None:
+            return None
+        key = (path, stat)
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        value = parse(path)
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+        return value
+
+
+_files = _FileCache()
+
+
+# ==================== REPOSITORY LAYOUT ====================
+
+
+class GitDir:
+    """Locations inside one repository (or worktree)"""
+
+    __slots__ = ("work_tree", "git_dir", "common_dir")
+
+    def __init__(self, work_tree: str, git_dir: str, common_dir: str):
+        self.work_tree = work_tree
+        self.git_dir = git_dir  # HEAD and index (per worktree)
+        self.common_dir = common_dir  # refs, packed-refs, objects, config (shared)
+
+
+def find_git_dir(path: Path) -> Optional[GitDir]:
+    """
+    Repository containing a directory (the directory itself or an ancestor).
+
+    Returns:
+        GitDir, or None if the directory isn't inside a git work tree
+    """
+    current = os.path.abspath(str(path))
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return GitDir(current, dot_git, _common_dir(dot_git))
+        if os.path.isfile(dot_git):  # Worktree or submodule: "gitdir: <path>"
+            content = _read_text(dot_git) or ""
+            if content.startswith("gitdir:"):
+                git_dir = os.path.normpath(os.path.join(current, content[len("gitdir:") :].strip()))
+                if os.path.isdir(git_dir):
+                    return GitDir(current, git_dir, _common_dir(git_dir))
+            return None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _common_dir(git_dir: str) -> str:
+    commondir = _read_text(os.path.join(git_dir, "commondir"))
+    if commondir:
+        return os.path.normpath(os.path.join(git_dir, commondir.strip()))
+    return git_dir
+
+
+# ==================== REFS AND CONFIG ====================
+
+
+def _parse_packed_refs(path: str) -> Dict[str, str]:
+    refs: Dict[str, str] = {}
+    for line in (_read_text(path) or "").splitlines():
+        if not line or line[0] in "#^":
+            continue
+        sha, _, name = line.partition(" ")
+        refs[name.strip()] = sha
+    return refs
+
+
+def _parse_git_config(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Sections of a git config file ('branch "main"' -> {"remote": ..., "merge": ...}).
+
+    Only what upstream lookup needs: section headers and key = value lines.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for raw in (_read_text(path) or "").splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            header = line[1 : line.find("]")].strip()
+            name, _, sub = header.partition(" ")
+            key = name.lower() + (" " + sub.strip().strip('"') if sub else "")
+            current = sections.setdefault(key, {})
+        elif current is not None:
+            key, _, value = line.partition("=")
+            current[key.strip().lower()] = value.strip().strip('"')
+    return sections
+
+
+def resolve_ref(repo: GitDir, ref: str) -> Optional[str]:
+    """SHA a ref points to (loose ref file first, then packed-refs)"""
+    for _ in range(5):  # Symbolic refs ("ref: ...") rarely chain
+        content = _read_text(os.path.join(repo.common_dir, ref))
+        if content is None and repo.git_dir != repo.common_dir:
+            content = _read_text(os.path.join(repo.git_dir, ref))
+        if content is None:
+            packed = _files.get(os.path.join(repo.common_dir, "packed-refs"), _parse_packed_refs) or {}
+            return packed.get(ref)
+        content = content.strip()
+        if not content.startswith("ref:"):
+            return content or None
+        ref = content[4:].strip()
+    return None
+
+
+def _upstream_ref(repo: GitDir, branch: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Tracking ref of a branch.
+
+    Returns:
+        (ref path like "refs/remotes/origin/main", display name like "origin/main")
+    """
+    config = _files.get(os.path.join(repo.common_dir, "config"), _parse_git_config) or {}
+    section = config.get(f"branch {branch}")
+    if not section or "merge" not in section:
+        return None, None
+    remote = section.get("remote", ".")
+    merge = section["merge"]
+    short = merge[len("refs/heads/") :] if merge.startswith("refs/heads/") else merge
+    if remote == ".":
+        return merge, short
+    return f"refs/remotes/{remote}/{short}", f"{remote}/{short}"
+
+
+# ==================== OBJECTS ====================
+
+
+def _inflate(f, size_hint: int) -> bytes:
+    """Decompress one zlib stream starting at the file's position"""
+    decompressor = zlib.decompressobj()
+    out = []
+    chunk_size = max(size_hint + 64, 4096)
+    while not decompressor.eof:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        out.append(decompressor.decompress(chunk))
+    return b"".join(out)
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Apply a git delta (copy / insert instructions) to a base object"""
+    pos = 0
+    for _ in range(2):  # Source and target sizes (varints, unused)
+        while delta[pos] & 0x80:
+            pos += 1
+        pos += 1
+
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:  # Copy from base
+            offset = size = 0
+            for bit in range(4):
+                if op & (1 << bit):
+                    offset |= delta[pos] << (8 * bit)
+                    pos += 1
+            for bit in range(3):
+                if op & (0x10 << bit):
+                    size |= delta[pos] << (8 * bit)
+                    pos += 1
+            out += base[offset : offset + (size or 0x10000)]
+        elif op:  # Insert literal bytes
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise ValueError("Invalid delta opcode")
+    return bytes(out)
+
+
+class _Pack:
+    """One packfile and its version 2 .idx"""
+
+    def __init__(self, idx_path: str):
+        self.idx_path = idx_path
+        self.pack_path = idx_path[:-4] + ".pack"
+        with open(idx_path, "rb") as f:
+            header = f.read(8 + 256 * 4)
+        if header[:4] != b"\xfftOc" or struct.unpack(">I", header[4:8])[0] != 2:
+            raise ValueError(f"Unsupported pack index: {idx_path}")
+        self.fanout = struct.unpack(">256I", header[8:])
+        self.count = self.fanout[255]
+
+    def offset(self, sha: bytes) -> Optional[int]:
+        """Offset of an object in the pack (binary search of the .idx)"""
+        lo = self.fanout[sha[0] - 1] if sha[0] else 0
+        hi = self.fanout[sha[0]]
+        names_at = 8 + 256 * 4
+        with open(self.idx_path, "rb") as f:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                f.seek(names_at + mid * 20)
+                name = f.read(20)
+                if name < sha:
+                    lo = mid + 1
+                elif name > sha:
+                    hi = mid
+                else:
+                    offsets_at = names_at + self.count * 24  # After names and CRCs
+                    f.seek(offsets_at + mid * 4)
+                    offset = struct.unpack(">I", f.read(4))[0]
+                    if offset & 0x80000000:  # Index into the 64-bit offset table
+                        f.seek(offsets_at + self.count * 4 + (offset & 0x7FFFFFFF) * 8)
+                        offset = struct.unpack(">Q", f.read(8))[0]
+                    return offset
+        return None
+
+    def read(self, offset: int, objects: "_ObjectStore", depth: int = 0) -> Tuple[int, bytes]:
+        """(type, data) of the object at an offset, deltas resolved"""
+        with open(self.pack_path, "rb") as f:
+            f.seek(offset)
+            header = f.read(32)
+            byte = header[0]
+            obj_type = (byte >> 4) & 7
+            size = byte & 0x0F
+            shift, pos = 4, 1
+            while byte & 0x80:
+                byte = header[pos]
+                size |= (byte & 0x7F) << shift
+                shift += 7
+                pos += 1
+
+            base_offset = base_sha = None
+            if obj_type == _OBJ_OFS_DELTA:
+                byte = header[pos]
+                pos += 1
+                distance = byte & 0x7F
+                while byte & 0x80:
+                    byte = header[pos]
+                    pos += 1
+                    distance = ((distance + 1) << 7) | (byte & 0x7F)
+                base_offset = offset - distance
+            elif obj_type == _OBJ_REF_DELTA:
+                base_sha = header[pos : pos + 20]
+                pos += 20
+
+            f.seek(offset + pos)
+            data = _inflate(f, size)
+
+        if obj_type not in (_OBJ_OFS_DELTA, _OBJ_REF_DELTA):
+            return obj_type, data
+        if depth >= MAX_DELTA_DEPTH:
+            raise ValueError("Delta chain too long")
+
+        if base_offset is not None:
+            base_type, base = self.read(base_offset, objects, depth + 1)
+        else:
+            found = objects.read_raw(base_sha.hex(), depth + 1)
+            if found is None:
+                raise ValueError("Missing delta base")
+            base_type, base = found
+        return base_type, _apply_delta(base, data)
+
+
+class _ObjectStore:
+    """Loose objects and packfiles of one objects directory"""
+
+    def __init__(self, objects_dir: str):
+        self.objects_dir = objects_dir
+        self._packs: List[_Pack] = []
+        self._packs_mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _load_packs(self) -> List[_Pack]:
+        pack_dir = os.path.join(self.objects_dir, "pack")
+        try:
+            mtime = os.stat(pack_dir).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            if mtime != self._packs_mtime:
+                packs = []
+                for name in sorted(os.listdir(pack_dir)):
+                    if name.endswith(".idx"):
+                        try:
+                            packs.append(_Pack(os.path.join(pack_dir, name)))
+                        except (OSError, ValueError) as e:
+                            logger.debug(f"Skipping pack index {name}: {e}")
+                self._packs, self._packs_mtime = packs, mtime
+            return self._packs
+
+    def read_raw(self, sha: str, depth: int = 0) -> Optional[Tuple[int, bytes]]:
+        """(type, data) of an object, None if it isn't in this store"""
+        loose = os.path.join(self.objects_dir, sha[:2], sha[2:])
+        try:
+            with open(loose, "rb") as f:
+                raw = zlib.decompress(f.read())
+            header, _, data = raw.partition(b"\0")
+            return (_OBJ_COMMIT if header.startswith(b"commit") else 0), data
+        except FileNotFoundError:
+            pass
+
+        binary = bytes.fromhex(sha)
+        for pack in self._load_packs():
+            offset = pack.offset(binary)
+            if offset is not None:
+                return pack.read(offset, self, depth)
+        return None
+
+
+_stores: Dict[str, _ObjectStore] = {}
+_stores_lock = threading.Lock()
+
+# (objects dir, sha) -> (commit time, parent SHAs)
+_commits: "OrderedDict[Tuple[str, str], Tuple[int, Tuple[str, ...]]]" = OrderedDict()
+_commits_lock = threading.Lock()
+
+
+def _store(repo: GitDir) -> _ObjectStore:
+    objects_dir = os.path.join(repo.common_dir, "objects")
+    with _stores_lock:
+        store = _stores.get(objects_dir)
+        if store is None:
+            store = _stores[objects_dir] = _ObjectStore(objects_dir)
+        return store
+
+
+def read_commit(repo: GitDir, sha: str) -> Optional[Tuple[int, Tuple[str, ...]]]:
+    """
+    Committer time and parents of a commit.
+
+    Returns:
+        (unix time, parent SHAs), or None if the object is missing or unreadable
+    """
+    store = _store(repo)
+    key = (store.objects_dir, sha)
+    with _commits_lock:
+        cached = _commits.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        found = store.read_raw(sha)
+    except (OSError, ValueError, zlib.error) as e:
+        logger.debug(f"Failed to read commit {sha} in {repo.work_tree}: {e}")
+        return None
+    if found is None or found[0] != _OBJ_COMMIT:
+        return None
+
+    parents: List[str] = []
+    timestamp = 0
+    for line in found[1].split(b"\n"):
+        if not line:
+            break  # End of the headers
+        if line.startswith(b"parent "):
+            parents.append(line[7:].decode())
+        elif line.startswith(b"committer "):
+            try:
+                timestamp = int(line.rsplit(b" ", 2)[1])
+            except (IndexError, ValueError):
+                pass
+
+    commit = (timestamp, tuple(parents))
+    with _commits_lock:
+        _commits[key] = commit
+        while len(_commits) > MAX_CACHED_COMMITS:
+            _commits.popitem(last=False)
+    return commit
+
+
+def ahead_behind(repo: GitDir, local: str, upstream: str, limit: int = MAX_WALK_COMMITS) -> Optional[Tuple[int, int]]:
+    """
+    Commits only on local and only on upstream.
+
+    Walks both histories newest-first, propagating "reachable from local /
+    upstream" marks to parents (same approach as git's merge-base walk).
+    A commit that gains a mark after it was counted (equal or skewed commit
+    times) is recounted and walked again. The walk stops once every queued
+    commit carries both marks and is older than all one-sided commits.
+
+    Returns:
+        (ahead, behind), or None if more than limit commits had to be read
+    """
+    if local == upstream:
+        return 0, 0
+
+    LOCAL, UPSTREAM = 1, 2
+    marks: Dict[str, int] = {}
+    heap: List[Tuple[int, str]] = []
+    one_sided: Dict[str, Tuple[int, int]] = {}  # Counted commits -> (commit time, mark)
+
+    for sha, mark in ((local, LOCAL), (upstream, UPSTREAM)):
+        commit = read_commit(repo, sha)
+        if commit is None:
+            return None
+        marks[sha] = marks.get(sha, 0) | mark
+        heapq.heappush(heap, (-commit[0], sha))
+
+    walked = 0
+    while heap:
+        if all(marks[sha] == LOCAL | UPSTREAM for _, sha in heap):
+            newest = -heap[0][0]
+            if not one_sided or newest < min(time for time, _ in one_sided.values()):
+                break
+        negated_time, sha = heapq.heappop(heap)
+        walked += 1
+        if walked > limit:
+            return None
+
+        mark = marks[sha]
+        if mark != LOCAL | UPSTREAM:
+            one_sided[sha] = (-negated_time, mark)
+
+        commit = read_commit(repo, sha)
+        if commit is None:
+            return None
+        for parent in commit[1]:
+            previous = marks.get(parent)
+            combined = (previous or 0) | mark
+            if previous == combined:
+                continue
+            parent_commit = read_commit(repo, parent)
+            if parent_commit is None:
+                return None  # Shallow clone or missing object
+            marks[parent] = combined
+            if previous is None or one_sided.pop(parent, None) is not None:
+                heapq.heappush(heap, (-parent_commit[0], parent))
+
+    ahead = sum(1 for _, mark in one_sided.values() if mark == LOCAL)
+    return ahead, len(one_sided) - ahead
+
+
+# ==================== INDEX (DIRTY CHECK) ====================
+
+
+def _parse_index(path: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Tracked entries of a .git/index (versions 2-4).
+
+    Returns:
+        (path, mtime seconds, mtime nanoseconds, size) per entry; entries
+        git doesn't stat (assume-unchanged, skip-worktree, submodules) are
+        left out, unmerged entries get size -1
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"DIRC":
+        raise ValueError("Not a git index")
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3, 4):
+        raise ValueError(f"Unsupported index version {version}")
+
+    entries: List[Tuple[str, int, int, int]] = []
+    pos = 12
+    previous = b""
+    for _ in range(count):
+        mtime_s, mtime_ns = struct.unpack_from(">II", data, pos + 8)
+        mode, = struct.unpack_from(">I", data, pos + 24)
+        size, = struct.unpack_from(">I", data, pos + 36)
+        flags, = struct.unpack_from(">H", data, pos + 60)
+        name_at = pos + 62
+        extended = 0
+        if flags & _FLAG_EXTENDED and version >= 3:
+            extended, = struct.unpack_from(">H", data, name_at)
+            name_at += 2
+
+        if version == 4:  # Path = previous path minus N bytes + NUL-terminated suffix
+            byte = data[name_at]
+            strip = byte & 0x7F
+            name_at += 1
+            while byte & 0x80:
+                byte = data[name_at]
+                name_at += 1
+                strip = ((strip + 1) << 7) | (byte & 0x7F)
+            end = data.index(b"\0", name_at)
+            name = previous[: len(previous) - strip] + data[name_at:end]
+            pos = end + 1
+        else:
+            end = data.index(b"\0", name_at)
+            name = data[name_at:end]
+            pos += ((end - pos) + 8) & ~7  # Entries are NUL-padded to 8 bytes
+        previous = name
+
+        if flags & _FLAG_ASSUME_VALID or extended & _FLAG_SKIP_WORKTREE or mode == _MODE_GITLINK:
+            continue
+        stage = (flags >> 12) & 3
+        entries.append((name.decode("utf-8", errors="surrogateescape"), mtime_s, mtime_ns, -1 if stage else size))
+    return entries
+
+
+def is_dirty(repo: GitDir) -> Optional[bool]:
+    """
+    Whether any tracked file differs from its index entry by size or mtime.
+
+    Returns:
+        None if the index can't be read (a new repository has no index: clean)
+    """
+    index_path = os.path.join(repo.git_dir, "index")
+    if not os.path.exists(index_path):
+        return False
+    try:
+        entries = _files.get(index_path, _parse_index)
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug(f"Failed to read git index of {repo.work_tree}: {e}")
+        return None
+    if entries is None:
+        return None
+
+    for name, mtime_s, mtime_ns, size in entries:
+        if size < 0:
+            return True  # Merge conflict
+        try:
+            st = os.lstat(os.path.join(repo.work_tree, name))
+        except OSError:
+            return True  # Deleted
+        if st.st_size & 0xFFFFFFFF != size or int(st.st_mtime) & 0xFFFFFFFF != mtime_s:
+            return True
+        if mtime_ns and st.st_mtime_ns % 1_000_000_000 != mtime_ns:
+            return True
+    return False
+
+
+# ==================== READER ====================
+
+
+class GitMetadataReader:
+    """
+    Reads and caches git metadata for projects.
+
+    Usage:
+        reader = get_git_reader()
+        reader.read_projects(result.projects_found)  # sets project.git
+        info = reader.read(Path("C:/dev/app"))
+    """
+
+    def __init__(self, index: Optional[ProjectIndex] = None, dirty_ttl_seconds: Optional[float] = None):
+        """
+        Initialize reader.
+
+        Args:
+            index: Index keeping results across runs (None = in-memory only)
+            dirty_ttl_seconds: Re-check the dirty flag after this long
+                (defaults to ProjectsConfig.project_git_dirty_ttl_seconds)
+        """
+        self.index = index if index is not None else ProjectIndex(persist=False)
+        if dirty_ttl_seconds is None:
+            dirty_ttl_seconds = get_settings().projects.project_git_dirty_ttl_seconds
+        self.dirty_ttl = timedelta(seconds=dirty_ttl_seconds)
+        self._repos: Dict[str, Optional[GitDir]] = {}  # Project path -> repository
+        self._lock = threading.Lock()
+        self.stats = {"reads": 0, "cached": 0, "dirty_checks": 0}
+
+    def _repository(self, path: Path) -> Optional[GitDir]:
+        key = str(path)
+        with self._lock:
+            if key in self._repos:
+                repo = self._repos[key]
+                if repo is None or os.path.exists(repo.git_dir):
+                    return repo
+        repo = find_git_dir(path)
+        with self._lock:
+            self._repos[key] = repo
+        return repo
+
+    @staticmethod
+    def _signature(repo: GitDir) -> Tuple[str, Optional[str]]:
+        """
+        Digest of the files the metadata depends on.
+
+        Returns:
+            (signature, branch ref from HEAD or None if detached)
+        """
+        head = (_read_text(os.path.join(repo.git_dir, "HEAD")) or "").strip()
+        branch_ref = head[4:].strip() if head.startswith("ref:") else None
+
+        parts = [head]
+        files = ["packed-refs", "config"]
+        if branch_ref:
+            files.append(branch_ref)
+            upstream_ref, _ = _upstream_ref(repo, branch_ref[len("refs/heads/") :])
+            if upstream_ref:
+                files.append(upstream_ref)
+        for name in files:
+            parts.append(f"{name}:{_stat_key(os.path.join(repo.common_dir, name))}")
+        parts.append(f"index:{_stat_key(os.path.join(repo.git_dir, 'index'))}")
+
+        digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+        return digest, branch_ref
+
+    def read(self, path: Path, check_dirty: bool = True) -> Optional[GitInfo]:
+        """
+        Git metadata of the repository containing a directory.
+
+        Args:
+            path: Project directory
+            check_dirty: Refresh the dirty flag if it's older than the TTL
+
+        Returns:
+            GitInfo, or None if the directory isn't in a git work tree
+        """
+        repo = self._repository(path)
+        if repo is None:
+            return None
+
+        try:
+            signature, branch_ref = self._signature(repo)
+            record = self.index.get_git(repo.work_tree, signature)
+            if record is not None:
+                info = record.info
+                self.stats["cached"] += 1
+            else:
+                info = self._read_info(repo, branch_ref)
+                self.stats["reads"] += 1
+
+            now = datetime.now()
+            if check_dirty and (info.checked_at is None or now - info.checked_at >= self.dirty_ttl):
+                info = info.model_copy(update={"dirty": is_dirty(repo), "checked_at": now})
+                self.stats["dirty_checks"] += 1
+                record = None
+
+            if record is None:
+                self.index.put_git(repo.work_tree, GitRecord(signature=signature, info=info))
+            return info
+
+        except Exception as e:
+            logger.warning(f"Failed to read git metadata of {repo.work_tree}: {e}")
+            return None
+
+    def _read_info(self, repo: GitDir, branch_ref: Optional[str]) -> GitInfo:
+        if branch_ref is None:  # Detached HEAD
+            head = (_read_text(os.path.join(repo.git_dir, "HEAD")) or "").strip() or None
+            return GitInfo(repository=Path(repo.work_tree), head=head)
+
+        branch = branch_ref[len("refs/heads/") :] if branch_ref.startswith("refs/heads/") else branch_ref
+        head = resolve_ref(repo, branch_ref)
+        info = GitInfo(repository=Path(repo.work_tree), branch=branch, head=head)
+
+        upstream_ref, upstream_name = _upstream_ref(repo, branch)
+        if upstream_ref:
+            info.upstream = upstream_name
+            upstream_sha = resolve_ref(repo, upstream_ref)
+            if head and upstream_sha:
+                counts = ahead_behind(repo, head, upstream_sha)
+                if counts is not None:
+                    info.ahead, info.behind = counts
+        return info
+
+    def read_projects(self, projects: Iterable[Project], check_dirty: bool = True) -> int:
+        """
+        Set project.git on each project (projects sharing a repository read it once).
+
+        Returns:
+            Number of projects in a git repository
+        """
+        projects = list(projects)
+        repos: Dict[str, List[Project]] = {}
+        for project in projects:
+            repo = self._repository(project.path)
+            if repo is not None:
+                repos.setdefault(repo.work_tree, []).append(project)
+            else:
+                project.git = None
+
+        def read_one(item: Tuple[str, List[Project]]) -> None:
+            work_tree, members = item
+            info = self.read(Path(work_tree), check_dirty=check_dirty)
+            for project in members:
+                project.git = info
+
+        if len(repos) > 1:
+            with ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="project-git") as executor:
+                list(executor.map(read_one, repos.items()))
+        else:
+            for item in repos.items():
+                read_one(item)
+
+        self.index.flush()
+        return sum(len(members) for members in repos.values())
+
+
+# Global git metadata reader
+_git_reader: Optional[GitMetadataReader] = None
+
+
+def get_git_reader() -> GitMetadataReader:
+    """Get or create the global git metadata reader (backed by the project index)"""
+    global _git_reader
+    if _git_reader is None:
+        _git_reader = GitMetadataReader(index=get_project_index())
+    return _git_reader
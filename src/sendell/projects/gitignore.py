@@ -0,0 +1,339 @@
+"""
+.gitignore / .ignore Matching
+
+Compiles ignore files into regular expressions and stacks them per
+directory, with git's semantics:
+- Patterns without a slash match a name at any depth below the file's
+  directory, patterns with one are anchored to it; "**", "*", "?" and
+  [classes] as in gitignore(5)
+- "dir/" only matches directories, "!pattern" re-includes, the last
+  matching line wins and deeper files override shallower ones
+- Each file's patterns are also joined into one regex, so the common
+  "nothing matches" case is a single search per file
+
+Parsed files are cached by (path, mtime, size) and compiled rule sets are
+shared by content, so rescans and the many copies of a template .gitignore
+cost one compile; both caches are bounded LRUs.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ignore file names read in each directory (later ones take precedence)
+IGNORE_FILE_NAMES = (".gitignore", ".ignore")
+
+# Parsed ignore files (and distinct contents) kept in memory
+MAX_CACHED_FILES = 2048
+
+
+def _translate(pattern: str) -> str:
+    """Translate one gitignore glob (without leading/trailing slash) into a regex"""
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+            out.append("(?:.*/)?")  # Zero or more directories
+            i += 3
+        elif pattern.startswith("**", i) and i + 2 == n and (i == 0 or pattern[i - 1] == "/"):
+            out.append(".*")  # Everything inside
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1 : i + 2] in ("!", "^") else i + 1)
+            if end < 0:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1 : end]
+            if body[0] in "!^":
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One compiled line of an ignore file"""
+
+    pattern: str  # As written (for reporting)
+    regex: "re.Pattern"
+    negated: bool
+    dir_only: bool
+
+
+def parse_rules(lines: Iterable[str]) -> Tuple[IgnoreRule, ...]:
+    """Compile ignore file lines (blank lines and comments skipped)"""
+    rules = []
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip("\r")
+        # Trailing spaces are ignored unless escaped
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        body = line.rstrip("/")
+        if not body:
+            continue
+
+        if "/" in body:  # Anchored to the ignore file's directory
+            regex = "^" + _translate(body.lstrip("/")) + "$"
+        else:
+            regex = "(?:^|/)" + _translate(body) + "$"
+
+        try:
+            rules.append(IgnoreRule(pattern=raw.strip(), regex=re.compile(regex), negated=negated, dir_only=dir_only))
+        except re.error:
+            logger.debug(f"Skipping invalid ignore pattern: {raw.strip()!r}")
+    return tuple(rules)
+
+
+class IgnoreFile:
+    """
+    Compiled rules of one ignore file.
+
+    match() answers for paths relative to the file's directory:
+    True = ignored, False = re-included by a "!" rule, None = no rule matched.
+    """
+
+    def __init__(self, rules: Tuple[IgnoreRule, ...], identity: str = ""):
+        self.rules = rules
+        self.identity = identity  # Content digest of the file it was read from
+        self.has_negations = any(rule.negated for rule in rules)
+
+        # One alternation per kind, for the "does anything match?" fast path
+        self._any = self._join(rules)
+        self._any_file = self._join(rule for rule in rules if not rule.dir_only)
+
+    @staticmethod
+    def _join(rules: Iterable[IgnoreRule]) -> Optional["re.Pattern"]:
+        patterns = [rule.regex.pattern for rule in rules]
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Ignore decision for a '/'-separated path relative to the file's directory"""
+        quick = self._any if is_dir else self._any_file
+        if quick is None or quick.search(rel_path) is None:
+            return None
+        if not self.has_negations:
+            return True
+        rule = self.matching_rule(rel_path, is_dir)
+        return None if rule is None else not rule.negated
+
+    def matching_rule(self, rel_path: str, is_dir: bool) -> Optional[IgnoreRule]:
+        """Last rule matching the path (git's precedence)"""
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.search(rel_path):
+                return rule
+        return None
+
+
+# ==================== FILE CACHE ====================
+
+_cache: "OrderedDict[Tuple[str, int, int], IgnoreFile]" = OrderedDict()  # By file identity
+_by_content: "OrderedDict[str, IgnoreFile]" = OrderedDict()  # By content digest
+_cache_lock = threading.Lock()
+
+
+def _remember(cache: OrderedDict, key, value: IgnoreFile) -> None:
+    """Insert into an LRU cache (lock held)"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MAX_CACHED_FILES:
+        cache.popitem(last=False)
+
+
+def load_ignore_file(path: str) -> Optional[IgnoreFile]:
+    """
+    Parsed ignore file, from the cache while its mtime and size are unchanged.
+
+    Files with identical content share one compiled IgnoreFile.
+
+    Returns:
+        IgnoreFile, or None if the file can't be read or has no rules
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (path, st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached if cached.rules else None
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    with _cache_lock:
+        ignore_file = _by_content.get(digest)
+    if ignore_file is None:
+        rules = parse_rules(data.decode("utf-8", errors="replace").splitlines())
+        ignore_file = IgnoreFile(rules, identity=digest)
+
+    with _cache_lock:
+        _remember(_by_content, digest, ignore_file)
+        _remember(_cache, key, ignore_file)
+
+    return ignore_file if ignore_file.rules else None
+
+
+class IgnoreStack:
+    """
+    Ignore files in effect for one directory: its own plus its ancestors'.
+
+    Immutable and linked to the parent's stack, so sibling directories
+    share everything above them and a child costs nothing unless it has
+    ignore files of its own. A walk keeps a stack alive only while
+    directories below it are queued.
+
+    Usage:
+        stack = IgnoreStack.empty().child(project_dir)
+        child = stack.child(subdir, [".gitignore"])
+        if child.is_ignored(os.path.join(subdir, "dist"), is_dir=True): ...
+    """
+
+    __slots__ = ("parent", "base", "names", "files", "fingerprint")
+
+    def __init__(
+        self,
+        parent: Optional["IgnoreStack"],
+        base: str,
+        names: Tuple[str, ...],
+        files: Tuple[IgnoreFile, ...],
+        fingerprint: str,
+    ):
+        self.parent = parent
+        self.base = base  # Directory the files apply to
+        self.names = names  # File names in base, parallel to files
+        self.files = files
+        self.fingerprint = fingerprint  # Changes when any ignore file in effect changes
+
+    EMPTY_FINGERPRINT = ""
+
+    @classmethod
+    def empty(cls) -> "IgnoreStack":
+        """Stack with no rules (the parent of a walk's top directory)"""
+        return _EMPTY
+
+    def child(self, directory: str, names: Optional[Iterable[str]] = None) -> "IgnoreStack":
+        """
+        Stack for a subdirectory.
+
+        Args:
+            directory: Subdirectory path
+            names: Ignore file names present there (None = check IGNORE_FILE_NAMES)
+
+        Returns:
+            self if the directory has no (non-empty) ignore files
+        """
+        if names is None:
+            candidates = IGNORE_FILE_NAMES
+        else:
+            present = set(names)
+            candidates = [name for name in IGNORE_FILE_NAMES if name in present]
+        if not candidates:
+            return self
+
+        names_found = []
+        files = []
+        digest = hashlib.blake2b(self.fingerprint.encode(), digest_size=8)
+        for name in candidates:
+            path = os.path.join(directory, name)
+            ignore_file = load_ignore_file(path)
+            if ignore_file is not None:
+                names_found.append(name)
+                files.append(ignore_file)
+                digest.update(f"{path}:{ignore_file.identity}".encode())
+        if not files:
+            return self
+
+        return IgnoreStack(self, directory, tuple(names_found), tuple(files), digest.hexdigest())
+
+    @property
+    def has_rules(self) -> bool:
+        """Whether any ignore file is in effect"""
+        return bool(self.files)
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """Whether an entry is ignored (deeper ignore files are consulted first)"""
+        return self._deciding(path, is_dir) is not None
+
+    def ignored_by(self, path: str, is_dir: bool) -> Optional[str]:
+        """
+        Rule that ignores an entry, for reporting.
+
+        Returns:
+            "<ignore file path>: <pattern>", or None if the entry isn't ignored
+        """
+        deciding = self._deciding(path, is_dir)
+        if deciding is None:
+            return None
+        stack, position, rel_path = deciding
+        rule = stack.files[position].matching_rule(rel_path, is_dir)
+        return f"{os.path.join(stack.base, stack.names[position])}: {rule.pattern if rule else '?'}"
+
+    def _deciding(self, path: str, is_dir: bool) -> Optional[Tuple["IgnoreStack", int, str]]:
+        """
+        Ignore file whose rule ignores an entry.
+
+        Returns:
+            (stack, position in stack.files, path relative to stack.base),
+            or None if no rule matches or the last match re-includes it
+        """
+        stack: Optional[IgnoreStack] = self
+        while stack is not None and stack.files:
+            rel_path = path[len(stack.base) :].lstrip(os.sep)
+            if os.sep != "/":
+                rel_path = rel_path.replace(os.sep, "/")
+            for position in range(len(stack.files) - 1, -1, -1):
+                decision = stack.files[position].match(rel_path, is_dir)
+                if decision is not None:
+                    return (stack, position, rel_path) if decision else None
+            stack = stack.parent
+        return None
+
+
+_EMPTY = IgnoreStack(None, "", (), (), IgnoreStack.EMPTY_FINGERPRINT)
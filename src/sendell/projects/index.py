@@ -0,0 +1,354 @@
+"""
+Persistent Project Index
+
+Remembers what the scanner saw so rescans only redo changed work:
+- Per directory: mtime_ns, subdirectory names, ignore files present and
+  detection result.
+  A directory's mtime changes when entries are added, removed or renamed,
+  so an unchanged mtime means the cached listing is still valid.
+- Per config file: the ConfigCache (size, mtime_ns, optional hash).
+  Edits in place don't touch the directory mtime, so configs are checked
+  with their own stat.
+- Per directory inside a project: the size walker's own-file totals,
+  valid while the directory mtime and the ignore files in effect match.
+- Per git repository: the metadata reader's GitInfo, valid while the
+  signature of HEAD, refs and index stats matches.
+
+Records live in memory during a scan and are written to SQLite
+(scan_directories, scan_config_files, scan_dir_sizes, scan_git) by flush().
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+
+from sendell.projects.config_cache import ConfigCache, get_config_cache
+from sendell.projects.models import ScanDirectoryModel, ScanGitModel, ScanSizeModel
+from sendell.projects.types import GitInfo, ProjectType
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Entries modified this recently are not cached: a second change within the
+# file system's mtime granularity would go unnoticed ("racily clean")
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class DirectoryRecord:
+    """Cached listing and detection result for one directory"""
+
+    mtime_ns: int
+    project_type: Optional[ProjectType] = None
+    config_name: Optional[str] = None
+    subdirs: Optional[Tuple[str, ...]] = None  # None if never listed for recursion
+    ignore_files: Tuple[str, ...] = ()  # .gitignore / .ignore present (listed directories)
+
+
+@dataclass
+class SizeRecord:
+    """Size walker totals for one directory's own files"""
+
+    mtime_ns: int
+    ignore_fingerprint: str  # IgnoreStack fingerprint the entries were filtered with
+    file_count: int
+    total_bytes: int
+    subdirs: Tuple[str, ...]  # Subdirectories walked (not ignored)
+    ignore_files: Tuple[str, ...] = ()  # .gitignore / .ignore present in the directory
+
+
+@dataclass
+class GitRecord:
+    """Git metadata of one repository"""
+
+    signature: str  # Digest of the .git file stats the info was read from
+    info: GitInfo
+
+
+class ProjectIndex:
+    """
+    In-memory view of the scanner index with write-behind to SQLite.
+
+    Thread-safe: scanner workers read and record concurrently.
+
+    Usage:
+        index = get_project_index()
+        scanner = ProjectScanner(index=index)
+        scanner.scan_directory(path)  # flushes the index when done
+    """
+
+    def __init__(self, persist: bool = True, configs: Optional[ConfigCache] = None):
+        """
+        Initialize index.
+
+        Args:
+            persist: Load from and flush to the project database
+            configs: Parsed config cache (defaults to a new one with the same persistence)
+        """
+        self.persist = persist
+        self.configs = configs if configs is not None else ConfigCache(persist=persist)
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, DirectoryRecord] = {}
+        self._dirty_dirs: Dict[str, Optional[DirectoryRecord]] = {}  # None = delete
+        self._sizes: Dict[str, SizeRecord] = {}
+        self._dirty_sizes: Dict[str, Optional[SizeRecord]] = {}  # None = delete
+        self._git: Dict[str, GitRecord] = {}
+        self._dirty_git: Dict[str, Optional[GitRecord]] = {}  # None = delete
+
+        if persist:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+    # ==================== DIRECTORIES ====================
+
+    def get_directory(self, path: str, mtime_ns: int) -> Optional[DirectoryRecord]:
+        """Cached record for a directory, if its mtime is unchanged"""
+        record = self._dirs.get(path)
+        if record is None or record.mtime_ns != mtime_ns:
+            return None
+        return record
+
+    def put_directory(self, path: str, record: DirectoryRecord) -> None:
+        """Record a directory listing (skipped if its mtime is too recent)"""
+        if time.time_ns() - record.mtime_ns < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._dirs[path] = record
+            self._dirty_dirs[path] = record
+
+    def forget_directory(self, path: str) -> None:
+        """Drop a directory that no longer exists"""
+        with self._lock:
+            if self._dirs.pop(path, None) is not None:
+                self._dirty_dirs[path] = None
+
+    def forget_tree(self, path: str) -> int:
+        """
+        Drop a directory and everything indexed below it (e.g. after it was deleted).
+
+        Returns:
+            Number of directory records dropped
+        """
+        prefix = path.rstrip(os.sep) + os.sep
+        with self._lock:
+            gone = [key for key in self._dirs if key == path or key.startswith(prefix)]
+            for key in gone:
+                del self._dirs[key]
+                self._dirty_dirs[key] = None
+            for key in [key for key in self._sizes if key == path or key.startswith(prefix)]:
+                del self._sizes[key]
+                self._dirty_sizes[key] = None
+            for key in [key for key in self._git if key == path or key.startswith(prefix)]:
+                del self._git[key]
+                self._dirty_git[key] = None
+        self.configs.forget_tree(path)
+        return len(gone)
+
+    # ==================== SIZES ====================
+
+    def get_size(self, path: str, mtime_ns: int) -> Optional[SizeRecord]:
+        """Cached size record for a directory, if its mtime is unchanged"""
+        record = self._sizes.get(path)
+        if record is None or record.mtime_ns != mtime_ns:
+            return None
+        return record
+
+    def put_size(self, path: str, record: SizeRecord) -> None:
+        """Record a directory's own totals (skipped if its mtime is too recent)"""
+        if time.time_ns() - record.mtime_ns < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._sizes[path] = record
+            self._dirty_sizes[path] = record
+
+    # ==================== GIT ====================
+
+    def get_git(self, path: str, signature: str) -> Optional[GitRecord]:
+        """Cached git metadata for a repository, if its signature is unchanged"""
+        record = self._git.get(path)
+        if record is None or record.signature != signature:
+            return None
+        return record
+
+    def put_git(self, path: str, record: GitRecord) -> None:
+        """Record a repository's git metadata"""
+        with self._lock:
+            self._git[path] = record
+            self._dirty_git[path] = record
+
+    # ==================== PERSISTENCE ====================
+
+    def _load(self) -> None:
+        """Load all records from the database"""
+        from sendell.projects.database import session_scope
+
+        start = time.perf_counter()
+        try:
+            with session_scope() as session:
+                # Plain column tuples: no ORM objects for tens of thousands of rows
+                dir_rows = session.execute(
+                    select(
+                        ScanDirectoryModel.path,
+                        ScanDirectoryModel.mtime_ns,
+                        ScanDirectoryModel.project_type,
+                        ScanDirectoryModel.config_name,
+                        ScanDirectoryModel.subdirs_json,
+                        ScanDirectoryModel.ignore_files_json,
+                    )
+                )
+                for path, mtime_ns, project_type, config_name, subdirs_json, ignore_json in dir_rows:
+                    self._dirs[path] = DirectoryRecord(
+                        mtime_ns=mtime_ns,
+                        project_type=ProjectType(project_type) if project_type else None,
+                        config_name=config_name,
+                        subdirs=tuple(json.loads(subdirs_json)) if subdirs_json is not None else None,
+                        ignore_files=tuple(json.loads(ignore_json)) if ignore_json else (),
+                    )
+                size_rows = session.execute(
+                    select(
+                        ScanSizeModel.path,
+                        ScanSizeModel.mtime_ns,
+                        ScanSizeModel.ignore_fingerprint,
+                        ScanSizeModel.file_count,
+                        ScanSizeModel.total_bytes,
+                        ScanSizeModel.subdirs_json,
+                        ScanSizeModel.ignore_files_json,
+                    )
+                )
+                for path, mtime_ns, fingerprint, file_count, total_bytes, subdirs_json, ignore_json in size_rows:
+                    self._sizes[path] = SizeRecord(
+                        mtime_ns=mtime_ns,
+                        ignore_fingerprint=fingerprint,
+                        file_count=file_count,
+                        total_bytes=total_bytes,
+                        subdirs=tuple(json.loads(subdirs_json)),
+                        ignore_files=tuple(json.loads(ignore_json)),
+                    )
+                git_rows = session.execute(
+                    select(ScanGitModel.path, ScanGitModel.signature, ScanGitModel.info_json)
+                )
+                for path, signature, info_json in git_rows:
+                    self._git[path] = GitRecord(signature=signature, info=GitInfo.model_validate_json(info_json))
+        except Exception as e:
+            logger.error(f"Failed to load project index: {e}")
+            self._dirs.clear()
+            self._sizes.clear()
+            self._git.clear()
+            return
+
+        logger.debug(
+            f"Loaded project index: {len(self._dirs)} directories, {len(self._sizes)} size records "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+
+    def flush(self) -> int:
+        """
+        Write changed records (and the config cache) to the database.
+
+        If the write fails, the records stay pending for the next flush.
+
+        Returns:
+            Number of records written or deleted
+        """
+        with self._lock:
+            dirty, self._dirty_dirs = self._dirty_dirs, {}
+            dirty_sizes, self._dirty_sizes = self._dirty_sizes, {}
+            dirty_git, self._dirty_git = self._dirty_git, {}
+
+        written = self.configs.flush()
+        if not self.persist or not (dirty or dirty_sizes or dirty_git):
+            return written
+
+        from sendell.projects.database import bulk_delete, bulk_upsert, session_scope
+
+        now = datetime.now()
+        rows = [
+            {
+                "path": path,
+                "mtime_ns": record.mtime_ns,
+                "project_type": record.project_type.value if record.project_type else None,
+                "config_name": record.config_name,
+                "subdirs_json": json.dumps(record.subdirs) if record.subdirs is not None else None,
+                "ignore_files_json": json.dumps(record.ignore_files) if record.ignore_files else None,
+                "indexed_at": now,
+            }
+            for path, record in dirty.items()
+            if record is not None
+        ]
+        deleted = [path for path, record in dirty.items() if record is None]
+
+        size_rows = [
+            {
+                "path": path,
+                "mtime_ns": record.mtime_ns,
+                "ignore_fingerprint": record.ignore_fingerprint,
+                "file_count": record.file_count,
+                "total_bytes": record.total_bytes,
+                "subdirs_json": json.dumps(record.subdirs),
+                "ignore_files_json": json.dumps(record.ignore_files),
+                "measured_at": now,
+            }
+            for path, record in dirty_sizes.items()
+            if record is not None
+        ]
+        deleted_sizes = [path for path, record in dirty_sizes.items() if record is None]
+
+        git_rows = [
+            {"path": path, "signature": record.signature, "info_json": record.info.model_dump_json(), "read_at": now}
+            for path, record in dirty_git.items()
+            if record is not None
+        ]
+        deleted_git = [path for path, record in dirty_git.items() if record is None]
+
+        try:
+            with session_scope() as session:
+                bulk_upsert(session, ScanDirectoryModel, rows)
+                bulk_delete(session, ScanDirectoryModel.path, deleted)
+                bulk_upsert(session, ScanSizeModel, size_rows)
+                bulk_delete(session, ScanSizeModel.path, deleted_sizes)
+                bulk_upsert(session, ScanGitModel, git_rows)
+                bulk_delete(session, ScanGitModel.path, deleted_git)
+        except Exception as e:
+            logger.error(f"Failed to flush project index: {e}")
+            self._restore_dirty(dirty, dirty_sizes, dirty_git)
+            return written
+
+        written += len(rows) + len(deleted) + len(size_rows) + len(deleted_sizes) + len(git_rows) + len(deleted_git)
+        logger.debug(f"Flushed {written} project index record(s)")
+        return written
+
+    def _restore_dirty(
+        self,
+        dirty: Dict[str, Optional[DirectoryRecord]],
+        dirty_sizes: Dict[str, Optional[SizeRecord]],
+        dirty_git: Dict[str, Optional[GitRecord]],
+    ) -> None:
+        """Put records of a failed flush back as pending (newer changes to the same path win)"""
+        with self._lock:
+            for pending, failed in (
+                (self._dirty_dirs, dirty),
+                (self._dirty_sizes, dirty_sizes),
+                (self._dirty_git, dirty_git),
+            ):
+                for path, record in failed.items():
+                    pending.setdefault(path, record)
+
+
+# Global project index
+_project_index: Optional[ProjectIndex] = None
+
+
+def get_project_index() -> ProjectIndex:
+    """Get or create the global project index (loaded from the database)"""
+    global _project_index
+    if _project_index is None:
+        _project_index = ProjectIndex(configs=get_config_cache())
+    return _project_index
@@ -0,0 +1,295 @@
+"""
+Lockfile Parsers
+
+Extract resolved package versions from lockfiles with bounded memory:
+- package-lock.json: read in chunks and decoded one package entry at a
+  time, the document tree is never built (v1 "dependencies" and v2/v3
+  "packages")
+- yarn.lock (v1 and berry), poetry.lock, Cargo.lock, go.sum: read line by line
+
+Each parser returns a ProjectConfig with only resolved_versions set
+(package name -> version), so results go through the same config cache
+as package.json / pyproject.toml.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from sendell.projects.types import ProjectConfig, ProjectType
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bytes read per chunk by the streaming JSON tokenizer
+CHUNK_SIZE = 1 << 16
+
+# Lockfiles per project type, in order of preference
+LOCKFILE_NAMES = {
+    ProjectType.NODEJS: ["package-lock.json", "yarn.lock"],
+    ProjectType.PYTHON: ["poetry.lock"],
+    ProjectType.RUST: ["Cargo.lock"],
+    ProjectType.GO: ["go.sum"],
+}
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = re.compile(r"[\s,]*")
+
+_VERSION_PARTS = re.compile(r"\d+")
+
+
+def _version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in _VERSION_PARTS.findall(version.split("+")[0].split("-")[0]))
+
+
+def _keep_highest(versions: Dict[str, str], name: str, version: str) -> None:
+    """Record a version, keeping the highest when a package appears several times"""
+    current = versions.get(name)
+    if current is None or _version_key(version) > _version_key(current):
+        versions[name] = version
+
+
+class _JSONStream:
+    """
+    Reads JSON values one at a time from a file read in chunks.
+
+    Values are decoded with the C decoder (raw_decode) as soon as the
+    buffer holds all of them, so only the current value is ever in memory.
+    """
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Drop consumed text and read more (at least as much as is pending)"""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next character after whitespace and commas ("" at end of file)"""
+        while True:
+            self.pos = _SEPARATORS.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending at the buffer's end may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_members(f, sections, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, str, object]]:
+    """
+    Stream the members of selected top-level objects of a JSON document.
+
+    Other top-level values are decoded and dropped one by one, and each
+    yielded member is decoded on its own: memory is bounded by the largest
+    single member, not the document.
+
+    Args:
+        f: Text file object
+        sections: Top-level keys whose object members are wanted
+        chunk_size: Characters read at a time
+
+    Yields:
+        (section, key, value), e.g. ("packages", "node_modules/lodash", {"version": ...})
+    """
+    stream = _JSONStream(f, chunk_size)
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        section = stream.value()
+        stream.expect(":")
+        if section in sections and stream.peek() == "{":
+            stream.expect("{")
+            while stream.peek() not in ("}", ""):
+                key = stream.value()
+                stream.expect(":")
+                yield section, key, stream.value()
+            stream.expect("}")
+        else:
+            stream.value()
+
+
+def parse_package_lock(path: Path) -> Optional[ProjectConfig]:
+    """
+    Resolved versions from package-lock.json / npm-shrinkwrap.json.
+
+    Only top-level (hoisted) packages are kept: nested
+    node_modules/a/node_modules/b copies are what a, not the project, imports.
+    """
+    versions: Dict[str, str] = {}
+    seen_packages = False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for section, name, entry in iter_json_members(f, ("packages", "dependencies")):
+                if section == "packages":
+                    # lockfileVersion 2/3: {"node_modules/lodash": {"version": ...}}
+                    seen_packages = True
+                    if name.startswith("node_modules/") and isinstance(entry, dict):
+                        name = name[len("node_modules/"):]
+                        if "/node_modules/" not in name and "version" in entry:
+                            versions[name] = entry["version"]
+                elif seen_packages:
+                    break  # v2 repeats everything in the legacy section
+                elif isinstance(entry, dict) and "version" in entry:
+                    # lockfileVersion 1: {"lodash": {"version": ..., "dependencies": {...}}}
+                    versions[name] = entry["version"]
+    except Exception as e:
+        logger.error(f"Failed to parse package-lock.json at {path}: {e}")
+        return None
+
+    return ProjectConfig(resolved_versions=versions)
+
+
+def parse_yarn_lock(path: Path) -> Optional[ProjectConfig]:
+    """
+    Resolved versions from yarn.lock (classic v1 and berry).
+
+    Entries look like:
+        "lodash@^4.17.15", lodash@^4.17.20:      (berry: "lodash@npm:^4.17.15":)
+          version "4.17.21"                       (berry: version: 4.17.21)
+    """
+    versions: Dict[str, str] = {}
+    name: Optional[str] = None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                if not line[0].isspace():
+                    # Header: first descriptor up to the version range's "@"
+                    descriptor = line.split(",")[0].strip().rstrip(":").strip('"')
+                    at = descriptor.find("@", 1)  # Scoped names start with "@"
+                    name = descriptor[:at] if at > 0 else None
+                    if name == "__metadata":
+                        name = None
+                elif name is not None and line.lstrip().startswith("version"):
+                    version = line.strip()[len("version"):].lstrip(": ").strip().strip('"')
+                    _keep_highest(versions, name, version)
+                    name = None
+    except Exception as e:
+        logger.error(f"Failed to parse yarn.lock at {path}: {e}")
+        return None
+
+    return ProjectConfig(resolved_versions=versions)
+
+
+def _parse_toml_packages(path: Path) -> Dict[str, str]:
+    """name/version of every [[package]] table (poetry.lock, Cargo.lock)"""
+    versions: Dict[str, str] = {}
+    in_package = False
+    name: Optional[str] = None
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                in_package = line == "[[package]]"
+                name = None
+                continue
+            if not in_package or "=" not in line:
+                continue
+
+            field, value = (part.strip() for part in line.split("=", 1))
+            value = value.strip('"')
+            if field == "name":
+                name = value
+            elif field == "version" and name is not None:
+                _keep_highest(versions, name, value)
+                in_package = False  # Rest of the table isn't needed
+
+    return versions
+
+
+def parse_poetry_lock(path: Path) -> Optional[ProjectConfig]:
+    """Resolved versions from poetry.lock"""
+    try:
+        return ProjectConfig(resolved_versions=_parse_toml_packages(path))
+    except Exception as e:
+        logger.error(f"Failed to parse poetry.lock at {path}: {e}")
+        return None
+
+
+def parse_cargo_lock(path: Path) -> Optional[ProjectConfig]:
+    """Resolved versions from Cargo.lock"""
+    try:
+        return ProjectConfig(resolved_versions=_parse_toml_packages(path))
+    except Exception as e:
+        logger.error(f"Failed to parse Cargo.lock at {path}: {e}")
+        return None
+
+
+def parse_go_sum(path: Path) -> Optional[ProjectConfig]:
+    """
+    Module versions from go.sum.
+
+    go.sum lists every version in the module graph; Go's minimal version
+    selection builds with the highest, so that one is kept.
+    """
+    versions: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 2:
+                    continue
+                version = parts[1]
+                if version.endswith("/go.mod"):
+                    version = version[: -len("/go.mod")]
+                _keep_highest(versions, parts[0], version)
+    except Exception as e:
+        logger.error(f"Failed to parse go.sum at {path}: {e}")
+        return None
+
+    return ProjectConfig(resolved_versions=versions)
+
+
+# Mapping of lockfiles to parser functions
+LOCKFILE_PARSERS = {
+    "package-lock.json": parse_package_lock,
+    "npm-shrinkwrap.json": parse_package_lock,
+    "yarn.lock": parse_yarn_lock,
+    "poetry.lock": parse_poetry_lock,
+    "Cargo.lock": parse_cargo_lock,
+    "go.sum": parse_go_sum,
+}
+
+
+def find_lockfile(project_dir: Path, project_type: ProjectType) -> Optional[Path]:
+    """First lockfile present in a project directory (None if there is none)"""
+    for name in LOCKFILE_NAMES.get(project_type, []):
+        candidate = project_dir / name
+        if candidate.is_file():
+            return candidate
+    return None
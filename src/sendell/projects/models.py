@@ -1,7 +1,7 @@
 """
 SQLAlchemy Database Models for Project Management
 
-7 tables for comprehensive project tracking:
+11 tables for comprehensive project tracking:
 1. projects - Core project metadata
 2. project_configs - Parsed configuration files
 3. project_metrics - Resource usage metrics
@@ -9,12 +9,17 @@ SQLAlchemy Database Models for Project Management
 5. project_errors - Structured error tracking
 6. project_commands - Runnable commands per project
 7. project_health_checks - Health status history
+8. scan_directories - Scanner index: directory mtimes and detection results
+9. scan_config_files - Config cache: parsed config files by size/mtime/hash
+10. scan_dir_sizes - Size walker: per-directory file counts and bytes
+11. scan_git - Git metadata reader: branch/HEAD/ahead/behind/dirty per repository
 """
 
 from datetime import datetime
 from pathlib import Path
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -112,9 +117,12 @@ class ProjectMetricModel(Base):
     cpu_percent = Column(Float, nullable=True)
     memory_mb = Column(Float, nullable=True)
     disk_usage_mb = Column(Float, nullable=True)
+    io_read_bytes = Column(Integer, nullable=True)  # Since the previous sample, summed over processes
+    io_write_bytes = Column(Integer, nullable=True)
 
     # Process info
-    process_id = Column(Integer, nullable=True)  # PID if running
+    process_id = Column(Integer, nullable=True)  # PID if running (lowest PID if several)
+    process_count = Column(Integer, nullable=True)  # Processes attributed to the project
     is_running = Column(Boolean, default=False)
 
     # Timing
@@ -270,6 +278,81 @@ class ProjectHealthCheckModel(Base):
         return f"<ProjectHealthCheck(id={self.id}, status={self.overall_status})>"
 
 
+class ScanDirectoryModel(Base):
+    """Scanner index entry for one visited directory"""
+
+    __tablename__ = "scan_directories"
+
+    path = Column(String(1024), primary_key=True)  # Absolute path
+    mtime_ns = Column(BigInteger, nullable=False)  # Directory mtime when listed
+
+    # Detection result (NULL if the directory is not a project)
+    project_type = Column(String(20), nullable=True)
+    config_name = Column(String(255), nullable=True)  # Marker file name
+
+    # Subdirectory names (JSON list, unfiltered); NULL if not listed
+    subdirs_json = Column(Text, nullable=True)
+    ignore_files_json = Column(Text, nullable=True)  # .gitignore / .ignore present (JSON list)
+
+    indexed_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanDirectory(path='{self.path}', type={self.project_type})>"
+
+
+class ScanConfigFileModel(Base):
+    """Scanner index entry for one parsed configuration file"""
+
+    __tablename__ = "scan_config_files"
+
+    path = Column(String(1024), primary_key=True)  # Absolute path
+    mtime_ns = Column(BigInteger, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    content_hash = Column(String(32), nullable=True)  # blake2b of the file (if hashing is on)
+    config_json = Column(Text, nullable=True)  # ProjectConfig JSON (NULL if unparseable)
+
+    parsed_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanConfigFile(path='{self.path}', size={self.size})>"
+
+
+class ScanSizeModel(Base):
+    """Size walker record for one directory (its own files, not subdirectories)"""
+
+    __tablename__ = "scan_dir_sizes"
+
+    path = Column(String(1024), primary_key=True)  # Absolute path
+    mtime_ns = Column(BigInteger, nullable=False)  # Directory mtime when listed
+    ignore_fingerprint = Column(String(16), nullable=False)  # Ignore files in effect ("" = none)
+
+    file_count = Column(Integer, nullable=False)
+    total_bytes = Column(BigInteger, nullable=False)
+
+    subdirs_json = Column(Text, nullable=False)  # Subdirectory names walked (JSON list)
+    ignore_files_json = Column(Text, nullable=False)  # .gitignore / .ignore present (JSON list)
+
+    measured_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanSize(path='{self.path}', files={self.file_count}, bytes={self.total_bytes})>"
+
+
+class ScanGitModel(Base):
+    """Git metadata reader record for one repository"""
+
+    __tablename__ = "scan_git"
+
+    path = Column(String(1024), primary_key=True)  # Work tree root
+    signature = Column(String(32), nullable=False)  # Digest of HEAD / ref / packed-refs / index stats
+    info_json = Column(Text, nullable=False)  # GitInfo JSON
+
+    read_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __repr__(self):
+        return f"<ScanGit(path='{self.path}')>"
+
+
 # Database initialization helper
 def init_database(engine):
     """
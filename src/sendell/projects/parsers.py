@@ -8,6 +8,9 @@ Parse project configuration files for different project types:
 - go.mod (Go)
 - pom.xml (Java/Maven)
 - And more...
+
+Lockfiles (package-lock.json, yarn.lock, ...) are handled by
+sendell.projects.lockfiles and dispatched from parse_project_config too.
 """
 
 import json
@@ -15,6 +18,7 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Optional
 
+from sendell.projects.lockfiles import LOCKFILE_PARSERS
 from sendell.projects.types import ProjectConfig
 from sendell.utils.logger import get_logger
 
@@ -342,7 +346,7 @@ def parse_project_config(config_file: Path) -> Optional[ProjectConfig]:
     """
     filename = config_file.name
 
-    parser = CONFIG_PARSERS.get(filename)
+    parser = CONFIG_PARSERS.get(filename) or LOCKFILE_PARSERS.get(filename)
     if parser:
         return parser(config_file)
 
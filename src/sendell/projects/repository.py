@@ -0,0 +1,340 @@
+"""
+Project Repository
+
+Persists discovered projects into the projects / project_configs tables:
+- One transaction per save, rows written with executemany upserts keyed
+  on the unique projects.path
+- Existing rows are read first and diffed, so a rescan of unchanged
+  projects writes nothing
+- Project.project_id is filled in from the database
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_, select, update
+
+from sendell.projects.models import (
+    ProjectCommandModel,
+    ProjectConfigModel,
+    ProjectErrorModel,
+    ProjectHealthCheckModel,
+    ProjectLogModel,
+    ProjectMetricModel,
+    ProjectModel,
+)
+from sendell.projects.types import Project, ScanResult
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Values per SELECT ... IN (...) (keeps bound parameters under SQLite's limit)
+SELECT_BATCH_SIZE = 500
+
+# Tables holding rows per project (deleted with the project)
+CHILD_MODELS = (
+    ProjectConfigModel,
+    ProjectMetricModel,
+    ProjectLogModel,
+    ProjectErrorModel,
+    ProjectCommandModel,
+    ProjectHealthCheckModel,
+)
+
+
+@dataclass
+class SaveStats:
+    """What one save wrote"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    configs_written: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def writes(self) -> int:
+        return self.inserted + self.updated + self.deleted + self.configs_written
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "deleted": self.deleted,
+            "configs_written": self.configs_written,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+@dataclass
+class _Existing:
+    """Stored state of one project, as needed for diffing"""
+
+    project_id: int
+    name: str
+    project_type: object
+    file_count: Optional[int]
+    total_size_bytes: Optional[int]
+    config_id: Optional[int] = None
+    config_json: Optional[dict] = None
+    config_file_path: Optional[str] = None
+
+
+def _config_row(project: Project) -> Tuple[dict, Optional[str]]:
+    """(config_json, config_file_path) as stored for a project ({} without a config)"""
+    config_json = project.config.model_dump(mode="json") if project.config else {}
+    config_file = str(project.config_file) if project.config_file else None
+    return config_json, config_file
+
+
+class ProjectRepository:
+    """
+    Writes scan results into the project database.
+
+    Usage:
+        repository = get_project_repository()
+        stats = repository.save_scan(result)
+        print(stats.to_dict())
+    """
+
+    def save_scan(self, result: ScanResult, prune: bool = False) -> SaveStats:
+        """
+        Persist the projects of a scan.
+
+        Args:
+            result: Scan result
+            prune: Also delete stored projects under result.scanned_path that
+                the scan did not find. Only pass for complete scans that went
+                as deep as earlier ones.
+
+        Returns:
+            SaveStats
+        """
+        prune_root = result.scanned_path if prune else None
+        return self.save_projects(result.projects_found, prune_root=prune_root)
+
+    def save_projects(self, projects: Iterable[Project], prune_root: Optional[Path] = None) -> SaveStats:
+        """
+        Insert new projects and update changed ones, in one transaction.
+
+        Args:
+            projects: Projects to store (matched to rows by path)
+            prune_root: Delete stored projects under this folder that are not in projects
+
+        Returns:
+            SaveStats
+        """
+        from sendell.projects.database import bulk_upsert, session_scope
+
+        start = time.perf_counter()
+        stats = SaveStats()
+        by_path: Dict[str, Project] = {str(project.path): project for project in projects}
+
+        if not by_path and prune_root is None:
+            return stats
+
+        ids: Dict[str, int] = {}
+        try:
+            with session_scope() as session:
+                existing = self._load_existing(session, list(by_path), prune_root)
+                now = datetime.now()
+
+                # ==================== PROJECTS ====================
+                rows = []
+                for path, project in by_path.items():
+                    stored = existing.get(path)
+                    if stored is None:
+                        stats.inserted += 1
+                    elif self._project_changed(project, stored):
+                        stats.updated += 1
+                    else:
+                        continue
+                    rows.append({
+                        "path": path,
+                        "name": project.name,
+                        "project_type": project.project_type,
+                        "status": project.status,
+                        "discovered_at": project.discovered_at,
+                        "last_scanned_at": now,
+                        "file_count": project.file_count if project.file_count is not None
+                        else getattr(stored, "file_count", None),
+                        "total_size_bytes": project.total_size_bytes if project.total_size_bytes is not None
+                        else getattr(stored, "total_size_bytes", None),
+                    })
+
+                if rows:
+                    # status and discovered_at belong to the stored row once it exists
+                    bulk_upsert(session, ProjectModel, rows, exclude_from_update=("status", "discovered_at"))
+
+                new_paths = [path for path in by_path if path not in existing]
+                ids = {path: stored.project_id for path, stored in existing.items()}
+                ids.update(self._select_ids(session, new_paths))
+
+                # ==================== CONFIGS ====================
+                config_inserts, config_updates = [], []
+                for path, project in by_path.items():
+                    config_json, config_file = _config_row(project)
+                    stored = existing.get(path)
+                    if stored is None or stored.config_id is None:
+                        if project.config is not None:
+                            config_inserts.append({
+                                "project_id": ids[path],
+                                "config_json": config_json,
+                                "config_file_path": config_file,
+                                "parsed_at": now,
+                            })
+                    elif stored.config_json != config_json or stored.config_file_path != config_file:
+                        config_updates.append({
+                            "id": stored.config_id,
+                            "config_json": config_json,
+                            "config_file_path": config_file,
+                            "parsed_at": now,
+                        })
+
+                if config_inserts:
+                    session.connection().execute(ProjectConfigModel.__table__.insert(), config_inserts)
+                if config_updates:
+                    session.execute(update(ProjectConfigModel), config_updates)
+                stats.configs_written = len(config_inserts) + len(config_updates)
+
+                # ==================== PRUNE ====================
+                if prune_root is not None:
+                    gone = [stored.project_id for path, stored in existing.items() if path not in by_path]
+                    self._delete_ids(session, gone)
+                    stats.deleted = len(gone)
+
+                stats.unchanged = len(by_path) - stats.inserted - stats.updated
+
+            for path, project in by_path.items():
+                project.project_id = ids.get(path)
+
+        except Exception as e:
+            logger.error(f"Failed to save projects: {e}")
+            return SaveStats(duration_seconds=time.perf_counter() - start)
+
+        stats.duration_seconds = time.perf_counter() - start
+        logger.debug(f"Saved projects: {stats.to_dict()}")
+        return stats
+
+    def remove_projects(self, paths: Iterable[Path]) -> int:
+        """
+        Delete projects (and their configs, metrics, logs, ...) by path.
+
+        Returns:
+            Number of projects deleted
+        """
+        from sendell.projects.database import session_scope
+
+        paths = [str(path) for path in paths]
+        if not paths:
+            return 0
+
+        try:
+            with session_scope() as session:
+                ids = list(self._select_ids(session, paths).values())
+                self._delete_ids(session, ids)
+        except Exception as e:
+            logger.error(f"Failed to remove projects: {e}")
+            return 0
+        return len(ids)
+
+    # ==================== HELPERS ====================
+
+    @staticmethod
+    def _project_changed(project: Project, stored: _Existing) -> bool:
+        if project.name != stored.name or project.project_type != stored.project_type:
+            return True
+        if project.file_count is not None and project.file_count != stored.file_count:
+            return True
+        if project.total_size_bytes is not None and project.total_size_bytes != stored.total_size_bytes:
+            return True
+        return False
+
+    @staticmethod
+    def _load_existing(session, paths: List[str], prune_root: Optional[Path]) -> Dict[str, _Existing]:
+        """Stored rows for the given paths (and everything under prune_root)"""
+        columns = (
+            ProjectModel.path,
+            ProjectModel.id,
+            ProjectModel.name,
+            ProjectModel.project_type,
+            ProjectModel.file_count,
+            ProjectModel.total_size_bytes,
+        )
+        existing: Dict[str, _Existing] = {}
+
+        def collect(stmt):
+            for path, project_id, name, project_type, file_count, total_size in session.execute(stmt):
+                existing[path] = _Existing(project_id, name, project_type, file_count, total_size)
+
+        if prune_root is not None:
+            root = str(prune_root)
+            collect(select(*columns).where(or_(
+                ProjectModel.path == root,
+                ProjectModel.path.startswith(root.rstrip(os.sep) + os.sep, autoescape=True),
+            )))
+        missing = [path for path in paths if path not in existing]
+        for i in range(0, len(missing), SELECT_BATCH_SIZE):
+            collect(select(*columns).where(ProjectModel.path.in_(missing[i : i + SELECT_BATCH_SIZE])))
+
+        # Latest config row per project
+        by_id = {stored.project_id: stored for stored in existing.values()}
+        ids = list(by_id)
+        for i in range(0, len(ids), SELECT_BATCH_SIZE):
+            stmt = (
+                select(
+                    ProjectConfigModel.project_id,
+                    ProjectConfigModel.id,
+                    ProjectConfigModel.config_json,
+                    ProjectConfigModel.config_file_path,
+                )
+                .where(ProjectConfigModel.project_id.in_(ids[i : i + SELECT_BATCH_SIZE]))
+                .order_by(ProjectConfigModel.id)
+            )
+            for project_id, config_id, config_json, config_file_path in session.execute(stmt):
+                stored = by_id[project_id]
+                stored.config_id, stored.config_json, stored.config_file_path = (
+                    config_id, config_json, config_file_path
+                )
+
+        return existing
+
+    @staticmethod
+    def _select_ids(session, paths: List[str]) -> Dict[str, int]:
+        ids: Dict[str, int] = {}
+        for i in range(0, len(paths), SELECT_BATCH_SIZE):
+            stmt = select(ProjectModel.path, ProjectModel.id).where(
+                ProjectModel.path.in_(paths[i : i + SELECT_BATCH_SIZE])
+            )
+            ids.update((path, project_id) for path, project_id in session.execute(stmt))
+        return ids
+
+    @staticmethod
+    def _delete_ids(session, ids: List[int]) -> None:
+        """Bulk delete projects with their child rows (bulk deletes skip ORM cascades)"""
+        from sendell.projects.database import bulk_delete
+
+        if not ids:
+            return
+        for model in CHILD_MODELS:
+            bulk_delete(session, model.project_id, ids)
+        bulk_delete(session, ProjectModel.id, ids)
+
+
+# Global repository
+_project_repository: Optional[ProjectRepository] = None
+
+
+def get_project_repository() -> ProjectRepository:
+    """Get or create the global project repository"""
+    global _project_repository
+    if _project_repository is None:
+        _project_repository = ProjectRepository()
+    return _project_repository
@@ -3,12 +3,46 @@ Project Scanner
 
 Discover development projects by scanning directories for configuration files
 and project markers.
+
+Each directory is listed once with os.scandir: the entry names are matched
+against precomputed marker tables (exact names and *.ext suffixes), and the
+same listing drives recursion using the DirEntry's cached type info.
+
+Directory listing releases the GIL, so the walk runs on a small thread pool
+fed from one shared LIFO deque.
+
+With a ProjectIndex, a directory whose mtime is unchanged since the last scan
+is not listed again: its detection result and subdirectory names come from
+the index, and config files are only reparsed when the ConfigCache sees a
+new size, mtime (or content hash). Lockfiles next to the config are parsed
+the same way and fill ProjectConfig.resolved_versions.
+
+.gitignore / .ignore files are loaded as the walk descends (an IgnoreStack
+per directory, shared by siblings), so ignored subtrees are never listed.
+
+The walk doesn't descend into projects; members of a monorepo workspace
+(pnpm, npm/yarn, Cargo, go.work, uv) are queued straight from its manifest.
+
+iter_scan() streams projects as they are found (sync or async iteration)
+and can stop after the first N results or a latency budget.
 """
 
+import asyncio
+import os
+import queue
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from sendell.config import get_settings
+from sendell.projects.gitignore import IGNORE_FILE_NAMES, IgnoreStack
+from sendell.projects.index import DirectoryRecord, ProjectIndex
+from sendell.projects.lockfiles import LOCKFILE_PARSERS, find_lockfile
 from sendell.projects.parsers import parse_project_config
 from sendell.projects.types import (
     Project,
@@ -18,20 +52,268 @@ from sendell.projects.types import (
     PROJECT_TYPE_MARKERS,
     IGNORE_DIRECTORIES,
 )
+from sendell.projects.workspaces import workspace_members
 from sendell.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Windows and macOS file systems are case-insensitive by default:
+# Path("makefile").exists() matches "Makefile" there
+_CASE_INSENSITIVE = sys.platform in ("win32", "darwin")
+
+
+def _marker_key(name: str) -> str:
+    return name.lower() if _CASE_INSENSITIVE else name
+
+
+def _build_marker_tables() -> Tuple[Dict[str, Tuple[int, ProjectType]], Dict[str, Tuple[int, ProjectType]]]:
+    """
+    Flatten PROJECT_TYPE_MARKERS into lookup tables.
+
+    The rank is the marker's position in PROJECT_TYPE_MARKERS, so the lowest
+    rank among a directory's matches is the marker the original per-marker
+    exists() loop would have found first.
+
+    Returns:
+        (exact name -> (rank, type), ".ext" suffix -> (rank, type))
+    """
+    exact: Dict[str, Tuple[int, ProjectType]] = {}
+    suffixes: Dict[str, Tuple[int, ProjectType]] = {}
+
+    rank = 0
+    for project_type, markers in PROJECT_TYPE_MARKERS.items():
+        for marker in markers:
+            if marker.startswith("*"):
+                suffixes.setdefault(_marker_key(marker[1:]), (rank, project_type))
+            else:
+                exact.setdefault(_marker_key(marker), (rank, project_type))
+            rank += 1
+
+    return exact, suffixes
+
+
+_EXACT_MARKERS, _SUFFIX_MARKERS = _build_marker_tables()
+
+
+def find_marker(names: Iterable[str]) -> Optional[Tuple[ProjectType, str]]:
+    """
+    Find the highest-priority project marker among directory entry names.
+
+    Markers keep the priority order of PROJECT_TYPE_MARKERS.
+
+    Returns:
+        (project type, marker file name) or None
+    """
+    by_key = {_marker_key(name): name for name in names}
+
+    best: Optional[Tuple[int, ProjectType]] = None
+    best_name: Optional[str] = None
+
+    for key in by_key.keys() & _EXACT_MARKERS.keys():
+        hit = _EXACT_MARKERS[key]
+        if best is None or hit < best:
+            best, best_name = hit, by_key[key]
+
+    if _SUFFIX_MARKERS:
+        for key, name in by_key.items():
+            dot = key.rfind(".")
+            if dot < 0:
+                continue
+            hit = _SUFFIX_MARKERS.get(key[dot:])
+            # Ties (several *.csproj) resolve to the first name alphabetically
+            if hit and (best is None or hit[0] < best[0] or (hit[0] == best[0] and name < best_name)):
+                best, best_name = hit, name
+
+    if best is None:
+        return None
+
+    return best[1], best_name
+
+
+@dataclass
+class _Visit:
+    """Result of visiting one directory"""
+
+    project: Optional[Project] = None
+    subdirs: List[Path] = field(default_factory=list)
+    members: List[Path] = field(default_factory=list)  # Workspace member directories of the project
+    ignore_stack: IgnoreStack = field(default_factory=IgnoreStack.empty)  # In effect for the subdirs
+    pruned: List[str] = field(default_factory=list)  # Rule of each subdirectory skipped by ignore files
+    error: Optional[str] = None
+    listed: bool = False  # Listed with os.scandir (not answered from the index)
+    cache_hits: int = 0  # Index lookups (directories and config files)
+    cache_misses: int = 0
+
+
+@dataclass
+class ScanProgress:
+    """Counters of a running (or finished) scan"""
+
+    directories_visited: int = 0
+    directories_listed: int = 0  # Visits that needed os.scandir
+    directories_queued: int = 0
+    directories_pruned: int = 0  # Skipped by .gitignore / .ignore rules
+    projects_found: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "directories_visited": self.directories_visited,
+            "directories_listed": self.directories_listed,
+            "directories_queued": self.directories_queued,
+            "directories_pruned": self.directories_pruned,
+            "projects_found": self.projects_found,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+class _Traversal:
+    """
+    Shared work deque for one parallel directory walk.
+
+    All workers pop from the end of one deque, guarded by a condition
+    variable, and push the subdirectories they find back onto it (there are
+    no per-worker queues). Whichever worker is idle takes the newest
+    directory, so one deep branch can't serialize the scan. All workers
+    share one monotonic deadline and a cancellation event; the caller of
+    run() only waits, so a worker stuck on a slow mount can't keep it past
+    either.
+    """
+
+    def __init__(
+        self,
+        visit: Callable[[Path, int, IgnoreStack, Optional[Path]], _Visit],
+        deadline: float,
+        cancel: threading.Event,
+        on_project: Optional[Callable[[Project], None]] = None,
+    ):
+        self._visit = visit
+        self.deadline = deadline
+        self.cancel = cancel
+        self.on_project = on_project
+        self.started_at = time.monotonic()
+
+        # (directory, depth, ignore stack, workspace root if it's a member)
+        self._work: Deque[Tuple[Path, int, IgnoreStack, Optional[Path]]] = deque()
+        self._pending = 0  # Queued + being visited
+        self._cond = threading.Condition()
+
+        self._projects: List[Project] = []
+        self._errors: List[str] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.visited = 0
+        self.listed = 0
+        self.pruned: Dict[str, int] = {}
+        self.timed_out = False
+        self.cancelled = False
+
+    def add(self, path: Path, depth: int, stack: IgnoreStack) -> None:
+        """Queue a directory (stack: ignore files in effect for its entries' parent)"""
+        with self._cond:
+            self._work.append((path, depth, stack, None))
+            self._pending += 1
+            self._cond.notify()
+
+    def run(self, workers: int) -> None:
+        """Walk until the queue drains, the deadline passes or the scan is cancelled"""
+        threads = [
+            threading.Thread(target=self._worker, name="project-scan", daemon=True)
+            for _ in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        with self._cond:
+            while self._pending and not self._stopped():
+                self._cond.wait(timeout=0.1)
+
+        # A worker stuck on a slow mount is abandoned; results() only has what finished
+        for thread in threads:
+            thread.join(timeout=0.1)
+
+    def results(self) -> Tuple[List[Project], List[str]]:
+        """Snapshot of projects and errors found so far"""
+        with self._cond:
+            return list(self._projects), list(self._errors)
+
+    def progress(self) -> ScanProgress:
+        """Snapshot of the scan counters"""
+        with self._cond:
+            return ScanProgress(
+                directories_visited=self.visited,
+                directories_listed=self.listed,
+                directories_queued=len(self._work),
+                directories_pruned=sum(self.pruned.values()),
+                projects_found=len(self._projects),
+                errors=len(self._errors),
+                cache_hits=self.cache_hits,
+                cache_misses=self.cache_misses,
+                elapsed_seconds=time.monotonic() - self.started_at,
+            )
+
+    def _stopped(self) -> bool:
+        if self.cancel.is_set():
+            self.cancelled = True
+            return True
+        if time.monotonic() > self.deadline:
+            self.timed_out = True
+            return True
+        return False
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._work and self._pending and not self._stopped():
+                    self._cond.wait(timeout=0.1)
+                if not self._work or self._stopped():
+                    self._cond.notify_all()
+                    return
+                # LIFO keeps each worker roughly depth-first and the queue small
+                path, depth, stack, workspace_root = self._work.pop()
+
+            visit = self._visit(path, depth, stack, workspace_root)
+
+            with self._cond:
+                if visit.project:
+                    self._projects.append(visit.project)
+                if visit.error:
+                    self._errors.append(visit.error)
+                self.visited += 1
+                self.listed += visit.listed
+                self.cache_hits += visit.cache_hits
+                self.cache_misses += visit.cache_misses
+                for rule in visit.pruned:
+                    self.pruned[rule] = self.pruned.get(rule, 0) + 1
+                self._work.extend((subdir, depth + 1, visit.ignore_stack, None) for subdir in visit.subdirs)
+                if visit.members:
+                    root = visit.project.path
+                    self._work.extend((member, depth + 1, IgnoreStack.empty(), root) for member in visit.members)
+                self._pending += len(visit.subdirs) + len(visit.members) - 1
+                self._cond.notify_all()
+
+            if visit.project and self.on_project:
+                self.on_project(visit.project)
+
 
 class ProjectScanner:
     """
     Scanner for discovering development projects in file system.
 
     Features:
-    - Recursive directory scanning
+    - Recursive directory scanning (parallel, shared deadline, cancellable)
     - Project type detection via configuration files
+    - Monorepo members from workspace manifests (no deeper walk needed)
     - Configuration parsing
-    - Ignore patterns for optimization
+    - Ignore patterns for optimization (fixed names plus .gitignore / .ignore)
+    - Optional persistent index: unchanged directories and configs are reused
     """
 
     def __init__(
@@ -39,6 +321,9 @@ class ProjectScanner:
         max_depth: int = 3,
         ignore_dirs: Optional[Set[str]] = None,
         timeout_seconds: int = 30,
+        max_workers: int = 8,
+        index: Optional[ProjectIndex] = None,
+        respect_ignore_files: Optional[bool] = None,
     ):
         """
         Initialize project scanner.
@@ -47,9 +332,21 @@ class ProjectScanner:
             max_depth: Maximum recursion depth (default 3)
             ignore_dirs: Additional directories to ignore
             timeout_seconds: Max time for entire scan operation
+            max_workers: Threads listing directories in parallel (1 = sequential)
+            index: Persistent index for incremental rescans (None = always list and parse)
+            respect_ignore_files: Skip directories matched by .gitignore / .ignore
+                (defaults to ProjectsConfig.project_scan_respect_gitignore)
         """
         self.max_depth = max_depth
         self.timeout_seconds = timeout_seconds
+        self.max_workers = max(1, max_workers)
+        self.index = index
+        if respect_ignore_files is None:
+            respect_ignore_files = get_settings().projects.project_scan_respect_gitignore
+        self.respect_ignore_files = respect_ignore_files
+
+        self._lock = threading.Lock()
+        self._active_scans: Set[threading.Event] = set()
 
         # Combine default ignore dirs with custom ones
         self.ignore_dirs = IGNORE_DIRECTORIES.copy()
@@ -58,66 +355,171 @@ class ProjectScanner:
 
         logger.info(f"ProjectScanner initialized (max_depth={max_depth}, timeout={timeout_seconds}s)")
 
-    def scan_directory(self, path: Path) -> ScanResult:
+    def scan_directory(self, path: Path, depth: int = 0) -> ScanResult:
         """
         Scan directory recursively to discover projects.
 
         Args:
             path: Directory path to scan
+            depth: Depth of path below the original scan root, when rescanning
+                part of a tree (max_depth stays relative to that root)
 
         Returns:
             ScanResult with discovered projects
         """
         start_time = time.time()
-        projects: List[Project] = []
-        errors: List[str] = []
 
         # Validate path
         if not isinstance(path, Path):
             path = Path(path)
 
+        error_msg = self._validate_path(path)
+        if error_msg:
+            return self._error_result(path, error_msg)
+
+        logger.info(f"Scanning directory: {path}")
+
+        traversal = self._new_traversal()
+        errors = self._run_traversal(traversal, path, depth)
+
+        return self._build_result(path, traversal, errors, time.time() - start_time)
+
+    def iter_scan(
+        self,
+        path: Path,
+        max_results: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+    ) -> "ScanStream":
+        """
+        Scan a directory, yielding each project as soon as it is found.
+
+        The walk runs on background threads; iteration ends when the scan
+        finishes, after max_results projects, or once the time budget is spent
+        (the rest of the walk is then cancelled).
+
+        Args:
+            path: Directory path to scan
+            max_results: Stop after this many projects
+            time_budget_seconds: Stop after this long, with whatever was found
+
+        Returns:
+            ScanStream (iterate with for / async for, then call result())
+
+        Example:
+            >>> stream = scanner.iter_scan(Path("~/dev").expanduser(), max_results=10)
+            >>> for project in stream:
+            ...     print(project.name, stream.progress.directories_visited)
+            >>> partial = stream.result()
+        """
+        return ScanStream(self, Path(path), max_results, time_budget_seconds)
+
+    def _validate_path(self, path: Path) -> Optional[str]:
+        """Error message if path can't be scanned"""
         if not path.exists():
             error_msg = f"Path does not exist: {path}"
-            logger.error(error_msg)
-            return ScanResult(
-                scanned_path=path,
-                projects_found=[],
-                scan_duration_seconds=0.0,
-                errors=[error_msg],
-                total_projects=0,
-                projects_by_type={},
-            )
-
-        if not path.is_dir():
+        elif not path.is_dir():
             error_msg = f"Path is not a directory: {path}"
-            logger.error(error_msg)
-            return ScanResult(
-                scanned_path=path,
-                projects_found=[],
-                scan_duration_seconds=0.0,
-                errors=[error_msg],
-                total_projects=0,
-                projects_by_type={},
-            )
+        else:
+            return None
 
-        logger.info(f"Scanning directory: {path}")
+        logger.error(error_msg)
+        return error_msg
 
-        try:
-            # Recursive scan
-            self._scan_recursive(path, depth=0, projects=projects, errors=errors, start_time=start_time)
+    @staticmethod
+    def _error_result(path: Path, error_msg: str) -> ScanResult:
+        return ScanResult(
+            scanned_path=path,
+            projects_found=[],
+            scan_duration_seconds=0.0,
+            errors=[error_msg],
+            total_projects=0,
+            projects_by_type={},
+        )
 
-        except TimeoutError as e:
-            error_msg = f"Scan timeout after {self.timeout_seconds}s"
-            logger.warning(error_msg)
-            errors.append(error_msg)
+    def _new_traversal(self, on_project: Optional[Callable[[Project], None]] = None) -> _Traversal:
+        return _Traversal(
+            visit=self._visit_directory,
+            deadline=time.monotonic() + self.timeout_seconds,
+            cancel=threading.Event(),
+            on_project=on_project,
+        )
+
+    def _run_traversal(self, traversal: _Traversal, path: Path, depth: int) -> List[str]:
+        """
+        Walk from path until done, timed out or cancelled.
+
+        Returns:
+            Errors raised by the walk itself (per-directory errors stay in the traversal)
+        """
+        errors: List[str] = []
+        with self._lock:
+            self._active_scans.add(traversal.cancel)
+
+        try:
+            stack = self._ancestor_stack(path, depth)
+            if path.name not in self.ignore_dirs and not stack.is_ignored(str(path), is_dir=True):
+                traversal.add(path, depth, stack)
+            traversal.run(self.max_workers)
 
         except Exception as e:
             error_msg = f"Scan error: {e}"
             logger.error(error_msg, exc_info=True)
             errors.append(error_msg)
 
+        finally:
+            with self._lock:
+                self._active_scans.discard(traversal.cancel)
+            if self.index is not None:
+                self.index.flush()
+
+        return errors
+
+    def _ancestor_stack(self, path: Path, depth: int) -> IgnoreStack:
+        """
+        Ignore files in effect above path when rescanning part of a tree.
+
+        Only the depth levels up to the original scan root are read, so a
+        rescan filters exactly like the full scan did.
+        """
+        stack = IgnoreStack.empty()
+        if not self.respect_ignore_files or depth <= 0:
+            return stack
+        for ancestor in reversed(path.parents[:depth]):
+            stack = stack.child(str(ancestor))
+        return stack
+
+    def _build_result(
+        self,
+        path: Path,
+        traversal: _Traversal,
+        errors: List[str],
+        duration: float,
+        stopped_early: Optional[str] = None,
+        projects: Optional[List[Project]] = None,
+    ) -> ScanResult:
+        """
+        Merge a traversal's projects and errors into a ScanResult
+
+        Args:
+            projects: Projects to report instead of everything the traversal found
+                (a stream reports only what it yielded)
+        """
+        # Deterministic merge: same order as a sorted depth-first walk
+        found, traversal_errors = traversal.results()
+        projects = list(found if projects is None else projects)
+        projects.sort(key=lambda project: project.path.parts)
+        errors = errors + sorted(traversal_errors)
+
+        if traversal.timed_out:
+            error_msg = f"Scan timeout after {self.timeout_seconds}s"
+            logger.warning(error_msg)
+            errors.append(error_msg)
+        elif stopped_early:
+            errors.append(f"Scan stopped early ({stopped_early})")
+        elif traversal.cancelled:
+            errors.append("Scan cancelled")
+
         # Calculate summary
-        duration = time.time() - start_time
         projects_by_type = {}
         for project in projects:
             type_name = project.project_type.value
@@ -130,73 +532,171 @@ class ProjectScanner:
             errors=errors,
             total_projects=len(projects),
             projects_by_type=projects_by_type,
+            cache_hits=traversal.cache_hits,
+            cache_misses=traversal.cache_misses,
+            directories_visited=traversal.visited,
+            directories_listed=traversal.listed,
+            pruned_by_rule=dict(sorted(traversal.pruned.items(), key=lambda item: (-item[1], item[0]))),
         )
 
         logger.info(
-            f"Scan complete: {result.total_projects} projects found in {duration:.2f}s"
+            f"Scan complete: {result.total_projects} projects found in {duration:.2f}s "
+            f"({result.directories_visited} directories, {sum(result.pruned_by_rule.values())} pruned by "
+            f"ignore files; index: {result.cache_hits} hits, {result.cache_misses} misses)"
         )
 
         return result
 
-    def _scan_recursive(
+    def cancel(self) -> None:
+        """Cancel all scans currently running on this scanner"""
+        with self._lock:
+            for cancel in self._active_scans:
+                cancel.set()
+
+    def _visit_directory(
         self,
-        current_path: Path,
+        path: Path,
         depth: int,
-        projects: List[Project],
-        errors: List[str],
-        start_time: float,
-    ):
+        stack: IgnoreStack,
+        workspace_root: Optional[Path] = None,
+    ) -> _Visit:
         """
-        Recursive scanning implementation.
+        Visit one directory: detect a project, or return subdirectories to walk.
 
-        Args:
-            current_path: Current directory being scanned
-            depth: Current recursion depth
-            projects: List to append discovered projects
-            errors: List to append errors
-            start_time: Scan start time for timeout check
-        """
-        # Check timeout
-        if time.time() - start_time > self.timeout_seconds:
-            raise TimeoutError()
+        With an index, an unchanged directory (same mtime) is answered from
+        the index with one stat instead of a listing.
 
-        # Check max depth
-        if depth > self.max_depth:
-            return
+        Args:
+            path: Directory to visit
+            depth: Its depth below the scan root
+            stack: Ignore files in effect above it
+            workspace_root: Set when visiting a workspace member (only
+                detected, never walked)
 
-        # Check if directory should be ignored
-        if current_path.name in self.ignore_dirs:
-            return
+        Returns:
+            _Visit with the project, subdirectories to visit, error and cache counts
+        """
+        visit = _Visit()
+        key = str(path)
 
         try:
-            # Try to detect project in current directory
-            project = self.detect_project(current_path)
-            if project:
-                projects.append(project)
-                logger.debug(f"Found project: {project.name} ({project.project_type.value}) at {current_path}")
-                # Don't scan subdirectories of detected projects (avoid nested detection)
-                return
+            record = None
+            if self.index is not None:
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    self.index.forget_directory(key)
+                    return visit
+                record = self.index.get_directory(key, mtime_ns)
+                if record is not None and (record.project_type or record.subdirs is not None):
+                    visit.cache_hits += 1
+                else:
+                    visit.cache_misses += 1
+                    record = self._list_directory(path, mtime_ns)
+                    visit.listed = True
+            else:
+                record = self._list_directory(path, mtime_ns=0)
+                visit.listed = True
+
+            if record.project_type:
+                visit.project = self._create_project(path, record.project_type, path / record.config_name, visit)
+                logger.debug(
+                    f"Found project: {visit.project.name} ({visit.project.project_type.value}) at {path}"
+                )
+                # Don't scan subdirectories of detected projects (avoid nested detection),
+                # but visit the members a workspace root declares
+                if workspace_root is not None:
+                    visit.project.workspace_root = workspace_root
+                else:
+                    visit.members = [
+                        member for member in workspace_members(path, record.project_type)
+                        if member.name not in self.ignore_dirs
+                    ]
+                return visit
+
+            if workspace_root is not None:
+                return visit  # Declared member without a project marker
 
             # Scan subdirectories if no project detected here
-            try:
-                for item in current_path.iterdir():
-                    if item.is_dir() and item.name not in self.ignore_dirs:
-                        self._scan_recursive(
-                            item,
-                            depth=depth + 1,
-                            projects=projects,
-                            errors=errors,
-                            start_time=start_time,
-                        )
-            except PermissionError:
-                error_msg = f"Permission denied: {current_path}"
-                logger.debug(error_msg)
-                errors.append(error_msg)
+            if depth < self.max_depth:
+                names = [name for name in record.subdirs if name not in self.ignore_dirs]
+                if self.respect_ignore_files:
+                    names = self._prune_ignored(key, names, record, stack, visit)
+                visit.subdirs = [path / name for name in names]
+
+        except PermissionError:
+            visit.error = f"Permission denied: {path}"
+            logger.debug(visit.error)
 
         except Exception as e:
-            error_msg = f"Error scanning {current_path}: {e}"
-            logger.warning(error_msg)
-            errors.append(error_msg)
+            visit.error = f"Error scanning {path}: {e}"
+            logger.warning(visit.error)
+
+        return visit
+
+    @staticmethod
+    def _prune_ignored(
+        key: str,
+        names: List[str],
+        record: DirectoryRecord,
+        stack: IgnoreStack,
+        visit: _Visit,
+    ) -> List[str]:
+        """Drop subdirectories matched by ignore files (recording the rule on the visit)"""
+        child = stack.child(key, record.ignore_files) if record.ignore_files else stack
+        visit.ignore_stack = child
+        if not child.has_rules:
+            return names
+
+        kept = []
+        for name in names:
+            rule = child.ignored_by(os.path.join(key, name), is_dir=True)
+            if rule is None:
+                kept.append(name)
+            else:
+                visit.pruned.append(rule)
+        return kept
+
+    def _list_directory(self, path: Path, mtime_ns: int) -> DirectoryRecord:
+        """
+        List one directory and record it in the index.
+
+        One listing per directory is used for detection and recursion.
+
+        Args:
+            path: Directory to list
+            mtime_ns: Its mtime before listing (only used with an index)
+
+        Returns:
+            DirectoryRecord with the detected marker or the sorted subdirectory names
+        """
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        marker = find_marker(entry.name for entry in entries)
+        if marker:
+            record = DirectoryRecord(mtime_ns=mtime_ns, project_type=marker[0], config_name=marker[1])
+        else:
+            subdirs = []
+            ignore_files = []
+            for entry in entries:
+                try:
+                    # DirEntry caches the type from the listing (no stat on Linux/Windows)
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif entry.name in IGNORE_FILE_NAMES:
+                        ignore_files.append(entry.name)
+                except OSError:
+                    continue
+            record = DirectoryRecord(
+                mtime_ns=mtime_ns,
+                subdirs=tuple(sorted(subdirs)),
+                ignore_files=tuple(sorted(ignore_files, key=IGNORE_FILE_NAMES.index)),
+            )
+
+        if self.index is not None:
+            self.index.put_directory(str(path), record)
+        return record
 
     def detect_project(self, path: Path) -> Optional[Project]:
         """
@@ -208,27 +708,36 @@ class ProjectScanner:
         Returns:
             Project object if detected, None otherwise
         """
-        # Check each project type's markers
-        for project_type, markers in PROJECT_TYPE_MARKERS.items():
-            for marker in markers:
-                # Handle glob patterns (e.g., *.csproj)
-                if "*" in marker:
-                    matches = list(path.glob(marker))
-                    if matches:
-                        config_file = matches[0]
-                        return self._create_project(path, project_type, config_file)
-                else:
-                    config_file = path / marker
-                    if config_file.exists():
-                        return self._create_project(path, project_type, config_file)
+        try:
+            names = os.listdir(path)
+        except OSError:
+            return None
 
-        return None
+        return self._detect_from_names(path, names)
+
+    def _detect_from_names(self, path: Path, names: Iterable[str]) -> Optional[Project]:
+        """
+        Detect a project from a directory listing (no file system access).
+
+        Args:
+            path: Directory the names were listed from
+            names: Entry names in that directory
+
+        Returns:
+            Project object if detected, None otherwise
+        """
+        marker = find_marker(names)
+        if marker is None:
+            return None
+
+        return self._create_project(path, marker[0], path / marker[1])
 
     def _create_project(
         self,
         path: Path,
         project_type: ProjectType,
         config_file: Path,
+        visit: Optional[_Visit] = None,
     ) -> Project:
         """
         Create a Project object from detected directory.
@@ -237,12 +746,24 @@ class ProjectScanner:
             path: Project directory path
             project_type: Detected project type
             config_file: Path to configuration file
+            visit: Visit to count config cache hits/misses on
 
         Returns:
             Project object
         """
         # Parse configuration
-        config = parse_project_config(config_file)
+        config = self._parse_config(config_file, visit)
+
+        # Pinned versions from the lockfile (through the same config cache)
+        if config_file.name not in LOCKFILE_PARSERS:
+            lockfile = find_lockfile(path, project_type)
+            if lockfile is not None:
+                locked = self._parse_config(lockfile, visit)
+                if locked is not None and locked.resolved_versions:
+                    # Copy: the parsed config is shared through the cache
+                    config = (config or ProjectConfig()).model_copy(
+                        update={"resolved_versions": locked.resolved_versions}
+                    )
 
         # Determine project name
         if config and config.name:
@@ -262,20 +783,184 @@ class ProjectScanner:
 
         return project
 
+    def _parse_config(self, config_file: Path, visit: Optional[_Visit] = None) -> Optional[ProjectConfig]:
+        """
+        Parse a config file through the index's config cache (if any).
+
+        Args:
+            config_file: Path to configuration file
+            visit: Visit to count cache hits/misses on
+
+        Returns:
+            ProjectConfig or None
+        """
+        if self.index is None:
+            return parse_project_config(config_file)
+
+        config, hit = self.index.configs.load(config_file)
+        if visit is not None:
+            if hit:
+                visit.cache_hits += 1
+            else:
+                visit.cache_misses += 1
+        return config
+
     def scan_multiple_paths(self, paths: List[Path]) -> List[ScanResult]:
         """
-        Scan multiple paths and return results for each.
+        Scan multiple paths concurrently and return results for each.
 
         Args:
             paths: List of directory paths to scan
 
         Returns:
-            List of ScanResult objects
+            List of ScanResult objects (same order as paths)
         """
-        results = []
+        if len(paths) <= 1:
+            return [self.scan_directory(path) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=len(paths), thread_name_prefix="project-scan-root") as executor:
+            return list(executor.map(self.scan_directory, paths))
+
+
+# Marks the end of a streamed scan in ScanStream's queue
+_SCAN_DONE = object()
+
+
+class ScanStream:
+    """
+    Projects of a running scan, in the order they are found.
+
+    Iterate once (for or async for). Stopping early (limits, break) cancels
+    the rest of the walk; result() then returns what was found so far.
+    """
 
-        for path in paths:
-            result = self.scan_directory(path)
-            results.append(result)
+    def __init__(
+        self,
+        scanner: ProjectScanner,
+        path: Path,
+        max_results: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+    ):
+        self.scanner = scanner
+        self.path = path
+        self.max_results = max_results
+        self.time_budget_seconds = time_budget_seconds
+        self.stopped_early: Optional[str] = None  # "max_results" or "time_budget"
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._traversal = scanner._new_traversal(on_project=self._queue.put)
+        self._errors: List[str] = []
+        self._yielded: List[Project] = []  # Workers may find more before they stop
+        self._error_msg = scanner._validate_path(path)
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self._duration: Optional[float] = None
+
+    @property
+    def progress(self) -> ScanProgress:
+        """Counters of the walk so far"""
+        return self._traversal.progress()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole tree was walked"""
+        return (
+            self._duration is not None
+            and not self.stopped_early
+            and not self._traversal.timed_out
+            and not self._traversal.cancelled
+        )
 
-        return results
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._started_at = time.time()
+        if self._error_msg:
+            self._queue.put(_SCAN_DONE)
+            return
+
+        logger.info(f"Streaming scan of directory: {self.path}")
+        self._thread = threading.Thread(target=self._walk, name="project-scan-stream", daemon=True)
+        self._thread.start()
+
+    def _walk(self) -> None:
+        try:
+            self._errors = self.scanner._run_traversal(self._traversal, self.path, depth=0)
+        finally:
+            self._duration = time.time() - self._started_at
+            self._queue.put(_SCAN_DONE)
+
+    def __iter__(self) -> Iterator[Project]:
+        self._start()
+        budget_deadline = (
+            time.monotonic() + self.time_budget_seconds if self.time_budget_seconds is not None else None
+        )
+        yielded = 0
+        done = False
+
+        try:
+            while True:
+                timeout = None
+                if budget_deadline is not None:
+                    timeout = max(budget_deadline - time.monotonic(), 0.0)
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self.stopped_early = "time_budget"
+                    return
+                if item is _SCAN_DONE:
+                    done = True
+                    return
+
+                self._yielded.append(item)
+                yield item
+                yielded += 1
+                if self.max_results is not None and yielded >= self.max_results:
+                    self.stopped_early = "max_results"
+                    return
+        finally:
+            if not done:
+                self._traversal.cancel.set()
+
+    async def __aiter__(self) -> AsyncIterator[Project]:
+        iterator = iter(self)
+        try:
+            while True:
+                project = await asyncio.to_thread(next, iterator, None)
+                if project is None:
+                    return
+                yield project
+        finally:
+            self._traversal.cancel.set()
+            try:
+                iterator.close()
+            except ValueError:
+                pass  # Still running in the worker thread; it ends with the cancelled walk
+
+    def result(self, wait_seconds: float = 2.0) -> ScanResult:
+        """
+        ScanResult for the projects yielded so far.
+
+        Args:
+            wait_seconds: How long to wait for cancelled workers to wind down
+        """
+        if self._error_msg:
+            return self.scanner._error_result(self.path, self._error_msg)
+
+        if self._thread is None:
+            for _ in self:  # Never iterated: run the scan to the end (or the limits)
+                pass
+        elif self._thread.is_alive():
+            self._traversal.cancel.set()  # Caller stopped iterating: don't finish the walk
+        if self._thread is not None:
+            self._thread.join(timeout=wait_seconds)
+        duration = self._duration if self._duration is not None else time.time() - self._started_at
+
+        return self.scanner._build_result(
+            self.path,
+            self._traversal,
+            list(self._errors),
+            duration,
+            stopped_early=self.stopped_early,
+            projects=self._yielded,
+        )
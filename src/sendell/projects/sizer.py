@@ -0,0 +1,409 @@
+"""
+Project Size Walker
+
+Fills Project.file_count and Project.total_size_bytes:
+- Parallel os.scandir walk over a shared work queue (listing releases
+  the GIL), skipping IGNORE_DIRECTORIES and .gitignore / .ignore matches
+- Each directory's own totals are kept in the ProjectIndex: while its
+  mtime and the ignore files in effect are unchanged it is only stat'ed,
+  so re-measuring after a small change lists just the changed directories
+- Runs in a background thread after discovery; listeners get the
+  measured projects (e.g. to persist them)
+
+A directory's mtime changes when entries are added, removed or renamed,
+not when a file grows in place; measure(force=True) relists everything,
+and background measuring forces one full relist per project every
+ProjectsConfig.project_size_full_rescan_seconds so such growth shows up.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from sendell.config import get_settings
+from sendell.projects.gitignore import IGNORE_FILE_NAMES, IgnoreStack
+from sendell.projects.index import ProjectIndex, SizeRecord, get_project_index
+from sendell.projects.types import IGNORE_DIRECTORIES, Project
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Longest a single project may take before its walk is abandoned
+MEASURE_TIMEOUT_SECONDS = 120
+
+# Projects measured before listeners are called and the index is flushed
+BATCH_SIZE = 50
+
+
+@dataclass
+class SizeResult:
+    """Totals of one measured directory tree"""
+
+    path: Path
+    file_count: int = 0
+    total_size_bytes: int = 0
+    directories: int = 0  # Directories walked
+    relisted: int = 0  # Directories listed (the rest came from the index)
+    errors: int = 0
+    complete: bool = True  # False if the walk timed out
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "path": str(self.path),
+            "file_count": self.file_count,
+            "total_size_bytes": self.total_size_bytes,
+            "directories": self.directories,
+            "relisted": self.relisted,
+            "errors": self.errors,
+            "complete": self.complete,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+class _SizeWalk:
+    """
+    Shared work queue for one parallel size walk.
+
+    Workers pop a directory, add its own files to the totals and push its
+    subdirectories back (same scheme as the scanner's traversal).
+    """
+
+    def __init__(
+        self,
+        result: SizeResult,
+        index: Optional[ProjectIndex],
+        ignore_dirs: Set[str],
+        deadline: float,
+        force: bool,
+    ):
+        self.result = result
+        self.index = index
+        self.ignore_dirs = ignore_dirs
+        self.deadline = deadline
+        self.force = force
+
+        self._work: Deque[Tuple[str, IgnoreStack]] = deque()
+        self._pending = 0
+        self._cond = threading.Condition()
+
+    def add(self, path: str, stack: IgnoreStack) -> None:
+        with self._cond:
+            self._work.append((path, stack))
+            self._pending += 1
+            self._cond.notify()
+
+    def run(self, workers: int) -> None:
+        threads = [
+            threading.Thread(target=self._worker, name="project-size", daemon=True)
+            for _ in range(workers - 1)
+        ]
+        for thread in threads:
+            thread.start()
+
+        self._worker()
+
+        for thread in threads:
+            thread.join(timeout=max(self.deadline - time.monotonic(), 0) + 0.1)
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._work and self._pending and time.monotonic() < self.deadline:
+                    self._cond.wait(timeout=0.1)
+                if not self._work or time.monotonic() >= self.deadline:
+                    if self._work:
+                        self.result.complete = False
+                    self._cond.notify_all()
+                    return
+                path, stack = self._work.pop()
+
+            record, stack, listed, error = self._visit(path, stack)
+
+            with self._cond:
+                self.result.directories += 1
+                self.result.relisted += listed
+                self.result.errors += error
+                if record is not None:
+                    self.result.file_count += record.file_count
+                    self.result.total_size_bytes += record.total_bytes
+                    for name in record.subdirs:
+                        self._work.append((os.path.join(path, name), stack))
+                    self._pending += len(record.subdirs)
+                self._pending -= 1
+                self._cond.notify_all()
+
+    def _visit(self, path: str, stack: IgnoreStack) -> Tuple[Optional[SizeRecord], IgnoreStack, int, int]:
+        """
+        Own totals of one directory.
+
+        Returns:
+            (record or None, ignore stack for its entries, 1 if listed, 1 on error)
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, stack, 0, 1
+
+        if self.index is not None and not self.force:
+            record = self.index.get_size(path, mtime_ns)
+            if record is not None:
+                child = stack.child(path, record.ignore_files) if record.ignore_files else stack
+                if child.fingerprint == record.ignore_fingerprint:
+                    return record, child, 0, 0
+
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return None, stack, 1, 1
+
+        ignore_files = tuple(entry.name for entry in entries if entry.name in IGNORE_FILE_NAMES)
+        child = stack.child(path, ignore_files) if ignore_files else stack
+
+        file_count = 0
+        total_bytes = 0
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.ignore_dirs and not child.is_ignored(entry.path, is_dir=True):
+                        subdirs.append(entry.name)
+                elif not child.is_ignored(entry.path, is_dir=False):
+                    file_count += 1
+                    total_bytes += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+
+        record = SizeRecord(
+            mtime_ns=mtime_ns,
+            ignore_fingerprint=child.fingerprint,
+            file_count=file_count,
+            total_bytes=total_bytes,
+            subdirs=tuple(sorted(subdirs)),
+            ignore_files=ignore_files,
+        )
+        if self.index is not None:
+            self.index.put_size(path, record)
+        return record, child, 1, 0
+
+
+class ProjectSizer:
+    """
+    Measures file counts and sizes of projects, in the background.
+
+    Usage:
+        sizer = get_project_sizer()
+        sizer.subscribe(lambda projects: print([p.total_size_bytes for p in projects]))
+        sizer.submit(result.projects_found)  # returns immediately
+
+        result = sizer.measure(Path("C:/dev/app"))  # or synchronously
+    """
+
+    def __init__(
+        self,
+        index: Optional[ProjectIndex] = None,
+        workers: Optional[int] = None,
+        ignore_dirs: Optional[Set[str]] = None,
+        full_rescan_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize sizer.
+
+        Args:
+            index: Index for per-directory totals (None = always list everything)
+            workers: Threads per walk (defaults to ProjectsConfig.project_size_workers)
+            ignore_dirs: Directory names never walked (defaults to IGNORE_DIRECTORIES)
+            full_rescan_seconds: Relist a project completely when its last full walk is
+                older than this (defaults to ProjectsConfig.project_size_full_rescan_seconds)
+        """
+        config = get_settings().projects
+        self.index = index
+        self.workers = max(1, workers if workers is not None else config.project_size_workers)
+        self.ignore_dirs = set(ignore_dirs) if ignore_dirs is not None else set(IGNORE_DIRECTORIES)
+        self.full_rescan_seconds = (
+            full_rescan_seconds if full_rescan_seconds is not None else config.project_size_full_rescan_seconds
+        )
+
+        self._queue: "queue.Queue[Optional[Project]]" = queue.Queue()
+        self._queued: Dict[str, Project] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[List[Project]], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._known: Dict[str, Tuple[int, int]] = {}  # Last complete totals per project path
+        self._full_at: Dict[str, float] = {}  # Monotonic time of the last full walk per project path
+
+        self.stats = {"measured": 0, "directories": 0, "relisted": 0, "timeouts": 0, "full_rescans": 0}
+
+    # ==================== SYNCHRONOUS ====================
+
+    def measure(self, path: Path, force: bool = False, timeout_seconds: float = MEASURE_TIMEOUT_SECONDS) -> SizeResult:
+        """
+        Count files and bytes below a directory.
+
+        Args:
+            path: Directory (project root)
+            force: Relist every directory instead of trusting unchanged mtimes
+            timeout_seconds: Give up after this long (result.complete = False)
+
+        Returns:
+            SizeResult
+        """
+        start = time.perf_counter()
+        root = str(path)
+        result = SizeResult(path=path)
+
+        walk = _SizeWalk(result, self.index, self.ignore_dirs, time.monotonic() + timeout_seconds, force)
+        walk.add(root, IgnoreStack.empty())
+        walk.run(self.workers)
+
+        result.duration_seconds = time.perf_counter() - start
+        with self._lock:
+            self.stats["measured"] += 1
+            self.stats["directories"] += result.directories
+            self.stats["relisted"] += result.relisted
+            self.stats["timeouts"] += 0 if result.complete else 1
+        return result
+
+    def measure_project(self, project: Project, force: Optional[bool] = None) -> SizeResult:
+        """
+        Measure a project and store the totals on it (left unset if the walk timed out).
+
+        Args:
+            project: Project to measure
+            force: Relist every directory (None = only when the project's last full
+                walk is older than full_rescan_seconds; the first one counts as full)
+        """
+        key = str(project.path)
+        if force is None:
+            now = time.monotonic()
+            with self._lock:
+                last_full = self._full_at.setdefault(key, now)
+            force = now - last_full >= self.full_rescan_seconds
+
+        result = self.measure(project.path, force=force)
+        if result.complete:
+            project.file_count = result.file_count
+            project.total_size_bytes = result.total_size_bytes
+            with self._lock:
+                self._known[key] = (result.file_count, result.total_size_bytes)
+                if force:
+                    self._full_at[key] = time.monotonic()
+                    self.stats["full_rescans"] += 1
+        else:
+            logger.warning(f"Size walk of {project.path} timed out after {result.directories} directories")
+        return result
+
+    def fill_known(self, projects: Iterable[Project]) -> int:
+        """
+        Set totals from earlier measurements on projects that don't have them yet.
+
+        Returns:
+            Number of projects filled
+        """
+        filled = 0
+        with self._lock:
+            for project in projects:
+                known = self._known.get(str(project.path))
+                if known is not None and project.file_count is None:
+                    project.file_count, project.total_size_bytes = known
+                    filled += 1
+        return filled
+
+    # ==================== BACKGROUND ====================
+
+    def subscribe(self, listener: Callable[[List[Project]], None]) -> None:
+        """Call listener(projects) from the sizer thread after each batch is measured"""
+        self._listeners.append(listener)
+
+    def submit(self, projects: Iterable[Project]) -> int:
+        """
+        Queue projects for measuring (a project already queued is measured once).
+
+        Returns:
+            Number of projects queued
+        """
+        queued = 0
+        with self._lock:
+            for project in projects:
+                key = str(project.path)
+                if key in self._queued:
+                    self._queued[key] = project  # Measure the newest object
+                    continue
+                self._queued[key] = project
+                self._queue.put(project)
+                queued += 1
+
+            if queued and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(target=self._run, name="project-sizer", daemon=True)
+                self._thread.start()
+        return queued
+
+    def stop(self) -> None:
+        """Stop the background thread after the current project"""
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        batch: List[Project] = []
+        while True:
+            try:
+                item = self._queue.get(timeout=0.5 if batch else 30)
+            except queue.Empty:
+                if batch:
+                    self._finish_batch(batch)
+                    batch = []
+                    continue
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            if item is None:
+                break
+
+            with self._lock:
+                project = self._queued.pop(str(item.path), item)
+            try:
+                self.measure_project(project)
+                batch.append(project)
+            except Exception as e:
+                logger.error(f"Failed to measure {project.path}: {e}")
+
+            if len(batch) >= BATCH_SIZE or (self._queue.empty() and batch):
+                self._finish_batch(batch)
+                batch = []
+
+        if batch:
+            self._finish_batch(batch)
+
+    def _finish_batch(self, projects: List[Project]) -> None:
+        if self.index is not None:
+            self.index.flush()
+        for listener in self._listeners:
+            try:
+                listener(projects)
+            except Exception as e:
+                logger.error(f"Project size listener failed: {e}")
+
+
+# Global project sizer
+_project_sizer: Optional[ProjectSizer] = None
+
+
+def get_project_sizer() -> ProjectSizer:
+    """Get or create the global project sizer (backed by the project index)"""
+    global _project_sizer
+    if _project_sizer is None:
+        _project_sizer = ProjectSizer(index=get_project_index())
+    return _project_sizer
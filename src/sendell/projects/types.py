@@ -56,6 +56,22 @@ class ProjectConfig(BaseModel):
     go_version: Optional[str] = None  # For Go projects
     rust_edition: Optional[str] = None  # For Rust projects
 
+    # Versions pinned by the lockfile (package -> version), if there is one
+    resolved_versions: Dict[str, str] = Field(default_factory=dict)
+
+
+class GitInfo(BaseModel):
+    """Git state of a project's repository (read from .git, no git process)"""
+
+    repository: Path  # Work tree root (may be above the project in a monorepo)
+    branch: Optional[str] = None  # None if HEAD is detached
+    head: Optional[str] = None  # Commit SHA (None on an unborn branch)
+    upstream: Optional[str] = None  # Tracking branch, e.g. "origin/main"
+    ahead: Optional[int] = None  # Commits not on upstream (None if unknown or too many)
+    behind: Optional[int] = None
+    dirty: Optional[bool] = None  # Tracked files changed vs. the index (untracked files not checked)
+    checked_at: Optional[datetime] = None  # When dirty was last checked
+
 
 class Project(BaseModel):
     """Represents a discovered development project"""
@@ -70,10 +86,16 @@ class Project(BaseModel):
     config: Optional[ProjectConfig] = None
     config_file: Optional[Path] = None  # Path to main config file
 
+    # Monorepo workspace root this project is a member of (pnpm, npm/yarn, Cargo, go.work, uv)
+    workspace_root: Optional[Path] = None
+
     # Metadata
     discovered_at: datetime = Field(default_factory=datetime.now)
     last_scanned_at: Optional[datetime] = None
 
+    # Git state (filled after discovery by the git metadata reader)
+    git: Optional[GitInfo] = None
+
     # Stats (filled later by monitoring)
     file_count: Optional[int] = None
     total_size_bytes: Optional[int] = None
@@ -116,6 +138,16 @@ class ScanResult(BaseModel):
     total_projects: int = 0
     projects_by_type: Dict[str, int] = Field(default_factory=dict)
 
+    # Project index lookups (directories and config files)
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    # Directories walked (listed = not answered from the index), and subdirectories
+    # skipped per .gitignore / .ignore rule ("<ignore file>: <pattern>" -> count)
+    directories_visited: int = 0
+    directories_listed: int = 0
+    pruned_by_rule: Dict[str, int] = Field(default_factory=dict)
+
     @field_validator("scanned_path", mode="before")
     @classmethod
     def validate_scanned_path(cls, v):
@@ -152,6 +184,7 @@ PROJECT_TYPE_MARKERS = {
     ],
     ProjectType.GO: [
         "go.mod",
+        "go.work",  # Multi-module workspace root
         "go.sum",
     ],
     ProjectType.JAVA: [
@@ -0,0 +1,560 @@
+"""
+Project Watcher
+
+Keeps the projects under configured roots up to date without full scans:
+- Linux: inotify watches on every directory the scanner walks; creating,
+  deleting or editing a marker file (PROJECT_TYPE_MARKERS) or adding /
+  removing a directory marks its parent dirty
+- Dirty directories are debounced (applied after a quiet period) and
+  coalesced (a dirty ancestor covers its descendants), then rescanned
+  through the ProjectIndex, so only changed listings and configs are read
+- Elsewhere, or when inotify watches run out: periodic index-backed rescans
+
+Project queries for watched roots are then answered from memory.
+"""
+
+import errno
+import os
+import selectors
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from sendell.config import get_settings
+from sendell.projects.gitignore import IGNORE_FILE_NAMES
+from sendell.projects.index import ProjectIndex, get_project_index
+from sendell.projects.scanner import ProjectScanner, find_marker
+from sendell.projects.types import Project, ScanResult
+from sendell.projects.workspaces import MANIFEST_READERS
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from sendell.device.platform.linux import (
+        IN_CLOSE_WRITE,
+        IN_CREATE,
+        IN_DELETE,
+        IN_DELETE_SELF,
+        IN_IGNORED,
+        IN_ISDIR,
+        IN_MOVE_SELF,
+        IN_MOVED_FROM,
+        IN_MOVED_TO,
+        IN_ONLYDIR,
+        IN_Q_OVERFLOW,
+        INOTIFY_AVAILABLE,
+        Inotify,
+    )
+
+    _WATCH_MASK = (
+        IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_CLOSE_WRITE
+        | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    )
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# Apply pending changes after this many debounce periods even if events keep coming
+MAX_DELAY_FACTOR = 8
+
+
+@dataclass
+class ProjectChanges:
+    """Projects added, updated or removed by one rescan"""
+
+    added: List[Project] = field(default_factory=list)
+    updated: List[Project] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def extend(self, other: "ProjectChanges") -> None:
+        self.added.extend(other.added)
+        self.updated.extend(other.updated)
+        self.removed.extend(other.removed)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            "added": [str(project.path) for project in self.added],
+            "updated": [str(project.path) for project in self.updated],
+            "removed": [str(path) for path in self.removed],
+        }
+
+
+class ProjectWatcher:
+    """
+    Background watcher keeping the projects under some roots current.
+
+    Callbacks run on the watcher thread; they must be quick and thread-safe.
+
+    Usage:
+        watcher = get_project_watcher()
+        watcher.subscribe(lambda changes: print(changes.to_dict()))
+        watcher.start()
+        projects = watcher.projects(under=Path("~/dev").expanduser())
+    """
+
+    def __init__(
+        self,
+        roots: Optional[Iterable[Path]] = None,
+        index: Optional[ProjectIndex] = None,
+        scanner: Optional[ProjectScanner] = None,
+        debounce_seconds: Optional[float] = None,
+        poll_seconds: Optional[float] = None,
+        use_inotify: bool = True,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            roots: Directories to watch (defaults to ProjectsConfig.project_watch_roots)
+            index: Project index (defaults to the global one)
+            scanner: Scanner used for rescans (defaults to max_depth=3 over the index)
+            debounce_seconds: Quiet period before events are applied
+            poll_seconds: Rescan interval without inotify
+            use_inotify: Set False to force polling
+        """
+        settings = get_settings().projects
+        self.roots = [Path(root).resolve() for root in roots] if roots is not None else settings.watch_roots
+        self.index = index if index is not None else get_project_index()
+        self.scanner = scanner or ProjectScanner(max_depth=3, timeout_seconds=30, index=self.index)
+        self.debounce = debounce_seconds if debounce_seconds is not None else settings.project_watch_debounce_seconds
+        self.poll_interval = poll_seconds if poll_seconds is not None else settings.project_watch_poll_seconds
+        self.use_inotify = use_inotify and INOTIFY_AVAILABLE
+
+        self._projects: Dict[str, Project] = {}
+        self._lock = threading.RLock()
+        self._subscriptions: Dict[int, Callable[[ProjectChanges], None]] = {}
+        self._next_token = 0
+
+        # Pending (debounced) work
+        self._dirty: Set[str] = set()
+        self._first_event_at = 0.0
+        self._last_event_at = 0.0
+
+        # inotify state (watcher thread only)
+        self._inotify = None
+        self._watches: Dict[int, str] = {}  # wd -> directory
+        self._wd_by_path: Dict[str, int] = {}
+
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.ready = threading.Event()  # Set after the initial scan
+
+        self.stats = {"events": 0, "rescans": 0, "full_scans": 0, "added": 0, "updated": 0, "removed": 0}
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ==================== SUBSCRIPTIONS ====================
+
+    def subscribe(self, callback: Callable[[ProjectChanges], None]) -> int:
+        """
+        Register a callback for project changes.
+
+        Returns:
+            Subscription token for unsubscribe()
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscriptions[token] = callback
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscriber"""
+        with self._lock:
+            self._subscriptions.pop(token, None)
+
+    # ==================== QUERIES ====================
+
+    def covers(self, path: Path) -> bool:
+        """Whether a path is inside a watched root"""
+        path = Path(path).resolve()
+        return any(path == root or root in path.parents for root in self.roots)
+
+    def projects(self, under: Optional[Path] = None) -> List[Project]:
+        """
+        Known projects, sorted by path.
+
+        Args:
+            under: Only projects at or below this directory
+        """
+        with self._lock:
+            projects = list(self._projects.values())
+
+        if under is not None:
+            under = Path(under).resolve()
+            projects = [p for p in projects if p.path == under or under in p.path.parents]
+
+        projects.sort(key=lambda project: project.path.parts)
+        return projects
+
+    def scan_result(self, path: Path) -> ScanResult:
+        """Answer a scan of a watched directory from memory"""
+        projects = self.projects(under=path)
+        projects_by_type: Dict[str, int] = {}
+        for project in projects:
+            type_name = project.project_type.value
+            projects_by_type[type_name] = projects_by_type.get(type_name, 0) + 1
+
+        return ScanResult(
+            scanned_path=Path(path),
+            projects_found=projects,
+            scan_duration_seconds=0.0,
+            total_projects=len(projects),
+            projects_by_type=projects_by_type,
+        )
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> None:
+        """Start watching (the initial scan runs on the watcher thread)"""
+        if self._running:
+            return
+        if not self.roots:
+            logger.warning("Project watcher has no roots configured")
+            return
+
+        if self.use_inotify:
+            try:
+                self._inotify = Inotify()
+            except OSError as e:
+                logger.warning(f"inotify unavailable, polling for project changes: {e}")
+
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        if self._inotify is not None:
+            self._selector.register(self._inotify.fileno(), selectors.EVENT_READ, "inotify")
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="project-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Project watcher started ({self.backend}) on {len(self.roots)} root(s)")
+
+    def stop(self) -> None:
+        """Stop watching"""
+        if not self._running:
+            return
+
+        self._running = False
+        self.scanner.cancel()
+        self._wake()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+        self._selector.close()
+        self._wake_r.close()
+        self._wake_w.close()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._watches.clear()
+        self._wd_by_path.clear()
+        self.ready.clear()
+        logger.info("Project watcher stopped")
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        try:
+            self._full_scan()
+        except Exception as e:
+            logger.error(f"Initial project scan failed: {e}")
+        self.ready.set()
+
+        while self._running:
+            try:
+                if self._inotify is not None:
+                    self._wait_for_events()
+                else:
+                    self._wait(self.poll_interval)
+                    if self._running:
+                        self._full_scan()
+            except Exception as e:
+                logger.error(f"Project watcher error: {e}")
+                time.sleep(self.debounce)
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        """Block until inotify events, stop() or the timeout"""
+        for key, _ in self._selector.select(timeout):
+            if key.data == "inotify":
+                if self._inotify is not None:
+                    for event in self._inotify.read_events():
+                        self._handle_event(*event)
+            else:
+                try:
+                    while self._wake_r.recv(64):
+                        pass
+                except (BlockingIOError, OSError):
+                    pass
+
+    def _wait_for_events(self) -> None:
+        """One round of the inotify loop: collect events, apply when quiet"""
+        timeout = None
+        if self._dirty:
+            deadline = min(
+                self._last_event_at + self.debounce,
+                self._first_event_at + self.debounce * MAX_DELAY_FACTOR,
+            )
+            timeout = max(deadline - time.monotonic(), 0.0)
+
+        self._wait(timeout)
+
+        if self._dirty and self._running:
+            now = time.monotonic()
+            quiet = now - self._last_event_at >= self.debounce
+            overdue = now - self._first_event_at >= self.debounce * MAX_DELAY_FACTOR
+            if quiet or overdue:
+                self._apply_dirty()
+
+    # ==================== EVENTS ====================
+
+    def _handle_event(self, wd: int, mask: int, cookie: int, name: str) -> None:
+        """Turn one inotify event into a dirty directory"""
+        self.stats["events"] += 1
+
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped: rescan everything (cheap with a warm index)
+            for root in self.roots:
+                self._mark_dirty(str(root))
+            return
+
+        if mask & IN_IGNORED:
+            path = self._watches.pop(wd, None)
+            if path is not None and self._wd_by_path.get(path) == wd:
+                del self._wd_by_path[path]
+            return
+
+        directory = self._watches.get(wd)
+        if directory is None:
+            return
+
+        if not name:
+            # The watched directory itself was deleted or moved
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                self._mark_dirty(os.path.dirname(directory) if directory not in self._root_keys() else directory)
+            return
+
+        if mask & IN_ISDIR:
+            if name in self.scanner.ignore_dirs:
+                return
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                self.index.forget_tree(os.path.join(directory, name))
+            self._mark_dirty(directory)
+        elif find_marker([name]) or name in IGNORE_FILE_NAMES or name in MANIFEST_READERS:
+            # Ignore file and workspace manifest edits can hide or reveal projects
+            self._mark_dirty(directory)
+
+    def _mark_dirty(self, directory: str) -> None:
+        now = time.monotonic()
+        if not self._dirty:
+            self._first_event_at = now
+        self._last_event_at = now
+        self._dirty.add(directory)
+
+    def _root_keys(self) -> Set[str]:
+        return {str(root) for root in self.roots}
+
+    def _apply_dirty(self) -> None:
+        """Rescan the coalesced dirty directories"""
+        dirty, self._dirty = self._dirty, set()
+
+        # A dirty ancestor covers its descendants
+        covered: List[str] = []
+        for directory in sorted(dirty, key=len):
+            if not any(directory == top or directory.startswith(top + os.sep) for top in covered):
+                covered.append(directory)
+
+        changes = ProjectChanges()
+        for directory in covered:
+            changes.extend(self._rescan(Path(directory)))
+        self._publish(changes)
+
+    # ==================== SCANNING ====================
+
+    def _full_scan(self) -> None:
+        """Scan every root (index-backed, so unchanged trees cost one stat per directory)"""
+        self.stats["full_scans"] += 1
+        changes = ProjectChanges()
+        for root in self.roots:
+            changes.extend(self._rescan(root))
+        self._publish(changes)
+
+    def _rescan(self, directory: Path) -> ProjectChanges:
+        """Rescan one directory subtree and update the known projects"""
+        depth = self._depth(directory)
+        if depth is None:
+            return ProjectChanges()
+
+        self.stats["rescans"] += 1
+        if directory.is_dir():
+            result = self.scanner.scan_directory(directory, depth=depth)
+            found = result.projects_found
+        else:
+            self.index.forget_tree(str(directory))
+            found = []
+
+        changes = self._replace(directory, found)
+        if self._inotify is not None:
+            self._rewatch(directory, depth)
+
+        if changes:
+            logger.debug(
+                f"Projects under {directory}: +{len(changes.added)} ~{len(changes.updated)} -{len(changes.removed)}"
+            )
+        return changes
+
+    def _depth(self, directory: Path) -> Optional[int]:
+        """
+        Depth of a directory below its watched root.
+
+        Returns:
+            None if the scanner would never visit it (outside the roots, too
+            deep, under an ignored directory or inside a known project)
+        """
+        for root in self.roots:
+            if directory == root:
+                return 0
+            if root in directory.parents:
+                parts = directory.relative_to(root).parts
+                if len(parts) > self.scanner.max_depth:
+                    return None
+                if any(part in self.scanner.ignore_dirs for part in parts):
+                    return None
+                # Nested directories of a project aren't scanned
+                with self._lock:
+                    for parent in directory.parents:
+                        if parent == root:
+                            break
+                        if str(parent) in self._projects:
+                            return None
+                return len(parts)
+        return None
+
+    def _replace(self, directory: Path, found: List[Project]) -> ProjectChanges:
+        """Swap the known projects under a directory for a fresh scan result"""
+        key = str(directory)
+        prefix = key.rstrip(os.sep) + os.sep
+        new = {str(project.path): project for project in found}
+        changes = ProjectChanges()
+
+        with self._lock:
+            old = {path: project for path, project in self._projects.items() if path == key or path.startswith(prefix)}
+
+            for path in old.keys() - new.keys():
+                del self._projects[path]
+                changes.removed.append(Path(path))
+            for path, project in new.items():
+                previous = old.get(path)
+                if previous is None:
+                    changes.added.append(project)
+                elif previous.project_type != project.project_type or previous.config != project.config:
+                    changes.updated.append(project)
+                else:
+                    continue
+                self._projects[path] = project
+
+        return changes
+
+    def _publish(self, changes: ProjectChanges) -> None:
+        if not changes:
+            return
+
+        self.stats["added"] += len(changes.added)
+        self.stats["updated"] += len(changes.updated)
+        self.stats["removed"] += len(changes.removed)
+
+        with self._lock:
+            callbacks = list(self._subscriptions.values())
+        for callback in callbacks:
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error(f"Project change callback failed: {e}")
+
+    # ==================== INOTIFY WATCHES ====================
+
+    def _rewatch(self, directory: Path, depth: int) -> None:
+        """Re-add watches for a rescanned subtree (dropping stale ones below it)"""
+        key = str(directory)
+        prefix = key.rstrip(os.sep) + os.sep
+        for path in [path for path in self._wd_by_path if path.startswith(prefix)]:
+            self._inotify.rm_watch(self._wd_by_path.pop(path))
+
+        stack = [(key, depth)]
+        while stack and self._inotify is not None:
+            path, level = stack.pop()
+            if not self._add_watch(path):
+                continue
+            with self._lock:
+                is_project = path in self._projects
+            # Project directories are watched for marker edits, not their contents
+            if is_project or level >= self.scanner.max_depth:
+                continue
+            stack.extend((os.path.join(path, name), level + 1) for name in self._subdirs(path))
+
+    def _add_watch(self, path: str) -> bool:
+        try:
+            wd = self._inotify.add_watch(path, _WATCH_MASK)
+        except OSError as e:
+            if e.errno == errno.ENOSPC:  # fs.inotify.max_user_watches reached
+                logger.warning(
+                    "inotify watch limit reached, polling for project changes instead "
+                    "(raise fs.inotify.max_user_watches to watch this tree)"
+                )
+                self._selector.unregister(self._inotify.fileno())
+                self._inotify.close()
+                self._inotify = None
+                self._watches.clear()
+                self._wd_by_path.clear()
+            return False
+
+        self._watches[wd] = path
+        self._wd_by_path[path] = wd
+        return True
+
+    def _subdirs(self, path: str) -> List[str]:
+        """Subdirectory names to watch, from the index when it's current"""
+        try:
+            record = self.index.get_directory(path, os.stat(path).st_mtime_ns)
+            if record is not None and record.subdirs is not None:
+                names = record.subdirs
+            else:
+                with os.scandir(path) as it:
+                    names = [entry.name for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+        return [name for name in names if name not in self.scanner.ignore_dirs]
+
+
+# Global project watcher
+_project_watcher: Optional[ProjectWatcher] = None
+
+
+def get_project_watcher() -> ProjectWatcher:
+    """Get or create the global project watcher (roots from settings, not started)"""
+    global _project_watcher
+    if _project_watcher is None:
+        _project_watcher = ProjectWatcher()
+    return _project_watcher
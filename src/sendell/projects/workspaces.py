@@ -0,0 +1,283 @@
+"""
+Workspace Manifests
+
+Monorepo member directories straight from the workspace manifests, so the
+scanner visits each member instead of walking the tree below the root:
+- pnpm-workspace.yaml "packages", package.json "workspaces" (npm / yarn,
+  list or {"packages": [...]})
+- Cargo.toml [workspace] members / exclude
+- go.work "use" directives
+- pyproject.toml [tool.uv.workspace] members / exclude
+
+Member globs ("packages/*", "apps/**", "!packages/legacy") are expanded by
+listing only the directories a pattern can reach; IGNORE_DIRECTORIES and
+hidden directories are never entered by "*" or "**".
+
+Manifests are cached by (path, mtime, size).
+"""
+
+import fnmatch
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sendell.projects.types import IGNORE_DIRECTORIES, ProjectType
+from sendell.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Manifests read per project type, in order (the first one declaring members wins)
+WORKSPACE_MANIFESTS = {
+    ProjectType.NODEJS: ["pnpm-workspace.yaml", "package.json"],
+    ProjectType.RUST: ["Cargo.toml"],
+    ProjectType.GO: ["go.work"],
+    ProjectType.PYTHON: ["pyproject.toml"],
+}
+
+# Parsed manifests kept in memory
+MAX_CACHED_MANIFESTS = 1024
+
+# Expanded members returned per workspace (protects against "**" on huge trees)
+MAX_MEMBERS = 5000
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+# ==================== MANIFEST READERS ====================
+# Each returns the member patterns (exclusions prefixed with "!"), or None
+# if the manifest doesn't declare a workspace
+
+
+def _load_toml(path: Path) -> dict:
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def read_pnpm_workspace(path: Path) -> Optional[List[str]]:
+    """
+    "packages" of a pnpm-workspace.yaml.
+
+    Only the packages key is read, as a block list ("- 'apps/*'") or a
+    flow list ("[apps/*, libs/*]"), so no YAML library is needed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    patterns: List[str] = []
+    in_packages = False
+    for line in lines:
+        stripped = line.split(" #", 1)[0].strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if not line[0].isspace() and not stripped.startswith("-"):
+            in_packages = stripped.startswith("packages:")
+            flow = stripped[len("packages:") :].strip() if in_packages else ""
+            if flow.startswith("["):
+                patterns.extend(item.strip().strip("'\"") for item in flow.strip("[]").split(",") if item.strip())
+            continue
+        if in_packages and stripped.startswith("-"):
+            patterns.append(stripped[1:].strip().strip("'\""))
+
+    return patterns or None
+
+
+def read_package_json_workspaces(path: Path) -> Optional[List[str]]:
+    """npm / yarn "workspaces" (a list, or yarn's {"packages": [...]})"""
+    with open(path, "r", encoding="utf-8") as f:
+        workspaces = json.load(f).get("workspaces")
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages")
+    if not isinstance(workspaces, list):
+        return None
+    return [str(pattern) for pattern in workspaces]
+
+
+def read_cargo_workspace(path: Path) -> Optional[List[str]]:
+    """[workspace] members and exclude of a Cargo.toml"""
+    workspace = _load_toml(path).get("workspace")
+    if not isinstance(workspace, dict):
+        return None
+    members = [str(member) for member in workspace.get("members", [])]
+    return members + [f"!{excluded}" for excluded in workspace.get("exclude", [])]
+
+
+def read_go_work(path: Path) -> Optional[List[str]]:
+    """Module directories of a go.work ("use ./a" and "use ( ./a ./b )")"""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    modules: List[str] = []
+    in_block = False
+    for line in lines:
+        line = line.split("//", 1)[0].strip()
+        if in_block:
+            if line.startswith(")"):
+                in_block = False
+            elif line:
+                modules.append(line.strip('"'))
+        elif line.startswith("use"):
+            rest = line[3:].strip()
+            if rest.startswith("("):
+                in_block = True
+            elif rest:
+                modules.append(rest.strip('"'))
+
+    return modules or None
+
+
+def read_uv_workspace(path: Path) -> Optional[List[str]]:
+    """[tool.uv.workspace] members and exclude of a pyproject.toml"""
+    workspace = _load_toml(path).get("tool", {}).get("uv", {}).get("workspace")
+    if not isinstance(workspace, dict):
+        return None
+    members = [str(member) for member in workspace.get("members", [])]
+    return members + [f"!{excluded}" for excluded in workspace.get("exclude", [])]
+
+
+MANIFEST_READERS: Dict[str, Callable[[Path], Optional[List[str]]]] = {
+    "pnpm-workspace.yaml": read_pnpm_workspace,
+    "package.json": read_package_json_workspaces,
+    "Cargo.toml": read_cargo_workspace,
+    "go.work": read_go_work,
+    "pyproject.toml": read_uv_workspace,
+}
+
+
+# ==================== MANIFEST CACHE ====================
+
+_cache: "OrderedDict[Tuple[str, int, int], Optional[List[str]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def read_manifest(path: Path) -> Optional[List[str]]:
+    """
+    Member patterns declared by a workspace manifest (cached by mtime and size).
+
+    Returns:
+        Patterns ("!" = exclude), or None if the file is missing, unreadable
+        or declares no workspace
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (str(path), st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    try:
+        patterns = MANIFEST_READERS[path.name](path)
+    except Exception as e:
+        logger.debug(f"Failed to read workspace manifest {path}: {e}")
+        patterns = None
+
+    with _cache_lock:
+        _cache[key] = patterns
+        while len(_cache) > MAX_CACHED_MANIFESTS:
+            _cache.popitem(last=False)
+    return patterns
+
+
+# ==================== GLOB EXPANSION ====================
+
+
+def _subdirs(directory: str) -> List[str]:
+    """Names of walkable subdirectories"""
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry.name
+                for entry in it
+                if entry.is_dir()
+                and entry.name not in IGNORE_DIRECTORIES
+                and not entry.name.startswith(".")
+            ]
+    except OSError:
+        return []
+
+
+def expand_pattern(root: Path, pattern: str, limit: int = MAX_MEMBERS) -> Set[str]:
+    """
+    Directories matching one member glob, relative to root.
+
+    Literal segments are joined without listing, "*"-style segments list
+    one directory, "**" lists the subtree below it.
+
+    Returns:
+        Absolute directory paths (at most limit)
+    """
+    segments = [segment for segment in pattern.replace("\\", "/").split("/") if segment not in ("", ".")]
+    if any(segment == ".." for segment in segments):
+        return set()  # Members outside the workspace root aren't scanned from it
+
+    found: Set[str] = set()
+    frontier = [str(root)]
+    for position, segment in enumerate(segments):
+        next_frontier: List[str] = []
+        if segment == "**":
+            # Zero or more directories: keep the current level and add everything below it
+            stack = list(frontier)
+            while stack and len(next_frontier) < limit:
+                directory = stack.pop()
+                next_frontier.append(directory)
+                stack.extend(os.path.join(directory, name) for name in _subdirs(directory))
+        elif _GLOB_CHARS.search(segment):
+            for directory in frontier:
+                next_frontier.extend(
+                    os.path.join(directory, name) for name in _subdirs(directory) if fnmatch.fnmatchcase(name, segment)
+                )
+        else:
+            next_frontier = [os.path.join(directory, segment) for directory in frontier]
+            if position == len(segments) - 1:
+                next_frontier = [directory for directory in next_frontier if os.path.isdir(directory)]
+        frontier = next_frontier[:limit]
+        if not frontier:
+            return found
+
+    found.update(frontier)
+    return found
+
+
+def workspace_members(root: Path, project_type: ProjectType) -> List[Path]:
+    """
+    Member directories of a workspace root.
+
+    Args:
+        root: Directory of a detected project
+        project_type: Its detected type (selects the manifests to read)
+
+    Returns:
+        Sorted member directories (the root itself excluded); empty if the
+        project isn't a workspace root
+    """
+    for name in WORKSPACE_MANIFESTS.get(project_type, []):
+        patterns = read_manifest(root / name)
+        if not patterns:
+            continue
+
+        included: Set[str] = set()
+        excluded: Set[str] = set()
+        for pattern in patterns:
+            if pattern.startswith("!"):
+                excluded |= expand_pattern(root, pattern[1:])
+            else:
+                included |= expand_pattern(root, pattern)
+
+        members = included - excluded - {str(root)}
+        if len(members) > MAX_MEMBERS:
+            logger.warning(f"Workspace {root} lists {len(members)} members, keeping {MAX_MEMBERS}")
+        return [Path(member) for member in sorted(members)[:MAX_MEMBERS]]
+
+    return []
@@ -34,6 +34,7 @@ ACTION_REQUIREMENTS = {
     # L1+ (Monitor Only)
     "get_system_health": (ActionCategory.OBSERVE, AutonomyLevel.L1_MONITOR_ONLY),
     "get_active_window": (ActionCategory.OBSERVE, AutonomyLevel.L1_MONITOR_ONLY),
+    "get_focus_history": (ActionCategory.OBSERVE, AutonomyLevel.L1_MONITOR_ONLY),
     "list_top_processes": (ActionCategory.OBSERVE, AutonomyLevel.L1_MONITOR_ONLY),
     "respond_to_user": (ActionCategory.QUERY, AutonomyLevel.L1_MONITOR_ONLY),
     # L3+ (Safe Actions)
@@ -7,12 +7,17 @@ Main orchestrator for VS Code monitoring.
 Based on investigation: investigacionvscodemonitoring.txt (Part 1 + Part 5)
 """
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
-
-import psutil
-
+from typing import Deque, Dict, List, Optional, Set
+
+from sendell.device.events import ProcessEvent, ProcessEventSource, ProcessEventType
+from sendell.device.process_tree import (
+    ProcessSnapshotService,
+    ProcessTree,
+    get_snapshot_service,
+)
 from sendell.utils.logger import get_logger
 from sendell.vscode.terminal_finder import TerminalFinder, TerminalInfo
 from sendell.vscode.window_matcher import WindowMatcher
@@ -68,12 +73,60 @@ class VSCodeMonitor:
         "cursor.exe",  # Cursor editor (VS Code fork)
     ]
 
-    def __init__(self):
-        """Initialize VS Code monitor."""
+    def __init__(self, snapshot_service: Optional[ProcessSnapshotService] = None):
+        """
+        Initialize VS Code monitor.
+
+        Args:
+            snapshot_service: Process snapshot service (defaults to the shared one)
+        """
+        self.snapshot_service = snapshot_service or get_snapshot_service()
         self.workspace_parser = WorkspaceParser()
         self.terminal_finder = TerminalFinder()
+
+        # Terminal tracking via process events (see attach_event_source)
+        self.event_source: Optional[ProcessEventSource] = None
+        self.terminal_exits: Deque[ProcessEvent] = deque(maxlen=50)
+        self._main_pids: Set[int] = set()
+        self._terminal_pids: Set[int] = set()
+
         logger.info("VSCodeMonitor initialized")
 
+    def attach_event_source(self, event_source: ProcessEventSource) -> None:
+        """
+        Track terminals through process lifecycle events.
+
+        Terminals found by find_vscode_instances() are watched, so their
+        exit is recorded in terminal_exits as soon as it happens, and new
+        children of VS Code invalidate the cached process snapshot.
+
+        Args:
+            event_source: Process event source to subscribe to
+        """
+        self.event_source = event_source
+        event_source.subscribe(self._on_process_event)
+
+    def _on_process_event(self, event: ProcessEvent) -> None:
+        """Handle a process event (called on the event source's thread)"""
+        if event.event_type == ProcessEventType.EXITED and event.pid in self._terminal_pids:
+            self._terminal_pids.discard(event.pid)
+            self.terminal_exits.append(event)
+            self.snapshot_service.invalidate()
+            logger.info(f"Terminal exited: {event.name} (PID {event.pid}) in {event.cwd}")
+
+        elif event.event_type == ProcessEventType.STARTED and event.ppid in self._main_pids:
+            self.snapshot_service.invalidate()
+            logger.debug(f"New VS Code child process: {event.name} (PID {event.pid})")
+
+    def _track_terminals(self, main_pid: int, terminals: List[TerminalInfo]) -> None:
+        """Remember (and watch) the terminals of the main process"""
+        self._main_pids = {main_pid}
+        self._terminal_pids = {term.pid for term in terminals}
+
+        if self.event_source:
+            for term in terminals:
+                self.event_source.watch(term.pid)
+
     def find_vscode_instances(self) -> List[VSCodeInstance]:
         """
         Find all VS Code instances with complete information.
@@ -96,8 +149,11 @@ class VSCodeMonitor:
         instances = []
 
         try:
+            # One process-table walk serves both steps below
+            tree = self.snapshot_service.get_tree()
+
             # Step 1: Find main VS Code process
-            main_process = self._find_main_vscode_process()
+            main_process = self._find_main_vscode_process(tree)
 
             if not main_process:
                 logger.warning("No main VS Code process found")
@@ -106,8 +162,9 @@ class VSCodeMonitor:
             logger.debug(f"Found main VS Code process: PID={main_process['pid']}")
 
             # Step 2: Get ALL terminals from main process
-            all_terminals = self.terminal_finder.find_terminals(main_process["pid"])
+            all_terminals = self.terminal_finder.find_terminals(main_process["pid"], tree=tree)
             logger.debug(f"Found {len(all_terminals)} total terminals")
+            self._track_terminals(main_process["pid"], all_terminals)
 
             if not all_terminals:
                 logger.info("No terminals found in VS Code")
@@ -157,7 +214,7 @@ class VSCodeMonitor:
         )
         return instances
 
-    def _find_main_vscode_process(self) -> Optional[Dict]:
+    def _find_main_vscode_process(self, tree: ProcessTree) -> Optional[Dict]:
         """
         Find the MAIN VS Code process (not helper processes).
 
@@ -166,44 +223,30 @@ class VSCodeMonitor:
         - Choose the OLDEST process (earliest create_time)
         - This is the parent that spawns all terminals
 
+        Args:
+            tree: Process snapshot to search
+
         Returns:
             Dictionary with process info or None if not found
         """
         candidates = []
 
-        try:
-            for proc in psutil.process_iter(
-                ["pid", "name", "exe", "cmdline", "create_time", "cwd"]
-            ):
-                try:
-                    name = proc.info.get("name")
-                    if not name or not self._is_vscode_process(name):
-                        continue
-
-                    cmdline = proc.info.get("cmdline") or []
-
-                    # Skip helper processes
-                    if self._is_helper_process(cmdline):
-                        continue
-
-                    # This is a main process candidate
-                    candidates.append(
-                        {
-                            "pid": proc.info["pid"],
-                            "name": name,
-                            "exe": proc.info.get("exe", ""),
-                            "cmdline": cmdline,
-                            "create_time": datetime.fromtimestamp(proc.info["create_time"]),
-                            "cwd": proc.info.get("cwd", ""),
-                        }
-                    )
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
-
-        except Exception as e:
-            logger.error(f"Error finding main VS Code process: {e}")
-            return None
+        for node in tree.find_by_name(self.TARGET_NAMES):
+            # Skip helper processes
+            if self._is_helper_process(node.cmdline):
+                continue
+
+            # This is a main process candidate
+            candidates.append(
+                {
+                    "pid": node.pid,
+                    "name": node.name,
+                    "exe": node.exe,
+                    "cmdline": node.cmdline,
+                    "create_time": datetime.fromtimestamp(node.create_time),
+                    "cwd": node.cwd,
+                }
+            )
 
         if not candidates:
             return None
@@ -310,5 +353,6 @@ class VSCodeMonitor:
 
             print()
 
-        print(f"Total: {len(instances)} instance(s), {self.get_terminal_count()} terminal(s)")
+        total_terminals = sum(len(inst.terminals) for inst in instances)
+        print(f"Total: {len(instances)} instance(s), {total_terminals} terminal(s)")
         print("=" * 70)
@@ -9,10 +9,9 @@ Based on investigation: investigacionvscodemonitoring.txt (Part 1, lines 124-166
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
-
-import psutil
+from typing import List, Optional
 
+from sendell.device.process_tree import ProcessTree, get_snapshot_service
 from sendell.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,56 +52,52 @@ class TerminalFinder:
     ]
 
     @staticmethod
-    def find_terminals(vscode_pid: int) -> List[TerminalInfo]:
+    def find_terminals(vscode_pid: int, tree: Optional[ProcessTree] = None) -> List[TerminalInfo]:
         """
         Find terminal processes spawned by a VS Code instance.
 
         Args:
             vscode_pid: PID of VS Code main process
+            tree: Process snapshot to search (defaults to the shared snapshot)
 
         Returns:
             List of TerminalInfo for all detected terminals
 
         Notes:
-            - Uses recursive process tree traversal
-            - Handles AccessDenied and NoSuchProcess errors gracefully
+            - Walks the snapshot's parent -> children lists (no per-child syscalls)
+            - Terminals whose cwd could not be read get an empty cwd
             - Returns empty list if parent process doesn't exist
         """
         terminals = []
 
         try:
-            parent = psutil.Process(vscode_pid)
-
-            # Recursively find all child processes
-            for child in parent.children(recursive=True):
-                try:
-                    name = child.name().lower()
-
-                    # Check if it's a terminal process
-                    if name in TerminalFinder.TERMINAL_NAMES:
-                        shell_type = TerminalFinder._detect_shell_type(name)
-
-                        terminals.append(
-                            TerminalInfo(
-                                pid=child.pid,
-                                name=child.name(),
-                                shell_type=shell_type,
-                                cmdline=child.cmdline(),
-                                cwd=child.cwd(),
-                                create_time=datetime.fromtimestamp(child.create_time()),
-                                status=child.status(),
-                            )
+            if tree is None:
+                tree = get_snapshot_service().get_tree()
+
+            if vscode_pid not in tree:
+                logger.warning(f"VS Code process {vscode_pid} not found")
+                return terminals
+
+            # All descendants, served from the snapshot
+            for child in tree.descendants(vscode_pid):
+                name = child.name.lower()
+
+                # Check if it's a terminal process
+                if name in TerminalFinder.TERMINAL_NAMES:
+                    shell_type = TerminalFinder._detect_shell_type(name)
+
+                    terminals.append(
+                        TerminalInfo(
+                            pid=child.pid,
+                            name=child.name,
+                            shell_type=shell_type,
+                            cmdline=child.cmdline,
+                            cwd=child.cwd,
+                            create_time=datetime.fromtimestamp(child.create_time),
+                            status=child.status,
                         )
+                    )
 
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    # Terminal may have closed or we don't have permission
-                    logger.debug(f"Could not access child process: {e}")
-                    continue
-
-        except psutil.NoSuchProcess:
-            logger.warning(f"VS Code process {vscode_pid} not found")
-        except psutil.AccessDenied:
-            logger.warning(f"Access denied to VS Code process {vscode_pid}")
         except Exception as e:
             logger.error(f"Error finding terminals for PID {vscode_pid}: {e}")
 
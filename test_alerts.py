@@ -0,0 +1,157 @@
+"""
+Test Script for Threshold Alerts
+
+Feeds synthetic samples into the AlertEngine to check windowing,
+hysteresis, cooldowns and the per-process RAM rule, then runs the
+engine briefly against live metrics.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.device.alerts import AlertEngine, AlertLevel
+from sendell.device.process_tree import ProcessNode
+
+
+def make_engine(**kwargs) -> AlertEngine:
+    engine = AlertEngine(interval_seconds=1, window=3, hysteresis=5, cooldown_seconds=60, **kwargs)
+    engine.rules["cpu"].threshold = 80
+    engine.rules["cpu"].clear_below = 75
+    return engine
+
+
+def make_process(pid: int, memory_mb: float) -> ProcessNode:
+    return ProcessNode(
+        pid=pid, ppid=1, name="node", exe="", cmdline=[], cwd="", create_time=0.0,
+        status="running", cpu_percent=0.0, memory_rss=int(memory_mb * 1024 * 1024),
+        memory_percent=0.0, num_threads=1,
+    )
+
+
+def test_single_spike_ignored():
+    """One spiky sample does not fire; a sustained window does"""
+    engine = make_engine()
+
+    alerts = []
+    for t, value in enumerate([10, 99, 10, 10]):
+        alerts += engine.evaluate({"cpu": value}, now=t)
+    assert alerts == [], "spike should be absorbed by the window"
+
+    for t, value in enumerate([90, 90, 90], start=10):
+        alerts += engine.evaluate({"cpu": value}, now=t)
+    assert [a.level for a in alerts] == [AlertLevel.RAISED]
+    print(f"  [OK] sustained load raised: {alerts[0].message}")
+
+
+def test_hysteresis():
+    """Average between clear_below and threshold keeps the alert active"""
+    engine = make_engine()
+
+    for t in range(3):
+        engine.evaluate({"cpu": 90}, now=t)
+
+    alerts = []
+    for t in range(3, 8):
+        alerts += engine.evaluate({"cpu": 78}, now=t)  # Below 80, above 75
+    assert alerts == [], "alert flapped inside the hysteresis band"
+
+    for t in range(8, 11):
+        alerts += engine.evaluate({"cpu": 50}, now=t)
+    assert [a.level for a in alerts] == [AlertLevel.CLEARED]
+    print(f"  [OK] cleared only below band: {alerts[0].message}")
+
+
+def test_cooldown():
+    """Re-crossing within the cooldown is suppressed"""
+    engine = make_engine()
+
+    raised = 0
+    for t, value in enumerate([90, 90, 90, 10, 10, 10, 90, 90, 90]):
+        raised += sum(1 for a in engine.evaluate({"cpu": value}, now=t) if a.level == AlertLevel.RAISED)
+    assert raised == 1
+    assert engine.stats["suppressed"] > 0
+
+    alerts = engine.evaluate({"cpu": 90}, now=100)  # Cooldown over
+    assert [a.level for a in alerts] == [AlertLevel.RAISED]
+    print(f"  [OK] repeat suppressed {engine.stats['suppressed']}x, fired again after cooldown")
+
+
+def test_process_rule():
+    """Per-process RAM rule tracks only heavy processes and clears on exit"""
+    engine = make_engine()
+    threshold = engine.process_rule.threshold
+
+    heavy = make_process(4242, threshold + 500)
+    light = make_process(100, 50)
+
+    alerts = []
+    for t in range(3):
+        alerts += engine.evaluate({}, [heavy, light], now=t)
+    assert [(a.level, a.pid) for a in alerts] == [(AlertLevel.RAISED, 4242)]
+    assert ("process_ram", 100) not in engine._states, "light process should not be tracked"
+
+    alerts = engine.evaluate({}, [light], now=3)
+    assert [(a.level, a.pid) for a in alerts] == [(AlertLevel.CLEARED, 4242)]
+    print(f"  [OK] {alerts[0].message}")
+
+
+def test_process_cooldown():
+    """A process that clears and climbs back within the cooldown is not re-raised"""
+    engine = make_engine()
+    threshold = engine.process_rule.threshold
+    heavy = make_process(4242, threshold + 500)
+    normal = make_process(4242, 50)
+
+    levels = []
+    for t, node in enumerate([heavy] * 3 + [normal] * 3 + [heavy] * 3):
+        levels += [a.level for a in engine.evaluate({}, [node], now=t)]
+    assert levels == [AlertLevel.RAISED, AlertLevel.CLEARED], levels
+
+    alerts = engine.evaluate({}, [heavy], now=100)  # Cooldown over
+    assert [a.level for a in alerts] == [AlertLevel.RAISED]
+
+    for t in range(101, 200):
+        engine.evaluate({}, [normal], now=t)
+    assert ("process_ram", 4242) not in engine._states, "state kept after cooldown"
+    print("  [OK] process re-raise suppressed within cooldown, dropped after it")
+
+
+async def run_live(seconds: float = 2.5):
+    """Run the engine against real metrics for a few samples"""
+    engine = AlertEngine(interval_seconds=0.5, window=2)
+    received = []
+    engine.subscribe(received.append)
+
+    await engine.start()
+    await asyncio.sleep(seconds)
+    await engine.stop()
+
+    print(f"  [OK] live: {engine.stats['samples']} samples, {len(received)} alert(s), active={engine.active_alerts()}")
+
+
+def test_live_engine():
+    asyncio.run(run_live())
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("ALERT ENGINE TEST")
+    print("=" * 70 + "\n")
+
+    test_single_spike_ignored()
+    test_hysteresis()
+    test_cooldown()
+    test_process_rule()
+    test_process_cooldown()
+    test_live_engine()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Test Script for the Parsed Config Cache
+
+Checks LRU eviction, hash hits for files touched without changing their
+content, that files inside the racy mtime window are never cached, that
+flush() and a fresh cache round-trip the entries through the database,
+and that large files are parsed in the process pool.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sqlalchemy.orm import sessionmaker
+
+from sendell.projects import database
+from sendell.projects.config_cache import POOL_MIN_BYTES, ConfigCache
+from sendell.projects.models import init_database
+
+
+def write_package(path: Path, name: str, age_seconds: float = 60, padding: int = 0) -> Path:
+    """package.json with an mtime age_seconds in the past (outside the racy window by default)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"name": name, "version": "1.0.0", "description": "x" * padding}
+    path.write_text(json.dumps(data))
+    old = time.time() - age_seconds
+    os.utime(path, (old, old))
+    return path
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted and parsed again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = [write_package(root / f"app{i}" / "package.json", f"app{i}") for i in range(3)]
+        cache = ConfigCache(max_entries=2, verify_hash=False, parse_processes=0, persist=False)
+
+        cache.load(files[0])
+        cache.load(files[1])
+        assert cache.load(files[0])[1] is True  # app0 now most recently used
+        cache.load(files[2])  # Evicts app1
+
+        assert len(cache) == 2 and cache.stats["evictions"] == 1
+        assert cache.load(files[0])[1] is True
+        config, hit = cache.load(files[1])
+        assert hit is False and config.name == "app1"
+        print(f"  [OK] LRU eviction: {cache.get_stats()}")
+
+
+def test_hash_hit_after_touch():
+    """A touched file with the same bytes is revalidated by hash, not reparsed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_package(Path(tmp) / "package.json", "app")
+        cache = ConfigCache(verify_hash=True, parse_processes=0, persist=False)
+        cache.load(path)
+
+        newer = time.time() - 30
+        os.utime(path, (newer, newer))
+        config, hit = cache.load(path)
+        assert hit is True and config.name == "app"
+        assert cache.stats["hash_hits"] == 1 and cache.stats["misses"] == 1
+
+        assert cache.load(path)[1] is True and cache.stats["hits"] == 1  # New stat stored
+        write_package(path, "renamed", age_seconds=20)
+        config, hit = cache.load(path)
+        assert hit is False and config.name == "renamed"
+        print("  [OK] hash hit after touch, miss after a content change")
+
+
+def test_racy_window():
+    """A file modified within RACY_WINDOW_NS is parsed every time"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_package(Path(tmp) / "package.json", "app", age_seconds=0)
+        cache = ConfigCache(verify_hash=True, parse_processes=0, persist=False)
+
+        assert cache.load(path)[1] is False
+        assert cache.load(path)[1] is False
+        assert len(cache) == 0 and cache.stats["misses"] == 2
+
+        old = time.time() - 60
+        os.utime(path, (old, old))
+        cache.load(path)
+        assert cache.load(path)[1] is True
+        print("  [OK] racily clean files are not cached")
+
+
+def test_flush_and_reload():
+    """Flushed entries are hits for a new cache; evicted ones are deleted"""
+    saved = database._engine, database._session_factory
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        engine = database.create_sqlite_engine(root / "projects.db")
+        init_database(engine)
+        database._engine = engine
+        database._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            files = [write_package(root / f"app{i}" / "package.json", f"app{i}") for i in range(3)]
+            cache = ConfigCache(max_entries=2, verify_hash=True, parse_processes=0)
+            for path in files[:2]:
+                cache.load(path)
+            assert cache.flush() == 2
+            assert cache.flush() == 0  # Nothing pending
+
+            cache.load(files[2])  # Evicts app0
+            assert cache.flush() == 2  # One upsert, one delete
+
+            reloaded = ConfigCache(max_entries=10, verify_hash=True, parse_processes=0)
+            assert len(reloaded) == 2
+            config, hit = reloaded.load(files[2])
+            assert hit is True and config.name == "app2" and config.version == "1.0.0"
+            assert reloaded.load(files[0])[1] is False
+            print("  [OK] flush / reload round trip")
+        finally:
+            database._engine, database._session_factory = saved
+            engine.dispose()
+
+
+def test_pool_parse():
+    """Large files go to the parse pool; close() shuts it down"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_package(Path(tmp) / "package.json", "big", padding=POOL_MIN_BYTES)
+        cache = ConfigCache(verify_hash=False, parse_processes=1, persist=False)
+        try:
+            config, hit = cache.load(path)
+            assert hit is False and config.name == "big"
+            assert cache.stats["pool_parses"] == 1
+        finally:
+            cache.close()
+        assert cache._pool is None
+        print("  [OK] large file parsed in the process pool")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("CONFIG CACHE TEST")
+    print("=" * 70 + "\n")
+
+    test_lru_eviction()
+    test_hash_hit_after_touch()
+    test_racy_window()
+    test_flush_and_reload()
+    test_pool_parse()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Test Script for the Dependency Index
+
+Indexes a few in-memory projects and checks package lookups, version
+constraints, PEP 508 splitting and incremental updates.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.dependency_index import DependencyIndex, minimum_version
+from sendell.projects.types import Project, ProjectConfig, ProjectType
+
+
+def make_project(name: str, project_type: ProjectType, dependencies: dict, dev: dict = None) -> Project:
+    return Project(
+        name=name,
+        path=f"/work/{name}",
+        project_type=project_type,
+        config=ProjectConfig(name=name, dependencies=dependencies, dev_dependencies=dev or {}),
+    )
+
+
+def make_index() -> DependencyIndex:
+    index = DependencyIndex()
+    index.add_projects([
+        make_project("web", ProjectType.NODEJS, {"lodash": "^4.17.15", "react": "^18.2.0"}),
+        make_project("admin", ProjectType.NODEJS, {"Lodash": "4.17.21"}, dev={"jest": "^29"}),
+        make_project("api", ProjectType.PYTHON, {"pydantic>=1.10,<2": "*", "fastapi": "*"}),
+        make_project("worker", ProjectType.PYTHON, {"Pydantic_Settings[dotenv]>=2.1": "*", "pydantic>=2.5": "*"}),
+        make_project("cli", ProjectType.RUST, {"serde": "1.0"}, dev={"lodash": "1"}),
+    ])
+    return index
+
+
+def names(uses) -> list:
+    return [use.project.name for use in uses]
+
+
+def test_lookup_and_constraints():
+    """Names are normalized per ecosystem, constraints use the spec's lower bound"""
+    index = make_index()
+
+    assert names(index.find("lodash")) == ["admin", "cli", "web"]
+    assert names(index.find("lodash", ecosystem="npm")) == ["admin", "web"]
+    assert names(index.find("lodash", version_constraint="<4.17.21")) == ["cli", "web"]
+    assert names(index.find("pydantic", version_constraint="<2")) == ["api"]
+    assert names(index.find("pydantic-settings")) == ["worker"]
+    assert names(index.find("jest", include_dev=False)) == []
+    assert minimum_version(">=1.10,<2") == (1, 10)
+    assert minimum_version("*") is None
+    print(f"  [OK] {len(index)} packages across {index.project_count} projects")
+
+
+def test_incremental_update():
+    """Re-indexing a project only moves its own entries"""
+    index = make_index()
+
+    index.update_project(make_project("api", ProjectType.PYTHON, {"pydantic>=2.6": "*"}))
+    assert names(index.find("pydantic", version_constraint="<2")) == []
+    assert names(index.find("fastapi")) == []
+    assert names(index.find("pydantic")) == ["api", "worker"]
+
+    index.remove_projects([Path("/work/web")])
+    assert names(index.find("react")) == []
+    assert "react" not in {package for _, package in index.dependencies_of(Path("/work/web"))}
+    print("  [OK] updates and removals applied")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("DEPENDENCY INDEX TEST")
+    print("=" * 70 + "\n")
+
+    test_lookup_and_constraints()
+    test_incremental_update()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Test Script for the Disk Monitor
+
+Checks partition listing, that usage is reused within max_age, that a
+hung mount never blocks get_usage() (the partition is flagged stale and
+keeps its last values), and that throughput consumers keep separate
+baselines.
+"""
+
+import sys
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import psutil
+
+from sendell.device.disks import IGNORED_FSTYPES, DiskMonitor, system_root
+
+DiskIO = namedtuple("DiskIO", "read_count write_count read_bytes write_bytes")
+
+
+class patched:
+    """Temporarily replace a psutil function"""
+
+    def __init__(self, name: str, replacement):
+        self.name = name
+        self.replacement = replacement
+
+    def __enter__(self):
+        self.original = getattr(psutil, self.name)
+        setattr(psutil, self.name, self.replacement)
+        return self
+
+    def __exit__(self, *exc):
+        setattr(psutil, self.name, self.original)
+
+
+def wait_for_refresh(monitor: DiskMonitor, timeout: float = 5.0) -> None:
+    """Block until no background refresh is running"""
+    assert monitor._refresh_lock.acquire(timeout=timeout), "refresh still running"
+    monitor._refresh_lock.release()
+
+
+def test_partition_listing():
+    """The system drive comes first; pseudo filesystems are left out"""
+    monitor = DiskMonitor()
+    wait_for_refresh(monitor)
+    disks = monitor.get_usage()
+
+    assert disks and disks[0].mountpoint == system_root()
+    assert not [disk for disk in disks if disk.fstype in IGNORED_FSTYPES]
+    assert len({disk.mountpoint for disk in disks}) == len(disks)
+    root = monitor.system_disk()
+    assert root.total_bytes > 0 and root.updated_at is not None and not root.stale
+    print(f"  [OK] {len(disks)} partition(s), system drive {root.percent}% used")
+
+
+def test_cache_reuse():
+    """No disk_usage calls while the cache is younger than max_age"""
+    calls = []
+    real = psutil.disk_usage
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    with patched("disk_usage", counting):
+        monitor = DiskMonitor(refresh_seconds=30.0)
+        wait_for_refresh(monitor)
+        warm = len(calls)
+        assert warm >= 1
+
+        for _ in range(5):
+            monitor.get_usage()
+        wait_for_refresh(monitor)
+        assert len(calls) == warm
+
+        monitor.get_usage(max_age=0, wait=True)
+        assert len(calls) == 2 * warm
+    print(f"  [OK] cache reused within max_age ({warm} mount(s) queried per refresh)")
+
+
+def test_hung_mount():
+    """A hanging disk_usage neither blocks the caller nor loses the last values"""
+    release = threading.Event()
+    real = psutil.disk_usage
+    root = system_root()
+
+    monitor = DiskMonitor(refresh_seconds=30.0, timeout_seconds=0.5)
+    wait_for_refresh(monitor)
+    before = monitor.system_disk()
+    assert before.total_bytes > 0
+
+    def hanging(path):
+        if path == root:
+            release.wait(10)
+        return real(path)
+
+    try:
+        with patched("disk_usage", hanging):
+            start = time.monotonic()
+            disks = monitor.get_usage(max_age=0)
+            assert time.monotonic() - start < 0.1  # Cached values, refresh in the background
+            assert disks[0].total_bytes == before.total_bytes
+
+            wait_for_refresh(monitor)
+            disk = monitor.system_disk()
+            assert disk.stale and disk.error == "timed out"
+            assert disk.total_bytes == before.total_bytes  # Last known values kept
+
+            # A synchronous refresh is bounded by timeout_seconds too
+            start = time.monotonic()
+            monitor.get_usage(max_age=0, wait=True)
+            assert time.monotonic() - start < monitor.timeout_seconds + 0.5
+            assert monitor.system_disk().error == "usage query still pending"
+    finally:
+        release.set()
+
+    time.sleep(0.1)
+    monitor.get_usage(max_age=0, wait=True)
+    assert not monitor.system_disk().stale
+    print("  [OK] hung mount flagged stale without blocking")
+
+
+def test_throughput_per_consumer():
+    """Two consumers polling at different rates each get their own interval"""
+    counters = DiskIO(read_count=0, write_count=0, read_bytes=0, write_bytes=0)
+    state = {"counters": counters}
+
+    with patched("disk_io_counters", lambda perdisk=False: state["counters"]):
+        monitor = DiskMonitor()
+        assert monitor.get_throughput("health") is None
+        assert monitor.get_throughput("alerts") is None
+
+        time.sleep(0.2)
+        state["counters"] = counters._replace(read_bytes=1_000_000)
+        fast = monitor.get_throughput("alerts")
+        time.sleep(0.2)
+        slow = monitor.get_throughput("health")
+
+    assert fast.interval_seconds < slow.interval_seconds
+    assert slow.interval_seconds >= 0.35
+    assert slow.read_bytes_per_sec > 0  # Not consumed by the other consumer's call
+    print(f"  [OK] separate baselines: {fast.interval_seconds:.2f}s and {slow.interval_seconds:.2f}s")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("DISK MONITOR TEST")
+    print("=" * 70 + "\n")
+
+    test_partition_listing()
+    test_cache_reuse()
+    test_hung_mount()
+    test_throughput_per_consumer()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
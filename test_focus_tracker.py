@@ -0,0 +1,119 @@
+"""
+Test Script for Focus Tracking
+
+Drives the FocusTracker with the stub backend to check deduplication,
+the PID -> name cache, privacy filtering and per-app summaries.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.device.focus import PRIVATE_APP, FocusTracker, StubFocusBackend
+
+
+def make_tracker():
+    backend = StubFocusBackend(names={100: "Code.exe", 200: "chrome.exe", 300: "KeePass.exe"})
+    return FocusTracker(backend=backend, interval_seconds=0.05), backend
+
+
+def test_dedupe_and_spans():
+    """Unchanged samples are not recorded; changes close spans"""
+    tracker, backend = make_tracker()
+    t0 = 1_000_000.0
+
+    backend.set_foreground(1, 100, "main.py - Visual Studio Code")
+    assert tracker.sample(now=t0)
+    for i in range(1, 60):
+        assert not tracker.sample(now=t0 + i)
+
+    backend.set_foreground(2, 200, "Docs - Chrome")
+    assert tracker.sample(now=t0 + 60)
+
+    assert len(tracker.spans) == 1
+    assert tracker.spans[0].app == "Code.exe"
+    assert tracker.spans[0].duration == 60
+    assert tracker.current.title == "Docs - Chrome"
+    print(f"  [OK] 61 samples -> {tracker.stats['changes']} changes, 1 closed span")
+
+
+def test_name_cache():
+    """Switching back and forth resolves each PID once"""
+    tracker, backend = make_tracker()
+
+    for i in range(10):
+        backend.set_foreground(1, 100, f"file{i}.py - Visual Studio Code")
+        tracker.sample(now=float(i * 2))
+        backend.set_foreground(2, 200, "Docs - Chrome")
+        tracker.sample(now=float(i * 2 + 1))
+
+    assert backend.name_lookups == 2
+    print(f"  [OK] {tracker.stats['changes']} changes, {backend.name_lookups} name lookups")
+
+
+def test_private_windows():
+    """Blocked apps are recorded without name or title hash"""
+    tracker, backend = make_tracker()
+
+    backend.set_foreground(3, 300, "Database.kdbx - KeePass")
+    tracker.sample(now=0.0)
+
+    assert tracker.current.title == PRIVATE_APP
+    span = tracker.get_history(since_seconds=60, now=5.0)[0]
+    assert span.app == PRIVATE_APP and span.title_hash == ""
+    print("  [OK] blocked app stored as private")
+
+
+def test_summary():
+    """Time per app over a window, clipped at the window start"""
+    tracker, backend = make_tracker()
+    t0 = 10_000.0
+
+    backend.set_foreground(1, 100, "main.py - Visual Studio Code")
+    tracker.sample(now=t0)
+    backend.set_foreground(2, 200, "Docs - Chrome")
+    tracker.sample(now=t0 + 1800)
+    backend.clear_foreground()
+    tracker.sample(now=t0 + 2400)
+
+    summary = tracker.summarize(since_seconds=1800, now=t0 + 2400)
+    apps = {entry["app"]: entry["seconds"] for entry in summary["apps"]}
+    assert apps == {"Code.exe": 1200, "chrome.exe": 600}, apps
+    print(f"  [OK] last 30 min: {apps}, {summary['switches']} switch(es)")
+
+
+def test_background_thread():
+    """Sampling thread picks up focus changes on its own"""
+    tracker, backend = make_tracker()
+    backend.set_foreground(1, 100, "main.py - Visual Studio Code")
+
+    tracker.start()
+    time.sleep(0.2)
+    backend.set_foreground(2, 200, "Docs - Chrome")
+    time.sleep(0.2)
+    tracker.stop()
+
+    assert [span.app for span in tracker.spans] == ["Code.exe", "chrome.exe"]
+    print(f"  [OK] thread took {tracker.stats['samples']} samples")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("FOCUS TRACKER TEST")
+    print("=" * 70 + "\n")
+
+    test_dedupe_and_spans()
+    test_name_cache()
+    test_private_windows()
+    test_summary()
+    test_background_thread()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
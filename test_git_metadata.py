@@ -0,0 +1,102 @@
+"""
+Test Script for the Git Metadata Reader
+
+Builds a repository and a clone with the git CLI, then checks branch,
+upstream, ahead/behind (loose and packed objects) and the dirty flag
+against what `git status` reports. Skipped if git isn't installed.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.git_meta import GitMetadataReader
+from sendell.projects.index import ProjectIndex
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Sendell",
+    "GIT_AUTHOR_EMAIL": "sendell@example.com",
+    "GIT_COMMITTER_NAME": "Sendell",
+    "GIT_COMMITTER_EMAIL": "sendell@example.com",
+}
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True, env={**os.environ, **GIT_ENV}
+    ).stdout
+
+
+def commit(repo: Path, name: str, content: str) -> None:
+    (repo / name).write_text(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", f"Update {name}")
+
+
+def read(path: Path):
+    return GitMetadataReader(index=ProjectIndex(persist=False), dirty_ttl_seconds=0).read(path)
+
+
+def test_git_metadata():
+    """Branch, upstream, ahead/behind and dirty match git"""
+    if shutil.which("git") is None:
+        print("  [SKIP] git not installed")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        upstream = root / "upstream"
+        upstream.mkdir()
+        git(upstream, "init", "-q", "-b", "main")
+        for i in range(5):
+            commit(upstream, "base.txt", f"base {i}\n")
+
+        clone = root / "clone"
+        git(root, "clone", "-q", str(upstream), str(clone))
+        for i in range(2):
+            commit(clone, f"local{i}.txt", "local\n")
+        for i in range(3):
+            commit(upstream, f"remote{i}.txt", "remote\n")
+        git(clone, "fetch", "-q")
+
+        info = read(clone)
+        assert (info.branch, info.upstream, info.ahead, info.behind, info.dirty) == ("main", "origin/main", 2, 3, False), info
+        assert info.head == git(clone, "rev-parse", "HEAD").strip()
+
+        # Same answers from packfiles and packed-refs
+        git(clone, "gc", "-q", "--aggressive")
+        info = read(clone)
+        assert (info.ahead, info.behind) == (2, 3), info
+        print("  [OK] ahead 2 / behind 3 from loose and packed objects")
+
+        (clone / "base.txt").write_text("edited\n")
+        assert read(clone).dirty is True
+        git(clone, "checkout", "-q", "base.txt")
+        assert read(clone).dirty is False
+        print("  [OK] dirty flag follows tracked file edits")
+
+        git(clone, "checkout", "-q", "--detach", "HEAD~1")
+        info = read(clone)
+        assert info.branch is None and info.head == git(clone, "rev-parse", "HEAD").strip()
+        print("  [OK] detached HEAD")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("GIT METADATA TEST")
+    print("=" * 70 + "\n")
+
+    test_git_metadata()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Test Script for the Lockfile Parsers
+
+Writes small lockfiles of every supported format and checks the resolved
+versions, the chunked package-lock reader at tiny chunk sizes, and that
+the scanner and dependency index pick the versions up.
+"""
+
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.dependency_index import DependencyIndex
+from sendell.projects.lockfiles import iter_json_members
+from sendell.projects.parsers import parse_project_config
+from sendell.projects.scanner import ProjectScanner
+
+PACKAGE_LOCK_V3 = {
+    "name": "web",
+    "lockfileVersion": 3,
+    "requires": True,
+    "packages": {
+        "": {"name": "web", "dependencies": {"lodash": "^4.17.15"}},
+        "node_modules/lodash": {"version": "4.17.20", "integrity": "sha512-x{}\"y"},
+        "node_modules/@types/node": {"version": "20.11.5"},
+        "node_modules/debug/node_modules/ms": {"version": "2.0.0"},
+        "node_modules/ms": {"version": "2.1.3"},
+    },
+    "dependencies": {"lodash": {"version": "4.17.20"}},
+}
+
+PACKAGE_LOCK_V1 = {
+    "name": "old",
+    "lockfileVersion": 1,
+    "dependencies": {
+        "lodash": {"version": "4.17.11", "dependencies": {"inner": {"version": "1.0.0"}}},
+        "ms": {"version": "2.1.1"},
+    },
+}
+
+YARN_LOCK = '''# yarn lockfile v1
+
+"@babel/core@^7.0.0", "@babel/core@^7.12.3":
+  version "7.23.9"
+  resolved "https://registry.yarnpkg.com/@babel/core/-/core-7.23.9.tgz"
+
+lodash@^4.17.15:
+  version "4.17.21"
+
+lodash@^3.0.0:
+  version "3.10.1"
+'''
+
+YARN_BERRY_LOCK = '''__metadata:
+  version: 6
+
+"lodash@npm:^4.17.15":
+  version: 4.17.21
+  resolution: "lodash@npm:4.17.21"
+'''
+
+POETRY_LOCK = '''[[package]]
+name = "pydantic"
+version = "1.10.13"
+description = "Data validation"
+
+[package.dependencies]
+typing-extensions = ">=4.2.0"
+
+[[package]]
+name = "typing-extensions"
+version = "4.9.0"
+
+[metadata]
+lock-version = "2.0"
+'''
+
+CARGO_LOCK = '''version = 3
+
+[[package]]
+name = "serde"
+version = "1.0.196"
+dependencies = [
+ "serde_derive",
+]
+
+[[package]]
+name = "syn"
+version = "1.0.109"
+
+[[package]]
+name = "syn"
+version = "2.0.48"
+'''
+
+GO_SUM = '''github.com/gin-gonic/gin v1.9.0 h1:abc=
+github.com/gin-gonic/gin v1.9.0/go.mod h1:def=
+github.com/gin-gonic/gin v1.9.1 h1:ghi=
+golang.org/x/net v0.20.0/go.mod h1:jkl=
+'''
+
+
+def parse(name: str, content: str) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / name
+        path.write_text(content)
+        return parse_project_config(path).resolved_versions
+
+
+def test_package_lock():
+    """Hoisted packages from v2/v3, top-level entries from v1"""
+    versions = parse("package-lock.json", json.dumps(PACKAGE_LOCK_V3, indent=2))
+    assert versions == {"lodash": "4.17.20", "@types/node": "20.11.5", "ms": "2.1.3"}, versions
+
+    versions = parse("package-lock.json", json.dumps(PACKAGE_LOCK_V1))
+    assert versions == {"lodash": "4.17.11", "ms": "2.1.1"}, versions
+
+    # Values split across chunk boundaries at every offset
+    text = json.dumps(PACKAGE_LOCK_V3)
+    expected = list(PACKAGE_LOCK_V3["packages"].items())
+    for chunk_size in range(1, 40):
+        members = [(key, value) for _, key, value in iter_json_members(io.StringIO(text), ("packages",), chunk_size)]
+        assert members == expected, chunk_size
+    print("  [OK] package-lock.json v1 and v3, chunk sizes 1-39")
+
+
+def test_line_oriented_lockfiles():
+    """yarn (classic and berry), poetry, Cargo and go.sum"""
+    assert parse("yarn.lock", YARN_LOCK) == {"@babel/core": "7.23.9", "lodash": "4.17.21"}
+    assert parse("yarn.lock", YARN_BERRY_LOCK) == {"lodash": "4.17.21"}
+    assert parse("poetry.lock", POETRY_LOCK) == {"pydantic": "1.10.13", "typing-extensions": "4.9.0"}
+    assert parse("Cargo.lock", CARGO_LOCK) == {"serde": "1.0.196", "syn": "2.0.48"}
+    assert parse("go.sum", GO_SUM) == {"github.com/gin-gonic/gin": "v1.9.1", "golang.org/x/net": "v0.20.0"}
+    print("  [OK] yarn.lock, poetry.lock, Cargo.lock, go.sum")
+
+
+def test_scanner_and_dependency_index():
+    """Scanned projects carry resolved versions, the index matches on them"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        web = root / "web"
+        web.mkdir()
+        (web / "package.json").write_text(json.dumps({"name": "web", "dependencies": {"lodash": "^4.17.15"}}))
+        (web / "package-lock.json").write_text(json.dumps(PACKAGE_LOCK_V3))
+
+        result = ProjectScanner(max_depth=2).scan_directory(root)
+        project = result.projects_found[0]
+        assert project.config.resolved_versions["lodash"] == "4.17.20"
+
+        index = DependencyIndex()
+        index.add_projects(result.projects_found)
+        lodash = index.find("lodash", version_constraint="<4.17.21")
+        assert [(use.resolved, use.direct) for use in lodash] == [("4.17.20", True)]
+        assert [use.direct for use in index.find("ms")] == [False]
+        assert index.find("ms", include_transitive=False) == []
+        print("  [OK] lodash 4.17.20 found through the lockfile")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("LOCKFILE PARSER TEST")
+    print("=" * 70 + "\n")
+
+    test_package_lock()
+    test_line_oriented_lockfiles()
+    test_scanner_and_dependency_index()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
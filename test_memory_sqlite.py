@@ -0,0 +1,102 @@
+"""
+Test Script for the SQLite Memory Backend
+
+Fills a JSON memory file, imports it into SQLiteMemory and checks that
+the data round-trips, that a default setup picks up data/sendell_memory.json
+on first start (and only then), that row-level changes persist across
+instances and that the conversation cap holds.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.agent.memory import DEFAULT_MEMORY_FILE, MAX_CONVERSATIONS, SendellMemory
+from sendell.agent.memory_sqlite import SQLiteMemory
+from sendell.projects.database import create_sqlite_engine
+
+
+def test_json_import_round_trip():
+    """Everything in the JSON file comes back out of SQLite unchanged"""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = Path(tmp) / "memory.json"
+        legacy = SendellMemory(json_file, flush_delay=0)
+        legacy.add_fact("Prefers dark mode", "preference")
+        legacy.add_conversation([{"role": "user", "content": "hola"}], "greeting")
+        legacy.end_session(legacy.start_session(), 4)
+        legacy.add_reminder({"reminder_id": "r1", "content": "stretch"})
+        legacy.set_agent_identity({"birth_date": "2025-01-01T00:00:00"})
+
+        memory = SQLiteMemory(create_sqlite_engine(Path(tmp) / "memory.db"), import_file=json_file)
+        assert memory.to_dict() == legacy.to_dict()
+        print("  [OK] JSON memory imported unchanged")
+
+
+def test_default_file_import():
+    """Without import_file, the JSON memory at DEFAULT_MEMORY_FILE is imported once"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # DEFAULT_MEMORY_FILE is relative to the working directory
+        try:
+            legacy = SendellMemory(flush_delay=0)
+            assert legacy.memory_file == DEFAULT_MEMORY_FILE
+            legacy.add_fact("Prefers dark mode", "preference")
+            legacy.add_reminder({"reminder_id": "r1", "content": "stretch"})
+
+            db_path = Path(tmp) / "data" / "sendell.db"
+            memory = SQLiteMemory(create_sqlite_engine(db_path))
+            assert memory.to_dict() == legacy.to_dict()
+
+            # Later starts keep the database; the JSON file is no longer read
+            legacy.add_fact("Added after the import")
+            reopened = SQLiteMemory(create_sqlite_engine(db_path))
+            assert [fact["fact"] for fact in reopened.get_facts()] == ["Prefers dark mode"]
+            assert DEFAULT_MEMORY_FILE.exists()
+            print(f"  [OK] {DEFAULT_MEMORY_FILE} imported on first start only")
+        finally:
+            os.chdir(cwd)
+
+
+def test_changes_persist():
+    """Row-level changes are visible to a new instance; no re-import"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "memory.db"
+        memory = SQLiteMemory(create_sqlite_engine(db_path), import_file=None)
+
+        for i in range(MAX_CONVERSATIONS + 5):
+            memory.add_conversation([{"role": "user", "content": str(i)}])
+        memory.add_fact("first")
+        memory.add_fact("second", "work")
+        assert memory.remove_fact(0)
+        memory.set_preference("work_hours", "9-18")
+
+        reopened = SQLiteMemory(create_sqlite_engine(db_path), import_file=None)
+        assert [fact["fact"] for fact in reopened.get_facts()] == ["second"]
+        assert reopened.get_facts("work")[0]["fact"] == "second"
+        assert reopened.get_preference("work_hours") == "9-18"
+
+        summary = reopened.get_memory_summary()
+        assert summary["total_conversations"] == MAX_CONVERSATIONS
+        assert reopened.get_conversations(1)[0]["messages"][0]["content"] == str(MAX_CONVERSATIONS + 4)
+        print(f"  [OK] changes persist, {summary['total_conversations']} conversations kept")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("SQLITE MEMORY TEST")
+    print("=" * 70 + "\n")
+
+    test_json_import_round_trip()
+    test_default_file_import()
+    test_changes_persist()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
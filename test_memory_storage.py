@@ -0,0 +1,140 @@
+"""
+Test Script for JSON Memory Storage
+
+Checks that a burst of SendellMemory changes is written to disk once,
+as compact JSON, by the debounced flush and by an explicit flush(); that
+reopening reads only the header and conversations page by page; that
+older single-document files are migrated; and that throwaway instances
+are not kept alive until exit.
+"""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import weakref
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.agent.memory import (
+    CONVERSATION_PAGE_SIZE,
+    MAX_CONVERSATIONS,
+    MEMORY_FORMAT,
+    SendellMemory,
+    empty_memory,
+    read_memory_file,
+)
+
+
+def test_burst_is_one_write():
+    """100 facts, one file write"""
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_file = Path(tmp) / "memory.json"
+        memory = SendellMemory(memory_file, flush_delay=0.2)
+
+        for i in range(100):
+            memory.add_fact(f"fact {i}")
+        assert memory.writes == 0 and not memory_file.exists()
+
+        time.sleep(0.5)
+        assert memory.writes == 1, memory.writes
+
+        text = (memory.sections_dir / "facts.json").read_text(encoding="utf-8")
+        assert "\n" not in text  # Compact
+        assert len(json.loads(text)) == 100
+        assert not list(Path(tmp).rglob("*.tmp"))  # No temp files left behind
+        print(f"  [OK] 100 facts -> {memory.writes} write ({len(text)} bytes)")
+
+
+def test_flush_and_close():
+    """flush() writes pending changes immediately, close() cancels the timer"""
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_file = Path(tmp) / "memory.json"
+        memory = SendellMemory(memory_file, flush_delay=30)
+
+        memory.set_preference("work_hours", "9-18")
+        memory.start_session()
+        assert memory.flush() is True
+        assert memory.flush() is False  # Nothing pending
+
+        memory.add_reminder({"reminder_id": "r1", "content": "stretch"})
+        memory.close()
+        assert memory.writes == 2
+
+        reloaded = SendellMemory(memory_file, flush_delay=30)
+        assert reloaded.get_preference("work_hours") == "9-18"
+        assert reloaded.get_reminders()[0]["content"] == "stretch"
+        print("  [OK] flush() and close() persist pending changes")
+
+
+def test_lazy_sections():
+    """Reopening reads only the header; conversations are read page by page"""
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_file = Path(tmp) / "memory.json"
+        memory = SendellMemory(memory_file, flush_delay=0)
+        for i in range(MAX_CONVERSATIONS + 7):
+            memory.add_conversation([{"role": "user", "content": str(i)}], f"conv {i}")
+        memory.add_fact("Uses VS Code", "work")
+
+        reopened = SendellMemory(memory_file, flush_delay=0)
+        summary = reopened.get_memory_summary()
+        assert (summary["total_facts"], summary["total_conversations"]) == (1, MAX_CONVERSATIONS)
+        assert not reopened._sections and not reopened._pages  # Nothing but the header read
+
+        page = reopened.get_conversations(limit=3, offset=2)
+        assert [conv["summary"] for conv in page] == [f"conv {MAX_CONVERSATIONS + i}" for i in (2, 3, 4)]
+        assert len(reopened._pages) == 1
+        assert len(list(memory.pages_dir.iterdir())) <= MAX_CONVERSATIONS // CONVERSATION_PAGE_SIZE + 1
+        print(f"  [OK] summary from header, {len(reopened._pages)} page read for 3 conversations")
+
+
+def test_single_document_migration():
+    """An older single-document file is split and keeps its contents"""
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_file = Path(tmp) / "memory.json"
+        legacy = empty_memory()
+        legacy["facts"] = [{"fact": "old fact", "category": "general", "learned_at": "2025-01-01T00:00:00"}]
+        legacy["conversations"] = [{"messages": [], "summary": "old", "timestamp": "2025-01-01T00:00:00", "message_count": 0}]
+        memory_file.write_text(json.dumps(legacy), encoding="utf-8")
+
+        memory = SendellMemory(memory_file, flush_delay=0)
+        assert json.loads(memory_file.read_text(encoding="utf-8"))["format"] == MEMORY_FORMAT
+        assert memory.to_dict() == legacy
+        print("  [OK] single-document memory migrated")
+
+
+def test_instances_released():
+    """Only get_memory() registers an exit hook; other instances can be collected"""
+    with tempfile.TemporaryDirectory() as tmp:
+        memory_file = Path(tmp) / "memory.json"
+        memory = SendellMemory(memory_file, flush_delay=0)
+        memory.add_fact("kept")
+        ref = weakref.ref(memory)
+        del memory
+
+        assert read_memory_file(memory_file)["facts"][0]["fact"] == "kept"
+        gc.collect()
+        assert ref() is None
+        print("  [OK] temporary memory instances are released")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("MEMORY STORAGE TEST")
+    print("=" * 70 + "\n")
+
+    test_burst_is_one_write()
+    test_flush_and_close()
+    test_lazy_sections()
+    test_single_document_migration()
+    test_instances_released()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Test Script for Process Lifecycle Events
+
+Spawns short-lived processes and checks that start/exit events are
+published, how quickly a watched process's exit is detected, that a
+reused PID is reported as an exit plus a start, and that start/stop
+cycles don't leak file descriptors.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.device.events import ProcessEventSource, ProcessEventType
+
+
+def test_poll_detects_start_and_exit():
+    """Synchronous polling reports a child starting and exiting"""
+    source = ProcessEventSource()
+    source.poll_once()  # Seed
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    started = source.poll_once()
+    assert any(
+        e.pid == child.pid and e.event_type == ProcessEventType.STARTED for e in started
+    ), "start event missing"
+
+    child.kill()
+    child.wait()
+    exited = source.poll_once()
+    assert any(
+        e.pid == child.pid and e.event_type == ProcessEventType.EXITED for e in exited
+    ), "exit event missing"
+
+    print(f"  [OK] start + exit events for PID {child.pid}")
+
+
+def test_watched_exit_latency():
+    """A watched process's exit reaches subscribers quickly"""
+    source = ProcessEventSource(max_interval=1.0)
+    received = threading.Event()
+    detected_at = {}
+
+    def on_exit(event):
+        detected_at["time"] = time.perf_counter()
+        received.set()
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    source.start()
+
+    try:
+        source.subscribe(on_exit, event_types=[ProcessEventType.EXITED], watched_only=True)
+        assert source.watch(child.pid)
+        time.sleep(1.5)  # Let the poll interval back off to its maximum
+
+        killed_at = time.perf_counter()
+        child.kill()
+        child.wait()
+
+        assert received.wait(timeout=3), "watched exit not delivered"
+        latency_ms = (detected_at["time"] - killed_at) * 1000
+        print(f"  [OK] watched exit delivered in {latency_ms:.1f}ms (idle poll interval 1s)")
+    finally:
+        source.stop()
+
+
+def test_pid_reuse():
+    """The psutil fallback notices a known PID now belonging to another process"""
+    source = ProcessEventSource()
+    source._proc_reader = None
+    source._use_proc = False  # psutil diffing, as on Windows / macOS
+    source.poll_once()  # Seed
+
+    pid = os.getpid()
+    source._known[pid] = replace(source._known[pid], name="previous", create_time=source._known[pid].create_time - 100)
+    events = [e for e in source.poll_once() if e.pid == pid]
+
+    assert [(e.event_type, e.name) for e in events][0] == (ProcessEventType.EXITED, "previous"), events
+    assert events[1].event_type == ProcessEventType.STARTED and events[1].name != "previous", events
+    assert not [e for e in source.poll_once() if e.pid == pid]  # Settled
+    print("  [OK] reused PID -> exit + start")
+
+
+def test_stop_closes_descriptors():
+    """Selector, wake sockets and pidfds are closed by stop()"""
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        print("  [SKIP] no /proc/self/fd")
+        return
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    source = ProcessEventSource()
+    before = len(os.listdir(fd_dir))
+    try:
+        for _ in range(3):
+            source.start()
+            assert source.watch(child.pid)
+            assert len(os.listdir(fd_dir)) > before
+            source.stop()
+            assert len(os.listdir(fd_dir)) == before, "descriptors leaked"
+
+        # Still watched across restarts
+        assert child.pid in source._watched
+    finally:
+        child.kill()
+        child.wait()
+    print("  [OK] no descriptors left after 3 start/stop cycles")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROCESS EVENTS TEST")
+    print("=" * 70 + "\n")
+
+    test_poll_detects_start_and_exit()
+    test_watched_exit_latency()
+    test_pid_reuse()
+    test_stop_closes_descriptors()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
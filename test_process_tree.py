@@ -0,0 +1,172 @@
+"""
+Test Script for Process Tree Snapshots
+
+Verifies the shared process snapshot used by SystemMonitor, VSCodeMonitor
+and TerminalFinder, checks that the /proc backend reads cmdline, cwd and
+exe only when used, and compares its cost against separate psutil walks.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import psutil
+
+from sendell.device.events import ProcessEventSource
+from sendell.device.platform.linux import PROC_AVAILABLE
+from sendell.device.process_tree import ProcessSnapshotService
+
+
+def test_snapshot_contains_self():
+    """Snapshot includes this process with its parent link"""
+    service = ProcessSnapshotService()
+    tree = service.get_tree()
+
+    me = tree.get(os.getpid())
+    assert me is not None, "current process missing from snapshot"
+    assert me.ppid == os.getppid()
+    assert me in tree.children(me.ppid)
+
+    print(f"  [OK] {len(tree)} processes, self={me.name} (ppid {me.ppid})")
+
+
+def test_descendants():
+    """Children spawned after a refresh show up as descendants"""
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+
+    try:
+        service = ProcessSnapshotService()
+        tree = service.refresh()
+
+        pids = [node.pid for node in tree.descendants(os.getpid())]
+        assert child.pid in pids, "spawned child not found in descendants"
+        print(f"  [OK] child PID {child.pid} found among {len(pids)} descendant(s)")
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_cache_reuse():
+    """Back-to-back queries reuse one walk"""
+    service = ProcessSnapshotService(max_age_seconds=5.0)
+
+    first = service.get_tree()
+    second = service.get_tree()
+
+    assert first is second
+    assert service.stats["refreshes"] == 1
+    assert service.stats["cache_hits"] == 1
+    print(f"  [OK] second query served from cache ({service.stats['last_refresh_ms']}ms walk)")
+
+
+def benchmark_snapshot_vs_separate_walks(rounds: int = 5):
+    """Compare one shared snapshot against three separate psutil walks"""
+    attrs = ["pid", "name", "cpu_percent", "memory_info", "status", "num_threads"]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(3):
+            list(psutil.process_iter(attrs))
+    separate_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    service = ProcessSnapshotService(backend="psutil")
+    start = time.perf_counter()
+    for _ in range(rounds):
+        service.refresh()
+    shared_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    print(f"  3 separate walks: {separate_ms:.1f}ms per refresh")
+    print(f"  1 shared snapshot: {shared_ms:.1f}ms per refresh")
+
+
+def test_proc_backend_matches_psutil():
+    """/proc backend reports the same PIDs, parents and names as psutil"""
+    if not PROC_AVAILABLE:
+        print("  [SKIP] /proc not available on this platform")
+        return
+
+    proc_tree = ProcessSnapshotService(backend="proc").refresh()
+    psutil_tree = ProcessSnapshotService(backend="psutil").refresh()
+
+    me = os.getpid()
+    assert proc_tree.get(me).ppid == psutil_tree.get(me).ppid
+    assert proc_tree.get(me).name == psutil_tree.get(me).name
+    assert proc_tree.get(me).cmdline == psutil_tree.get(me).cmdline
+    assert proc_tree.get(me).cwd == psutil_tree.get(me).cwd
+    assert proc_tree.get(me).exe == psutil_tree.get(me).exe  # Real binary, not argv[0]
+    assert abs(proc_tree.get(me).create_time - psutil_tree.get(me).create_time) < 1.0
+
+    common = set(proc_tree.nodes) & set(psutil_tree.nodes)
+    assert len(common) >= 0.9 * len(psutil_tree), "backends disagree on process list"
+    print(f"  [OK] /proc and psutil agree on {len(common)} processes")
+
+
+def test_proc_fields_read_on_access():
+    """/proc snapshots read cmdline, cwd and exe lazily; event seeds read them up front"""
+    if not PROC_AVAILABLE:
+        print("  [SKIP] /proc not available on this platform")
+        return
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"], cwd="/")
+    try:
+        tree = ProcessSnapshotService(backend="proc").refresh()
+        seeded = ProcessEventSource(snapshot_service=ProcessSnapshotService(backend="proc"))
+        seeded._seed()
+    finally:
+        child.kill()
+        child.wait()
+
+    gone = tree.get(child.pid)
+    assert gone.name.startswith("python")  # From stat, at snapshot time
+    assert gone.cwd == "" and gone.cmdline == [] and gone.exe == ""  # First access after exit
+
+    node = seeded._known[child.pid]
+    assert node.cwd == "/" and node.cmdline[1:] == ["-c", "import time; time.sleep(5)"]
+    print("  [OK] lazy cmdline / cwd / exe, loaded up front for process events")
+
+
+def benchmark_backends(rounds: int = 10):
+    """Time a full table refresh with each backend"""
+    if not PROC_AVAILABLE:
+        return
+
+    for backend in ("psutil", "proc"):
+        service = ProcessSnapshotService(backend=backend)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            tree = service.refresh()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+        per_proc_us = elapsed_ms * 1000 / max(len(tree), 1)
+        print(
+            f"  {backend:>6}: {elapsed_ms:.1f}ms per refresh "
+            f"({len(tree)} processes, {per_proc_us:.1f}us/process, "
+            f"~{per_proc_us * 1.5:.0f}ms for 1500)"
+        )
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROCESS TREE SNAPSHOT TEST")
+    print("=" * 70 + "\n")
+
+    test_snapshot_contains_self()
+    test_descendants()
+    test_cache_reuse()
+    test_proc_backend_matches_psutil()
+    test_proc_fields_read_on_access()
+
+    print("\n[BENCHMARK]")
+    benchmark_snapshot_vs_separate_walks()
+    benchmark_backends()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Test Script for Project Resource Attribution
+
+Checks longest-prefix matching in the project path trie (nested projects
+and sibling names sharing a prefix), cwd and command-line matching of
+processes, per-project I/O deltas between calls, the project_metrics
+rows written by record_metrics(), the project_logs row written for a
+watched process exit, and that the proactive loop refreshes usage once
+per check interval.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sqlalchemy.orm import sessionmaker
+
+from sendell.device.events import ProcessEvent, ProcessEventType
+from sendell.device.process_tree import ProcessNode, ProcessTree
+from sendell.proactive.identity import AgentIdentity
+from sendell.proactive.proactive_loop import ProactiveLoop
+from sendell.proactive.reminders import ReminderManager
+from sendell.proactive.temporal_clock import TemporalClock
+from sendell.projects import database
+from sendell.projects.attribution import PathTrie, ProjectAttributor
+from sendell.projects.models import ProjectLogModel, ProjectMetricModel, ProjectModel, init_database
+from sendell.projects.types import Project, ProjectType
+
+ROOT = Path(os.path.abspath(os.sep)) / "dev"
+
+
+def project(*parts: str) -> Project:
+    """Project rooted at ROOT/parts"""
+    return Project(name=parts[-1], path=ROOT.joinpath(*parts), project_type=ProjectType.NODEJS)
+
+
+def node(pid: int, cwd: str = "", cmdline=None, create_time: float = 1000.0, rss: int = 0) -> ProcessNode:
+    """Process snapshot entry"""
+    return ProcessNode(
+        pid=pid,
+        ppid=1,
+        name="node",
+        exe="",
+        cmdline=cmdline or ["node"],
+        cwd=cwd,
+        create_time=create_time,
+        status="running",
+        cpu_percent=1.5,
+        memory_rss=rss,
+        memory_percent=0.0,
+        num_threads=1,
+    )
+
+
+def test_trie_longest_prefix():
+    """The deepest containing root wins; app is not a prefix of app2"""
+    app, app2, ui = project("app"), project("app2"), project("app", "packages", "ui")
+    trie = PathTrie()
+    for item in (app, app2, ui):
+        trie.insert(item.path, item)
+    assert len(trie) == 3
+
+    assert trie.lookup(str(ROOT / "app")) is app
+    assert trie.lookup(str(ROOT / "app" / "src" / "index.js")) is app
+    assert trie.lookup(str(ROOT / "app2" / "src")) is app2
+    assert trie.lookup(str(ROOT / "app" / "packages" / "ui" / "button.tsx")) is ui
+    assert trie.lookup(str(ROOT / "app" / "packages" / "uikit")) is app
+    assert trie.lookup(str(ROOT / "ap")) is None
+    assert trie.lookup(str(ROOT)) is None
+    assert trie.lookup(str(ROOT / "app" / ".." / "app2" / "x")) is app2  # Normalized
+
+    trie.remove(ui.path)
+    assert len(trie) == 2
+    assert trie.lookup(str(ROOT / "app" / "packages" / "ui" / "button.tsx")) is app
+    print("  [OK] longest-prefix lookups, sibling prefixes kept apart")
+
+
+def test_process_matching():
+    """cwd first, then absolute command-line paths"""
+    app, api = project("app"), project("api")
+    attributor = ProjectAttributor([app, api])
+
+    assert attributor.match_process(node(1, cwd=str(ROOT / "app" / "src"))) is app
+    by_arg = node(2, cwd="/", cmdline=["python", "-m", str(ROOT / "api" / "main.py")])
+    assert attributor.match_process(by_arg) is api
+    both = node(3, cwd=str(ROOT / "app"), cmdline=["python", str(ROOT / "api" / "main.py")])
+    assert attributor.match_process(both) is app  # cwd wins
+    assert attributor.match_process(node(4, cwd="/tmp", cmdline=["python", "relative/api/main.py"])) is None
+    assert attributor.match_process(node(5, cmdline=[str(ROOT / "api" / "bin")])) is None  # argv[0] skipped
+
+    attributor.remove_projects([api.path])
+    assert attributor.match_process(by_arg) is None
+    print("  [OK] cwd and cmdline matching")
+
+
+def test_io_deltas():
+    """I/O is reported since the previous call, per (pid, create_time)"""
+    app = project("app")
+    attributor = ProjectAttributor([app])
+    counters = {10: (1000, 500), 11: (50, 0)}
+    attributor._read_io = lambda pid: counters.get(pid)
+
+    long_running = node(10, cwd=str(ROOT / "app"), create_time=1000.0)
+    tree = ProcessTree({10: long_running})
+    first = attributor.attribute(tree)[str(app.path)]
+    assert (first.io_read_bytes, first.io_write_bytes) == (0, 0)  # Baseline only
+
+    counters[10] = (1300, 600)
+    second = attributor.attribute(tree)[str(app.path)]
+    assert (second.io_read_bytes, second.io_write_bytes) == (300, 100)
+
+    # Unchanged counters: nothing new, not the lifetime totals again
+    third = attributor.attribute(tree)[str(app.path)]
+    assert (third.io_read_bytes, third.io_write_bytes) == (0, 0)
+
+    # A process started since the previous call counts in full; PID 10 reused
+    reused = node(10, cwd=str(ROOT / "app"), create_time=time.time() + 1)
+    started = node(11, cwd=str(ROOT / "app"), create_time=time.time() + 1)
+    counters[10] = (20, 0)
+    fourth = attributor.attribute(ProcessTree({10: reused, 11: started}))[str(app.path)]
+    assert fourth.io_read_bytes == 70, fourth.io_read_bytes
+    print("  [OK] I/O deltas between calls")
+
+
+def test_record_metrics():
+    """One project_metrics row per active project; unknown projects are inserted"""
+    saved = database._engine, database._session_factory
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = database.create_sqlite_engine(Path(tmp) / "projects.db")
+        init_database(engine)
+        database._engine = engine
+        database._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            app, api, idle = project("app"), project("api"), project("idle")
+            attributor = ProjectAttributor([app, api, idle])
+            attributor._read_io = lambda pid: (0, 0)
+            tree = ProcessTree({
+                20: node(20, cwd=str(ROOT / "app"), rss=100 * 1024 * 1024, create_time=time.time() - 60),
+                21: node(21, cwd=str(ROOT / "app" / "web"), rss=50 * 1024 * 1024),
+                30: node(30, cwd=str(ROOT / "api"), rss=10 * 1024 * 1024),
+            })
+            usage = attributor.attribute(tree)
+
+            with database.session_scope() as session:
+                assert attributor.record_metrics(session, usage) == 2
+
+            with database.session_scope() as session:
+                rows = {
+                    model.name: metric
+                    for metric, model in session.query(ProjectMetricModel, ProjectModel).join(ProjectModel)
+                }
+                assert sorted(rows) == ["api", "app"]
+                assert session.query(ProjectModel).count() == 2  # idle has no processes
+
+                row = rows["app"]
+                assert (row.process_count, row.process_id, row.is_running) == (2, 20, True)
+                assert row.memory_mb == 150.0 and row.cpu_percent == 3.0
+                assert (row.io_read_bytes, row.io_write_bytes) == (0, 0)
+                assert row.uptime_seconds >= 60
+                assert rows["api"].memory_mb == 10.0
+            print("  [OK] record_metrics rows")
+        finally:
+            database._engine, database._session_factory = saved
+            engine.dispose()
+
+
+def test_record_process_exit():
+    """A watched exit inside a project becomes a project_logs row"""
+    saved = database._engine, database._session_factory
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = database.create_sqlite_engine(Path(tmp) / "projects.db")
+        init_database(engine)
+        database._engine = engine
+        database._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            app = project("app")
+            attributor = ProjectAttributor([app])
+
+            def exited(cwd: str) -> ProcessEvent:
+                return ProcessEvent(
+                    event_type=ProcessEventType.EXITED,
+                    pid=40,
+                    name="node",
+                    ppid=1,
+                    cmdline=["node", "server.js"],
+                    cwd=cwd,
+                    watched=True,
+                )
+
+            assert attributor.record_process_exit(exited(str(ROOT / "app" / "web"))) is app
+            assert attributor.record_process_exit(exited("/tmp")) is None
+
+            with database.session_scope() as session:
+                logs = session.query(ProjectLogModel, ProjectModel).join(ProjectModel).all()
+                assert len(logs) == 1
+                log, model = logs[0]
+                assert model.name == "app" and (log.log_level, log.source) == ("WARNING", "process")
+                assert log.log_text == "Process exited: node (PID 40) node server.js"
+            print("  [OK] process exit logged against its project")
+        finally:
+            database._engine, database._session_factory = saved
+            engine.dispose()
+
+
+def test_proactive_loop_refresh():
+    """Cycles refresh and record usage, at most once per check interval"""
+    calls = []
+
+    class CountingAttributor(ProjectAttributor):
+        def refresh(self, record: bool = True):
+            calls.append(record)
+            return {}
+
+    loop = ProactiveLoop(
+        identity=AgentIdentity(user_name=None),
+        reminder_manager=ReminderManager(),
+        temporal_clock=TemporalClock(),
+        check_interval_seconds=60,
+        project_attributor=CountingAttributor([project("app")]),
+    )
+
+    async def cycles():
+        await loop._run_cycle()
+        await loop._run_cycle()  # e.g. woken early by an alert
+        loop._usage_refreshed_at -= 60
+        await loop._run_cycle()
+
+    asyncio.run(cycles())
+    assert calls == [True, True], calls
+    assert loop.get_status()["usage_refreshes"] == 2
+    print("  [OK] proactive loop refreshes project usage")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT ATTRIBUTION TEST")
+    print("=" * 70 + "\n")
+
+    test_trie_longest_prefix()
+    test_process_matching()
+    test_io_deltas()
+    test_record_metrics()
+    test_record_process_exit()
+    test_proactive_loop_refresh()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
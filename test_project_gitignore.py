@@ -0,0 +1,137 @@
+"""
+Test Script for .gitignore-Aware Scanning
+
+Checks the gitignore matcher semantics (anchoring, directory-only rules,
+negation, nested files), how stacked ignore files override each other
+and when their fingerprint changes, that the scanner never descends into ignored
+directories and reports the rule that pruned them, and that subtree
+rescans filter like the full scan.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.gitignore import IgnoreFile, IgnoreStack, parse_rules
+from sendell.projects.index import ProjectIndex
+from sendell.projects.scanner import ProjectScanner
+
+
+def make_tree(root: Path) -> None:
+    """repo/ with ignored data dumps, generated clients and one re-included dir"""
+    files = {
+        "repo/.gitignore": "data/\n/generated\n*.cache/\n!keep.cache/\n",
+        "repo/app/package.json": '{"name": "app"}',
+        "repo/data/dump/package.json": '{"name": "dump"}',
+        "repo/generated/client/package.json": '{"name": "client"}',
+        "repo/sub/generated/real/package.json": '{"name": "real"}',
+        "repo/a.cache/p/package.json": '{"name": "cached"}',
+        "repo/keep.cache/p/package.json": '{"name": "kept"}',
+        "repo/lib/.ignore": "tmp\n",
+        "repo/lib/tmp/p/package.json": '{"name": "tmp"}',
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def test_matcher():
+    """Anchored vs. unanchored patterns, dir-only rules and negation"""
+    rules = IgnoreFile(parse_rules(["# comment", "*.log", "/build", "out/", "docs/**/tmp", "!keep.log"]))
+
+    assert rules.match("app.log", is_dir=False) is True
+    assert rules.match("src/app.log", is_dir=False) is True
+    assert rules.match("keep.log", is_dir=False) is False
+    assert rules.match("build", is_dir=True) is True
+    assert rules.match("src/build", is_dir=True) is None
+    assert rules.match("out", is_dir=True) is True
+    assert rules.match("out", is_dir=False) is None
+    assert rules.match("docs/a/b/tmp", is_dir=True) is True
+    print("  [OK] gitignore semantics")
+
+
+def test_ignore_stack():
+    """Deeper ignore files win, rules are reported, fingerprints track edits"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        repo = str(root / "repo")
+        lib = str(root / "repo" / "lib")
+        (root / "repo" / "lib" / ".gitignore").write_text("!tmp\n*.bak\n")
+
+        assert IgnoreStack.empty().child(str(root)) is IgnoreStack.empty()  # No ignore files
+        stack = IgnoreStack.empty().child(repo)
+        nested = stack.child(lib)
+        assert stack.has_rules and nested.parent is stack
+
+        assert stack.is_ignored(os.path.join(repo, "data"), is_dir=True)
+        assert nested.is_ignored(os.path.join(lib, "old.bak"), is_dir=False)
+        assert not stack.is_ignored(os.path.join(lib, "old.bak"), is_dir=False)
+        assert nested.ignored_by(os.path.join(lib, "old.bak"), is_dir=False) == f"{os.path.join(lib, '.gitignore')}: *.bak"
+        assert nested.ignored_by(os.path.join(lib, "app.py"), is_dir=False) is None
+
+        # .ignore takes precedence over .gitignore in the same directory
+        assert nested.ignored_by(os.path.join(lib, "tmp"), is_dir=True) == f"{os.path.join(lib, '.ignore')}: tmp"
+
+        before = nested.fingerprint
+        (root / "repo" / "lib" / ".gitignore").write_text("*.bak\n*.orig\n")
+        assert IgnoreStack.empty().child(repo).child(lib).fingerprint != before
+        print("  [OK] stacked ignore files and fingerprints")
+
+
+def test_scanner_prunes_ignored_directories():
+    """Ignored subtrees are skipped and counted per rule"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+
+        scanner = ProjectScanner(max_depth=4, index=ProjectIndex(persist=False), respect_ignore_files=True)
+        result = scanner.scan_directory(root)
+        names = sorted(project.name for project in result.projects_found)
+        assert names == ["app", "kept", "real"], names
+
+        gitignore = str(root / "repo" / ".gitignore")
+        assert result.pruned_by_rule[f"{gitignore}: data/"] == 1
+        assert result.pruned_by_rule[f"{gitignore}: /generated"] == 1
+        assert result.pruned_by_rule[f"{root / 'repo' / 'lib' / '.ignore'}: tmp"] == 1
+
+        unfiltered = ProjectScanner(max_depth=4, respect_ignore_files=False).scan_directory(root)
+        assert unfiltered.total_projects == 7
+        assert result.directories_visited < unfiltered.directories_visited
+        print(f"  [OK] {result.directories_visited} vs {unfiltered.directories_visited} directories visited")
+
+
+def test_subtree_rescan():
+    """A rescan below the root applies the ancestors' ignore files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        scanner = ProjectScanner(max_depth=4, respect_ignore_files=True)
+
+        assert scanner.scan_directory(root / "repo" / "data", depth=2).projects_found == []
+        rescanned = scanner.scan_directory(root / "repo" / "sub", depth=2)
+        assert [project.name for project in rescanned.projects_found] == ["real"]
+        print("  [OK] subtree rescans filter like the full scan")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("GITIGNORE PRUNING TEST")
+    print("=" * 70 + "\n")
+
+    test_matcher()
+    test_ignore_stack()
+    test_scanner_prunes_ignored_directories()
+    test_subtree_rescan()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
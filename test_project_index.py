@@ -0,0 +1,182 @@
+"""
+Test Script for the Incremental Project Index
+
+Builds a small project tree, scans it twice through a ProjectIndex and
+checks that unchanged directories and configs come from the index while
+added folders and edited configs are picked up, and that records of a
+failed flush are written by the next one.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sqlalchemy.orm import sessionmaker
+
+from sendell.projects import database
+from sendell.projects.index import DirectoryRecord, ProjectIndex, SizeRecord
+from sendell.projects.models import init_database
+from sendell.projects.scanner import ProjectScanner
+
+
+def age(root: Path, seconds: float = 60) -> None:
+    """Backdate every mtime so entries aren't 'racily clean'"""
+    past = time.time() - seconds
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+    os.utime(root, (past, past))
+
+
+def backdate(*paths: Path, seconds: float = 30) -> None:
+    """Backdate only the given entries (leaves the rest of the tree as indexed)"""
+    past = time.time() - seconds
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+def make_tree(root: Path) -> None:
+    for i in range(3):
+        app = root / "work" / f"app{i}"
+        app.mkdir(parents=True)
+        (app / "package.json").write_text(json.dumps({"name": f"app{i}", "version": "1.0.0"}))
+    (root / "work" / "notes").mkdir()
+    (root / "tools" / "cli").mkdir(parents=True)
+    (root / "tools" / "cli" / "pyproject.toml").write_text('[project]\nname = "cli"\nversion = "0.1.0"\n')
+    age(root)
+
+
+def scan(root: Path, index: ProjectIndex):
+    result = ProjectScanner(max_depth=3, index=index).scan_directory(root)
+    return result, {project.name: project for project in result.projects_found}
+
+
+def test_warm_rescan():
+    """Second scan of an unchanged tree is all cache hits, same projects"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        index = ProjectIndex(persist=False)
+
+        cold, cold_projects = scan(root, index)
+        warm, warm_projects = scan(root, index)
+
+        assert cold.cache_hits == 0 and cold.cache_misses > 0
+        assert warm.cache_misses == 0 and warm.cache_hits == cold.cache_misses
+        assert sorted(cold_projects) == sorted(warm_projects) == ["app0", "app1", "app2", "cli"]
+        assert warm_projects["cli"].config.version == "0.1.0"
+        print(f"  [OK] cold: {cold.cache_misses} misses, warm: {warm.cache_hits} hits")
+
+
+def test_changes_invalidate():
+    """New directories and edited configs are rescanned, the rest is reused"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        index = ProjectIndex(persist=False)
+        scan(root, index)
+
+        # New project under work/ (changes work/'s mtime) and an edited config
+        new_app = root / "work" / "app3"
+        new_app.mkdir()
+        (new_app / "go.mod").write_text("module example.com/app3\n\ngo 1.22\n")
+        (root / "tools" / "cli" / "pyproject.toml").write_text('[project]\nname = "cli"\nversion = "0.2.0"\n')
+        backdate(root / "work", new_app, new_app / "go.mod", root / "tools" / "cli" / "pyproject.toml")
+
+        result, projects = scan(root, index)
+
+        assert any(project.path == new_app for project in projects.values())
+        assert projects["cli"].config.version == "0.2.0"
+        # work/ relisted, app3 listed, app3 and cli configs parsed
+        assert result.cache_misses == 4, result.cache_misses
+        print(f"  [OK] {result.cache_misses} misses, {result.cache_hits} hits after edits")
+
+
+def test_racy_entries_not_cached():
+    """Directories modified just now are listed again next time"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        (root / "fresh").mkdir()  # Touches root's mtime: now racy
+        index = ProjectIndex(persist=False)
+
+        scan(root, index)
+        result, _ = scan(root, index)
+
+        assert result.cache_misses == 2, result.cache_misses  # root and fresh/
+        print(f"  [OK] racy directories relisted ({result.cache_misses} misses)")
+
+
+def test_failed_flush_is_retried():
+    """A flush that fails keeps its records pending; changes made meanwhile win"""
+    saved = database._engine, database._session_factory
+    real_session_scope = database.session_scope
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        engine = database.create_sqlite_engine(root / "projects.db")
+        init_database(engine)
+        database._engine = engine
+        database._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            make_tree(root / "tree")
+            old = time.time_ns() - 60 * 10**9
+            first = DirectoryRecord(mtime_ns=old, subdirs=("a",))
+            newer = DirectoryRecord(mtime_ns=old + 1, subdirs=("a", "b"))
+            size = SizeRecord(mtime_ns=old, ignore_fingerprint="", file_count=3, total_bytes=300, subdirs=())
+            config = root / "tree" / "tools" / "cli" / "pyproject.toml"
+
+            index = ProjectIndex(persist=True)
+            index.put_directory("/work", first)
+            index.put_directory("/gone", first)
+            index.put_size("/work", size)
+            index.configs.load(config)
+
+            @contextmanager
+            def failing_scope():
+                index.put_directory("/work", newer)  # Changed while the flush was running
+                raise RuntimeError("database is locked")
+                yield
+
+            database.session_scope = failing_scope
+            try:
+                assert index.flush() == 0
+            finally:
+                database.session_scope = real_session_scope
+
+            index.forget_directory("/gone")
+            assert index.flush() == 4  # /work, /gone deleted, its size, the config
+
+            reloaded = ProjectIndex(persist=True)
+            assert reloaded.get_directory("/work", newer.mtime_ns) == newer
+            assert reloaded.get_directory("/gone", first.mtime_ns) is None
+            assert reloaded.get_size("/work", old) == size
+            assert reloaded.configs.load(config)[1] is True
+            print("  [OK] failed flush retried by the next one, newer records kept")
+        finally:
+            database._engine, database._session_factory = saved
+            engine.dispose()
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT INDEX TEST")
+    print("=" * 70 + "\n")
+
+    test_warm_rescan()
+    test_changes_invalidate()
+    test_racy_entries_not_cached()
+    test_failed_flush_is_retried()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Test Script for Project Marker Detection
+
+Checks find_marker(): the PROJECT_TYPE_MARKERS priority when several
+markers coexist, suffix markers (*.csproj, *.sln, ...) and their ties,
+case-insensitive names where the file system is (Windows, macOS), and
+that it agrees with the original per-marker exists()/glob() detection
+on a small tree.
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects import scanner
+from sendell.projects.scanner import ProjectScanner, find_marker
+from sendell.projects.types import PROJECT_TYPE_MARKERS, ProjectType
+
+
+def baseline_marker(path: Path):
+    """The original detection: one exists() / glob() per marker, in priority order"""
+    for project_type, markers in PROJECT_TYPE_MARKERS.items():
+        for marker in markers:
+            if "*" in marker:
+                matches = sorted(match.name for match in path.glob(marker))
+                if matches:
+                    return project_type, matches
+            elif (path / marker).exists():
+                return project_type, [marker]
+    return None
+
+
+class case_insensitive:
+    """Rebuild the marker tables as on Windows / macOS"""
+
+    def __enter__(self):
+        self.saved = scanner._CASE_INSENSITIVE, scanner._EXACT_MARKERS, scanner._SUFFIX_MARKERS
+        scanner._CASE_INSENSITIVE = True
+        scanner._EXACT_MARKERS, scanner._SUFFIX_MARKERS = scanner._build_marker_tables()
+        return self
+
+    def __exit__(self, *exc):
+        scanner._CASE_INSENSITIVE, scanner._EXACT_MARKERS, scanner._SUFFIX_MARKERS = self.saved
+
+
+def test_priority_when_markers_coexist():
+    """The first marker in PROJECT_TYPE_MARKERS order wins"""
+    cases = [
+        (["package.json", "pyproject.toml"], (ProjectType.PYTHON, "pyproject.toml")),
+        (["package.json", "requirements.txt"], (ProjectType.PYTHON, "requirements.txt")),
+        (["poetry.lock", "setup.py", "README.md"], (ProjectType.PYTHON, "setup.py")),
+        (["yarn.lock", "package.json"], (ProjectType.NODEJS, "package.json")),
+        (["Cargo.toml", "package.json"], (ProjectType.NODEJS, "package.json")),
+        (["go.sum", "go.work", "go.mod"], (ProjectType.GO, "go.mod")),
+        (["build.gradle.kts", "pom.xml"], (ProjectType.JAVA, "pom.xml")),
+        (["Makefile", "CMakeLists.txt"], (ProjectType.CPP, "CMakeLists.txt")),
+        (["src", "README.md", ".gitignore"], None),
+        ([], None),
+    ]
+    for names, expected in cases:
+        assert find_marker(names) == expected, (names, find_marker(names))
+    print(f"  [OK] {len(cases)} coexisting-marker cases")
+
+
+def test_suffix_markers():
+    """*.ext markers rank by position; ties go to the first name alphabetically"""
+    cases = [
+        (["App.csproj"], (ProjectType.DOTNET, "App.csproj")),
+        (["b.csproj", "a.csproj"], (ProjectType.DOTNET, "a.csproj")),
+        (["a.fsproj", "b.csproj"], (ProjectType.DOTNET, "b.csproj")),  # *.csproj ranks first
+        (["Solution.sln", "Api.Tests.csproj"], (ProjectType.DOTNET, "Api.Tests.csproj")),
+        (["Solution.sln", "CMakeLists.txt"], (ProjectType.DOTNET, "Solution.sln")),
+        (["Makefile", "Tool.vcxproj"], (ProjectType.CPP, "Makefile")),
+        (["pom.xml", "App.csproj"], (ProjectType.JAVA, "pom.xml")),
+        (["notes.csproj.bak", "csproj"], None),
+    ]
+    for names, expected in cases:
+        assert find_marker(names) == expected, (names, find_marker(names))
+    for names in itertools.permutations(["c.sln", "b.csproj", "a.csproj", "Makefile"]):
+        assert find_marker(names) == (ProjectType.DOTNET, "a.csproj")
+    print(f"  [OK] suffix markers and ties ({len(cases)} cases, order independent)")
+
+
+def test_case_insensitive_names():
+    """Windows / macOS match markers regardless of case and report the real name"""
+    with case_insensitive():
+        assert find_marker(["makefile"]) == (ProjectType.CPP, "makefile")
+        assert find_marker(["PACKAGE.JSON", "Cargo.TOML"]) == (ProjectType.NODEJS, "PACKAGE.JSON")
+        assert find_marker(["App.CSPROJ"]) == (ProjectType.DOTNET, "App.CSPROJ")
+        assert find_marker(["gemfile", "PyProject.toml"]) == (ProjectType.PYTHON, "PyProject.toml")
+
+    if not scanner._CASE_INSENSITIVE:
+        assert find_marker(["makefile", "PACKAGE.JSON"]) is None  # Case-sensitive here
+    print("  [OK] case-insensitive marker names")
+
+
+def test_matches_baseline_detection():
+    """find_marker() and detect_project() agree with the per-marker exists() loop"""
+    layouts = [
+        ["pyproject.toml", "package.json"],
+        ["package-lock.json", "Gemfile"],
+        ["go.mod", "go.sum"],
+        ["composer.json", "Makefile"],
+        ["One.csproj", "Two.csproj", "All.sln"],
+        ["Tool.vbproj", "CMakeLists.txt"],
+        ["Cargo.lock"],
+        ["build.gradle", "settings.gradle"],
+        ["README.md"],
+        ["Pipfile", "yarn.lock", "x.vcxproj"],
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        project_scanner = ProjectScanner(max_depth=1, respect_ignore_files=False)
+
+        for i, names in enumerate(layouts):
+            directory = root / f"dir{i}"
+            directory.mkdir()
+            for name in names:
+                (directory / name).write_text("")
+
+            expected = baseline_marker(directory)
+            found = find_marker(os.listdir(directory))
+            project = project_scanner.detect_project(directory)
+
+            if expected is None:
+                assert found is None and project is None, names
+                continue
+            assert found[0] == expected[0] and found[1] in expected[1], (names, found, expected)
+            assert found[1] == expected[1][0]  # Deterministic pick among ties
+            assert project.project_type == expected[0] and project.config_file == directory / found[1]
+
+        result = project_scanner.scan_directory(root)
+        assert result.total_projects == sum(1 for names in layouts if names != ["README.md"])
+    print(f"  [OK] same detection as the baseline for {len(layouts)} directories")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT MARKER TEST")
+    print("=" * 70 + "\n")
+
+    test_priority_when_markers_coexist()
+    test_suffix_markers()
+    test_case_insensitive_names()
+    test_matches_baseline_detection()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Test Script for the Project Repository
+
+Saves projects into a temporary project database and checks that a
+rescan of unchanged projects writes nothing, that one change updates one
+row while keeping its status and discovery time, and that pruning and
+remove_projects delete the projects' child rows too.
+"""
+
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from sendell.projects import database
+from sendell.projects.models import (
+    ProjectConfigModel,
+    ProjectLogModel,
+    ProjectMetricModel,
+    ProjectModel,
+    init_database,
+)
+from sendell.projects.repository import ProjectRepository
+from sendell.projects.types import Project, ProjectConfig, ProjectStatus, ProjectType, ScanResult
+
+
+@contextmanager
+def temp_database():
+    """Point session_scope() at a fresh SQLite file; yields (engine, executed write statements)"""
+    saved = database._engine, database._session_factory
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = database.create_sqlite_engine(Path(tmp) / "projects.db")
+        init_database(engine)
+        writes = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().split(" ", 1)[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+                writes.append(statement)
+
+        database._engine = engine
+        database._session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            yield engine, writes
+        finally:
+            database._engine, database._session_factory = saved
+            engine.dispose()
+
+
+def make_projects(root: Path, count: int = 5) -> list:
+    """app0..appN under root, each with a config and size totals"""
+    return [
+        Project(
+            name=f"app{i}",
+            path=root / f"app{i}",
+            project_type=ProjectType.NODEJS,
+            config=ProjectConfig(name=f"app{i}", version="1.0.0"),
+            config_file=root / f"app{i}" / "package.json",
+            file_count=10 + i,
+            total_size_bytes=1000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def scan_result(root: Path, projects: list) -> ScanResult:
+    """Complete scan of root that found projects"""
+    return ScanResult(scanned_path=root, projects_found=projects, scan_duration_seconds=0.0)
+
+
+def count(engine, model) -> int:
+    """Rows in a table"""
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(model)).scalar()
+
+
+def test_unchanged_rescan_writes_nothing():
+    """The second save of the same projects issues no INSERT/UPDATE/DELETE"""
+    with temp_database() as (engine, writes):
+        root = Path("/dev-root")
+        repository = ProjectRepository()
+
+        first = repository.save_scan(scan_result(root, make_projects(root)))
+        assert (first.inserted, first.configs_written) == (5, 5), first.to_dict()
+
+        writes.clear()
+        rescan = make_projects(root)
+        second = repository.save_scan(scan_result(root, rescan), prune=True)
+        assert second.writes == 0 and second.unchanged == 5, second.to_dict()
+        assert writes == [], writes
+        assert all(project.project_id is not None for project in rescan)
+        print("  [OK] unchanged rescan: 0 write statements")
+
+
+def test_single_change_updates_one_row():
+    """One changed project is one upsert row; status and discovered_at are kept"""
+    with temp_database() as (engine, writes):
+        root = Path("/dev-root")
+        repository = ProjectRepository()
+        repository.save_projects(make_projects(root))
+
+        discovered = datetime(2025, 1, 1, 12, 0)
+        with engine.begin() as conn:
+            conn.execute(
+                update(ProjectModel)
+                .where(ProjectModel.name == "app2")
+                .values(status=ProjectStatus.ACTIVE, discovered_at=discovered)
+            )
+
+        rescan = make_projects(root)
+        rescan[2].total_size_bytes = 5000
+        writes.clear()
+        stats = repository.save_projects(rescan)
+        assert (stats.updated, stats.unchanged, stats.inserted, stats.configs_written) == (1, 4, 0, 0), stats.to_dict()
+        assert len(writes) == 1, writes
+
+        with engine.connect() as conn:
+            row = conn.execute(select(ProjectModel).where(ProjectModel.name == "app2")).one()
+        assert row.total_size_bytes == 5000
+        assert row.status == ProjectStatus.ACTIVE and row.discovered_at == discovered
+        print("  [OK] one change -> one row updated, status and discovered_at kept")
+
+
+def test_deletes_remove_child_rows():
+    """prune=True and remove_projects delete configs, metrics and logs with the project"""
+    with temp_database() as (engine, writes):
+        root = Path("/dev-root")
+        repository = ProjectRepository()
+        projects = make_projects(root)
+        repository.save_projects(projects)
+
+        with engine.begin() as conn:
+            for project in projects:
+                conn.execute(ProjectMetricModel.__table__.insert(), {"project_id": project.project_id, "cpu_percent": 1.0})
+                conn.execute(
+                    ProjectLogModel.__table__.insert(),
+                    {"project_id": project.project_id, "log_text": "started", "log_level": "INFO"},
+                )
+
+        # app3 and app4 are gone from a complete rescan
+        stats = repository.save_scan(scan_result(root, make_projects(root, count=3)), prune=True)
+        assert stats.deleted == 2, stats.to_dict()
+        assert count(engine, ProjectModel) == 3
+        for model in (ProjectConfigModel, ProjectMetricModel, ProjectLogModel):
+            assert count(engine, model) == 3, model.__tablename__
+
+        assert repository.remove_projects([root / "app0", root / "missing"]) == 1
+        assert count(engine, ProjectModel) == 2
+        for model in (ProjectConfigModel, ProjectMetricModel, ProjectLogModel):
+            assert count(engine, model) == 2, model.__tablename__
+        print("  [OK] prune and remove_projects delete child rows")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT REPOSITORY TEST")
+    print("=" * 70 + "\n")
+
+    test_unchanged_rescan_writes_nothing()
+    test_single_change_updates_one_row()
+    test_deletes_remove_child_rows()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Test Script for the Project Size Walker
+
+Checks file and byte totals (ignored directories and .gitignore matches
+excluded), that a warm re-measure lists only changed directories, and
+that files grown in place are picked up by the periodic full relist.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.index import ProjectIndex
+from sendell.projects.sizer import ProjectSizer
+from sendell.projects.types import Project, ProjectType
+
+
+def make_project(root: Path) -> Path:
+    """app/ with 4 counted files (10 + 20 + 30 + 13 bytes) and some ignored ones"""
+    files = {
+        "app/.gitignore": "*.log\nbuild/\n",  # 13 bytes
+        "app/package.json": "x" * 10,
+        "app/src/index.js": "x" * 20,
+        "app/src/lib/util.js": "x" * 30,
+        "app/debug.log": "x" * 1000,
+        "app/build/out.js": "x" * 1000,
+        "app/node_modules/dep/index.js": "x" * 1000,
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root / "app"
+
+
+def backdate(root: Path) -> None:
+    """Move every mtime out of the index's racy window"""
+    old = time.time() - 60
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (old, old))
+    os.utime(root, (old, old))
+
+
+def test_totals():
+    """Ignored directories and .gitignore matches are not counted"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_project(Path(tmp))
+
+        result = ProjectSizer(workers=2).measure(app)
+        assert result.complete
+        assert (result.file_count, result.total_size_bytes) == (4, 73), result.to_dict()
+        assert result.directories == 3  # app, src, src/lib
+        print(f"  [OK] {result.file_count} files, {result.total_size_bytes} bytes")
+
+
+def test_warm_measure_uses_index():
+    """Unchanged directories come from the index; a new file relists one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_project(Path(tmp))
+        backdate(app)
+        sizer = ProjectSizer(index=ProjectIndex(persist=False), workers=2)
+
+        cold = sizer.measure(app)
+        warm = sizer.measure(app)
+        assert cold.relisted == 3 and warm.relisted == 0
+        assert (warm.file_count, warm.total_size_bytes) == (cold.file_count, cold.total_size_bytes)
+
+        (app / "src" / "new.js").write_text("x" * 5)
+        changed = sizer.measure(app)
+        assert changed.relisted == 1
+        assert (changed.file_count, changed.total_size_bytes) == (5, 78)
+        print(f"  [OK] relisted {cold.relisted} -> {warm.relisted} -> {changed.relisted} directories")
+
+
+def test_growth_in_place():
+    """A file that grows without touching its directory shows up on the next full relist"""
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_project(Path(tmp))
+        backdate(app)
+        project = Project(name="app", path=app, project_type=ProjectType.NODEJS)
+
+        sizer = ProjectSizer(index=ProjectIndex(persist=False), workers=2, full_rescan_seconds=3600)
+        sizer.measure_project(project)
+
+        util = app / "src" / "lib" / "util.js"
+        stat = os.stat(util.parent)
+        util.write_text("x" * 130)
+        os.utime(util.parent, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Directory mtime unchanged
+
+        sizer.measure_project(project)
+        assert project.total_size_bytes == 73  # Cached totals trusted between full relists
+
+        sizer.full_rescan_seconds = 0
+        result = sizer.measure_project(project)
+        assert result.relisted == 3 and project.total_size_bytes == 173
+        assert sizer.stats["full_rescans"] == 1
+        print(f"  [OK] grown file counted after a full relist ({project.total_size_bytes} bytes)")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT SIZER TEST")
+    print("=" * 70 + "\n")
+
+    test_totals()
+    test_warm_measure_uses_index()
+    test_growth_in_place()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
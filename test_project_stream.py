@@ -0,0 +1,67 @@
+"""
+Test Script for Streaming Project Scans
+
+Builds a tree of 200 projects and checks that a stream capped with
+max_results reports exactly the projects it yielded, even though the
+worker threads may find more before they stop.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.scanner import ProjectScanner
+
+
+def test_capped_stream_result():
+    """result() contains only the yielded projects"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(200):
+            app = root / f"group{i % 10}" / f"app{i}"
+            app.mkdir(parents=True)
+            (app / "package.json").write_text(json.dumps({"name": f"app{i}"}))
+
+        stream = ProjectScanner(max_depth=3, max_workers=8).iter_scan(root, max_results=5)
+        yielded = [project.path for project in stream]
+        result = stream.result()
+
+        assert len(yielded) == 5 and stream.stopped_early == "max_results"
+        assert result.total_projects == len(result.projects_found) == 5, result.total_projects
+        assert sorted(project.path for project in result.projects_found) == sorted(yielded)
+        assert sum(result.projects_by_type.values()) == 5
+        print(f"  [OK] 5 of 200 projects yielded and reported ({result.directories_visited} directories visited)")
+
+
+def test_full_stream_result():
+    """An uncapped stream reports every project"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(20):
+            (root / f"app{i}").mkdir()
+            (root / f"app{i}" / "package.json").write_text(json.dumps({"name": f"app{i}"}))
+
+        stream = ProjectScanner(max_depth=2).iter_scan(root)
+        assert len(list(stream)) == 20
+        assert stream.result().total_projects == 20 and stream.complete
+        print("  [OK] uncapped stream reports all 20 projects")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT STREAM TEST")
+    print("=" * 70 + "\n")
+
+    test_capped_stream_result()
+    test_full_stream_result()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
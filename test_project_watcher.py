@@ -0,0 +1,101 @@
+"""
+Test Script for the Project Watcher
+
+Starts a ProjectWatcher on a temporary folder and checks that new, edited
+and deleted projects show up without calling discover_projects, with
+inotify (Linux) and with the polling fallback.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.index import ProjectIndex
+from sendell.projects.watcher import INOTIFY_AVAILABLE, ProjectWatcher
+
+
+def wait_for(predicate, timeout: float = 5.0) -> float:
+    """Seconds until predicate() held (fails after timeout)"""
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if predicate():
+            return time.monotonic() - start
+        time.sleep(0.02)
+    raise AssertionError("condition not reached")
+
+
+def run_watcher(use_inotify: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "work" / "api").mkdir(parents=True)
+        (root / "work" / "api" / "package.json").write_text('{"name": "api", "version": "1.0.0"}')
+
+        watcher = ProjectWatcher(
+            roots=[root],
+            index=ProjectIndex(persist=False),
+            debounce_seconds=0.1,
+            poll_seconds=0.5,
+            use_inotify=use_inotify,
+        )
+        changes = []
+        watcher.subscribe(changes.append)
+        watcher.start()
+        try:
+            assert watcher.ready.wait(5)
+            assert [project.name for project in watcher.projects()] == ["api"]
+
+            def names():
+                return {project.name for project in watcher.projects()}
+
+            # New project
+            (root / "tools" / "cli").mkdir(parents=True)
+            (root / "tools" / "cli" / "Cargo.toml").write_text('[package]\nname = "cli"\nversion = "0.1.0"\n')
+            added = wait_for(lambda: "cli" in names())
+
+            # Edited config
+            (root / "work" / "api" / "package.json").write_text('{"name": "api", "version": "2.0.0"}')
+            wait_for(lambda: watcher.projects(under=root / "work")[0].config.version == "2.0.0")
+
+            # Deleted project
+            shutil.rmtree(root / "work")
+            wait_for(lambda: names() == {"cli"})
+
+            assert sum(len(change.added) for change in changes) == 2
+            assert sum(len(change.removed) for change in changes) == 1
+            print(f"  [OK] {watcher.backend}: new project visible after {added:.2f}s, stats {watcher.stats}")
+        finally:
+            watcher.stop()
+
+
+def test_inotify_watcher():
+    """Marker file events are applied within the debounce window"""
+    if not INOTIFY_AVAILABLE:
+        print("  [SKIP] inotify not available on this platform")
+        return
+    run_watcher(use_inotify=True)
+
+
+def test_polling_watcher():
+    """Periodic index-backed rescans pick up the same changes"""
+    run_watcher(use_inotify=False)
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("PROJECT WATCHER TEST")
+    print("=" * 70 + "\n")
+
+    test_inotify_watcher()
+    test_polling_watcher()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Test Script for Workspace Member Discovery
+
+Builds pnpm, npm, Cargo, go.work and uv workspaces and checks that a
+shallow scan (max_depth=1) still finds every declared member, with globs,
+exclusions and workspace_root filled in.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.index import ProjectIndex
+from sendell.projects.scanner import ProjectScanner
+from sendell.projects.workspaces import read_go_work, read_pnpm_workspace
+
+FILES = {
+    "pn/package.json": '{"name": "pn-root"}',
+    "pn/pnpm-workspace.yaml": "packages:\n  - 'apps/*'\n  - \"libs/**\"  # everything\n  - '!libs/legacy'\n",
+    "pn/apps/web/package.json": '{"name": "web"}',
+    "pn/apps/web/node_modules/dep/package.json": '{"name": "dep"}',
+    "pn/libs/deep/ui/package.json": '{"name": "ui"}',
+    "pn/libs/legacy/package.json": '{"name": "legacy"}',
+    "npm/package.json": json.dumps({"name": "npm-root", "workspaces": {"packages": ["packages/*"]}}),
+    "npm/packages/a/package.json": '{"name": "a"}',
+    "rs/Cargo.toml": '[workspace]\nmembers = ["crates/*"]\nexclude = ["crates/skip"]\n',
+    "rs/crates/core/Cargo.toml": '[package]\nname = "core"\n',
+    "rs/crates/skip/Cargo.toml": '[package]\nname = "skip"\n',
+    "go/go.work": 'go 1.22\n\nuse (\n\t./svc/a // api\n\t"./svc/b"\n)\nuse ./tools\n',
+    "go/svc/a/go.mod": "module example.com/a\n",
+    "go/svc/b/go.mod": "module example.com/b\n",
+    "go/tools/go.mod": "module example.com/tools\n",
+    "uv/pyproject.toml": '[project]\nname = "uv-root"\n[tool.uv.workspace]\nmembers = ["packages/*"]\n',
+    "uv/packages/p1/pyproject.toml": '[project]\nname = "p1"\n',
+}
+
+
+def test_manifest_readers():
+    """pnpm block lists and go.work use blocks"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in ("pn/pnpm-workspace.yaml", "go/go.work"):
+            (root / name).parent.mkdir(parents=True)
+            (root / name).write_text(FILES[name])
+
+        assert read_pnpm_workspace(root / "pn" / "pnpm-workspace.yaml") == ["apps/*", "libs/**", "!libs/legacy"]
+        assert read_go_work(root / "go" / "go.work") == ["./svc/a", "./svc/b", "./tools"]
+        print("  [OK] manifest readers")
+
+
+def test_members_found_without_deep_walk():
+    """Members below max_depth are found through the manifests"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name, content in FILES.items():
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+        scanner = ProjectScanner(max_depth=1, index=ProjectIndex(persist=False))
+        result = scanner.scan_directory(root)
+        members = {
+            project.name: project.workspace_root.name
+            for project in result.projects_found
+            if project.workspace_root is not None
+        }
+
+        assert members == {
+            "web": "pn",
+            "ui": "pn",
+            "a": "npm",
+            "core": "rs",
+            "example.com/a": "go",
+            "example.com/b": "go",
+            "example.com/tools": "go",
+            "p1": "uv",
+        }, members
+        print(f"  [OK] {len(members)} members in {result.directories_visited} directory visits")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("WORKSPACE DISCOVERY TEST")
+    print("=" * 70 + "\n")
+
+    test_manifest_readers()
+    test_members_found_without_deep_walk()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
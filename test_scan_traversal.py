@@ -0,0 +1,155 @@
+"""
+Test Script for the Parallel Scan Traversal
+
+Builds a project tree and checks that cancel() and an expired deadline
+return a partial result with the reason in errors (even while a worker
+is stuck on a directory), that the project order doesn't depend on the
+number of workers, and that concurrent scans of overlapping roots, with
+and without a shared index, match independent scans.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from sendell.projects.index import ProjectIndex
+from sendell.projects.scanner import ProjectScanner
+
+GROUPS = TEAMS = APPS = 4
+
+
+def make_tree(root: Path) -> int:
+    """root/groupG/teamT/appA projects plus a few plain directories; returns the project count"""
+    for g in range(GROUPS):
+        for t in range(TEAMS):
+            team = root / f"group{g}" / f"team{t}"
+            (team / "docs").mkdir(parents=True)
+            for a in range(APPS):
+                app = team / f"app{a}"
+                app.mkdir()
+                if a % 2:
+                    (app / "pyproject.toml").write_text(f'[project]\nname = "svc-{g}-{t}-{a}"\n')
+                else:
+                    (app / "package.json").write_text(json.dumps({"name": f"web-{g}-{t}-{a}"}))
+    return GROUPS * TEAMS * APPS
+
+
+class SlowScanner(ProjectScanner):
+    """Scanner whose directory visits take a while, optionally hanging on one path"""
+
+    def __init__(self, delay: float = 0.01, hang_on: str = "", **kwargs):
+        super().__init__(respect_ignore_files=False, **kwargs)
+        self.delay = delay
+        self.hang_on = hang_on
+        self.release = threading.Event()
+
+    def _visit_directory(self, path, depth, stack, workspace_root=None):
+        if self.hang_on and path.name == self.hang_on:
+            self.release.wait(30)
+        time.sleep(self.delay)
+        return super()._visit_directory(path, depth, stack, workspace_root)
+
+
+def test_cancel_returns_partial():
+    """cancel() from another thread stops the walk with what was found"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = make_tree(root)
+        scanner = SlowScanner(delay=0.02, max_workers=2, timeout_seconds=30)
+
+        timer = threading.Timer(0.3, scanner.cancel)
+        timer.start()
+        start = time.monotonic()
+        result = scanner.scan_directory(root)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        assert elapsed < 2.0, elapsed
+        assert "Scan cancelled" in result.errors, result.errors
+        assert 0 < result.directories_visited and result.total_projects < total
+        assert not scanner._active_scans
+        print(f"  [OK] cancelled after {elapsed:.2f}s with {result.total_projects}/{total} projects")
+
+
+def test_deadline_with_stuck_worker():
+    """An expired deadline returns even while a worker hangs on one directory"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = make_tree(root)
+        scanner = SlowScanner(delay=0.0, hang_on="team0", max_workers=4, timeout_seconds=1)
+
+        try:
+            start = time.monotonic()
+            result = scanner.scan_directory(root)
+            elapsed = time.monotonic() - start
+        finally:
+            scanner.release.set()
+
+        assert elapsed < 2.0, elapsed
+        assert any(error.startswith("Scan timeout after") for error in result.errors), result.errors
+        assert 0 < result.total_projects < total  # Everything outside the team0 directories
+        print(f"  [OK] deadline hit after {elapsed:.2f}s, {result.total_projects}/{total} projects")
+
+
+def test_order_independent_of_workers():
+    """1, 2 and 8 workers report the same projects in the same order"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = make_tree(root)
+
+        results = [
+            ProjectScanner(max_depth=3, max_workers=workers, respect_ignore_files=False).scan_directory(root)
+            for workers in (1, 2, 8)
+        ]
+        orders = [[project.path for project in result.projects_found] for result in results]
+
+        assert len(orders[0]) == total
+        assert orders[0] == orders[1] == orders[2]
+        assert orders[0] == sorted(orders[0], key=lambda path: path.parts)
+        assert all(result.errors == [] for result in results)
+        print(f"  [OK] identical order of {total} projects for 1, 2 and 8 workers")
+
+
+def test_overlapping_roots():
+    """Concurrent scans of nested roots match scanning each root alone"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        roots = [root, root / "group1", root, root / "group1" / "team2"]
+
+        for index in (None, ProjectIndex(persist=False)):
+            scanner = ProjectScanner(max_depth=3, max_workers=4, index=index, respect_ignore_files=False)
+            expected = [[project.path for project in scanner.scan_directory(path).projects_found] for path in roots]
+
+            for _ in range(3):
+                results = scanner.scan_multiple_paths(roots)
+                assert [result.scanned_path for result in results] == roots
+                for result, paths in zip(results, expected):
+                    assert result.errors == [], result.errors
+                    assert [project.path for project in result.projects_found] == paths
+
+        print(f"  [OK] {len(roots)} overlapping roots scanned concurrently, with and without an index")
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("SCAN TRAVERSAL TEST")
+    print("=" * 70 + "\n")
+
+    test_cancel_returns_partial()
+    test_deadline_with_stuck_worker()
+    test_order_independent_of_workers()
+    test_overlapping_roots()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
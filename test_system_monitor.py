@@ -0,0 +1,105 @@
+"""
+Test Script for the System Monitor CPU Sampler
+
+Checks that CPU readings never wait for a measurement window (neither on
+a fresh monitor nor long after the previous reading), that they cover the
+newest pair of background samples, and that concurrent readers share the
+sampler safely.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import psutil
+
+from sendell.device.monitor import CPU_SAMPLE_INTERVAL, SystemMonitor
+
+
+def test_readings_never_block():
+    """First reading and a reading after an idle gap both return at once"""
+    monitor = SystemMonitor()
+    try:
+        start = time.monotonic()
+        first = monitor._sample_cpu()
+        assert time.monotonic() - start < 0.1
+        assert 0.0 <= first <= 100.0
+
+        time.sleep(CPU_SAMPLE_INTERVAL * 2.5)  # Idle gap: the sampler kept going
+        start = time.monotonic()
+        later = monitor._sample_cpu()
+        assert time.monotonic() - start < 0.1
+        assert len(monitor._cpu_samples) == 2
+        print(f"  [OK] readings without waiting: {first}% then {later}%")
+    finally:
+        monitor.stop()
+
+
+def test_reading_covers_newest_pair():
+    """An old busy stretch outside the newest pair doesn't show up"""
+    monitor = SystemMonitor()
+    monitor.stop()
+    times = psutil.cpu_times()
+    now = time.monotonic()
+
+    # 10^6 busy seconds before the older sample, then one idle second
+    ancient = times._replace(user=times.user - 1_000_000)
+    idle = times._replace(idle=times.idle + 1.0)
+    with monitor._cpu_lock:
+        monitor._cpu_samples.clear()
+        monitor._cpu_samples.extend([(now - 600, ancient), (now - 1, times), (now, idle)])
+
+    assert monitor._sample_cpu() == 0.0
+
+    busy = idle._replace(user=idle.user + 1.0, idle=idle.idle + 1.0)
+    with monitor._cpu_lock:
+        monitor._cpu_samples.append((now + 1, busy))
+    assert monitor._sample_cpu() == 50.0  # 1 busy of 2 seconds between the newest pair
+    print("  [OK] reading covers the newest sample pair")
+
+
+def test_concurrent_readers():
+    """Tools, CLI and agent threads can read while the sampler appends"""
+    monitor = SystemMonitor()
+    readings = []
+    errors = []
+
+    def read():
+        try:
+            for _ in range(200):
+                readings.append(monitor._sample_cpu())
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    try:
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not errors, errors
+        assert len(readings) == 800 and all(0.0 <= value <= 100.0 for value in readings)
+        print(f"  [OK] {len(readings)} concurrent readings")
+    finally:
+        monitor.stop()
+
+
+def main():
+    """Run all checks"""
+    print("\n" + "=" * 70)
+    print("SYSTEM MONITOR TEST")
+    print("=" * 70 + "\n")
+
+    test_readings_never_block()
+    test_reading_covers_newest_pair()
+    test_concurrent_readers()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()